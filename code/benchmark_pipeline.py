@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+End to end benchmark of the pipeline on synthetic exports (synthetic_odk_export.py):
+
+    python benchmark_pipeline.py -x <work directory> -n 10,100,1000,10000 -v <veg list> -s <shrub list>
+
+For each number of sites a synthetic export is written and the pipeline stages are timed one after another:
+
+    clean        steps 2 - 6, one record per form workflow (one clean_concurrent record with -j above 1)
+    partition    step7 - read the intermediate store, partition by site and create the site folders
+    extract      step8 - site data extraction of every site
+    workbook     step9 / step10 / step11 - observation and RAS workbooks of every site
+
+The start up of a new pipeline process is timed once (0 sites): step1 --help and the imports up to the first form
+workflow.
+
+The wall and CPU seconds of every stage are written to a JSON file (with the git commit, so runs of different commits
+can be compared) and printed as a table.
+"""
+
+# Import modules
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import subprocess
+from datetime import datetime
+import warnings
+
+warnings.filterwarnings("ignore")
+
+SITE_COUNT_LIST = [10, 100, 1000, 10000]
+
+# raw odk output -> benchmark stage name of its form workflow.
+FORM_STAGE_LIST = [('RM_Star_Transect_results.csv', 'clean_step2_star_transect'),
+                   ('RMB_Integrated_Site_results.csv', 'clean_step3_integrated'),
+                   ('RMB_Basal_Sweep_results.csv', 'clean_step4_basal'),
+                   ('RMB_Woody_Thickening_results.csv', 'clean_step5_woody'),
+                   ('RMB_Rapid_Assessment_RAS_results.csv', 'clean_step6_ras')]
+
+
+def cmd_args_fn():
+    template_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    p = argparse.ArgumentParser(description='''Time the pipeline stages on synthetic ODK exports.''')
+
+    p.add_argument('-x', '--work_dir', help='Directory for the synthetic exports and pipeline outputs.',
+                   default=os.getcwd())
+    p.add_argument('-n', '--sites', help='Comma separated numbers of sites (default 10,100,1000,10000).',
+                   default=','.join(str(sites) for sites in SITE_COUNT_LIST))
+    p.add_argument('-d', '--template_dir', help='The directory containing the sample raw odk csv files.',
+                   default=template_dir)
+    p.add_argument('-v', '--veg_list_excel', help='Odk veg list Excel file path.',
+                   default=os.path.join(template_dir, 'odk_veg_list_final.xlsx'))
+    p.add_argument('-s', '--shrub_list_excel', help='Odk shrub list Excel file path.',
+                   default=os.path.join(template_dir, 'dominantVegSplitDistricts2.xlsx'))
+    p.add_argument('-p', '--pastoral_estate', help='File path to the pastoral estate shapefile (optional).',
+                   default=None)
+    p.add_argument('-k', '--reference_cache', help='Directory used to store a snapshot of the veg and shrub list '
+                                                   'Excel files (optional).', default=None)
+    p.add_argument('-e', '--seed', help='Random seed of the synthetic exports.', type=int, default=0)
+    p.add_argument('-o', '--output', help='JSON results file (default: benchmark_<commit>.json in the work '
+                                          'directory).', default=None)
+    p.add_argument('-j', '--form_workers', help='Number of worker processes cleaning the forms (default 1 times each '
+                                               'form workflow, above 1 times the concurrent clean as one stage).',
+                   type=int, default=1)
+    p.add_argument('-q', '--quiet', help='Hide the pipeline print output? - Enter Yes or No.', default='Yes')
+
+    cmd_args = p.parse_args()
+
+    return cmd_args
+
+
+def commit_fn():
+    """ Return the git commit of the code directory, None outside a git repository. """
+
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed_fn(result_list, sites, stage, quiet, fn, *args):
+    """ Call a function and record its wall and CPU time.
+
+            :param result_list: list object the stage record is appended to.
+            :param sites: integer object containing the number of sites of the run.
+            :param stage: string object containing the stage name.
+            :param quiet: Boolean object - hide the print output of the function.
+            :param fn: function object.
+            :param args: function arguments.
+            :return: the function output. """
+
+    stdout = sys.stdout
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        output = fn(*args)
+    finally:
+        if quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    result_list.append({'sites': sites, 'stage': stage, 'wall': round(time.perf_counter() - wall, 4),
+                        'cpu': round(time.process_time() - cpu, 4)})
+    print('{0:>7} sites  {1:<28}{2:>10.3f} s'.format(sites, stage, result_list[-1]['wall']))
+
+    return output
+
+
+def startup_fn():
+    """ Time the start of a new pipeline process: the step1 argument parsing (--help) and the start up to the first
+    form workflow (step1 and the RAS handler module imported, the reference data is not loaded).
+
+            :return result_list: list object containing the 'startup_help' and 'startup_first_form' records. """
+
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    command_dict = {
+        'startup_help': [sys.executable, os.path.join(code_dir, 'step1_initiate_odk_processing_pipeline.py'),
+                         '--help'],
+        'startup_first_form': [sys.executable, '-c',
+                               'import importlib, step1_initiate_odk_processing_pipeline, form_handler_registry; '
+                               'importlib.import_module(form_handler_registry.handler_fn('
+                               '"RMB_Rapid_Assessment_RAS_results.csv")["module"])']}
+
+    result_list = []
+    for stage, command in command_dict.items():
+        wall = time.perf_counter()
+        subprocess.check_call(command, cwd=code_dir, stdout=subprocess.DEVNULL)
+        result_list.append({'sites': 0, 'stage': stage, 'wall': round(time.perf_counter() - wall, 4), 'cpu': None})
+        print('{0:>7} sites  {1:<28}{2:>10.3f} s'.format(0, stage, result_list[-1]['wall']))
+
+    return result_list
+
+
+def extract_fn(site_dir_path_list, site_df_dict, reference_data):
+    """ Run the step8 extraction of every site.
+
+            :return extraction_list: list object containing the site_extraction_fn outputs (None if the site
+            failed). """
+
+    import step7_site_processing_workflow
+
+    extraction_list = []
+    for site_dir, frame_dict in zip(site_dir_path_list, site_df_dict.values()):
+        try:
+            extraction_list.append(step7_site_processing_workflow.site_extraction_fn(site_dir, frame_dict,
+                                                                                     reference_data))
+        except Exception:
+            extraction_list.append(None)
+
+    return extraction_list
+
+
+def workbook_fn(directory_odk, site_dir_path_list, site_df_dict, extraction_list):
+    """ Build the observation and RAS workbooks of every site extracted by extract_fn.
+
+            :return failed: integer object containing the number of sites that failed. """
+
+    import step7_site_processing_workflow
+
+    failed = 0
+    for site_dir, frame_dict, extraction in zip(site_dir_path_list, site_df_dict.values(), extraction_list):
+        if extraction is None:
+            failed += 1
+            continue
+        try:
+            step7_site_processing_workflow.site_sheet_fn(directory_odk, site_dir, frame_dict, 'No', None, None,
+                                                         extraction[0], extraction[1])
+        except Exception:
+            failed += 1
+
+    return failed
+
+
+def benchmark_fn(work_dir, sites, template_dir, veg_list_excel, seed, reference_data, property_index, quiet,
+                 form_workers=1):
+    """ Generate a synthetic export of a number of sites and time each pipeline stage.
+
+            :param work_dir: string object containing the work directory.
+            :param sites: integer object containing the number of sites.
+            :param template_dir: string object containing the directory of the sample raw odk csv files.
+            :param veg_list_excel: string object containing the path to the odk veg list Excel file.
+            :param seed: integer object containing the random seed.
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
+            :param property_index: dictionary object containing the pastoral estate property code lookup table
+            (property_code_index.py).
+            :param quiet: Boolean object - hide the pipeline print output.
+            :param form_workers: integer object containing the number of form worker processes.
+            :return result_list: list object containing one record per stage. """
+
+    import synthetic_odk_export
+    import step1_initiate_odk_processing_pipeline
+    import form_handler_registry
+    import intermediate_store
+    import step7_site_processing_workflow
+
+    directory_odk = os.path.join(work_dir, 'odk_' + str(sites))
+    temp_dir = os.path.join(work_dir, 'output_' + str(sites))
+    for path in (directory_odk, temp_dir):
+        shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(temp_dir)
+
+    result_list = []
+    timed_fn(result_list, sites, 'generate', quiet, synthetic_odk_export.main_routine, template_dir, directory_odk,
+             sites, seed, veg_list_excel)
+
+    input_dict = {'reference_data': reference_data, 'property_index': property_index}
+    if form_workers > 1:
+        form_path_list = [[search_criteria, os.path.join(directory_odk, search_criteria)]
+                          for search_criteria, _ in FORM_STAGE_LIST]
+        timed_fn(result_list, sites, 'clean_concurrent', quiet, form_handler_registry.concurrent_fn, form_path_list,
+                 temp_dir, input_dict, form_workers)
+    else:
+        for search_criteria, stage in FORM_STAGE_LIST:
+            timed_fn(result_list, sites, stage, quiet,
+                     step1_initiate_odk_processing_pipeline.raw_odk_output_workflow_fn,
+                     os.path.join(directory_odk, search_criteria), search_criteria, temp_dir, input_dict)
+
+    def partition_fn():
+        table_list, df_list = intermediate_store.main_routine(temp_dir)
+        site_df_dict = step7_site_processing_workflow.site_partition_fn(table_list, df_list)
+        _, site_dir_path_list = step7_site_processing_workflow.site_directories_fn(site_df_dict, temp_dir)
+        return site_df_dict, site_dir_path_list
+
+    site_df_dict, site_dir_path_list = timed_fn(result_list, sites, 'partition', quiet, partition_fn)
+
+    extraction_list = timed_fn(result_list, sites, 'extract', quiet, extract_fn, site_dir_path_list, site_df_dict,
+                               reference_data)
+
+    failed = timed_fn(result_list, sites, 'workbook', quiet, workbook_fn, directory_odk, site_dir_path_list,
+                      site_df_dict, extraction_list)
+
+    for result in result_list:
+        result['site_folders'] = len(site_dir_path_list)
+        result['failed_sites'] = failed
+
+    return result_list
+
+
+def table_fn(result_list):
+    """ Print the stage times as a table (one column per number of sites). """
+
+    site_list = sorted({result['sites'] for result in result_list})
+    stage_list = list(dict.fromkeys(result['stage'] for result in result_list))
+    wall_dict = {(result['sites'], result['stage']): result['wall'] for result in result_list}
+
+    print('------------------------------------------------------------')
+    print('{0:<28}'.format('stage (wall s)') + ''.join('{0:>12}'.format(sites) for sites in site_list))
+    for stage in stage_list:
+        print('{0:<28}'.format(stage) + ''.join('{0:>12}'.format('{0:.3f}'.format(wall_dict[(sites, stage)])
+                                                                 if (sites, stage) in wall_dict else '-')
+                                                for sites in site_list))
+
+
+def main_routine():
+    cmd_args = cmd_args_fn()
+    quiet = cmd_args.quiet == 'Yes'
+
+    # call the reference_data_cache.py script.
+    import reference_data_cache
+    reference_data = reference_data_cache.main_routine(cmd_args.veg_list_excel, cmd_args.shrub_list_excel,
+                                                       cmd_args.reference_cache)
+
+    # call the property_code_index.py script.
+    import property_code_index
+    property_index = property_code_index.main_routine(cmd_args.pastoral_estate)
+
+    # call the startup_fn function - process start up, once per benchmark.
+    result_list = startup_fn()
+    for sites in [int(sites) for sites in cmd_args.sites.split(',')]:
+        result_list.extend(benchmark_fn(cmd_args.work_dir, sites, cmd_args.template_dir, cmd_args.veg_list_excel,
+                                        cmd_args.seed, reference_data, property_index, quiet, cmd_args.form_workers))
+
+    commit = commit_fn()
+    output = cmd_args.output or os.path.join(cmd_args.work_dir, 'benchmark_' + (commit or 'unknown') + '.json')
+    with open(output, 'w') as f:
+        json.dump({'commit': commit, 'created': str(datetime.now()), 'python': platform.python_version(),
+                   'platform': platform.platform(), 'seed': cmd_args.seed, 'results': result_list}, f, indent=2)
+
+    table_fn(result_list)
+    print('Benchmark results written to: ', output)
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# Import modules
+from __future__ import print_function, division
+import warnings
+import numpy as np
+import pandas as pd
+
+warnings.filterwarnings("ignore")
+
+# PROP:PROPERTY values recorded when the property is not listed - the name is in PROP:NOT_PASTORAL_NAME2.
+UNLISTED_PROPERTY_SET = {'NP_prop_new', 'B_property_outside', 'D_property_outside', 'G_property_outside',
+                         'K_property_outside', 'NAS_property_outside', 'P_property_outside', 'R_property_outside',
+                         'SAS_property_outside', 'SP_property_outside', 'TC_property_outside', 'VR_property_outside',
+                         'NP_property_outside'}
+
+# raw odk source columns read by header_mapping_fn (the coordinate columns are form specific) and meta_mapping_fn.
+HEADER_SOURCE_LIST = ['START', 'OFFICER_ONE:RECORDER', 'OFFICER_ONE:OTHER_RECORDER', 'DISTRICT', 'PROP:PROPERTY',
+                      'PROP:NOT_PASTORAL_NAME2', 'GROUP_SITE:SITE_FINAL', 'GPS_SELECT']
+ESTIMATOR_SOURCE_LIST = ['OFFICER_TWO:ESTIMATOR', 'OFFICER_TWO:OTHER_ESTIMATOR']
+META_SOURCE_LIST = ['meta:instanceID', 'meta:instanceName']
+
+
+def column_fn(df, col):
+    """ Return a raw odk column, a missing column is returned as nan values and a categorical column (export_reader.py)
+    as its values.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    if col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype(series.cat.categories.dtype)
+        return series
+
+    return pd.Series(np.nan, index=df.index)
+
+
+def string_fn(df, col):
+    """ Convert a column to string values (str() of each value, nan -> 'nan').
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    return column_fn(df, col).map(str)
+
+
+def float_fn(df, col):
+    """ Convert a column to float values.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    return column_fn(df, col).astype(float)
+
+
+def int_fn(df, col):
+    """ Convert a column to integer values.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    return column_fn(df, col).astype(float).astype(int)
+
+
+def float_sum_fn(df, col_list):
+    """ Sum the float values of several columns.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col_list: list object containing the odk column names.
+            :return: pandas series object. """
+
+    total = float_fn(df, col_list[0])
+    for col in col_list[1:]:
+        total = total + float_fn(df, col)
+
+    return total
+
+
+def string_clean_series_fn(series, case):
+    """ Vectorised version of the string_clean_upper/capital/title_fn functions.
+
+            :param series: pandas series object containing string values.
+            :param case: string object (upper, capital or title).
+            :return: pandas series object containing the processed string values. """
+
+    series = series.map(str).str.replace('_', ' ', regex=False).str.replace('-', ' ', regex=False)
+
+    if case == 'upper':
+        series = series.str.upper()
+    elif case == 'capital':
+        series = series.str.capitalize()
+    else:
+        series = series.str.title()
+
+    return series.str.strip()
+
+
+def string_clean_fn(df, col, case):
+    """ Clean a string column (replace '_' and '-' with whitespace, change the case and strip whitespace).
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :param case: string object (upper, capital or title).
+            :return: pandas series object. """
+
+    return string_clean_series_fn(column_fn(df, col), case)
+
+
+def text_fn(df, col, n=None):
+    """ Convert a column to string values, optionally remove the last n characters and replace '-' with whitespace.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :param n: integer object containing the number of characters removed from the end of each value.
+            :return: pandas series object. """
+
+    series = string_fn(df, col)
+    if n:
+        series = series.str[:-n]
+
+    return series.str.replace('-', ' ', regex=False)
+
+
+def other_substitution_fn(df, col, other_prefix, case='capital', count=5):
+    """ Clean a species select column and substitute 'Other1'..'Other(count)' with the matching free text column.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk select column name.
+            :param other_prefix: string object containing the other column prefix (i.e. 'TS_SP:TS_OTHER').
+            :param case: string object (upper, capital or title).
+            :param count: integer object containing the number of other columns.
+            :return: pandas series object. """
+
+    series = string_clean_fn(df, col, case)
+
+    condition_list = [series == 'Other' + str(i + 1) for i in range(count)]
+    choice_list = [string_clean_fn(df, other_prefix + str(i + 1), case) for i in range(count)]
+
+    return pd.Series(np.select(condition_list, choice_list, default=series), index=df.index, dtype=object)
+
+
+def date_fn(df, col='START'):
+    """ Extract the date (dd/mm/yy) from the odk start time stamp (i.e. 2021-03-04T10:21:17.324+09:30).
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    s_date = column_fn(df, col).map(str).str.split('T').str[0]
+
+    return s_date.str[-2:] + '/' + s_date.str[-5:-3] + '/' + s_date.str[2:4]
+
+
+def date_time_fn(df, col='START'):
+    """ Extract the date and time (dd/mm/yy HH:MM AM) from the odk start time stamp.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    s_time = column_fn(df, col).map(str).str.split('T').str[1].str[:5]
+    obs_time = pd.to_datetime(s_time, format='%H:%M').dt.strftime('%I:%M %p')
+
+    return date_fn(df, col) + ' ' + obs_time
+
+
+def officer_fn(df, col, other_col):
+    """ Extract the officer name ('other' is substituted with the free text column) as 'Surname, First'.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the officer select column name.
+            :param other_col: string object containing the officer free text column name.
+            :return: pandas series object. """
+
+    officer = string_fn(df, col)
+    officer = officer.where(officer != 'other', string_fn(df, other_col))
+    name = string_clean_series_fn(officer, 'title').str.split(' ', n=1)
+
+    return name.str[1] + ', ' + name.str[0]
+
+
+def unlisted_mask_fn(df):
+    """ Identify records with an unlisted property.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object containing boolean values. """
+
+    return string_fn(df, 'PROP:PROPERTY').isin(UNLISTED_PROPERTY_SET)
+
+
+def listed_property_fn(df):
+    """ Extract the listed property name (nan if the property is unlisted).
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object. """
+
+    return string_clean_fn(df, 'PROP:PROPERTY', 'title').where(~unlisted_mask_fn(df), np.nan)
+
+
+def unlisted_property_fn(df):
+    """ Extract the unlisted property name (nan if the property is listed).
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object. """
+
+    return string_clean_fn(df, 'PROP:NOT_PASTORAL_NAME2', 'title').where(unlisted_mask_fn(df), np.nan)
+
+
+def final_property_fn(df):
+    """ Extract the final property name (listed or unlisted).
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object. """
+
+    return listed_property_fn(df).where(~unlisted_mask_fn(df), unlisted_property_fn(df))
+
+
+def gps_select_fn(df, source_dict, default, dtype=float, select_col='GPS_SELECT'):
+    """ Select the coordinate source column for each record from the GPS_SELECT value.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param source_dict: dictionary object (GPS_SELECT value -> odk column name or None for nan).
+            :param default: string object containing the GPS_SELECT value used when no other value matches.
+            :param dtype: float or str, the output value type.
+            :param select_col: string object containing the gps select column name.
+            :return: pandas series object. """
+
+    select = string_fn(df, select_col)
+
+    def source_fn(col):
+        if col is None:
+            return pd.Series(np.nan, index=df.index)
+        if dtype is str:
+            return string_fn(df, col)
+        return pd.to_numeric(column_fn(df, col), errors='coerce')
+
+    condition_list = [select == key for key in source_dict if key != default]
+    choice_list = [source_fn(source_dict[key]) for key in source_dict if key != default]
+
+    values = np.select(condition_list, choice_list, default=source_fn(source_dict[default]))
+
+    if dtype is str:
+        return pd.Series(values, index=df.index, dtype=object)
+
+    return pd.Series(values, index=df.index, dtype=float)
+
+
+def header_mapping_fn(gps_dict, estimator=False):
+    """ Create the column mapping shared by all odk forms (site, date, officers, location and coordinates).
+
+            :param gps_dict: dictionary object (output column name -> source_dict passed to gps_select_fn), the
+            'later_gps' key of each source_dict is the default.
+            :param estimator: boolean object, True if the form records an estimator.
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples. """
+
+    column_mapping = [
+        ('site', string_clean_fn, ('GROUP_SITE:SITE_FINAL', 'upper')),
+        ('date', date_fn, ()),
+        ('date_time', date_time_fn, ()),
+        ('recorder', officer_fn, ('OFFICER_ONE:RECORDER', 'OFFICER_ONE:OTHER_RECORDER'))]
+
+    if estimator:
+        column_mapping.append(('estimator', officer_fn, ('OFFICER_TWO:ESTIMATOR', 'OFFICER_TWO:OTHER_ESTIMATOR')))
+
+    column_mapping.extend([
+        ('district', string_clean_fn, ('DISTRICT', 'title')),
+        ('prop', listed_property_fn, ()),
+        ('unlist_prop', unlisted_property_fn, ()),
+        ('final_prop', final_property_fn, ()),
+        ('gps', string_fn, ('GPS_SELECT',))])
+
+    for output, source_dict in gps_dict.items():
+        dtype = str if output == 'off_direct' else float
+        column_mapping.append((output, gps_select_fn, (source_dict, 'later_gps', dtype)))
+
+    return column_mapping
+
+
+def meta_key_clean_fn(df, col):
+    """ Remove the 'uuid:' prefix from the odk form identifier key.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param col: string object containing the odk column name.
+            :return: pandas series object. """
+
+    return string_fn(df, col).str[5:]
+
+
+def meta_mapping_fn():
+    """ Create the column mapping of the odk form identifier fields.
+
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples. """
+
+    column_mapping = [
+        ('meta_key', string_fn, ('meta:instanceID',)),
+        ('clean_meta_key', meta_key_clean_fn, ('meta:instanceID',)),
+        ('form', string_fn, ('meta:instanceName',))]
+
+    return column_mapping
+
+
+def mapping_frame_fn(df, column_mapping):
+    """ Apply a column mapping to the raw odk results, each transform is run once over the whole column.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :param column_mapping: list object containing (output name, transform function, arguments) tuples.
+            :return clean_df: pandas dataframe object containing one column per output name (in mapping order). """
+
+    series_list = []
+    for output, transform_fn, args in column_mapping:
+        series = transform_fn(df, *args)
+        series_list.append(pd.Series(series.values, index=df.index, name=output))
+
+    clean_df = pd.concat(series_list, axis=1).reset_index(drop=True)
+
+    return clean_df
+
+
+def records_fn(df):
+    """ Convert the raw odk results to a list of dictionaries (one per record) for the per record helper scripts,
+    avoiding the Series construction cost of df.iterrows().
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: list object containing one dictionary per record. """
+
+    return df.to_dict('records')
+
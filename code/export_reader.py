@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# raw odk exports are read in chunks of this many submissions - memory is bound by the chunk, not by the number of
+# seasons held in the cumulative export.
+CHUNK_SIZE = 5000
+
+# low cardinality columns read as categoricals.
+CATEGORY_LIST = ['DISTRICT', 'OFFICER_ONE:RECORDER', 'PROP:PROPERTY']
+
+
+def header_fn(file_path):
+    """ Read the column names of a raw odk export (no records are read).
+
+            :param file_path: string object containing the raw odk export file path.
+            :return: list object containing the column names. """
+
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+
+def usecols_fn(file_path, column_list):
+    """ Select the declared source columns present in a raw odk export, in file order. A declared column that is not
+    in the export (older form version) is left to the column_mapping_engine.py missing column handling.
+
+            :param file_path: string object containing the raw odk export file path.
+            :param column_list: list object containing the source column names declared by the form workflow, None
+            reads every column.
+            :return: list object containing the column names to read. """
+
+    header_list = header_fn(file_path)
+    if column_list is None:
+        return header_list
+
+    column_set = set(column_list)
+
+    return [column for column in header_list if column in column_set]
+
+
+def dtype_scan_fn(file_path, usecols, chunk_size=CHUNK_SIZE):
+    """ Determine the dtype of each column over the whole export, so every chunk of a multi chunk export is typed as a
+    single pd.read_csv of the whole file would type it: the chunk dtype where every chunk agrees, float64 where the
+    chunks mix integer and float, and text otherwise.
+
+            :param file_path: string object containing the raw odk export file path.
+            :param usecols: list object containing the column names to read (usecols_fn defined).
+            :param chunk_size: integer object containing the number of submissions per chunk.
+            :return dtype_dict: dictionary object (column name -> dtype). """
+
+    category_set = set(CATEGORY_LIST)
+    scan_list = [column for column in usecols if column not in category_set]
+
+    chunk_dtype_dict = {}
+    for df in pd.read_csv(file_path, usecols=scan_list, chunksize=chunk_size):
+        for column, dtype in df.dtypes.items():
+            chunk_dtype_dict.setdefault(column, set()).add(dtype)
+
+    dtype_dict = {}
+    for column, dtype_set in chunk_dtype_dict.items():
+        if len(dtype_set) == 1:
+            dtype_dict[column] = dtype_set.pop()
+        elif all(pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype) for dtype in dtype_set):
+            dtype_dict[column] = 'float64'
+        else:
+            dtype_dict[column] = str
+
+    dtype_dict.update((column, 'category') for column in usecols if column in category_set)
+
+    return dtype_dict
+
+
+def chunk_fn(file_path, column_list=None, chunk_size=CHUNK_SIZE):
+    """ Stream a raw odk export in chunks of submissions, reading only the declared source columns.
+
+    An export holding a single chunk is read once. A longer export is typed by dtype_scan_fn first, so the values the
+    form workflows see do not depend on where the chunks fall.
+
+            :param file_path: string object containing the raw odk export file path.
+            :param column_list: list object containing the source column names declared by the form workflow, None
+            reads every column.
+            :param chunk_size: integer object containing the number of submissions per chunk.
+            :return: generator object yielding pandas dataframe objects (the index runs on across the chunks). """
+
+    usecols = usecols_fn(file_path, column_list)
+    category_dict = {column: 'category' for column in CATEGORY_LIST if column in usecols}
+
+    with pd.read_csv(file_path, usecols=usecols, dtype=category_dict, chunksize=chunk_size) as reader:
+        first_df = next(reader, None)
+        second_df = next(reader, None)
+
+    if second_df is None:
+        # a header only export yields an empty dataframe, as pd.read_csv does.
+        yield pd.read_csv(file_path, usecols=usecols, dtype=category_dict) if first_df is None else first_df
+        return
+
+    del first_df, second_df
+    dtype_dict = dtype_scan_fn(file_path, usecols, chunk_size)
+
+    with pd.read_csv(file_path, usecols=usecols, dtype=dtype_dict, chunksize=chunk_size) as reader:
+        for df in reader:
+            yield df
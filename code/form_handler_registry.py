@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import glob
+import fnmatch
+import importlib
+import importlib.util
+import traceback
+import warnings
+import stage_monitor
+
+warnings.filterwarnings("ignore")
+
+# raw odk form handlers, in processing order - the handler module is only imported when a matching export is found:
+#   file_name        raw odk file name as downloaded from ODK Aggregate (the search criteria).
+#   pattern_list     file name patterns (fnmatch) accepted for the export, the first match is processed.
+#   module           form workflow script, main_routine(file_path, temp_dir, *inputs) is called.
+#   input_list       run inputs passed to main_routine after file_path and temp_dir (see inputs_fn).
+#   dependency_list  third party packages the workflow imports, checked before the module is imported.
+#   form_id          ODK form id on the server, used to pull the submissions over OData (odata_pull_client.py).
+#   repeat_list      repeat groups pulled with the submissions, written as <form>-<repeat>.csv repeat exports.
+# run inputs stored once per form worker process (see form_worker_init_fn).
+WORKER_INPUT_DICT = {}
+
+HANDLER_LIST = [
+    {'file_name': 'RM_Star_Transect_results.csv', 'pattern_list': ['RM_Star_Transect_results.csv'],
+     'module': 'step2_1_star_transect_processing_workflow', 'input_list': ['reference_data'],
+     'dependency_list': ['pandas', 'numpy', 'pyarrow'], 'form_id': 'RMB_STAR_TRANSECT',
+     'repeat_list': ['REPEAT_points_1', 'REPEAT_points_2', 'REPEAT_points_3']},
+    {'file_name': 'RMB_Integrated_Site_results.csv', 'pattern_list': ['RMB_Integrated_Site_results.csv'],
+     'module': 'step3_1_integrated_processing_workflow', 'input_list': [],
+     'dependency_list': ['pandas', 'pyarrow'], 'form_id': 'RMB_INTEGRATED_SITE',
+     'repeat_list': []},
+    {'file_name': 'RMB_Basal_Sweep_results.csv', 'pattern_list': ['RMB_Basal_Sweep_results.csv'],
+     'module': 'step4_1_basal_processing_workflow', 'input_list': [],
+     'dependency_list': ['pandas', 'pyarrow'], 'form_id': 'RMB_BASAL_SWEEP',
+     'repeat_list': []},
+    {'file_name': 'RMB_Woody_Thickening_results.csv', 'pattern_list': ['RMB_Woody_Thickening_results.csv'],
+     'module': 'step5_1_woody_processing_workflow', 'input_list': [],
+     'dependency_list': ['pandas', 'pyarrow'], 'form_id': 'RMB_WOODY_THICKENING',
+     'repeat_list': []},
+    {'file_name': 'RMB_Rapid_Assessment_RAS_results.csv', 'pattern_list': ['RMB_Rapid_Assessment_RAS_results.csv'],
+     'module': 'step6_1_ras_processing_workflow', 'input_list': ['reference_data', 'property_index'],
+     'dependency_list': ['pandas', 'pyarrow'], 'form_id': 'RMB_RAPID_ASSESSMENT_RAS',
+     'repeat_list': []},
+]
+
+
+def search_criteria_list_fn():
+    """ Return the raw odk file names of the registered handlers, in processing order. """
+
+    return [handler['file_name'] for handler in HANDLER_LIST]
+
+
+def handler_fn(file_name):
+    """ Return the handler of a raw odk file name.
+
+            :param file_name: string object containing the raw odk file name (i.e. 'RMB_Basal_Sweep_results.csv').
+            :return handler: dictionary object (HANDLER_LIST element), None if no handler matches. """
+
+    for handler in HANDLER_LIST:
+        if file_name == handler['file_name'] or any(fnmatch.fnmatch(file_name, pattern)
+                                                    for pattern in handler['pattern_list']):
+            return handler
+
+    return None
+
+
+def locate_fn(dir_path, handler):
+    """ Locate the export of a handler in a directory.
+
+            :param dir_path: string object containing the raw odk output directory.
+            :param handler: dictionary object (HANDLER_LIST element).
+            :return: string object containing the export file path, None if it was not located. """
+
+    for pattern in handler['pattern_list']:
+        file_path = os.path.join(dir_path, pattern)
+        if os.path.exists(file_path):
+            return file_path
+
+        match_list = sorted(glob.glob(os.path.join(dir_path, pattern)))
+        if match_list:
+            return match_list[0]
+
+    return None
+
+
+def missing_dependency_fn(handler):
+    """ Find the dependencies of a handler that are not installed (without importing them).
+
+            :param handler: dictionary object (HANDLER_LIST element).
+            :return: list object containing the missing package names. """
+
+    return [package for package in handler['dependency_list'] if importlib.util.find_spec(package) is None]
+
+
+def inputs_fn(input_dict, name):
+    """ Return a run input, an input given as a function is called on first use and the result is kept.
+
+            :param input_dict: dictionary object (input name -> value or function returning the value).
+            :param name: string object containing the input name (i.e. 'reference_data').
+            :return: the input value. """
+
+    value = input_dict[name]
+    if callable(value):
+        value = value()
+        input_dict[name] = value
+
+    return value
+
+
+def main_routine(file_path, temp_dir, input_dict, handler=None):
+    """ Run the form workflow of a raw odk export.
+
+            :param file_path: string object containing the raw odk export file path.
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param input_dict: dictionary object (input name -> value or function returning the value) containing the
+            'reference_data' (reference_data_cache.py) and 'property_index' (property_code_index.py) inputs.
+            :param handler: dictionary object (HANDLER_LIST element), default matched on the file name.
+            :return: Boolean object - True if the form workflow ran. """
+
+    if handler is None:
+        handler = handler_fn(os.path.basename(file_path.replace('\\', os.sep)))
+
+    if handler is None:
+        print('No form handler is registered for: ', file_path)
+        return False
+
+    missing_list = missing_dependency_fn(handler)
+    if missing_list:
+        print(handler['file_name'], ' requires ', ', '.join(missing_list), ' (not installed) - the form is skipped.')
+        return False
+
+    module = importlib.import_module(handler['module'])
+    module.main_routine(file_path, temp_dir, *[inputs_fn(input_dict, name) for name in handler['input_list']])
+
+    return True
+
+
+def form_worker_init_fn(input_dict, monitor_settings=None):
+    """ Store the read only run inputs once in each form worker process.
+
+            :param input_dict: dictionary object containing the resolved run inputs (concurrent_fn defined).
+            :param monitor_settings: dictionary object containing the stage_monitor.py settings of the parent
+            process. """
+
+    WORKER_INPUT_DICT.update(input_dict)
+
+    # call the stage_monitor.py script - the worker logs and profiles its stages like the parent process.
+    stage_monitor.reset_fn()
+    if monitor_settings:
+        stage_monitor.configure_fn(**monitor_settings)
+
+
+def form_worker_fn(file_path, temp_dir, file_name, input_dict=None):
+    """ Run main_routine and return the outcome instead of raising, so one failed form does not stop the others.
+
+            :param file_path: string object containing the raw odk export file path.
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param file_name: string object containing the raw odk file name of the handler.
+            :param input_dict: dictionary object containing the run inputs, if None the inputs stored by
+            form_worker_init_fn are used.
+            :return form_result: list object containing the raw odk file name, status (success/skipped/failed) and
+            error. """
+
+    if input_dict is None:
+        input_dict = WORKER_INPUT_DICT
+
+    try:
+        ran = main_routine(file_path, temp_dir, input_dict, handler_fn(file_name))
+        form_result = [file_name, 'success' if ran else 'skipped', '']
+    except Exception as e:
+        traceback.print_exc()
+        form_result = [file_name, 'failed', '{0}: {1}'.format(type(e).__name__, e)]
+
+    return form_result
+
+
+def form_pool_worker_fn(file_path, temp_dir, file_name):
+    """ Run form_worker_fn in a worker process and hand the stage records back to the parent process.
+
+            :return form_result: list object containing the raw odk file name, status and error.
+            :return record_list: list object containing the stage records of the form (stage_monitor.py). """
+
+    form_result = form_worker_fn(file_path, temp_dir, file_name)
+
+    return form_result, stage_monitor.drain_fn()
+
+
+def form_summary_fn(form_result_list):
+    """ Print the success/failure summary of the form workflows.
+
+            :param form_result_list: list object containing the form_worker_fn outputs. """
+
+    print('------------------------------------------------------------')
+    print('Form summary: ', sum(status == 'success' for _, status, _ in form_result_list), ' of ',
+          len(form_result_list), ' form workflows succeeded.')
+    for file_name, status, error in form_result_list:
+        if status != 'success':
+            print(' - ', file_name, status, error)
+
+
+def concurrent_fn(form_path_list, temp_dir, input_dict, workers=1):
+    """ Run the form workflows of the located raw odk exports, in worker processes when workers is above 1. Every
+    form workflow has finished when the function returns (step7 reads all of their outputs).
+
+            :param form_path_list: list object containing [raw odk file name, file path] of each located export.
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param input_dict: dictionary object (input name -> value or function returning the value) containing the
+            'reference_data' and 'property_index' inputs.
+            :param workers: integer object containing the number of worker processes (cmd_args_fn defined).
+            :return form_result_list: list object containing [raw odk file name, status, error] of each form. """
+
+    form_result_list = []
+
+    if workers > 1 and len(form_path_list) > 1:
+        # the forms read different exports and write different tables - fan them out to a process pool. The inputs
+        # the located forms require are resolved here and sent once to each worker (read only).
+        from concurrent.futures import ProcessPoolExecutor
+
+        name_list = sorted({name for file_name, _ in form_path_list for name in handler_fn(file_name)['input_list']})
+        shared_dict = {}
+        input_error_dict = {}
+        for name in name_list:
+            try:
+                shared_dict[name] = inputs_fn(input_dict, name)
+            except Exception as e:
+                # i.e. a missing pastoral estate shapefile - only the forms requiring the input fail.
+                traceback.print_exc()
+                input_error_dict[name] = '{0}: {1}'.format(type(e).__name__, e)
+
+        pool_path_list = []
+        for file_name, file_path in form_path_list:
+            error_list = [input_error_dict[name] for name in handler_fn(file_name)['input_list']
+                          if name in input_error_dict]
+            if error_list:
+                form_result_list.append([file_name, 'failed', error_list[0]])
+            else:
+                pool_path_list.append([file_name, file_path])
+
+        print('Processing ', len(pool_path_list), ' forms with ', min(workers, len(pool_path_list)),
+              ' workers..........')
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(pool_path_list))),
+                                 initializer=form_worker_init_fn,
+                                 initargs=(shared_dict, stage_monitor.SETTINGS)) as executor:
+            future_list = [executor.submit(form_pool_worker_fn, file_path, temp_dir, file_name)
+                           for file_name, file_path in pool_path_list]
+
+            # barrier - wait for every form workflow.
+            for (file_name, _), future in zip(pool_path_list, future_list):
+                try:
+                    form_result, record_list = future.result()
+                    form_result_list.append(form_result)
+                    # call the stage_monitor.py script - add the worker stage records to the end of run table.
+                    stage_monitor.merge_fn(record_list)
+                except Exception as e:
+                    # the worker process itself failed (i.e. terminated).
+                    form_result_list.append([file_name, 'failed', '{0}: {1}'.format(type(e).__name__, e)])
+
+    else:
+        for file_name, file_path in form_path_list:
+            form_result_list.append(form_worker_fn(file_path, temp_dir, file_name, input_dict))
+
+    # call the form_summary_fn function
+    form_summary_fn(form_result_list)
+
+    return form_result_list
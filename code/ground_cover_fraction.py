@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Ground layer cover fractions of every site, calculated from the whole clean star transect table in one pass.
+
+The site cover (litter, exposed, veg and site total) and vegetation fractions (pg, ag, pf and af) are carried as the
+field, adjusted and final values of step2_2_star_transect_basics.py. The ground layer figures of the observation sheet
+(fraction x final veg cover / 100) are column arithmetic, and the consistency checks are boolean columns of the same
+per site table, which step8_2 indexes into.
+"""
+
+# Import modules
+import numpy as np
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# site cover and vegetation fraction names (field_<name>, adj_<name> and final_<name> columns of the clean table).
+SITE_LIST = ['litter', 'exposed', 'veg', 'site_total']
+VEG_LIST = ['pg', 'ag', 'pf', 'af']
+
+# the site and vegetation fractions are expected to total 100 within this many percent (recorded to two decimals).
+TOTAL_TOLERANCE = 1.0
+
+# per site table name (step7 partitions it by site with the clean form tables).
+TABLE = 'ground_cover'
+
+
+def value_fn(df, column):
+    """ Read a cover column as numeric values, integer columns stay integer (a missing column is NaN).
+
+            :param df: pandas dataframe object containing the clean star transect table.
+            :param column: string object containing the column name.
+            :return: numpy array object containing numeric values. """
+
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+
+    return pd.to_numeric(df[column], errors='coerce').to_numpy()
+
+
+def fraction_fn(df):
+    """ Calculate the ground layer figures of every site.
+
+            :param df: pandas dataframe object containing the first clean star transect record of each site.
+            :return result_df: pandas dataframe object containing the field, adjusted and final values, the rounded
+            values (round_<name>) and the ground layer products (ground_field_<name> and ground_final_<name>). """
+
+    result_df = pd.DataFrame({'site': df['site'].to_numpy(dtype=object)})
+    result_df['rep_cover'] = df['rep_cover'].astype(str).to_numpy(dtype=object)
+    result_df['rep_veg'] = df['rep_veg'].astype(str).to_numpy(dtype=object)
+
+    for name in SITE_LIST + VEG_LIST:
+        for state in ('field', 'adj', 'final'):
+            result_df[state + '_' + name] = value_fn(df, state + '_' + name)
+
+    final_veg = result_df['final_veg'].to_numpy(dtype='float64')
+
+    for state in ('field', 'final'):
+        for name in VEG_LIST:
+            fraction = result_df[state + '_' + name].to_numpy(dtype='float64')
+            # the share of the site covered by the group (fraction of the vegetation x final veg cover).
+            result_df['ground_' + state + '_' + name] = np.round(fraction * final_veg / 100)
+            result_df['round_' + state + '_' + name] = np.round(fraction)
+
+        for name in ('veg', 'litter', 'exposed'):
+            result_df['round_' + state + '_' + name] = np.round(result_df[state + '_' + name].to_numpy(dtype='float64'))
+
+    return result_df
+
+
+def check_fn(result_df):
+    """ Add the consistency check masks to the per site table (True passes).
+
+            :param result_df: pandas dataframe object (fraction_fn defined).
+            :return result_df: pandas dataframe object with the representative, site_total_check, veg_total_check,
+            cover_select_check and veg_select_check columns. """
+
+    rep_cover = (result_df['rep_cover'] == 'representative').to_numpy()
+    rep_veg = (result_df['rep_veg'] == 'representative').to_numpy()
+    result_df['representative'] = rep_cover & rep_veg
+
+    site_total = result_df[['final_' + name for name in SITE_LIST[:3]]].to_numpy(dtype='float64').sum(axis=1)
+    result_df['site_total_check'] = np.abs(site_total - 100) <= TOTAL_TOLERANCE
+
+    veg_total = result_df[['final_' + name for name in VEG_LIST]].fillna(0).to_numpy(dtype='float64').sum(axis=1)
+    result_df['veg_total_check'] = np.abs(veg_total - 100) <= TOTAL_TOLERANCE
+
+    # the final value is the field value of a representative site and the adjusted value otherwise (the
+    # step2_2_star_transect_basics.field_adjusted_fn selection), annual forb is amended in step2_3.
+    for column, mask, name_list in (('cover_select_check', rep_cover, SITE_LIST),
+                                    ('veg_select_check', rep_veg, VEG_LIST[:3])):
+        field = result_df[['field_' + name for name in name_list]].to_numpy(dtype='float64')
+        adjusted = result_df[['adj_' + name for name in name_list]].to_numpy(dtype='float64')
+        final = result_df[['final_' + name for name in name_list]].to_numpy(dtype='float64')
+        expected = np.where(mask[:, None], field, adjusted)
+        result_df[column] = (np.isclose(final, expected) | (np.isnan(final) & np.isnan(expected))).all(axis=1)
+
+    return result_df
+
+
+def main_routine(star_df):
+    """ Calculate the ground layer cover fractions and consistency checks of every site.
+
+            :param star_df: pandas dataframe object containing the clean star transect table.
+            :return result_df: pandas dataframe object containing one record per site (fraction_fn and check_fn
+            defined). """
+
+    # the observation sheet is filled from the first record of a site.
+    df = star_df.dropna(subset=['site']).drop_duplicates('site')
+
+    result_df = check_fn(fraction_fn(df))
+
+    for column in ('site_total_check', 'veg_total_check', 'cover_select_check', 'veg_select_check'):
+        failed_list = result_df.loc[~result_df[column], 'site'].tolist()
+        if failed_list:
+            print('ERROR -- ', column, ' failed for ', len(failed_list), ' sites: ', failed_list[:10])
+
+    return result_df
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+import pandas as pd
+import warnings
+import column_mapping_engine
+
+warnings.filterwarnings("ignore")
+
+# the raw odk columns identifying a submission and its site.
+INSTANCE_COLUMN = 'meta:instanceID'
+SITE_COLUMN = 'GROUP_SITE:SITE_FINAL'
+
+
+def connect_fn(state_path):
+    """ Open (and create if required) the SQLite state store of processed submissions.
+
+            :param state_path: string object containing the path to the SQLite database file.
+            :return conn: sqlite3 connection object. """
+
+    state_dir = os.path.dirname(os.path.abspath(state_path))
+    if not os.path.exists(state_dir):
+        os.makedirs(state_dir)
+
+    conn = sqlite3.connect(state_path)
+    conn.execute('''CREATE TABLE IF NOT EXISTS processed (
+                        form TEXT NOT NULL,
+                        instance_id TEXT NOT NULL,
+                        row_hash TEXT NOT NULL,
+                        site TEXT,
+                        processed TEXT,
+                        PRIMARY KEY (form, instance_id))''')
+    conn.commit()
+
+    return conn
+
+
+def row_hash_fn(df):
+    """ Hash each raw odk row, so an edited submission is detected.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object containing the row hashes as strings. """
+
+    return pd.util.hash_pandas_object(df.astype(str), index=False).astype(str)
+
+
+def site_fn(df):
+    """ Clean the site name of each raw odk row the same way as the form workflows.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return: pandas series object containing the site names. """
+
+    return column_mapping_engine.string_clean_fn(df, SITE_COLUMN, 'upper')
+
+
+def changed_rows_fn(conn, form, df):
+    """ Identify the new or changed submissions of a form.
+
+            :param conn: sqlite3 connection object (connect_fn defined).
+            :param form: string object containing the raw odk file name (i.e. 'RMB_Basal_Sweep_results.csv').
+            :param df: pandas dataframe object containing the raw odk results.
+            :return state_df: pandas dataframe object containing the instance_id, row_hash, site and changed
+            (Boolean) fields of each raw row. """
+
+    state_df = pd.DataFrame({'instance_id': column_mapping_engine.string_fn(df, INSTANCE_COLUMN),
+                             'row_hash': row_hash_fn(df), 'site': site_fn(df)}, index=df.index)
+
+    stored_dict = dict(conn.execute('SELECT instance_id, row_hash FROM processed WHERE form = ?', (form,)))
+
+    state_df['changed'] = [stored_dict.get(instance_id) != row_hash for instance_id, row_hash
+                           in zip(state_df['instance_id'].tolist(), state_df['row_hash'].tolist())]
+
+    return state_df
+
+
+def record_fn(conn, form, state_df):
+    """ Record submissions as processed.
+
+            :param conn: sqlite3 connection object (connect_fn defined).
+            :param form: string object containing the raw odk file name.
+            :param state_df: pandas dataframe object containing the instance_id, row_hash and site fields
+            (changed_rows_fn defined). """
+
+    processed = str(datetime.now())
+    conn.executemany('INSERT OR REPLACE INTO processed (form, instance_id, row_hash, site, processed) '
+                     'VALUES (?, ?, ?, ?, ?)',
+                     [(form, instance_id, row_hash, site, processed) for instance_id, row_hash, site
+                      in zip(state_df['instance_id'].tolist(), state_df['row_hash'].tolist(),
+                             state_df['site'].tolist())])
+    conn.commit()
+
+
+def select_fn(conn, file_path_dict, temp_dir):
+    """ Write the raw odk rows of every site touched by a new or changed submission (of any form) to
+    temp_dir/incremental, so the form workflows only process those sites.
+
+            :param conn: sqlite3 connection object (connect_fn defined).
+            :param file_path_dict: dictionary object (raw odk file name -> raw odk file path) of the located forms.
+            :param temp_dir: string object path to the created output directory (date_time).
+            :return incremental_dir: string object containing the directory of the selected raw odk rows, forms
+            without a touched site are not written.
+            :return state_dict: dictionary object (raw odk file name -> changed_rows_fn output of the changed rows). """
+
+    raw_dict = {}
+    state_dict = {}
+    touched_site_set = set()
+
+    for form, file_path in file_path_dict.items():
+        df = pd.read_csv(file_path)
+        state_df = changed_rows_fn(conn, form, df)
+        touched_site_set.update(state_df.loc[state_df['changed'], 'site'].tolist())
+
+        raw_dict[form] = [df, state_df]
+        state_dict[form] = state_df[state_df['changed']]
+        print(form, ' - ', int(state_df['changed'].sum()), ' new or changed of ', len(df), ' submissions.')
+
+    incremental_dir = os.path.join(temp_dir, 'incremental')
+    if not os.path.exists(incremental_dir):
+        os.makedirs(incremental_dir)
+
+    for form, (df, state_df) in raw_dict.items():
+        # every submission of a touched site is processed again so the site sheets are complete.
+        site_mask = state_df['site'].isin(touched_site_set)
+        if site_mask.any():
+            df[site_mask.values].to_csv(os.path.join(incremental_dir, form), index=False)
+
+    # the star transect repeat group exports are keyed to the submissions (transect_repeat_reader.py), so they are
+    # copied whole - points of an unselected submission are not joined.
+    import transect_repeat_reader
+    dir_list = sorted(set(os.path.dirname(os.path.abspath(file_path)) for file_path in file_path_dict.values()))
+    for directory_odk in dir_list:
+        for file_path in transect_repeat_reader.repeat_file_fn(directory_odk).values():
+            shutil.copy(file_path, os.path.join(incremental_dir, os.path.basename(file_path)))
+
+    print('Incremental run - ', len(touched_site_set), ' sites touched: ', sorted(touched_site_set))
+
+    return incremental_dir, state_dict
+
+
+def commit_fn(conn, state_dict, site_result_list):
+    """ Record the changed submissions of every site that was processed successfully.
+
+            :param conn: sqlite3 connection object (connect_fn defined).
+            :param state_dict: dictionary object (raw odk file name -> changed rows) (select_fn defined).
+            :param site_result_list: list object containing the step7 site results (site directory, status, error and
+            the meta:instanceID values of the site), None records every changed submission. """
+
+    # the submissions of a failed site are matched on their meta:instanceID, the site folder name (i.e. DOR_RAS01)
+    # is not the raw site name of the state rows.
+    failed_instance_set = set()
+    if site_result_list is not None:
+        for _, status, _, instance_list in site_result_list:
+            if status != 'success':
+                failed_instance_set.update(instance_list)
+
+    for form, state_df in state_dict.items():
+        record_fn(conn, form, state_df[~state_df['instance_id'].isin(failed_instance_set)])
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# Import modules
+from __future__ import print_function, division
+import glob
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# Arrow IPC (feather v2) tables handed from the form workflows (steps 2 - 6) to the site workflow (step7), the csv
+# files written alongside them are exports only.
+EXTENSION = '.arrow'
+
+# string values the form workflows use to mark a missing value, stored as a true null.
+NULL_STRING_LIST = ['Nan', 'nan', '']
+
+
+def text_dtype_fn(dtype):
+    """ Determine if a column holds text (object or pandas string dtype).
+
+            :param dtype: pandas dtype object.
+            :return: Boolean object. """
+
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def string_column_fn(series):
+    """ Convert an object column to strings, with every missing value marker as a null.
+
+            :param series: pandas series object.
+            :return: pandas series object containing string values or None. """
+
+    null_mask = series.isna() | series.isin(NULL_STRING_LIST)
+
+    return series.astype(str).where(~null_mask, None)
+
+
+def numeric_column_fn(series):
+    """ Convert a text column to numbers when every value is numeric (i.e. cover fractions held as '32.0'), as the
+    previous csv hand-off inferred them.
+
+            :param series: pandas series object (string_column_fn converted).
+            :return: pandas series object containing float values, or the unchanged series. """
+
+    value_series = series.dropna()
+    if value_series.empty:
+        return series
+
+    numeric_series = pd.to_numeric(value_series, errors='coerce')
+    if numeric_series.isna().any():
+        return series
+
+    return pd.to_numeric(series, errors='coerce')
+
+
+def schema_fn(df):
+    """ Define the explicit arrow schema of a form table: numeric, Boolean and date columns keep their dtype and every
+    object (text or mixed) column is stored as a nullable string.
+
+            :param df: pandas dataframe object containing the clean form data (object columns string_column_fn
+            converted).
+            :return schema: pyarrow schema object. """
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+    for n, (column, dtype) in enumerate(df.dtypes.items()):
+        if text_dtype_fn(dtype):
+            schema = schema.set(n, pa.field(str(column), pa.string()))
+
+    return schema
+
+
+def write_fn(df, temp_dir, table):
+    """ Write a clean form table to the intermediate store.
+
+            :param df: pandas dataframe object containing the clean form data.
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param table: string object containing the table name (i.e. 'clean_star_transect').
+            :return output: string object containing the arrow file path. """
+
+    df = df.reset_index(drop=True)
+    df.columns = [str(column) for column in df.columns]
+
+    for column, dtype in df.dtypes.items():
+        if text_dtype_fn(dtype):
+            df[column] = numeric_column_fn(string_column_fn(df[column]))
+
+    arrow_table = pa.Table.from_pandas(df, schema=schema_fn(df), preserve_index=False)
+
+    output = (temp_dir + '\\' + table + EXTENSION)
+    # uncompressed so the table can be memory mapped when it is read.
+    feather.write_feather(arrow_table, output, compression='uncompressed')
+
+    return output
+
+
+def read_fn(file_path):
+    """ Read a clean form table from the intermediate store (memory mapped, no parsing or type inference).
+
+            :param file_path: string object containing the arrow file path.
+            :return: pandas dataframe object, missing values are null (NaN or None). """
+
+    return feather.read_table(file_path, memory_map=True).to_pandas()
+
+
+def main_routine(temp_dir):
+    """ Read every table of the intermediate store.
+
+            :param temp_dir: string object path to the created output directory (date_time).
+            :return table_list: list object containing the table names (i.e. 'clean_star_transect').
+            :return df_list: list object containing open pandas data frames. """
+
+    table_list = []
+    df_list = []
+
+    for file in sorted(glob.glob(temp_dir + '\\*' + EXTENSION)):
+        table_list.append(file.rsplit('\\', 1)[-1][:-len(EXTENSION)])
+        df_list.append(read_fn(file))
+
+    return table_list, df_list
@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Local stand-in for the ODK Aggregate transect table (formMultipleValue) pages, so the transect fetch path can be run
+offline:
+
+    python mock_odk_aggregate_server.py -d <directory> -o 8443
+
+<directory> must contain the raw RM_Star_Transect_results.csv and the '<SITE>_transect<N>.html' tables. Run the
+pipeline with -a http://localhost:8443 so the table urls in the star transect csv are sent to the mock server.
+
+The raw odk csv files (and <form>-<repeat>.csv repeat exports) in <directory> are also served as the OData feed of the
+forms at http://localhost:8443/v1/projects/1, for odata_pull_client.py. A submission date is taken from a SubmissionDate
+column, or is one minute after the previous row of the csv.
+
+The photo urls (view/binaryData?blobKey=...) of the raw odk csv files are answered with a small JPEG unique to the
+blobKey, with Content-Length and ETag headers (GET and HEAD), for photo_download_client.py.
+"""
+
+# Import modules
+import os
+import re
+import csv
+import json
+import base64
+import hashlib
+import argparse
+import urllib.parse
+import http.server
+from datetime import datetime, timedelta
+import warnings
+import form_handler_registry
+import odata_pull_client
+
+warnings.filterwarnings("ignore")
+
+# submission date of the first row of a csv without a SubmissionDate column.
+FIRST_SUBMISSION_DATE = datetime(2021, 1, 1)
+
+# OData table path (i.e. /v1/projects/1/forms/RMB_STAR_TRANSECT.svc/Submissions.REPEAT_points_1).
+ODATA_PATTERN = re.compile(r'/forms/([^/]+)\.svc/(Submissions(?:\.[A-Za-z0-9_]+)?)$')
+FIELDS_PATTERN = re.compile(r'/forms/([^/]+)/fields$')
+FILTER_PATTERN = re.compile(r'submissionDate (ge|gt) (\S+)')
+
+# a 1 x 1 pixel greyscale JPEG (less the start of image marker), served for every photo blobKey.
+JPEG_BODY = base64.b64decode(
+    '/+AAEEpGSUYAAQEBAEgASAAA/9sAQwD/////////////////////////////////////////////////////////////////////////////'
+    '/////////8IACwgAAQABAQERAP/EABQQAQAAAAAAAAAAAAAAAAAAAAD/2gAIAQEAAT8Q') + b'\xff\xd9'
+
+
+def cmd_args_fn():
+    p = argparse.ArgumentParser(description='''Serve saved star transect tables as a mock ODK Aggregate.''')
+
+    p.add_argument('-d', '--directory_odk', help='The directory containing the star transect csv and html tables.',
+                   default=os.getcwd())
+    p.add_argument('-o', '--port', help='Port number.', type=int, default=8443)
+    p.add_argument('-u', '--odk_user', help='ODK Aggregate user name.', default='odktest')
+    p.add_argument('-i', '--odk_password', help='ODK Aggregate password.', default='odktest')
+
+    cmd_args = p.parse_args()
+
+    return cmd_args
+
+
+def table_index_fn(directory_odk):
+    """ Map the form uuid of each star transect record to its site name.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :return table_index: dictionary object (uuid -> site). """
+
+    table_index = {}
+    if not os.path.isfile(os.path.join(directory_odk, 'RM_Star_Transect_results.csv')):
+        return table_index
+
+    with open(os.path.join(directory_odk, 'RM_Star_Transect_results.csv')) as f:
+        for row in csv.DictReader(f):
+            site = row['GROUP_SITE:SITE_FINAL'].replace('_', ' ').replace('-', ' ').upper().strip()
+            uuid = row['meta:instanceID'].replace('uuid:', '')
+            table_index[uuid] = site
+
+    return table_index
+
+
+def photo_index_fn(directory_odk):
+    """ Collect the photo blobKeys of the raw odk csv files (and repeat exports) in the directory.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :return photo_index: set object containing the blobKey of every photo url. """
+
+    photo_index = set()
+
+    for file_name in sorted(os.listdir(directory_odk)):
+        if not file_name.endswith('.csv'):
+            continue
+        with open(os.path.join(directory_odk, file_name)) as f:
+            for row in csv.reader(f):
+                for value in row:
+                    parts = urllib.parse.urlsplit(value)
+                    if parts.path.endswith('/view/binaryData'):
+                        photo_index.update(urllib.parse.parse_qs(parts.query).get('blobKey', []))
+
+    return photo_index
+
+
+def photo_body_fn(blob_key):
+    """ Create the JPEG of a photo, the blobKey is written to a comment segment so every photo differs.
+
+            :param blob_key: string object containing the photo blobKey.
+            :return: bytes object containing the JPEG. """
+
+    comment = blob_key.encode('utf-8')[:65000]
+
+    return b'\xff\xd8\xff\xfe' + (len(comment) + 2).to_bytes(2, 'big') + comment + JPEG_BODY
+
+
+def nested_record_fn(row):
+    """ Convert a raw odk csv row (group:field columns) to a nested OData record, geopoints as GeoJSON.
+
+            :param row: dictionary object (column name -> value).
+            :return record: dictionary object. """
+
+    record = {}
+    for column, value in row.items():
+        group = record
+        name_list = column.split(':')
+        for name in name_list[:-1]:
+            group = group.setdefault(name, {})
+        group[name_list[-1]] = value if value != '' else None
+
+    def geopoint_fn(group):
+        for name, value in group.items():
+            if isinstance(value, dict) and sorted(value) == sorted(odata_pull_client.GEOPOINT_LIST):
+                if value['Latitude'] is None:
+                    group[name] = None
+                else:
+                    coordinate_list = [float(value['Longitude']), float(value['Latitude'])]
+                    if value['Altitude'] is not None:
+                        coordinate_list.append(float(value['Altitude']))
+                    accuracy = float(value['Accuracy']) if value['Accuracy'] is not None else None
+                    group[name] = {'type': 'Point', 'coordinates': coordinate_list,
+                                   'properties': {'accuracy': accuracy}}
+            elif isinstance(value, dict):
+                geopoint_fn(value)
+
+    geopoint_fn(record)
+
+    return record
+
+
+def odata_index_fn(directory_odk):
+    """ Build the OData tables of every form export in the directory.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :return odata_index: dictionary object (form id -> table name -> list of [submission date, record], and
+            'fields' -> form schema geopoint fields). """
+
+    odata_index = {}
+
+    for handler in form_handler_registry.HANDLER_LIST:
+        file_path = os.path.join(directory_odk, handler['file_name'])
+        if not os.path.isfile(file_path):
+            continue
+
+        table_dict = {'Submissions': []}
+        date_dict = {}
+        with open(file_path) as f:
+            for n, row in enumerate(csv.DictReader(f)):
+                date = row.pop('SubmissionDate', None) or \
+                    (FIRST_SUBMISSION_DATE + timedelta(minutes=n)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+                instance_id = row.get('meta:instanceID')
+                # a repeat group is a link to its own table, as ODK Central.
+                row = dict((column + odata_pull_client.NAVIGATION_SUFFIX, "Submissions('" + instance_id + "')/" +
+                            column) if column in handler['repeat_list'] else (column, value)
+                           for column, value in row.items())
+
+                record = {'__id': instance_id, '__system': {'submissionDate': date}}
+                record.update(nested_record_fn(row))
+                table_dict['Submissions'].append([date, record])
+                date_dict[instance_id] = date
+
+        for repeat in handler['repeat_list']:
+            repeat_path = os.path.join(directory_odk, odata_pull_client.repeat_file_name_fn(handler, repeat))
+            table_dict['Submissions.' + repeat] = repeat_list = []
+            if not os.path.isfile(repeat_path):
+                continue
+            with open(repeat_path) as f:
+                for row in csv.DictReader(f):
+                    parent_key, key = row.pop('PARENT_KEY'), row.pop('KEY')
+                    record = {'__id': key, odata_pull_client.PARENT_COLUMN: parent_key}
+                    record.update(nested_record_fn(row))
+                    # a repeat record is filtered on the submission date of its submission.
+                    repeat_list.append([date_dict.get(parent_key, ''), record])
+
+        for table, record_list in table_dict.items():
+            record_list.sort(key=lambda date_record: date_record[0])
+
+        # the form schema lists the geopoints (the four :Latitude, :Longitude, :Altitude and :Accuracy columns).
+        with open(file_path) as f:
+            column_list = next(csv.reader(f))
+        table_dict['fields'] = [{'path': '/' + column[:-len(':Latitude')].replace(':', '/'), 'type': 'geopoint'}
+                                for column in column_list if column.endswith(':Latitude')]
+
+        odata_index[handler['form_id']] = table_dict
+
+    return odata_index
+
+
+def odata_page_fn(odata_index, form_id, table, query):
+    """ Select an OData page ($top, $skip, $count and a submissionDate ge/gt $filter are supported).
+
+            :param odata_index: dictionary object (odata_index_fn defined).
+            :param form_id: string object containing the ODK form id.
+            :param table: string object containing the table name.
+            :param query: string object containing the url query.
+            :return: dictionary object containing the page, None if the table does not exist. """
+
+    record_list = odata_index.get(form_id, {}).get(table)
+    if record_list is None:
+        return None
+
+    query_dict = dict((name, value_list[0]) for name, value_list in urllib.parse.parse_qs(query).items())
+
+    match = FILTER_PATTERN.search(query_dict.get('$filter', ''))
+    if match:
+        if match.group(1) == 'ge':
+            record_list = [[date, record] for date, record in record_list if date >= match.group(2)]
+        else:
+            record_list = [[date, record] for date, record in record_list if date > match.group(2)]
+
+    skip = int(query_dict.get('$skip', 0))
+    top = int(query_dict.get('$top', len(record_list)))
+    page = {'@odata.context': form_id + '.svc/$metadata#' + table,
+            'value': [record for _, record in record_list[skip:skip + top]]}
+    if query_dict.get('$count') == 'true':
+        page['@odata.count'] = len(record_list)
+
+    return page
+
+
+def handler_fn(directory_odk, table_index, user, password, odata_index=None, photo_index=None):
+    """ Create the request handler class serving the transect tables.
+
+            :param directory_odk: string object containing the directory path to the saved html tables.
+            :param table_index: dictionary object (uuid -> site) (table_index_fn defined).
+            :param user: string object containing the accepted user name.
+            :param password: string object containing the accepted password.
+            :param odata_index: dictionary object containing the OData tables (odata_index_fn defined), None serves
+            no OData feed.
+            :param photo_index: set object containing the photo blobKeys (photo_index_fn defined), None serves no
+            photos.
+            :return: http.server request handler class. """
+
+    token = 'Basic ' + base64.b64encode((user + ':' + password).encode('utf-8')).decode('ascii')
+
+    class MockAggregateHandler(http.server.BaseHTTPRequestHandler):
+        # keep-alive, as ODK Aggregate.
+        protocol_version = 'HTTP/1.1'
+
+        def send_body(self, status, body, content_type='text/html; charset=UTF-8', etag=None):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            if etag:
+                self.send_header('ETag', etag)
+            if status == 401:
+                self.send_header('WWW-Authenticate', 'Basic realm="ODK Aggregate"')
+            self.end_headers()
+            # a HEAD request is answered with the headers of the GET request only.
+            if self.command != 'HEAD':
+                self.wfile.write(body)
+
+        def do_GET(self):
+            if self.headers.get('Authorization') != token:
+                return self.send_body(401, b'Unauthorized')
+
+            parts = urllib.parse.urlsplit(self.path)
+
+            fields_match = FIELDS_PATTERN.search(parts.path)
+            if fields_match and odata_index is not None and urllib.parse.unquote(fields_match.group(1)) in odata_index:
+                field_list = odata_index[urllib.parse.unquote(fields_match.group(1))]['fields']
+                return self.send_body(200, json.dumps(field_list).encode('utf-8'), 'application/json')
+
+            odata_match = ODATA_PATTERN.search(parts.path)
+            if odata_match and odata_index is not None:
+                page = odata_page_fn(odata_index, urllib.parse.unquote(odata_match.group(1)), odata_match.group(2),
+                                     parts.query)
+                if page is not None:
+                    return self.send_body(200, json.dumps(page).encode('utf-8'), 'application/json')
+
+            blob_key = urllib.parse.parse_qs(parts.query).get('blobKey', [''])[0]
+            if parts.path.endswith('/view/binaryData') and photo_index is not None and blob_key in photo_index:
+                body = photo_body_fn(blob_key)
+                return self.send_body(200, body, 'image/jpeg', '"' + hashlib.md5(body).hexdigest() + '"')
+
+            form_id = urllib.parse.parse_qs(parts.query).get('formId', [''])[0]
+            match = re.search(r'uuid:([0-9a-fA-F-]+)\].*REPEAT_points_(\d)', form_id)
+
+            if parts.path.endswith('/view/formMultipleValue') and match and match.group(1) in table_index:
+                html = os.path.join(directory_odk, table_index[match.group(1)] + '_transect' + match.group(2) +
+                                    '.html')
+                if os.path.isfile(html):
+                    with open(html, 'rb') as f:
+                        return self.send_body(200, f.read())
+
+            return self.send_body(404, b'Not found')
+
+        do_HEAD = do_GET
+
+    return MockAggregateHandler
+
+
+def main_routine():
+    cmd_args = cmd_args_fn()
+
+    table_index = table_index_fn(cmd_args.directory_odk)
+    odata_index = odata_index_fn(cmd_args.directory_odk)
+    photo_index = photo_index_fn(cmd_args.directory_odk)
+    handler = handler_fn(cmd_args.directory_odk, table_index, cmd_args.odk_user, cmd_args.odk_password, odata_index,
+                         photo_index)
+
+    server = http.server.ThreadingHTTPServer(('localhost', cmd_args.port), handler)
+    print('Mock ODK Aggregate serving ', len(table_index), ' star transect records at http://localhost:',
+          cmd_args.port)
+    print('OData feed of ', len(odata_index), ' forms at http://localhost:', cmd_args.port, '/v1/projects/1')
+    print('Serving ', len(photo_index), ' photos')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,457 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Pull the submissions and repeat groups of the five RMB forms over the ODK server OData feed, in place of the manual
+csv export into the raw odk directory:
+
+    python odata_pull_client.py -d <directory_odk> -b https://<host>/v1/projects/<project id>
+
+The feed is paged ($top / $skip) and the pages of a form are requested concurrently. Submissions are appended to the
+raw odk csv of the form (<form>_results.csv, the ODK Aggregate column layout read by the form workflows) and the repeat
+groups are written as <form>-<repeat>.csv repeat exports (read by transect_repeat_reader.py). The last submission date
+and instanceIDs pulled for each form are kept in odata_pull_state.json, so the next pull only requests newer
+submissions. Run mock_odk_aggregate_server.py for a local stand-in of the feed.
+"""
+
+# Import modules
+import os
+import json
+import time
+import argparse
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import warnings
+import form_handler_registry
+import photo_download_client
+import stage_monitor
+import transect_table_fetcher
+
+warnings.filterwarnings("ignore")
+
+PULL_WORKERS = 4
+PULL_PAGE_SIZE = 500
+PULL_RETRIES = 3
+PULL_BACKOFF = 1.0
+PULL_TIMEOUT = 60
+
+STATE_NAME = 'odata_pull_state.json'
+
+INSTANCE_COLUMN = 'meta:instanceID'
+PARENT_COLUMN = '__Submissions-id'
+NAVIGATION_SUFFIX = '@odata.navigationLink'
+
+# the four columns of a geopoint in the ODK Aggregate csv layout, in column order.
+GEOPOINT_LIST = ['Latitude', 'Longitude', 'Altitude', 'Accuracy']
+
+
+def cmd_args_fn():
+    p = argparse.ArgumentParser(description='''Pull the RMB form submissions over the ODK server OData feed.''')
+
+    p.add_argument('-d', '--directory_odk', help='The directory the raw odk csv files are written to.',
+                   default=os.getcwd())
+    p.add_argument('-b', '--base_url', help='OData project url (i.e. https://<host>/v1/projects/1).', required=True)
+    p.add_argument('-u', '--odk_user', help='ODK user name.', default='odktest')
+    p.add_argument('-i', '--odk_password', help='ODK password.', default='odktest')
+    p.add_argument('-w', '--workers', help='Number of concurrent page requests.', type=int, default=PULL_WORKERS)
+    p.add_argument('-z', '--page_size', help='Number of submissions per page.', type=int, default=PULL_PAGE_SIZE)
+
+    cmd_args = p.parse_args()
+
+    return cmd_args
+
+
+def repeat_file_name_fn(handler, repeat):
+    """ Create the file name of a repeat export (i.e. RM_Star_Transect-REPEAT_points_1.csv).
+
+            :param handler: dictionary object (form_handler_registry.HANDLER_LIST element).
+            :param repeat: string object containing the repeat group name.
+            :return: string object containing the repeat export file name. """
+
+    return handler['file_name'].replace('_results.csv', '') + '-' + repeat + '.csv'
+
+
+def table_url_fn(base_url, form_id, table, query_dict):
+    """ Create the url of an OData table page.
+
+            :param base_url: string object containing the OData project url.
+            :param form_id: string object containing the ODK form id.
+            :param table: string object containing the table name ('Submissions' or 'Submissions.<repeat>').
+            :param query_dict: dictionary object containing the OData query options.
+            :return: string object containing the url. """
+
+    return (base_url.rstrip('/') + '/forms/' + urllib.parse.quote(form_id) + '.svc/' + table + '?' +
+            urllib.parse.urlencode(query_dict, quote_via=urllib.parse.quote))
+
+
+def get_json_fn(url, headers, retries, backoff, timeout):
+    """ Request an OData page, retrying with an exponential backoff.
+
+            :param url: string object containing the page url.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param retries: integer object containing the number of attempts.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return: dictionary object containing the decoded page. """
+
+    error = None
+    for attempt in range(retries):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            response, connection_key = photo_download_client.request_fn('GET', url, headers, timeout)
+            try:
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                photo_download_client.drop_connection_fn(*connection_key)
+                raise
+            if response.status == 200:
+                return json.loads(body.decode('utf-8'))
+            error = http.client.HTTPException('HTTP {0} {1}: {2}'.format(response.status, response.reason, url))
+            if response.status < 500 and response.status != 429:
+                # i.e. 401 or 404 - retrying will not help.
+                break
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            error = e
+
+    raise error
+
+
+def table_pull_fn(base_url, form_id, table, filter_string, headers, workers, page_size, retries, backoff, timeout):
+    """ Pull every record of an OData table: the first page returns the record count, the other pages are requested
+    concurrently.
+
+            :param base_url: string object containing the OData project url.
+            :param form_id: string object containing the ODK form id.
+            :param table: string object containing the table name ('Submissions' or 'Submissions.<repeat>').
+            :param filter_string: string object containing the OData $filter, None pulls every record.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param workers: integer object containing the number of concurrent page requests.
+            :param page_size: integer object containing the number of records per page.
+            :param retries: integer object containing the number of attempts per page.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return record_list: list object containing the records (dictionaries) in server order. """
+
+    def page_url_fn(skip, count=False):
+        # oldest first, so a submission received during the pull is added to the last page and the pages requested
+        # concurrently do not shift.
+        query_dict = {'$top': page_size, '$skip': skip, '$orderby': '__system/submissionDate asc'}
+        if count:
+            query_dict['$count'] = 'true'
+        if filter_string:
+            query_dict['$filter'] = filter_string
+        return table_url_fn(base_url, form_id, table, query_dict)
+
+    first_page = get_json_fn(page_url_fn(0, True), headers, retries, backoff, timeout)
+    record_list = list(first_page.get('value', []))
+    total = int(first_page.get('@odata.count', len(record_list)))
+
+    skip_list = list(range(page_size, total, page_size))
+    if skip_list:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            future_list = [executor.submit(get_json_fn, page_url_fn(skip), headers, retries, backoff, timeout)
+                           for skip in skip_list]
+            for future in future_list:
+                record_list.extend(future.result().get('value', []))
+
+    return record_list
+
+
+def geopoint_set_fn(base_url, form_id, headers, retries, backoff, timeout):
+    """ Read the geopoint fields of a form from the server form schema, so a geopoint that is empty in a submission
+    still fills its four csv columns.
+
+            :param base_url: string object containing the OData project url.
+            :param form_id: string object containing the ODK form id.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param retries: integer object containing the number of attempts.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return: set object containing the geopoint column names (i.e. 'CENTRE_GPS1'). """
+
+    url = base_url.rstrip('/') + '/forms/' + urllib.parse.quote(form_id) + '/fields?odata=true'
+    try:
+        field_list = get_json_fn(url, headers, retries, backoff, timeout)
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        # without the schema a geopoint is recognised by its GeoJSON value.
+        print('Form fields of ', form_id, ' could not be read: ', e)
+        field_list = []
+
+    return set(field['path'].strip('/').replace('/', ':') for field in field_list if field.get('type') == 'geopoint')
+
+
+def flatten_fn(record, base_url, geopoint_set, prefix='', flat_dict=None):
+    """ Flatten an OData record into the ODK Aggregate csv columns (group:field, geopoint:Latitude etc.).
+
+            :param record: dictionary object containing the OData record.
+            :param base_url: string object containing the OData project url (repeat group links are made absolute).
+            :param geopoint_set: set object containing the geopoint column names (geopoint_set_fn defined).
+            :param prefix: string object containing the column name prefix of the enclosing group.
+            :param flat_dict: dictionary object the columns are added to.
+            :return flat_dict: dictionary object (column name -> value). """
+
+    if flat_dict is None:
+        flat_dict = {}
+
+    for name, value in record.items():
+        if name.endswith(NAVIGATION_SUFFIX):
+            # a repeat group - the column holds the link to its records (as the ODK Aggregate export).
+            flat_dict[prefix + name[:-len(NAVIGATION_SUFFIX)]] = base_url.rstrip('/') + '/' + value
+        elif name.startswith('__') or '@' in name:
+            continue
+        elif prefix + name in geopoint_set or (isinstance(value, dict) and value.get('type') == 'Point'):
+            value = value or {}
+            coordinate_list = list(value.get('coordinates') or []) + [None, None, None]
+            accuracy = (value.get('properties') or {}).get('accuracy')
+            for field, point_value in zip(GEOPOINT_LIST, [coordinate_list[1], coordinate_list[0], coordinate_list[2],
+                                                          accuracy]):
+                flat_dict[prefix + name + ':' + field] = point_value
+        elif isinstance(value, dict):
+            flatten_fn(value, base_url, geopoint_set, prefix + name + ':', flat_dict)
+        else:
+            flat_dict[prefix + name] = value
+
+    return flat_dict
+
+
+def submission_frame_fn(record_list, base_url, geopoint_set, column_list):
+    """ Convert the submission records to the raw odk csv layout.
+
+            :param record_list: list object containing the submission records.
+            :param base_url: string object containing the OData project url.
+            :param geopoint_set: set object containing the geopoint column names (geopoint_set_fn defined).
+            :param column_list: list object containing the columns of the existing export (kept first, in order).
+            :return: pandas dataframe object. """
+
+    flat_list = [flatten_fn(record, base_url, geopoint_set) for record in record_list]
+
+    column_list = list(column_list)
+    column_set = set(column_list)
+    for flat_dict in flat_list:
+        for column in flat_dict:
+            if column not in column_set:
+                column_list.append(column)
+                column_set.add(column)
+
+    return pd.DataFrame(flat_list, columns=column_list)
+
+
+def repeat_frame_fn(record_list, repeat, geopoint_set, column_list):
+    """ Convert the repeat group records to the ODK Briefcase repeat export layout (PARENT_KEY and KEY columns).
+
+            :param record_list: list object containing the repeat group records.
+            :param repeat: string object containing the repeat group name.
+            :param geopoint_set: set object containing the geopoint column names (geopoint_set_fn defined).
+            :param column_list: list object containing the columns of the existing repeat export.
+            :return: pandas dataframe object. """
+
+    # the repeat records are flattened relative to the repeat group.
+    geopoint_set = set(column[len(repeat) + 1:] for column in geopoint_set if column.startswith(repeat + ':'))
+    df = submission_frame_fn(record_list, '', geopoint_set,
+                             [column for column in column_list if column not in ('PARENT_KEY', 'KEY')])
+
+    parent_series = pd.Series([record.get(PARENT_COLUMN) for record in record_list], index=df.index, dtype=object)
+    # the repeat instance number counts the records of each submission, in server order.
+    point_series = parent_series.groupby(parent_series).cumcount() + 1
+    df['PARENT_KEY'] = parent_series
+    df['KEY'] = parent_series + '/' + repeat + '[' + point_series.astype(str) + ']'
+
+    return df
+
+
+def read_state_fn(state_path):
+    """ Read the pull state of the raw odk directory.
+
+            :param state_path: string object containing the state file path.
+            :return state_dict: dictionary object (form id -> {'submission_date', 'instance_list'}). """
+
+    if not os.path.isfile(state_path):
+        return {}
+
+    try:
+        with open(state_path) as f:
+            state_dict = json.load(f)
+    except ValueError:
+        print('OData pull state could not be read, every submission will be pulled: ', state_path)
+        state_dict = {}
+
+    return state_dict
+
+
+def write_state_fn(state_path, state_dict):
+    """ Write the pull state of the raw odk directory.
+
+            :param state_path: string object containing the state file path.
+            :param state_dict: dictionary object (form id -> {'submission_date', 'instance_list'}). """
+
+    with open(state_path + '.part', 'w') as f:
+        json.dump(state_dict, f, indent=2, sort_keys=True)
+    os.replace(state_path + '.part', state_path)
+
+
+def append_export_fn(file_path, df, key_column):
+    """ Append pulled records to a raw odk export, a record already in the export is replaced.
+
+            :param file_path: string object containing the export file path.
+            :param df: pandas dataframe object containing the pulled records.
+            :param key_column: string object containing the record key column.
+            :return: integer object containing the number of records in the export. """
+
+    if os.path.isfile(file_path):
+        export_df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+        export_df = export_df[~export_df[key_column].isin(df[key_column])]
+        df = pd.concat([export_df, df], ignore_index=True)
+
+    df.to_csv(file_path + '.part', index=False)
+    os.replace(file_path + '.part', file_path)
+
+    return len(df)
+
+
+def form_pull_fn(handler, directory_odk, base_url, form_state, headers, workers, page_size, retries, backoff,
+                 timeout):
+    """ Pull the new submissions and repeat group records of a form.
+
+            :param handler: dictionary object (form_handler_registry.HANDLER_LIST element).
+            :param directory_odk: string object containing the raw odk directory.
+            :param base_url: string object containing the OData project url.
+            :param form_state: dictionary object containing the 'submission_date' and 'instance_list' of the last pull.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param workers: integer object containing the number of concurrent page requests.
+            :param page_size: integer object containing the number of records per page.
+            :param retries: integer object containing the number of attempts per page.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return form_state: dictionary object containing the updated pull state of the form.
+            :return pull_result: list object containing the file name and the number of new submissions. """
+
+    form_id = handler['form_id']
+    submission_date = form_state.get('submission_date')
+    seen_set = set(form_state.get('instance_list', []))
+
+    # submissions sharing the last submission date are requested again and dropped by instanceID.
+    filter_string = '__system/submissionDate ge ' + submission_date if submission_date else None
+    record_list = table_pull_fn(base_url, form_id, 'Submissions', filter_string, headers, workers, page_size,
+                                retries, backoff, timeout)
+    record_list = [record for record in record_list if record.get('__id') not in seen_set]
+
+    if not record_list:
+        return form_state, [handler['file_name'], 0]
+
+    geopoint_set = geopoint_set_fn(base_url, form_id, headers, retries, backoff, timeout)
+
+    file_path = os.path.join(directory_odk, handler['file_name'])
+    column_list = pd.read_csv(file_path, nrows=0).columns.tolist() if os.path.isfile(file_path) else []
+    df = submission_frame_fn(record_list, base_url, geopoint_set, column_list)
+    if INSTANCE_COLUMN not in df.columns:
+        df[INSTANCE_COLUMN] = [record.get('__id') for record in record_list]
+
+    instance_set = set(record.get('__id') for record in record_list)
+    for repeat in handler['repeat_list']:
+        repeat_filter = '$root/Submission/__system/submissionDate ge ' + submission_date if submission_date else None
+        repeat_list = table_pull_fn(base_url, form_id, 'Submissions.' + repeat, repeat_filter, headers, workers,
+                                    page_size, retries, backoff, timeout)
+        repeat_list = [record for record in repeat_list if record.get(PARENT_COLUMN) in instance_set]
+
+        repeat_path = os.path.join(directory_odk, repeat_file_name_fn(handler, repeat))
+        repeat_column_list = pd.read_csv(repeat_path, nrows=0).columns.tolist() if os.path.isfile(repeat_path) \
+            else []
+        repeat_df = repeat_frame_fn(repeat_list, repeat, geopoint_set, repeat_column_list)
+        # the repeat records are written before the submissions, so an interrupted pull is pulled again.
+        append_export_fn(repeat_path, repeat_df, 'KEY')
+
+    append_export_fn(file_path, df, INSTANCE_COLUMN)
+
+    date_list = [(record.get('__system') or {}).get('submissionDate') for record in record_list]
+    last_date = max([date for date in date_list if date] + ([submission_date] if submission_date else []),
+                    default=None)
+
+    instance_set = set(record.get('__id') for record, date in zip(record_list, date_list) if date == last_date)
+    instance_list = sorted(instance_set.union(seen_set) if last_date == submission_date else instance_set)
+
+    return {'submission_date': last_date, 'instance_list': instance_list}, [handler['file_name'], len(record_list)]
+
+
+@stage_monitor.monitor_fn
+def main_routine(directory_odk, base_url, odk_aggregate=None, workers=PULL_WORKERS, page_size=PULL_PAGE_SIZE,
+                 retries=PULL_RETRIES, backoff=PULL_BACKOFF, timeout=PULL_TIMEOUT):
+    """ Pull the new submissions of every registered form into the raw odk directory.
+
+            :param directory_odk: string object containing the raw odk directory (cmd_args_fn defined).
+            :param base_url: string object containing the OData project url (i.e. https://<host>/v1/projects/1).
+            :param odk_aggregate: dictionary object containing the ODK 'user' and 'password' (cmd_args_fn defined),
+            None uses the default account.
+            :param workers: integer object containing the number of concurrent page requests.
+            :param page_size: integer object containing the number of submissions per page.
+            :param retries: integer object containing the number of attempts per page.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return pull_result_list: list object containing [file name, new submissions, status, error] list
+            elements. """
+
+    print('odata_pull_client.py INITIATED.')
+
+    if not os.path.exists(directory_odk):
+        os.makedirs(directory_odk)
+
+    odk_aggregate = odk_aggregate or {}
+    headers = transect_table_fetcher.auth_header_fn(
+        odk_aggregate.get('user') or transect_table_fetcher.ODK_AGGREGATE_USER,
+        odk_aggregate.get('password') or transect_table_fetcher.ODK_AGGREGATE_PASSWORD)
+    headers['Accept'] = 'application/json'
+
+    state_path = os.path.join(directory_odk, STATE_NAME)
+    state_dict = read_state_fn(state_path)
+
+    pull_result_list = []
+    try:
+        for handler in form_handler_registry.HANDLER_LIST:
+            try:
+                form_state, pull_result = form_pull_fn(
+                    handler, directory_odk, base_url, state_dict.get(handler['form_id'], {}), headers, workers,
+                    page_size, retries, backoff, timeout)
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                # the form keeps its pull state and is pulled again on the next run.
+                pull_result_list.append([handler['file_name'], 0, 'failed', '{0}: {1}'.format(type(e).__name__, e)])
+                continue
+
+            state_dict[handler['form_id']] = form_state
+            write_state_fn(state_path, state_dict)
+            stage_monitor.count_fn(rows=pull_result[1])
+            pull_result_list.append(pull_result + ['success', ''])
+    finally:
+        photo_download_client.close_connections_fn()
+
+    for file_name, count, status, error in pull_result_list:
+        print(' - ', file_name, ': ', count, ' new submissions' if status == 'success' else ' pull failed ' + error)
+
+    print('odata_pull_client.py COMPLETED.')
+
+    return pull_result_list
+
+
+if __name__ == '__main__':
+    cmd_args = cmd_args_fn()
+    main_routine(cmd_args.directory_odk, cmd_args.base_url, {'user': cmd_args.odk_user,
+                                                             'password': cmd_args.odk_password},
+                 cmd_args.workers, cmd_args.page_size)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import json
+import time
+import threading
+import http.client
+import urllib.parse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# default number of concurrent downloads, attempts per photo and the first retry delay (seconds, doubled per retry).
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 1.0
+DOWNLOAD_TIMEOUT = 60
+
+MANIFEST_NAME = 'photo_manifest.json'
+
+# one keep-alive connection per host for each download thread (see get_connection_fn).
+THREAD_CONNECTIONS = threading.local()
+CONNECTION_LIST = []
+CONNECTION_LOCK = threading.Lock()
+
+
+def get_connection_fn(scheme, netloc, timeout):
+    """ Return the open keep-alive connection of the current thread for a host, creating it if required.
+
+            :param scheme: string object containing the url scheme (http or https).
+            :param netloc: string object containing the url host (and port).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return connection: http.client connection object. """
+
+    if not hasattr(THREAD_CONNECTIONS, 'connection_dict'):
+        THREAD_CONNECTIONS.connection_dict = {}
+
+    key = (scheme, netloc)
+    connection = THREAD_CONNECTIONS.connection_dict.get(key)
+    if connection is None:
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(netloc, timeout=timeout)
+        else:
+            connection = http.client.HTTPConnection(netloc, timeout=timeout)
+        THREAD_CONNECTIONS.connection_dict[key] = connection
+        with CONNECTION_LOCK:
+            CONNECTION_LIST.append(connection)
+
+    return connection
+
+
+def drop_connection_fn(scheme, netloc):
+    """ Close and forget the connection of the current thread for a host (i.e. after a failed request).
+
+            :param scheme: string object containing the url scheme (http or https).
+            :param netloc: string object containing the url host (and port). """
+
+    connection_dict = getattr(THREAD_CONNECTIONS, 'connection_dict', {})
+    connection = connection_dict.pop((scheme, netloc), None)
+    if connection is not None:
+        connection.close()
+
+
+def close_connections_fn():
+    """ Close every connection opened by the download threads. """
+
+    with CONNECTION_LOCK:
+        for connection in CONNECTION_LIST:
+            connection.close()
+        del CONNECTION_LIST[:]
+
+
+def request_fn(method, url, headers, timeout, redirects=5):
+    """ Send a request over the pooled connection, following redirects.
+
+            :param method: string object containing the http method (GET or HEAD).
+            :param url: string object containing the photo url.
+            :param headers: dictionary object containing the request headers.
+            :param timeout: integer object containing the socket timeout (seconds).
+            :param redirects: integer object containing the maximum number of redirects followed.
+            :return response: http.client response object, the body has not been read.
+            :return connection_key: list object containing the scheme and host of the connection used. """
+
+    for _ in range(redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = path + '?' + parts.query
+
+        connection = get_connection_fn(parts.scheme, parts.netloc, timeout)
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            # a kept-alive connection may have been closed by the server - drop it so a retry reconnects.
+            drop_connection_fn(parts.scheme, parts.netloc)
+            raise
+
+        if response.status in (301, 302, 303, 307, 308) and response.getheader('Location'):
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader('Location'))
+            continue
+
+        return response, [parts.scheme, parts.netloc]
+
+    raise http.client.HTTPException('Too many redirects: ' + url)
+
+
+def remote_matches_fn(url, output_path, manifest_record, headers, timeout):
+    """ Check (HEAD request) if the file already on disk matches the remote photo by ETag or size.
+
+            :param url: string object containing the photo url.
+            :param output_path: string object containing the output file path.
+            :param manifest_record: dictionary object containing the manifest record of the file (or None).
+            :param headers: dictionary object containing the request headers (authentication).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return: Boolean object - True if the file on disk is current. """
+
+    response, _ = request_fn('HEAD', url, headers, timeout)
+    response.read()
+    if response.status != 200:
+        return False
+
+    size = os.path.getsize(output_path)
+
+    # the ETag only vouches for the file recorded in the manifest, a truncated file is fetched again.
+    etag = response.getheader('ETag')
+    if etag and manifest_record and manifest_record.get('etag') == etag and manifest_record.get('size') == size:
+        return True
+
+    length = response.getheader('Content-Length')
+    return length is not None and int(length) == size
+
+
+def fetch_fn(url, output_path, headers, timeout):
+    """ Download a photo to a temporary file and move it into place once complete.
+
+            :param url: string object containing the photo url.
+            :param output_path: string object containing the output file path.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return manifest_record: dictionary object containing the url, size, etag and download time. """
+
+    response, connection_key = request_fn('GET', url, headers, timeout)
+
+    if response.status != 200:
+        response.read()
+        error = http.client.HTTPException('HTTP {0} {1}: {2}'.format(response.status, response.reason, url))
+        # only server side errors and throttling are worth retrying.
+        error.retry = response.status >= 500 or response.status == 429
+        raise error
+
+    part_path = output_path + '.part'
+    try:
+        with open(part_path, 'wb') as f:
+            for block in iter(lambda: response.read(65536), b''):
+                f.write(block)
+    except (OSError, http.client.HTTPException):
+        drop_connection_fn(*connection_key)
+        raise
+
+    os.replace(part_path, output_path)
+
+    manifest_record = {'url': url, 'size': os.path.getsize(output_path), 'etag': response.getheader('ETag'),
+                       'downloaded': str(datetime.now())}
+
+    return manifest_record
+
+
+def download_fn(url, output_path, manifest_record, headers, retries, backoff, timeout):
+    """ Download a single photo unless the file on disk is current, retrying with an exponential backoff.
+
+            :param url: string object containing the photo url.
+            :param output_path: string object containing the output file path.
+            :param manifest_record: dictionary object containing the manifest record of the file (or None).
+            :param headers: dictionary object containing the request headers (authentication).
+            :param retries: integer object containing the number of attempts.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return download_result: list object containing the output path, status (downloaded/skipped/failed),
+            manifest record and error. """
+
+    on_disk = os.path.isfile(output_path)
+
+    # resume - the manifest already records this file at its current size.
+    if on_disk and manifest_record and manifest_record.get('url') == url \
+            and manifest_record.get('size') == os.path.getsize(output_path):
+        return [output_path, 'skipped', manifest_record, '']
+
+    error = None
+    for attempt in range(retries):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            if on_disk and remote_matches_fn(url, output_path, manifest_record, headers, timeout):
+                manifest_record = {'url': url, 'size': os.path.getsize(output_path),
+                                   'etag': (manifest_record or {}).get('etag'), 'downloaded': str(datetime.now())}
+                return [output_path, 'skipped', manifest_record, '']
+
+            return [output_path, 'downloaded', fetch_fn(url, output_path, headers, timeout), '']
+
+        except (OSError, http.client.HTTPException) as e:
+            error = e
+            if not getattr(e, 'retry', True):
+                break
+
+    return [output_path, 'failed', manifest_record, '{0}: {1}'.format(type(error).__name__, error)]
+
+
+def read_manifest_fn(manifest_path):
+    """ Read the photo manifest of a site directory.
+
+            :param manifest_path: string object containing the manifest file path.
+            :return manifest_dict: dictionary object (file name -> manifest record). """
+
+    if not os.path.isfile(manifest_path):
+        return {}
+
+    try:
+        with open(manifest_path) as f:
+            manifest_dict = json.load(f)
+    except ValueError:
+        print('Photo manifest could not be read and will be rebuilt: ', manifest_path)
+        manifest_dict = {}
+
+    return manifest_dict
+
+
+def write_manifest_fn(manifest_path, manifest_dict):
+    """ Write the photo manifest of a site directory.
+
+            :param manifest_path: string object containing the manifest file path.
+            :param manifest_dict: dictionary object (file name -> manifest record). """
+
+    with open(manifest_path + '.part', 'w') as f:
+        json.dump(manifest_dict, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + '.part', manifest_path)
+
+
+def main_routine(download_list, site_dir, odk_aggregate=None, workers=DOWNLOAD_WORKERS, retries=DOWNLOAD_RETRIES,
+                 backoff=DOWNLOAD_BACKOFF, timeout=DOWNLOAD_TIMEOUT):
+    """ Download a list of photographs concurrently and record them in the site photo manifest.
+
+            :param download_list: list object containing [photo url, output file path] list elements.
+            :param site_dir: string object containing the path to the site directory (manifest location).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined), None downloads the photo urls as they are, without authentication.
+            :param workers: integer object containing the number of concurrent downloads.
+            :param retries: integer object containing the number of attempts per photo.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return download_result_list: list object containing the download_fn outputs. """
+
+    manifest_path = os.path.join(site_dir, MANIFEST_NAME)
+    manifest_dict = read_manifest_fn(manifest_path)
+
+    headers = {}
+    if odk_aggregate is not None:
+        # call the transect_table_fetcher.py script - the photos share the account and host of the transect tables.
+        import transect_table_fetcher
+        headers = transect_table_fetcher.auth_header_fn(
+            odk_aggregate.get('user') or transect_table_fetcher.ODK_AGGREGATE_USER,
+            odk_aggregate.get('password') or transect_table_fetcher.ODK_AGGREGATE_PASSWORD)
+        download_list = [[transect_table_fetcher.rebase_url_fn(url, odk_aggregate.get('base_url')), output_path]
+                         for url, output_path in download_list]
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            future_list = [executor.submit(download_fn, url, output_path,
+                                           manifest_dict.get(os.path.basename(output_path)),
+                                           headers, retries, backoff, timeout)
+                           for url, output_path in download_list]
+            download_result_list = [future.result() for future in future_list]
+    finally:
+        close_connections_fn()
+
+    for output_path, status, manifest_record, error in download_result_list:
+        if status != 'failed':
+            manifest_dict[os.path.basename(output_path)] = manifest_record
+        else:
+            print('Photo download failed: ', output_path, error)
+
+    write_manifest_fn(manifest_path, manifest_dict)
+
+    status_list = [result[1] for result in download_result_list]
+    print('Photos - downloaded: ', status_list.count('downloaded'), ', skipped: ', status_list.count('skipped'),
+          ', failed: ', status_list.count('failed'))
+
+    return download_result_list
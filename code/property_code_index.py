@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# Import modules
+from __future__ import print_function, division
+import os
+import difflib
+import warnings
+import stage_monitor
+
+warnings.filterwarnings("ignore")
+
+# minimum difflib similarity ratio accepted when a property name is not an exact match.
+FUZZY_CUTOFF = 0.85
+
+# pastoral_estate values that run without the shapefile (the ras property codes are left blank).
+NO_SHAPEFILE_LIST = ['', 'None', 'No']
+
+
+def property_name_clean_fn(property_name):
+    """ Normalise a property name for lookup (matches step6_1 string_clean_upper_fn and collapses whitespace).
+
+            :param property_name: string object containing the property name.
+            :return clean_string: processed string object. """
+
+    str1 = str(property_name).replace('_', ' ')
+    str2 = str1.replace('-', ' ')
+    clean_string = ' '.join(str2.upper().split())
+
+    return clean_string
+
+
+def property_index_fn(estate_df):
+    """ Create a property name -> property code lookup table, the first record of a duplicated property is retained.
+
+            :param estate_df: pandas dataframe object containing the PROPERTY and PROP_TAG fields.
+            :return property_index: dictionary object containing:
+                prop_tag_dict: dictionary object (normalised property name -> property code).
+                fuzzy_dict: dictionary object caching the result of each fuzzy lookup. """
+
+    prop_tag_dict = {}
+    for property_name, prop_tag in zip(estate_df['PROPERTY'].tolist(), estate_df['PROP_TAG'].tolist()):
+        clean_name = property_name_clean_fn(property_name)
+        if clean_name not in prop_tag_dict:
+            prop_tag_dict[clean_name] = prop_tag
+
+    property_index = {'prop_tag_dict': prop_tag_dict, 'fuzzy_dict': {}}
+
+    return property_index
+
+
+def prop_tag_lookup_fn(property_index, property_name):
+    """ Return the property code for a property name, misspelled names (i.e. free text NOT_PASTORAL_NAME2 entries)
+    are matched to the closest listed property name.
+
+            :param property_index: dictionary object created by property_index_fn.
+            :param property_name: string object containing the property name.
+            :return prop_tag: string object containing the property code or None if there is no match. """
+
+    clean_name = property_name_clean_fn(property_name)
+    prop_tag_dict = property_index['prop_tag_dict']
+
+    if clean_name in prop_tag_dict:
+        return prop_tag_dict[clean_name]
+
+    fuzzy_dict = property_index['fuzzy_dict']
+    if clean_name not in fuzzy_dict:
+        match_list = difflib.get_close_matches(clean_name, prop_tag_dict.keys(), n=1, cutoff=FUZZY_CUTOFF)
+        if match_list:
+            print('Property name: ', property_name, ' matched to: ', match_list[0])
+            fuzzy_dict[clean_name] = prop_tag_dict[match_list[0]]
+        else:
+            fuzzy_dict[clean_name] = None
+
+    return fuzzy_dict[clean_name]
+
+
+@stage_monitor.monitor_fn
+def main_routine(pastoral_estate):
+    """ Read the pastoral estate shapefile attribute table once and create the property code lookup table.
+
+            :param pastoral_estate: string object containing the file path to the pastoral estate shapefile, None or a
+            NO_SHAPEFILE_LIST value runs without the shapefile.
+            :return property_index: dictionary object created by property_index_fn (empty without the shapefile). """
+
+    print('property_code_index.py INITIATED.')
+
+    if pastoral_estate is None or pastoral_estate in NO_SHAPEFILE_LIST:
+        print('No pastoral estate shapefile - the ras property codes are not looked up.')
+        property_index = {'prop_tag_dict': {}, 'fuzzy_dict': {}}
+
+    elif not os.path.isfile(pastoral_estate):
+        # a mistyped path would silently leave every ras property code blank.
+        raise FileNotFoundError('The following pastoral estate shapefile does not exist: ' + str(pastoral_estate))
+
+    else:
+        import geopandas as gpd
+        # only the attribute table is required.
+        estate = gpd.read_file(pastoral_estate, ignore_geometry=True)
+        property_index = property_index_fn(estate[['PROPERTY', 'PROP_TAG']])
+
+    print('property_code_index.py COMPLETED.')
+
+    return property_index
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import hashlib
+import pickle
+import warnings
+import pandas as pd
+import stage_monitor
+
+warnings.filterwarnings("ignore")
+
+# increment when the layout of the reference_data dictionary changes so old snapshots are ignored.
+SNAPSHOT_VERSION = 3
+
+
+def clean_list_fn(df, col):
+    """ Convert a worksheet column to a list and remove all 'BLANK' values.
+
+            :param df: pandas dataframe object read with header=None.
+            :param col: integer object containing the column position.
+            :return cleaned_list: list object containing the non blank column values. """
+
+    df = df.fillna('BLANK').replace('Nan', 'BLANK')
+
+    cleaned_list = [x for x in df[col].tolist() if str(x) != 'BLANK']
+
+    return cleaned_list
+
+
+def botanical_common_dict_fn(series):
+    """ Create a botanical -> common name lookup table, the first record of a duplicated botanical name is retained
+    (matches the .iloc[0] lookup previously used by the step8 scripts).
+
+            :param series: pandas dataframe object containing the copyBotanical2 and copyCommon fields.
+            :return botanical_common_dict: dictionary object (botanical name -> common name). """
+
+    botanical_common_dict = {}
+    for botanical, common in zip(series['copyBotanical2'].tolist(), series['copyCommon'].tolist()):
+        if botanical not in botanical_common_dict:
+            botanical_common_dict[botanical] = common
+
+    return botanical_common_dict
+
+
+def read_veg_list_fn(veg_list_excel):
+    """ Read the PPP_COMP and ANNUAL_FORB_COMP worksheets from the odk veg list excel file.
+
+            :param veg_list_excel: string object path to the odk veglist excel file.
+            :return veg_list_dict: dictionary object containing the cleaned 3p grass and annual forb lists and their
+            classification indexes. """
+
+    # import the 3p list (column 4) and the annual forb list (column 6) from the final species excel
+    sheet_dict = pd.read_excel(veg_list_excel, sheet_name=['PPP_COMP', 'ANNUAL_FORB_COMP'], header=None)
+
+    veg_list_dict = {'ppp_list': clean_list_fn(sheet_dict['PPP_COMP'], 3),
+                     'af_list': clean_list_fn(sheet_dict['ANNUAL_FORB_COMP'], 5)}
+
+    # call the species_classifier.py script - the classification indexes are built once with the lists.
+    import species_classifier
+    veg_list_dict['ppp_index'] = species_classifier.index_fn(veg_list_dict['ppp_list'])
+    veg_list_dict['af_index'] = species_classifier.index_fn(veg_list_dict['af_list'])
+
+    return veg_list_dict
+
+
+def read_shrub_list_fn(shrub_list_excel):
+    """ Read the completeGrassForb, CompleteTree and CompleteShrub worksheets from the odk shrub list excel file.
+
+            :param shrub_list_excel: string object path to the odk shrub list excel file.
+            :return shrub_list_dict: dictionary object containing the botanical and common name series and lookup
+            tables of each worksheet. """
+
+    sheet_dict = pd.read_excel(shrub_list_excel, sheet_name=['completeGrassForb', 'CompleteTree', 'CompleteShrub'])
+
+    import taxonomy_resolver
+
+    shrub_list_dict = {}
+    for key, sheet_name in (('grass_forb', 'completeGrassForb'), ('tree', 'CompleteTree'),
+                            ('shrub', 'CompleteShrub')):
+        # filter out unwanted fields.
+        series = sheet_dict[sheet_name][['copyBotanical2', 'copyCommon']]
+        shrub_list_dict[key + '_series'] = series
+        shrub_list_dict[key + '_dict'] = botanical_common_dict_fn(series)
+        # call the taxonomy_resolver.py script - normalised and fuzzy botanical name lookup.
+        shrub_list_dict[key + '_index'] = taxonomy_resolver.taxonomy_index_fn(shrub_list_dict[key + '_dict'])
+
+    return shrub_list_dict
+
+
+def file_hash_fn(file_path):
+    """ Calculate the sha1 hash of a file.
+
+            :param file_path: string object containing the file path.
+            :return: string object containing the hex digest. """
+
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1048576), b''):
+            sha1.update(block)
+
+    return sha1.hexdigest()
+
+
+def file_signature_fn(file_path):
+    """ Collect the modified time and size of a file.
+
+            :param file_path: string object containing the file path.
+            :return: list object containing the modified time and the file size. """
+
+    stat = os.stat(file_path)
+
+    return [stat.st_mtime, stat.st_size]
+
+
+def snapshot_path_fn(cache_dir, veg_list_excel, shrub_list_excel):
+    """ Define the snapshot file path for the two input excel files.
+
+            :param cache_dir: string object path to the snapshot directory.
+            :param veg_list_excel: string object path to the odk veglist excel file.
+            :param shrub_list_excel: string object path to the odk shrub list excel file.
+            :return: string object containing the path to the pickle snapshot. """
+
+    key = hashlib.sha1((os.path.abspath(veg_list_excel) + '|' + os.path.abspath(shrub_list_excel))
+                       .encode('utf-8')).hexdigest()[:16]
+
+    return os.path.join(cache_dir, 'reference_data_' + key + '.pickle')
+
+
+def snapshot_valid_fn(snapshot, excel_list):
+    """ Check that a snapshot was created from the current excel files - files with an unchanged modified time and
+    size are accepted, otherwise the file hash must match.
+
+            :param snapshot: dictionary object loaded from the pickle snapshot.
+            :param excel_list: list object containing the excel file paths.
+            :return valid: boolean object. """
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return False
+
+    for excel, (signature, digest) in zip(excel_list, snapshot['sources']):
+        if file_signature_fn(excel) != signature and file_hash_fn(excel) != digest:
+            return False
+
+    return True
+
+
+def load_snapshot_fn(snapshot_path, excel_list):
+    """ Load the reference data from a pickle snapshot if it exists and is current.
+
+            :param snapshot_path: string object containing the path to the pickle snapshot.
+            :param excel_list: list object containing the excel file paths.
+            :return: dictionary object containing the reference data or None. """
+
+    if not os.path.isfile(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        print('Reference data snapshot could not be read: ', snapshot_path)
+        return None
+
+    if not snapshot_valid_fn(snapshot, excel_list):
+        print('Reference data snapshot is out of date: ', snapshot_path)
+        return None
+
+    return snapshot['reference_data']
+
+
+def save_snapshot_fn(snapshot_path, excel_list, reference_data):
+    """ Save the reference data as a pickle snapshot.
+
+            :param snapshot_path: string object containing the path to the pickle snapshot.
+            :param excel_list: list object containing the excel file paths.
+            :param reference_data: dictionary object containing the reference data. """
+
+    snapshot = {'version': SNAPSHOT_VERSION,
+                'sources': [[file_signature_fn(excel), file_hash_fn(excel)] for excel in excel_list],
+                'reference_data': reference_data}
+
+    if not os.path.exists(os.path.dirname(snapshot_path)):
+        os.makedirs(os.path.dirname(snapshot_path))
+
+    # write to a temporary file first so an interrupted run does not leave a corrupt snapshot.
+    temp_path = snapshot_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, snapshot_path)
+
+
+@stage_monitor.monitor_fn
+def main_routine(veg_list_excel, shrub_list_excel, cache_dir=None):
+    """ Read every reference worksheet used by the pipeline once and return them as lookup tables.
+
+            :param veg_list_excel: string object path to the odk veglist excel file (PPP_COMP and ANNUAL_FORB_COMP).
+            :param shrub_list_excel: string object path to the odk shrub list excel file (completeGrassForb,
+            CompleteTree and CompleteShrub).
+            :param cache_dir: string object path to a directory used to store a pickle snapshot of the reference data,
+            if None the excel files are always read.
+            :return reference_data: dictionary object containing:
+                ppp_list: list object of 3P grass botanical names.
+                af_list: list object of annual forb botanical names.
+                ppp_index, af_index: dictionary objects (species_classifier.py) classifying the 3P grass and annual
+                forb names.
+                grass_forb_series, tree_series, shrub_series: pandas dataframe objects (copyBotanical2, copyCommon).
+                grass_forb_dict, tree_dict, shrub_dict: dictionary objects (botanical name -> common name).
+                grass_forb_index, tree_index, shrub_index: dictionary objects (taxonomy_resolver.py) resolving botanical
+                names to common names. """
+
+    print('reference_data_cache.py INITIATED.')
+
+    excel_list = [veg_list_excel, shrub_list_excel]
+
+    snapshot_path = None
+    reference_data = None
+    if cache_dir:
+        snapshot_path = snapshot_path_fn(cache_dir, veg_list_excel, shrub_list_excel)
+        reference_data = load_snapshot_fn(snapshot_path, excel_list)
+        if reference_data is not None:
+            print('Reference data loaded from snapshot: ', snapshot_path)
+
+    if reference_data is None:
+        reference_data = {}
+        reference_data.update(read_veg_list_fn(veg_list_excel))
+        reference_data.update(read_shrub_list_fn(shrub_list_excel))
+
+        if snapshot_path:
+            save_snapshot_fn(snapshot_path, excel_list, reference_data)
+            print('Reference data snapshot created: ', snapshot_path)
+
+    print('reference_data_cache.py COMPLETED.')
+
+    return reference_data
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+"""
+Spatial output of the clean forms: every form is a point layer of one GeoPackage, so the wide tables are not truncated
+to the shapefile 10 character column names and 254 fields:
+
+    clean_star_transect           star transect, transect center points (c_lon, c_lat)
+    clean_offset_star_transect    star transect, offset points (o_lon, o_lat)
+    clean_integrated              integrated site, center points
+    clean_basal                   basal sweep, center points
+    clean_woody_thick             woody thickening, center points
+    clean_ras                     rapid assessment, center points
+
+Each layer is written in one transaction with an R-tree spatial index. When the GeoPackage already holds a layer
+(i.e. a season long package), only the records with a new meta_key (meta:instanceID) are appended.
+"""
+
+# Import modules
+import os
+import sqlite3
+import geopandas as gpd
+import warnings
+import intermediate_store
+import stage_monitor
+
+warnings.filterwarnings("ignore")
+
+# the clean column holding the odk meta:instanceID.
+INSTANCE_COLUMN = 'meta_key'
+
+OFFSET_COLUMN_LIST = ['site', 'date', 'date_time', 'recorder', 'estimator', 'district', 'final_prop', 'off_direct',
+                      'o_acc', 'o_lat', 'o_lon', 'meta_key', 'form']
+
+# (layer name, intermediate table, longitude column, latitude column, columns - None keeps every column).
+LAYER_LIST = [('clean_star_transect', 'clean_star_transect', 'c_lon', 'c_lat', None),
+              ('clean_offset_star_transect', 'clean_star_transect', 'o_lon', 'o_lat', OFFSET_COLUMN_LIST),
+              ('clean_integrated', 'clean_integrated', 'c_lon', 'c_lat', None),
+              ('clean_basal', 'clean_basal', 'c_lon', 'c_lat', None),
+              ('clean_woody_thick', 'clean_woody_thick', 'c_lon', 'c_lat', None),
+              ('clean_ras', 'clean_ras', 'c_lon', 'c_lat', None)]
+
+
+def layer_gdf_fn(df, lon, lat, column_list=None):
+    """ Create the point geoDataFrame of a layer.
+
+            :param df: pandas dataframe object containing the clean form data (intermediate_store defined).
+            :param lon: string object containing the longitude column name.
+            :param lat: string object containing the latitude column name.
+            :param column_list: list object containing the layer columns, None keeps every column.
+            :return: geopandas geoDataFrame object (EPSG:4326). """
+
+    if column_list is not None:
+        df = df[[column for column in column_list if column in df.columns]]
+
+    return gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(df[lon], df[lat]), crs="EPSG:4326")
+
+
+def existing_instance_fn(gpkg_path, layer):
+    """ Read the meta_key values already stored in a GeoPackage layer (a GeoPackage is a SQLite database, so only the
+    one column is read).
+
+            :param gpkg_path: string object containing the GeoPackage file path.
+            :param layer: string object containing the layer name.
+            :return: set object containing the stored meta_key values, None if the layer does not exist. """
+
+    if not os.path.isfile(gpkg_path):
+        return None
+
+    conn = sqlite3.connect(gpkg_path)
+    try:
+        if conn.execute('SELECT 1 FROM gpkg_contents WHERE table_name = ?', (layer,)).fetchone() is None:
+            return None
+        column_list = [row[1] for row in conn.execute('PRAGMA table_info("{0}")'.format(layer))]
+        if INSTANCE_COLUMN not in column_list:
+            return set()
+        return {row[0] for row in conn.execute('SELECT "{0}" FROM "{1}"'.format(INSTANCE_COLUMN, layer))}
+    finally:
+        conn.close()
+
+
+def write_layer_fn(gdf, gpkg_path, layer):
+    """ Write or append a layer, records whose meta_key is already in the layer are skipped.
+
+            :param gdf: geopandas geoDataFrame object (layer_gdf_fn defined).
+            :param gpkg_path: string object containing the GeoPackage file path.
+            :param layer: string object containing the layer name.
+            :return: integer object containing the number of records written. """
+
+    instance_set = existing_instance_fn(gpkg_path, layer)
+
+    if instance_set is None:
+        mode = 'w'
+    else:
+        mode = 'a'
+        if INSTANCE_COLUMN in gdf.columns:
+            gdf = gdf[~gdf[INSTANCE_COLUMN].isin(instance_set)]
+
+    if len(gdf):
+        gdf.to_file(gpkg_path, layer=layer, driver='GPKG', mode=mode, SPATIAL_INDEX='YES')
+
+    return len(gdf)
+
+
+@stage_monitor.monitor_fn
+def main_routine(temp_dir, spatial_output=None):
+    """ Write the center and offset points of every processed form as layers of one GeoPackage.
+
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param spatial_output: string object containing the GeoPackage file path (cmd_args_fn defined), an existing
+            package is appended to, None writes temp_dir\\clean_odk_forms.gpkg.
+            :return gpkg_path: string object containing the GeoPackage file path. """
+
+    gpkg_path = spatial_output or (temp_dir + '\\clean_odk_forms.gpkg')
+
+    table_dict = {}
+    for layer, table, lon, lat, column_list in LAYER_LIST:
+        table_path = temp_dir + '\\' + table + intermediate_store.EXTENSION
+        if not os.path.isfile(table_path):
+            continue
+
+        if table not in table_dict:
+            # call the intermediate_store.py script - each table is read once for all of its layers.
+            table_dict[table] = intermediate_store.read_fn(table_path)
+
+        record = write_layer_fn(layer_gdf_fn(table_dict[table], lon, lat, column_list), gpkg_path, layer)
+        print('-', gpkg_path, ' layer: ', layer, ' - ', record, ' records written.')
+
+    return gpkg_path
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+"""
+Species classification index built once from the veg list worksheets (3P grass and annual forb lists):
+
+    exact    set of normalised (lower case, '_' and '-' as spaces) token tuples - a recorded name equal to a listed name.
+    trie     nested dictionary of the same tokens - a recorded name that is a whole token prefix of a listed name
+             (i.e. 'Aristida' matches 'Aristida inaequiglumis').
+
+A short name is no longer matched inside another word (i.e. 'Ris' does not match 'Aristida'), as the previous
+substring scan did.
+"""
+
+# Import modules
+import numpy as np
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# sort key of an empty species slot, it is sorted to the end and returned as np.nan.
+EMPTY_COVER = 9999.0
+
+
+def tokens_fn(name):
+    """ Normalise a botanical name to its tokens.
+
+            :param name: string object containing the botanical name.
+            :return: tuple object containing the lower case tokens. """
+
+    return tuple(str(name).replace('_', ' ').replace('-', ' ').lower().split())
+
+
+def index_fn(name_list):
+    """ Build the classification index of a species list.
+
+            :param name_list: list object containing the listed botanical names (reference_data_cache defined).
+            :return index: dictionary object containing the exact (set) and trie (dictionary) lookup tables. """
+
+    index = {'exact': set(), 'trie': {}}
+
+    for name in name_list:
+        tokens = tokens_fn(name)
+        if not tokens:
+            continue
+        index['exact'].add(tokens)
+
+        node = index['trie']
+        for token in tokens:
+            node = node.setdefault(token, {})
+
+    return index
+
+
+def match_fn(index, name):
+    """ Determine if a recorded name is a listed species.
+
+            :param index: dictionary object (index_fn defined).
+            :param name: string object containing the recorded botanical name.
+            :return: Boolean object. """
+
+    tokens = tokens_fn(name)
+    if not tokens or tokens == ('nan',):
+        return False
+
+    if tokens in index['exact']:
+        return True
+
+    node = index['trie']
+    for token in tokens:
+        node = node.get(token)
+        if node is None:
+            return False
+
+    return True
+
+
+def mask_fn(index, name_df):
+    """ Classify every name of the species columns, each unique name is looked up once.
+
+            :param index: dictionary object (index_fn defined).
+            :param name_df: pandas dataframe object containing the clean botanical names (one column per species slot).
+            :return: pandas dataframe object containing the match (True) / no match (False) mask. """
+
+    match_set = {name for name in pd.unique(name_df.values.ravel()) if match_fn(index, name)}
+
+    return name_df.isin(match_set)
+
+
+def sort_fn(name_array, cover_array):
+    """ Sort the species of every record by cover (then name) in ascending order, empty slots last.
+
+            :param name_array: numpy array object containing the botanical names (records x slots).
+            :param cover_array: numpy array object containing the cover values (EMPTY_COVER for an empty slot).
+            :return name_array: numpy array object containing the sorted botanical names.
+            :return cover_array: numpy array object containing the sorted cover values (empty slots -> np.nan). """
+
+    # names are ranked once so both sort keys are numeric.
+    name_code = pd.factorize(name_array.ravel(), sort=True)[0].reshape(name_array.shape)
+    order = np.lexsort((name_code, cover_array), axis=-1)
+
+    name_array = np.take_along_axis(name_array, order, axis=-1)
+    cover_array = np.take_along_axis(cover_array, order, axis=-1)
+
+    return name_array, np.where(cover_array == EMPTY_COVER, np.nan, cover_array)
+
+
+def main_routine(index, name_df, cover_df):
+    """ Split the species columns of all records into listed (match) and unlisted (no match) species and sort both.
+
+            :param index: dictionary object (index_fn defined).
+            :param name_df: pandas dataframe object containing the clean botanical names (one column per species slot).
+            :param cover_df: pandas dataframe object containing the cover values (np.nan for an empty slot).
+            :return match_name: numpy array object containing the sorted listed names ('Nan' for other slots).
+            :return match_cover: numpy array object containing the sorted listed cover values.
+            :return no_match_name: numpy array object containing the sorted unlisted names ('Nan' for other slots).
+            :return no_match_cover: numpy array object containing the sorted unlisted cover values. """
+
+    mask = mask_fn(index, name_df).values
+    name_array = name_df.values.astype(object)
+    cover_array = cover_df.values.astype(float)
+    cover_array = np.where(np.isnan(cover_array), EMPTY_COVER, cover_array)
+
+    match_name, match_cover = sort_fn(np.where(mask, name_array, 'Nan'), np.where(mask, cover_array, EMPTY_COVER))
+    no_match_name, no_match_cover = sort_fn(np.where(mask, 'Nan', name_array), np.where(mask, EMPTY_COVER, cover_array))
+
+    return match_name, match_cover, no_match_name, no_match_cover
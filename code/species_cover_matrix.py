@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Sparse site x species cover matrix of the season, built once from the clean star transect and ras tables.
+
+Each recorded species is one entry (coordinate format): the site row, the interned species column, the form, the
+functional group tag and the cover (float32, NaN for the ras form which records names only). Entries are held in
+site, form, group and descending cover order, so each site / form / group is a contiguous segment (indptr) and the
+ranking, the 3P overflow into the perennial grass and the group totals are whole season array operations.
+"""
+
+# Import modules
+import numpy as np
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# functional group tags (bot_<group>_<n> / cover_<group>_<n> columns of the clean tables).
+GROUP_LIST = ['3p', 'pg', 'ag', 'pf', 'af', 'ts', 'sb']
+
+# form -> (clean table, functional groups, species slots per group, per species cover recorded).
+FORM_DICT = {
+    'star': ('clean_star_transect', ['3p', 'pg', 'ag', 'pf', 'af'], 10, True),
+    'ras': ('clean_ras', ['3p', 'pg', 'ag', 'pf', 'ts', 'sb'], 4, False),
+}
+FORM_LIST = list(FORM_DICT)
+
+# species per group on the observation sheet cover estimates, the 3P species ranked after these are perennial grass.
+PRIMARY = 4
+
+# per site table name (step7 partitions it by site with the clean form tables).
+TABLE = 'species_cover'
+
+# clean table values of an empty species slot.
+EMPTY_LIST = ['', 'nan', 'Nan', 'BLANK']
+
+
+def entry_fn(df, form):
+    """ Convert the wide species slot columns of a clean form table to one entry per recorded species.
+
+            :param df: pandas dataframe object containing the clean form table (site and bot_/cover_ columns).
+            :param form: string object containing the form name (FORM_DICT key).
+            :return: pandas dataframe object containing the site, form, group, slot, botanical and cover columns. """
+
+    _, group_list, slots, cover = FORM_DICT[form]
+
+    # the observation sheet is filled from the first record of a site.
+    df = df.dropna(subset=['site']).drop_duplicates('site')
+
+    name_list = ['bot_{0}_{1}'.format(group, n + 1) for group in group_list for n in range(slots)]
+    name_array = df.reindex(columns=name_list).to_numpy(dtype=object)
+
+    if cover:
+        cover_list = ['cover_{0}_{1}'.format(group, n + 1) for group in group_list for n in range(slots)]
+        cover_array = df.reindex(columns=cover_list).apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float32')
+    else:
+        cover_array = np.full(name_array.shape, np.nan, dtype='float32')
+
+    name_array = pd.DataFrame(name_array).fillna('').astype(str).apply(lambda x: x.str.strip()).to_numpy(dtype=object)
+    record, position = np.nonzero(~np.isin(name_array, EMPTY_LIST))
+
+    group_code = np.array([GROUP_LIST.index(group) for group in group_list], dtype='int8')
+
+    return pd.DataFrame({'site': df['site'].to_numpy(dtype=object)[record],
+                         'form': np.int8(FORM_LIST.index(form)),
+                         'group': group_code[position // slots],
+                         'slot': (position % slots).astype('int8'),
+                         'botanical': name_array[record, position],
+                         'cover': cover_array[record, position]})
+
+
+def sort_fn(matrix):
+    """ Order the entries by site, form, group and descending cover (ties in descending slot order, as the reversed
+    species lists were) and index the site / form / group segments.
+
+            :param matrix: dictionary object containing the entry arrays (build_fn defined).
+            :return matrix: dictionary object with the entries sorted and the segment and indptr arrays updated. """
+
+    segment = ((matrix['row'].astype('int64') * len(FORM_LIST) + matrix['form']) * len(GROUP_LIST) +
+               matrix['group'])
+    # an entry without a cover (ras) keeps the slot order.
+    no_cover = np.isnan(matrix['cover'])
+    slot_key = np.where(no_cover, matrix['slot'], -matrix['slot'].astype('int16'))
+    order = np.lexsort((slot_key, -np.where(no_cover, 0.0, matrix['cover']), segment))
+
+    for key in ('row', 'column', 'form', 'group', 'slot', 'cover'):
+        matrix[key] = matrix[key][order]
+
+    matrix['segment'] = segment[order]
+    matrix['indptr'] = np.searchsorted(matrix['segment'], np.arange(len(matrix['site_list']) * len(FORM_LIST) *
+                                                                    len(GROUP_LIST) + 1))
+
+    return matrix
+
+
+def build_fn(entry_df):
+    """ Intern the sites and species of the entries and build the sparse matrix.
+
+            :param entry_df: pandas dataframe object containing the entries of every form (entry_fn defined).
+            :return matrix: dictionary object containing the site_list and species_list labels and the row, column,
+            form, group, slot and cover entry arrays (sorted, sort_fn defined). """
+
+    row, site_list = pd.factorize(entry_df['site'], sort=False)
+    column, species_list = pd.factorize(entry_df['botanical'], sort=True)
+
+    matrix = {'site_list': np.asarray(site_list, dtype=object), 'species_list': np.asarray(species_list, dtype=object),
+              'row': row.astype('int32'), 'column': column.astype('int32'),
+              'form': entry_df['form'].to_numpy(dtype='int8'), 'group': entry_df['group'].to_numpy(dtype='int8'),
+              'slot': entry_df['slot'].to_numpy(dtype='int8'), 'cover': entry_df['cover'].to_numpy(dtype='float32')}
+
+    return sort_fn(matrix)
+
+
+def rank_fn(matrix):
+    """ Rank every entry within its site / form / group (0 is the largest cover).
+
+            :param matrix: dictionary object (build_fn defined).
+            :return: numpy array object containing the integer ranks. """
+
+    return np.arange(len(matrix['segment'])) - matrix['indptr'][matrix['segment']]
+
+
+def overflow_fn(matrix, n=PRIMARY):
+    """ Move the star 3P species ranked after the first n to the perennial grass of the site.
+
+            :param matrix: dictionary object (build_fn defined).
+            :param n: integer object containing the number of 3P species listed.
+            :return matrix: dictionary object re-sorted with the overflow species in the perennial grass. """
+
+    overflow = ((matrix['form'] == FORM_LIST.index('star')) & (matrix['group'] == GROUP_LIST.index('3p')) &
+                (rank_fn(matrix) >= n))
+
+    if overflow.any():
+        matrix['group'] = np.where(overflow, np.int8(GROUP_LIST.index('pg')), matrix['group'])
+        matrix = sort_fn(matrix)
+
+    return matrix
+
+
+def group_total_fn(matrix, n=PRIMARY):
+    """ Sum the cover of the first n species of every site / form / group.
+
+            :param matrix: dictionary object (build_fn defined).
+            :param n: integer object containing the number of species summed.
+            :return: numpy array object (sites x forms x groups) containing the float cover totals. """
+
+    cover = np.where(rank_fn(matrix) < n, np.nan_to_num(matrix['cover'], nan=0.0), 0.0)
+    total = np.add.reduceat(np.append(cover, 0.0), matrix['indptr'][:-1])
+    # reduceat returns the start value for an empty segment.
+    total = np.where(np.diff(matrix['indptr']) > 0, total, 0.0)
+
+    return total.reshape(len(matrix['site_list']), len(FORM_LIST), len(GROUP_LIST))
+
+
+def frame_fn(matrix, n=PRIMARY):
+    """ Convert the matrix to the per site table of ranked species (step7 partitions it by site).
+
+            :param matrix: dictionary object (build_fn defined).
+            :param n: integer object containing the number of species per group on the observation sheet.
+            :return: pandas dataframe object containing the site, form, group, rank, botanical, cover, primary and
+            group_total columns. """
+
+    total = group_total_fn(matrix, n).ravel()
+    rank = rank_fn(matrix)
+
+    return pd.DataFrame({'site': matrix['site_list'][matrix['row']],
+                         'form': np.asarray(FORM_LIST, dtype=object)[matrix['form']],
+                         'group': np.asarray(GROUP_LIST, dtype=object)[matrix['group']],
+                         'rank': rank,
+                         'botanical': matrix['species_list'][matrix['column']],
+                         'cover': matrix['cover'],
+                         'primary': rank < n,
+                         'group_total': total[matrix['segment']]})
+
+
+def district_summary_fn(matrix, district_dict):
+    """ Summarise the species of every district over the season (number of sites and cover).
+
+            :param matrix: dictionary object (build_fn defined).
+            :param district_dict: dictionary object (site -> district).
+            :return: pandas dataframe object containing the district, form, group, botanical, sites, mean_cover and
+            max_cover columns. """
+
+    district, district_list = pd.factorize(pd.Series(matrix['site_list']).map(district_dict).fillna('Unknown'))
+    district = district[matrix['row']]
+
+    # one key per district / form / group / species.
+    key = ((district.astype('int64') * len(FORM_LIST) + matrix['form']) * len(GROUP_LIST) +
+           matrix['group']) * len(matrix['species_list']) + matrix['column']
+    key_array, inverse = np.unique(key, return_inverse=True)
+    # a species recorded in two slots of a site is one site.
+    site_count = np.bincount(np.unique(inverse.astype('int64') * len(matrix['site_list']) + matrix['row']) //
+                             len(matrix['site_list']), minlength=len(key_array))
+
+    cover = matrix['cover'].astype('float64')
+    recorded = ~np.isnan(cover)
+    cover_sum = np.bincount(inverse, weights=np.where(recorded, cover, 0.0), minlength=len(key_array))
+    cover_count = np.bincount(inverse, weights=recorded, minlength=len(key_array))
+    cover_max = np.full(len(key_array), np.nan)
+    np.fmax.at(cover_max, inverse, cover)
+
+    column = key_array % len(matrix['species_list'])
+    key_array = key_array // len(matrix['species_list'])
+    group = key_array % len(GROUP_LIST)
+    key_array = key_array // len(GROUP_LIST)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_cover = cover_sum / cover_count
+
+    return pd.DataFrame({'district': np.asarray(district_list, dtype=object)[key_array // len(FORM_LIST)],
+                         'form': np.asarray(FORM_LIST, dtype=object)[key_array % len(FORM_LIST)],
+                         'group': np.asarray(GROUP_LIST, dtype=object)[group],
+                         'botanical': matrix['species_list'][column],
+                         'sites': site_count,
+                         'mean_cover': mean_cover,
+                         'max_cover': cover_max})
+
+
+def main_routine(table_list, df_list, temp_dir=None):
+    """ Build the season species cover matrix from the clean star transect and ras tables.
+
+            :param table_list: list object containing the intermediate table names (intermediate_store defined).
+            :param df_list: list object containing open pandas data frames (intermediate_store defined).
+            :param temp_dir: string object path to the created output directory (date_time), if given the district
+            species summary csv is written to it.
+            :return: pandas dataframe object containing the ranked species of every site (frame_fn defined), None if
+            there is no star transect or ras table. """
+
+    table_dict = dict(zip(table_list, df_list))
+    entry_list = [entry_fn(table_dict[table], form) for form, (table, _, _, _) in FORM_DICT.items()
+                  if table in table_dict]
+
+    if not entry_list:
+        return None
+
+    matrix = overflow_fn(build_fn(pd.concat(entry_list, ignore_index=True)))
+    print('Species cover matrix: ', len(matrix['site_list']), ' sites, ', len(matrix['species_list']), ' species, ',
+          len(matrix['row']), ' entries.')
+
+    if temp_dir is not None:
+        district_dict = {}
+        for form, (table, _, _, _) in FORM_DICT.items():
+            if table in table_dict and 'district' in table_dict[table].columns:
+                district_dict.update(table_dict[table].drop_duplicates('site').set_index('site')['district'].dropna())
+        district_summary_fn(matrix, district_dict).to_csv(temp_dir + '\\species_district_summary.csv', index=False)
+
+    return frame_fn(matrix)
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import sys
+import json
+import time
+import logging
+import cProfile
+import functools
+import contextlib
+import tracemalloc
+from datetime import datetime
+import warnings
+
+warnings.filterwarnings("ignore")
+
+LOGGER = logging.getLogger('odk_pipeline')
+# silent until configure_fn is called (i.e. when a script is imported by benchmark_pipeline.py).
+LOGGER.addHandler(logging.NullHandler())
+
+# run settings (configure_fn defined), passed on to the step7 worker processes.
+SETTINGS = {'log_level': 'WARNING', 'log_file': None, 'profile_dir': None, 'trace_memory': False}
+
+# completed stage records of this process, in order of completion.
+STAGE_RECORD_LIST = []
+
+# open stages of this process, innermost last - each entry is [record, profile, wall start, CPU start].
+ACTIVE_LIST = []
+
+# one cProfile profile per stage name, accumulated over every call of the stage.
+PROFILE_DICT = {}
+
+
+def configure_fn(log_level='WARNING', log_file=None, profile_dir=None, trace_memory=False):
+    """ Configure the structured (JSON lines) log, the cProfile dumps and the memory tracing of the run.
+
+            :param log_level: string object containing the log level (DEBUG, INFO, WARNING or ERROR).
+            :param log_file: string object containing the log file path, None logs to the console (stderr).
+            :param profile_dir: string object containing the directory of the per stage cProfile dumps (optional).
+            :param trace_memory: Boolean object - record the tracemalloc peak of each stage (slows the run). """
+
+    SETTINGS.update({'log_level': log_level, 'log_file': log_file, 'profile_dir': profile_dir,
+                     'trace_memory': trace_memory})
+
+    for handler in list(LOGGER.handlers):
+        LOGGER.removeHandler(handler)
+        handler.close()
+
+    if log_file:
+        handler = logging.FileHandler(log_file)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    LOGGER.addHandler(handler)
+    LOGGER.setLevel(getattr(logging, str(log_level).upper(), logging.WARNING))
+    LOGGER.propagate = False
+
+    if profile_dir and not os.path.exists(profile_dir):
+        os.makedirs(profile_dir)
+
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def reset_fn():
+    """ Clear the stage records, open stages and profiles (a forked step7 worker inherits those of the parent). """
+
+    for entry in ACTIVE_LIST:
+        if entry[1] is not None:
+            entry[1].disable()
+
+    del STAGE_RECORD_LIST[:]
+    del ACTIVE_LIST[:]
+    PROFILE_DICT.clear()
+
+
+def log_fn(level, event, **fields):
+    """ Write one JSON log line, the fields are only serialised when the level is enabled.
+
+            :param level: integer object containing the logging level (i.e. logging.INFO).
+            :param event: string object containing the event name.
+            :param fields: keyword arguments written as JSON fields (str() used for other types). """
+
+    if not LOGGER.isEnabledFor(level):
+        return
+
+    line_dict = {'time': datetime.now().isoformat(), 'level': logging.getLevelName(level), 'pid': os.getpid(),
+                 'event': event}
+    line_dict.update(fields)
+
+    LOGGER.log(level, json.dumps(line_dict, default=str))
+
+
+def peak_rss_fn():
+    """ Return the peak resident set size of the process in MB, None if it can not be determined. """
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS.
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+    except ImportError:
+        pass
+
+    try:
+        # Windows - psutil is optional.
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+
+    except (ImportError, AttributeError):
+        return None
+
+
+def count_fn(rows=0, sites=0):
+    """ Add the rows and sites processed to the innermost open stage.
+
+            :param rows: integer object containing the number of rows processed.
+            :param sites: integer object containing the number of sites processed. """
+
+    if ACTIVE_LIST:
+        record = ACTIVE_LIST[-1][0]
+        record['rows'] += rows
+        record['sites'] += sites
+
+
+@contextlib.contextmanager
+def stage_fn(stage, rows=0, sites=0):
+    """ Time a pipeline stage: wall and CPU seconds (exclusive of the nested stages), rows and sites processed,
+    peak RSS and the optional tracemalloc peak and cProfile dump.
+
+            :param stage: string object containing the stage name (i.e. 'step2_1_star_transect_processing_workflow').
+            :param rows: integer object containing the number of rows processed (count_fn adds to it).
+            :param sites: integer object containing the number of sites processed (count_fn adds to it).
+            :return record: dictionary object containing the stage record. """
+
+    record = {'stage': stage, 'rows': rows, 'sites': sites, 'status': 'success', 'wall': 0.0, 'cpu': 0.0,
+              'peak_mb': None}
+
+    # the enclosing stage is paused, so each stage reports its own time.
+    if ACTIVE_LIST:
+        pause_fn(ACTIVE_LIST[-1])
+
+    profile = None
+    if SETTINGS['profile_dir']:
+        profile = PROFILE_DICT.setdefault(stage, cProfile.Profile())
+
+    entry = [record, profile, time.perf_counter(), time.process_time()]
+    ACTIVE_LIST.append(entry)
+    log_fn(logging.DEBUG, 'stage_start', stage=stage)
+    resume_fn(entry)
+
+    try:
+        yield record
+
+    except Exception as e:
+        record['status'] = 'failed'
+        log_fn(logging.ERROR, 'stage_failed', stage=stage, error='{0}: {1}'.format(type(e).__name__, e))
+        raise
+
+    finally:
+        pause_fn(entry)
+        ACTIVE_LIST.pop()
+
+        record['wall'] = round(record['wall'], 4)
+        record['cpu'] = round(record['cpu'], 4)
+        record['peak_rss_mb'] = peak_rss_fn()
+        STAGE_RECORD_LIST.append(record)
+        log_fn(logging.INFO, 'stage_complete', **record)
+
+        if ACTIVE_LIST:
+            resume_fn(ACTIVE_LIST[-1])
+
+
+def pause_fn(entry):
+    """ Stop the clocks, profile and memory trace of an open stage.
+
+            :param entry: list object containing the stage record, profile, wall and CPU start (stage_fn defined). """
+
+    record, profile, wall, cpu = entry
+    if profile is not None:
+        profile.disable()
+
+    record['wall'] += time.perf_counter() - wall
+    record['cpu'] += time.process_time() - cpu
+
+    if tracemalloc.is_tracing():
+        peak = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+        record['peak_mb'] = max(record['peak_mb'] or 0, peak)
+
+
+def resume_fn(entry):
+    """ Restart the clocks, profile and memory trace of an open stage.
+
+            :param entry: list object containing the stage record, profile, wall and CPU start (stage_fn defined). """
+
+    entry[2] = time.perf_counter()
+    entry[3] = time.process_time()
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+    if entry[1] is not None:
+        entry[1].enable()
+
+
+def monitor_fn(fn):
+    """ Decorator running a main_routine as a stage named after its module, the rows of a data frame passed as the
+    first argument are counted.
+
+            :param fn: function object.
+            :return: function object. """
+
+    stage = fn.__module__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        rows = len(args[0]) if args and hasattr(args[0], 'columns') else 0
+        with stage_fn(stage, rows):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def drain_fn():
+    """ Return and clear the stage records of this process (step7 worker processes hand them to the parent) and
+    write the cProfile dumps of a worker process.
+
+            :return record_list: list object containing the stage records. """
+
+    record_list = STAGE_RECORD_LIST[:]
+    del STAGE_RECORD_LIST[:]
+
+    # call the profile_dump_fn function - worker dumps are suffixed with the process id.
+    profile_dump_fn('_' + str(os.getpid()))
+
+    return record_list
+
+
+def merge_fn(record_list):
+    """ Add the stage records of a worker process to the records of this process.
+
+            :param record_list: list object containing the stage records (drain_fn defined). """
+
+    STAGE_RECORD_LIST.extend(record_list)
+
+
+def profile_dump_fn(suffix=''):
+    """ Write one cProfile dump per stage (<stage><suffix>.prof), read with pstats or snakeviz.
+
+            :param suffix: string object appended to the file names. """
+
+    if not SETTINGS['profile_dir']:
+        return
+
+    for stage, profile in PROFILE_DICT.items():
+        profile.dump_stats(os.path.join(SETTINGS['profile_dir'], stage + suffix + '.prof'))
+
+
+def summary_fn(record_list=None):
+    """ Total the stage records by stage.
+
+            :param record_list: list object containing the stage records, default all records of this process.
+            :return summary_list: list object containing one dictionary per stage (first completion order). """
+
+    if record_list is None:
+        record_list = STAGE_RECORD_LIST
+
+    summary_dict = {}
+    for record in record_list:
+        summary = summary_dict.setdefault(record['stage'], {'stage': record['stage'], 'calls': 0, 'failed': 0,
+                                                            'rows': 0, 'sites': 0, 'wall': 0.0, 'cpu': 0.0,
+                                                            'peak_mb': None, 'peak_rss_mb': None})
+        summary['calls'] += 1
+        summary['failed'] += record['status'] != 'success'
+        for key in ('rows', 'sites', 'wall', 'cpu'):
+            summary[key] += record[key]
+        for key in ('peak_mb', 'peak_rss_mb'):
+            if record.get(key) is not None:
+                summary[key] = max(summary[key] or 0, record[key])
+
+    return list(summary_dict.values())
+
+
+def report_fn():
+    """ Print the end of run timing table, log the stage summaries and write the cProfile dumps.
+
+            :return summary_list: list object containing one dictionary per stage (summary_fn defined). """
+
+    summary_list = summary_fn()
+    profile_dump_fn()
+
+    print('------------------------------------------------------------')
+    print('{0:<54}{1:>7}{2:>8}{3:>7}{4:>11}{5:>11}{6:>10}'.format('stage', 'calls', 'rows', 'sites', 'wall s',
+                                                                   'cpu s', 'peak MB'))
+    for summary in summary_list:
+        peak = summary['peak_mb'] if summary['peak_mb'] is not None else summary['peak_rss_mb']
+        print('{0:<54}{1:>7}{2:>8}{3:>7}{4:>11.3f}{5:>11.3f}{6:>10}'.format(
+            summary['stage'], summary['calls'], summary['rows'], summary['sites'], summary['wall'], summary['cpu'],
+            '-' if peak is None else peak))
+
+        log_fn(logging.INFO, 'stage_summary', **summary)
+
+    print('{0:<54}{1:>40.3f}'.format('total', sum(summary['wall'] for summary in summary_list)))
+    if SETTINGS['profile_dir']:
+        print('cProfile dumps written to: ', SETTINGS['profile_dir'])
+
+    return summary_list
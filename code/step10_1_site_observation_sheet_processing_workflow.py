@@ -19,9 +19,10 @@ SOFTWARE.
 """
 
 # Import modules
-import pandas as pd
 import glob
 import warnings
+import transect_table_cache
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -35,66 +36,34 @@ def search_html_files_fn(site_dir):
     # create an empty list
     html_list = []
 
-    for file in glob.glob(site_dir + '//*.html'):
+    for file in sorted(glob.glob(site_dir + '//*.html')):
         # append file paths to list
         html_list.append(file)
 
     return html_list
 
 
-def table_clean_up_fn(html_list):
-    """ Filter the DataFrame and rename feature headings.
+def table_clean_up_fn(html_list, transect_cache=None):
+    """ Parse the transect tables and rename the feature variables for observational sheet insertion.
 
     :param html_list: list of string objects containing the path to all located transect.html files.
+    :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
     :return clean_df_list: list object containing open pandas dataframe elements produced by the transect.html files. """
 
     clean_df_list = []
 
     for htmlTablePath in html_list:
-        html_table_list = pd.read_html(htmlTablePath)
-        html_table = html_table_list[0]
-        df = html_table.iloc[:, 2:5]
-        df.columns = ['ground', 'below', 'above']
-
-        # call the variable_renaming_fn function
-        df = variable_renaming_fn(df)
+        # call the transect_table_cache.py script - ground, below and above columns with the sheet values, html
+        # already parsed by an earlier run is not parsed again.
+        df = transect_table_cache.parse_cached_fn(htmlTablePath, transect_cache)
 
         clean_df_list.append(df)
 
     return clean_df_list
 
 
-def variable_renaming_fn(df):
-    """ Rename the feature variables for observational sheet insertion.
-            :param df: pandas data frame object.
-            :return df: pandas data frame that has had its values changed using the included dictionaries. """
-
-    # Change values in columns to required values for workbook
-    ground_values = {'bare': 'BARE GROUND', 'gravel': 'GRAVEL', 'rock': 'ROCK', 'ash': 'ASH', 'litter': 'LITTER',
-                     'cryptogram': 'CRYPTOGRAM',
-                     'dead_annual_grass': 'DEAD ANNUAL GRASS', 'dead_perennial_grass': 'DEAD PERENNIAL GRASS',
-                     'dead_annual_forb':
-                         'DEAD ANNUAL FORB / HERB', 'dead_forb': 'DEAD PERENNIAL FORB / HERB',
-                     'green_annual_grass': 'GREEN ANNUAL GRASS',
-                     'green_perennial_grass': 'GREEN PERENNIAL GRASS', 'green_annual_forb': 'GREEN ANNUAL FORB / HERB',
-                     'green_forb':
-                         'GREEN PERENNIAL FORB / HERB', 'green_plant': 'GREEN PLANT', 'dead_plant': 'DEAD PLANT'}
-
-    below_values = {'below_green': 'BELOW - GREEN', 'below_brown': 'BELOW - BROWN', 'below_dead': 'BELOW - DEAD',
-                    'subshrub': 'SUBSHRUB - GREY', 'none': 'BLANK'}
-
-    above_values = {'above_green': 'ABOVE - GREEN', 'above_brown': 'ABOVE - BROWN', 'above_dead': 'ABOVE - DEAD',
-                    'above_in_crown':
-                        'ABOVE - IN CROWN', 'not_in_crown': 'BLANK'}
-
-    df['ground'] = df['ground'].replace(ground_values)
-    df['below'] = df['below'].replace(below_values)
-    df['above'] = df['above'].replace(above_values)
-
-    return df
-
-
-def main_routine(obs_data_list, site, site_dir, star):
+@stage_monitor.monitor_fn
+def main_routine(obs_data_list, site, site_dir, star, transect_cache=None, clean_df_list=None):
     """transectVariables1P.py imports the three odk transect tables which have been extracted for the previous script
     aggregateStarTransect1P.py and converts them to three separate DataFrames, changing the
     variables ((i.e. bare_ground) to the correct format for the RLM database.
@@ -104,15 +73,19 @@ def main_routine(obs_data_list, site, site_dir, star):
         (one list per worksheet) insertion.
         :param site: string object containing the site name.
         :param site_dir: string object containing the path to the current site directory.
-        :param star: pandas data frame object. """
+        :param star: pandas data frame object.
+        :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+        :param clean_df_list: list object containing the three transect data frames read from the repeat group
+        exports (transect_repeat_reader.py), None parses the transect.html files of the site directory. """
 
     print('step10_1_site_observation_sheet_processing_workflow.py INITIATED.')
 
-    # call the search_html_files_fn function
-    html_list = search_html_files_fn(site_dir)
+    if clean_df_list is None:
+        # call the search_html_files_fn function
+        html_list = search_html_files_fn(site_dir)
 
-    # call the table_clean_up_fn function
-    clean_df_list = table_clean_up_fn(html_list)
+        # call the table_clean_up_fn function
+        clean_df_list = table_clean_up_fn(html_list, transect_cache)
 
     print('step10_1_site_observation_sheet_processing_workflow.py COMPLETED.')
     print('step10_2_observation_sheet_formatting.py initiating..........')
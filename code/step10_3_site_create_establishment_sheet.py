@@ -23,144 +23,86 @@ SOFTWARE.
 import xlsxwriter
 from openpyxl import load_workbook
 import pandas as pd
-
-
-def create_worksheet_fn(workbook, worksheet_name):
-    """ Create establishment worksheet and set row height.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name."""
-
-    # Set up Site Establishment worksheet
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(56.25)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings_fn(workbook, worksheet, heading2, heading3):
-    """ Add item headings to cells as strings.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading3: workbook style derived  from define heading3_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('A2', 'ITEM', heading2)
-    worksheet.write_string('A3', 'RECORDER:', heading3)
-    worksheet.write_string('A4', 'ESTIMATOR:', heading3)
-    worksheet.write_string('A5', 'ANY OTHERS PRESENT:', heading3)
-    worksheet.write_string('A6', 'PROPERTY:', heading3)
-    worksheet.write_string('A7', 'UNLISTED PROPERTY: (if required)', heading3)
-    worksheet.write_string('A8', 'SITE ID:', heading3)
-    worksheet.write_string('A9', 'PADDOCK NAME:', heading3)
-    worksheet.write_string('A10', 'DATE & TIME:', heading3)
-    worksheet.write_string('A11', 'DIRECTION FROM OFFSET:', heading3)
-    worksheet.write_string('A12', 'DATUM:', heading3)
-    worksheet.write_string('A13', 'OFFSET (LAT):', heading3)
-    worksheet.write_string('A14', 'OFFSET (LONG):', heading3)
-    worksheet.write_string('A15', 'CENTRE POINT (LAT):', heading3)
-    worksheet.write_string('A16', 'CENTRE POINT (LONG):', heading3)
-    worksheet.write_string('A17', 'LANDSCAPE POSITION:', heading3)
-    worksheet.write_string('A18', 'SOIL SURFACE COLOUR:', heading3)
-    worksheet.write_string('A19', 'SITE DESCRIPTION:', heading3)
-    worksheet.write_string('A20', 'REASON FOR SITE SELECTION:', heading3)
-    worksheet.write_string('A21', 'LAND SYSTEM:', heading3)
-    worksheet.write_string('D21', 'SOURCE', heading3)
-    worksheet.write_string('A22', 'CONSISTENT WITH MAPPING?:', heading3)
-    worksheet.write_string('D22', 'IF NO, WHAT LAND SYSTEM:', heading3)
-    worksheet.write_string('A23', 'NOTES:', heading3)
-    worksheet.write_string('A24', 'NEAREST STOCK WATER (NAME):', heading3)
-    worksheet.write_string('D24', 'NEAREST STOCK WATER (TYPE):', heading3)
-    worksheet.write_string('A25', 'DISTANCE FROM NEAREST STOCK WATER (km):', heading3)
-    worksheet.write_string('D25', 'DIRECTION FROM NEAREST STOCK WATER:', heading3)
-    worksheet.write_string('A26', 'DISTANCE FROM TRACK (m):', heading3)
-    worksheet.write_string('D26', 'DIRECTION FROM TRACK:', heading3)
-    worksheet.write_string('A27', 'OTHER NEARBY INFRASTRUCTURE:', heading3)
-
-    return workbook, worksheet
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7):
-    """ Add blank formatted cells to worksheet.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_blank('E21', None, heading7)
-    worksheet.write_blank('E22', None, heading7)
-    worksheet.write_blank('E24', None, heading7)
-    worksheet.write_blank('E25', None, heading7)
-    worksheet.write_blank('E26', None, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells(workbook, worksheet, worksheet_name, heading1, heading2, heading7):
-    """ Add item headings to cells and merge.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param worksheet_name: string object containing the worksheet name.
-            :param heading1: workbook style derived  from define heading1_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.merge_range('A1:E1', worksheet_name, heading1)
-    worksheet.merge_range('B2:E2', 'INPUT', heading2)
-    worksheet.merge_range('B3:E3', '', heading7)
-    worksheet.merge_range('B4:E4', '', heading7)
-    worksheet.merge_range('B5:E5', '', heading7)
-    worksheet.merge_range('B6:E6', '', heading7)
-    worksheet.merge_range('B7:E7', '', heading7)
-    worksheet.merge_range('B8:E8', '', heading7)
-    worksheet.merge_range('B9:E9', '', heading7)
-    worksheet.merge_range('B10:E10', '', heading7)
-    worksheet.merge_range('B11:E11', '', heading7)
-    worksheet.merge_range('B12:E12', '', heading7)
-    worksheet.merge_range('B13:E13', '', heading7)
-    worksheet.merge_range('B14:E14', '', heading7)
-    worksheet.merge_range('B15:E15', '', heading7)
-    worksheet.merge_range('B16:E16', '', heading7)
-    worksheet.merge_range('B17:E17', '', heading7)
-    worksheet.merge_range('B18:E18', '', heading7)
-    worksheet.merge_range('B19:E19', '', heading7)
-    worksheet.merge_range('B20:E20', '', heading7)
-    worksheet.merge_range('B21:C21', '', heading7)
-    worksheet.merge_range('B22:C22', '', heading7)
-    worksheet.merge_range('B23:E23', '', heading7)
-    worksheet.merge_range('B24:C24', '', heading7)
-    worksheet.merge_range('B25:C25', '', heading7)
-    worksheet.merge_range('B26:C26', '', heading7)
-    worksheet.merge_range('B27:E27', '', heading7)
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ define and set column widths.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.set_column('A:A', 45.73)
-    worksheet.set_column('B:B', 10.09)
-    worksheet.set_column('C:C', 26.91)
-    worksheet.set_column('D:D', 26.91)
-    worksheet.set_column('E:E', 26.91)
-
-    return workbook, worksheet
+import worksheet_template
+
+
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step10_3_site_create_establishment_sheet',
+    'default_row': 56.25,
+    'cell_list': [
+        ('write_string', 'A2', 'ITEM', 'heading2'),
+        ('write_string', 'A3', 'RECORDER:', 'heading3'),
+        ('write_string', 'A4', 'ESTIMATOR:', 'heading3'),
+        ('write_string', 'A5', 'ANY OTHERS PRESENT:', 'heading3'),
+        ('write_string', 'A6', 'PROPERTY:', 'heading3'),
+        ('write_string', 'A7', 'UNLISTED PROPERTY: (if required)', 'heading3'),
+        ('write_string', 'A8', 'SITE ID:', 'heading3'),
+        ('write_string', 'A9', 'PADDOCK NAME:', 'heading3'),
+        ('write_string', 'A10', 'DATE & TIME:', 'heading3'),
+        ('write_string', 'A11', 'DIRECTION FROM OFFSET:', 'heading3'),
+        ('write_string', 'A12', 'DATUM:', 'heading3'),
+        ('write_string', 'A13', 'OFFSET (LAT):', 'heading3'),
+        ('write_string', 'A14', 'OFFSET (LONG):', 'heading3'),
+        ('write_string', 'A15', 'CENTRE POINT (LAT):', 'heading3'),
+        ('write_string', 'A16', 'CENTRE POINT (LONG):', 'heading3'),
+        ('write_string', 'A17', 'LANDSCAPE POSITION:', 'heading3'),
+        ('write_string', 'A18', 'SOIL SURFACE COLOUR:', 'heading3'),
+        ('write_string', 'A19', 'SITE DESCRIPTION:', 'heading3'),
+        ('write_string', 'A20', 'REASON FOR SITE SELECTION:', 'heading3'),
+        ('write_string', 'A21', 'LAND SYSTEM:', 'heading3'),
+        ('write_string', 'D21', 'SOURCE', 'heading3'),
+        ('write_string', 'A22', 'CONSISTENT WITH MAPPING?:', 'heading3'),
+        ('write_string', 'D22', 'IF NO, WHAT LAND SYSTEM:', 'heading3'),
+        ('write_string', 'A23', 'NOTES:', 'heading3'),
+        ('write_string', 'A24', 'NEAREST STOCK WATER (NAME):', 'heading3'),
+        ('write_string', 'D24', 'NEAREST STOCK WATER (TYPE):', 'heading3'),
+        ('write_string', 'A25', 'DISTANCE FROM NEAREST STOCK WATER (km):', 'heading3'),
+        ('write_string', 'D25', 'DIRECTION FROM NEAREST STOCK WATER:', 'heading3'),
+        ('write_string', 'A26', 'DISTANCE FROM TRACK (m):', 'heading3'),
+        ('write_string', 'D26', 'DIRECTION FROM TRACK:', 'heading3'),
+        ('write_string', 'A27', 'OTHER NEARBY INFRASTRUCTURE:', 'heading3'),
+        ('write_blank', 'E21', None, 'heading7'),
+        ('write_blank', 'E22', None, 'heading7'),
+        ('write_blank', 'E24', None, 'heading7'),
+        ('write_blank', 'E25', None, 'heading7'),
+        ('write_blank', 'E26', None, 'heading7'),
+        ('merge_range', 'A1:E1', worksheet_template.WORKSHEET_NAME, 'heading1'),
+        ('merge_range', 'B2:E2', 'INPUT', 'heading2'),
+        ('merge_range', 'B3:E3', '', 'heading7'),
+        ('merge_range', 'B4:E4', '', 'heading7'),
+        ('merge_range', 'B5:E5', '', 'heading7'),
+        ('merge_range', 'B6:E6', '', 'heading7'),
+        ('merge_range', 'B7:E7', '', 'heading7'),
+        ('merge_range', 'B8:E8', '', 'heading7'),
+        ('merge_range', 'B9:E9', '', 'heading7'),
+        ('merge_range', 'B10:E10', '', 'heading7'),
+        ('merge_range', 'B11:E11', '', 'heading7'),
+        ('merge_range', 'B12:E12', '', 'heading7'),
+        ('merge_range', 'B13:E13', '', 'heading7'),
+        ('merge_range', 'B14:E14', '', 'heading7'),
+        ('merge_range', 'B15:E15', '', 'heading7'),
+        ('merge_range', 'B16:E16', '', 'heading7'),
+        ('merge_range', 'B17:E17', '', 'heading7'),
+        ('merge_range', 'B18:E18', '', 'heading7'),
+        ('merge_range', 'B19:E19', '', 'heading7'),
+        ('merge_range', 'B20:E20', '', 'heading7'),
+        ('merge_range', 'B21:C21', '', 'heading7'),
+        ('merge_range', 'B22:C22', '', 'heading7'),
+        ('merge_range', 'B23:E23', '', 'heading7'),
+        ('merge_range', 'B24:C24', '', 'heading7'),
+        ('merge_range', 'B25:C25', '', 'heading7'),
+        ('merge_range', 'B26:C26', '', 'heading7'),
+        ('merge_range', 'B27:E27', '', 'heading7'),
+    ],
+    'column_list': [
+        ('A:A', 45.73),
+        ('B:B', 10.09),
+        ('C:C', 26.91),
+        ('D:D', 26.91),
+        ('E:E', 26.91),
+    ],
+}
 
 
 def insert_vertical_data_fn(worksheet, row, col, input_list, style, factor):
@@ -176,7 +118,6 @@ def insert_vertical_data_fn(worksheet, row, col, input_list, style, factor):
     if input_list[0]:
         # Iterate over the data and write it out row by row.
         for item in input_list:
-            print(item)
             worksheet.write(row, col, item, style)
             row += factor
 
@@ -194,7 +135,6 @@ def insert_horizontal_data_fn(worksheet, row, col, input_list, style, factor):
     if input_list[0]:
         # Iterate over the data and write it out row by row.
         for item in input_list:
-            print(item)
             worksheet.write(row, col, item, style)
             col += factor
 
@@ -215,20 +155,10 @@ def main_routine(heading1, heading2, heading3, heading7, workbook, obs_data_list
 
     work_sheet_name = 'Step 1 - Site Establishment'
 
-    # call the create_worksheet_fn function.
-    workbook, worksheet = create_worksheet_fn(workbook, work_sheet_name)
-
-    # call the insert_sheet_headings_fn function.
-    workbook, worksheet = insert_sheet_headings_fn(workbook, worksheet, heading2, heading3)
-
-    # call the insert_blank_formatted_cells_fn function.
-    workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7)
-
-    # call the merge_cells_fn function.
-    workbook, worksheet = merge_cells(workbook, worksheet, work_sheet_name, heading1, heading2, heading7)
-
-    # call the define_column_widths_fn(workbook) function
-    workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+    # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+    worksheet = worksheet_template.main_routine(
+        workbook, work_sheet_name, LAYOUT,
+        dict(heading1=heading1, heading2=heading2, heading3=heading3, heading7=heading7))
 
     establishment_data_list = obs_data_list[0]
     if establishment_data_list[0]:
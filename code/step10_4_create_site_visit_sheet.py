@@ -19,97 +19,44 @@ SOFTWARE.
 
 """
 
-
-def create_worksheet(workbook, worksheet_name):
-    """ Create establishment worksheet and set row height.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name."""
-
-    # Set up Site Establishment worksheet
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(56.25)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings(workbook, worksheet, heading2, heading3):
-    """ Add item headings to cells as strings.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading3: workbook style derived  from define heading3_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('A2', 'ITEM', heading2)
-    worksheet.write_string('B2', 'INPUT', heading2)
-    worksheet.write_string('A3', 'RECORDER:', heading3)
-    worksheet.write_string('A4', 'ESTIMATOR:', heading3)
-    worksheet.write_string('A5', 'SITE ID:', heading3)
-    worksheet.write_string('A6', 'DATE & TIME:', heading3)
-    worksheet.write_string('A7', 'OFFSET PHOTO NUMBER:', heading3)
-    worksheet.write_string('A8', 'SEASONAL CONDITIONS:', heading3)
-    worksheet.write_string('A9', 'ATMOSPHERIC CONDITIONS:', heading3)
-    worksheet.write_string('A10', 'SURFACE CRACKS:', heading3)
-    worksheet.write_string('A11', 'SOIL MOISTURE:', heading3)
-    worksheet.write_string('A12', 'BRIEF SITE DESCRIPTION:', heading3)
-
-    return workbook, worksheet
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7):
-    """ Add blank formatted cells to worksheet.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_blank('B3', None, heading7)
-    worksheet.write_blank('B4', None, heading7)
-    worksheet.write_blank('B5', None, heading7)
-    worksheet.write_blank('B6', None, heading7)
-    worksheet.write_blank('B7', None, heading7)
-    worksheet.write_blank('B8', None, heading7)
-    worksheet.write_blank('B9', None, heading7)
-    worksheet.write_blank('B10', None, heading7)
-    worksheet.write_blank('B11', None, heading7)
-    worksheet.write_blank('B12', None, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells_fn(workbook, worksheet, worksheet_name, heading1):
-    """ Add item headings to cells and merge.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param worksheet_name: string object containing the worksheet name.
-            :param heading1: workbook style derived  from define heading1_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.merge_range('A1:B1', worksheet_name, heading1)
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ define and set column widths.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.set_column('A:A', 45.73)
-    worksheet.set_column('B:B', 71.09)
-
-    return workbook, worksheet
+# import modules
+import worksheet_template
+
+
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step10_4_create_site_visit_sheet',
+    'default_row': 56.25,
+    'cell_list': [
+        ('write_string', 'A2', 'ITEM', 'heading2'),
+        ('write_string', 'B2', 'INPUT', 'heading2'),
+        ('write_string', 'A3', 'RECORDER:', 'heading3'),
+        ('write_string', 'A4', 'ESTIMATOR:', 'heading3'),
+        ('write_string', 'A5', 'SITE ID:', 'heading3'),
+        ('write_string', 'A6', 'DATE & TIME:', 'heading3'),
+        ('write_string', 'A7', 'OFFSET PHOTO NUMBER:', 'heading3'),
+        ('write_string', 'A8', 'SEASONAL CONDITIONS:', 'heading3'),
+        ('write_string', 'A9', 'ATMOSPHERIC CONDITIONS:', 'heading3'),
+        ('write_string', 'A10', 'SURFACE CRACKS:', 'heading3'),
+        ('write_string', 'A11', 'SOIL MOISTURE:', 'heading3'),
+        ('write_string', 'A12', 'BRIEF SITE DESCRIPTION:', 'heading3'),
+        ('write_blank', 'B3', None, 'heading7'),
+        ('write_blank', 'B4', None, 'heading7'),
+        ('write_blank', 'B5', None, 'heading7'),
+        ('write_blank', 'B6', None, 'heading7'),
+        ('write_blank', 'B7', None, 'heading7'),
+        ('write_blank', 'B8', None, 'heading7'),
+        ('write_blank', 'B9', None, 'heading7'),
+        ('write_blank', 'B10', None, 'heading7'),
+        ('write_blank', 'B11', None, 'heading7'),
+        ('write_blank', 'B12', None, 'heading7'),
+        ('merge_range', 'A1:B1', worksheet_template.WORKSHEET_NAME, 'heading1'),
+    ],
+    'column_list': [
+        ('A:A', 45.73),
+        ('B:B', 71.09),
+    ],
+}
 
 
 def main_routine(heading1, heading2, heading3, heading7, workbook, obs_data_list, insert_vertical_data_fn):
@@ -125,20 +72,10 @@ def main_routine(heading1, heading2, heading3, heading7, workbook, obs_data_list
 
     worksheet_name = 'Step 2 - Visit Details'
 
-    # call the createEstablishmentWorksheet function.
-    workbook, worksheet = create_worksheet(workbook, worksheet_name)
-
-    # call the insert_sheet_headings_fn function.
-    workbook, worksheet = insert_sheet_headings(workbook, worksheet, heading2, heading3)
-
-    # call the insert_blank_formatted_cells_fn function.
-    workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7)
-
-    # call the merge_cells_fn function.
-    workbook, worksheet = merge_cells_fn(workbook, worksheet, worksheet_name, heading1)
-
-    # call the define_column_widths_fn(workbook) function
-    workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+    # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+    worksheet = worksheet_template.main_routine(
+        workbook, worksheet_name, LAYOUT,
+        dict(heading1=heading1, heading2=heading2, heading3=heading3, heading7=heading7))
 
     visitDataList = obs_data_list[1]
     # call the insertDataFN function
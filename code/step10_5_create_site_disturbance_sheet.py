@@ -20,193 +20,128 @@ SOFTWARE.
 """
 # import modules
 import os
-
-
-def create_worksheet_fn(workbook, worksheet_name):
-    """ Create worksheet and set row height.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    # Set up Site Establishment worksheet
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(57.00)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings(workbook, worksheet, heading2, heading3, heading4, heading5, color_fill):
-    """ Add item headings to cells as strings.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading3: workbook style derived  from define heading3_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :param heading5: workbook style derived  from define heading5_fn.
-            :param color_fill: workbook style derived  from define colour_fill_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('A2', 'ITEM', heading2)
-    worksheet.write_string('A3', 'CLEARING:', heading3)
-    worksheet.write_string('A5', 'CYCLONE/STORM:', heading3)
-    worksheet.write_string('A7', 'DIEBACK', heading3)
-    worksheet.write_string('A9', 'ADJACENT INFRASTRUCTURE:', heading3)
-    worksheet.write_string('A10', 'COMMENTS:', heading3)
-    worksheet.write_string('A11', 'DISTANCE TO INFRASTRUCTURE:', heading3)
-    worksheet.write_string('A12', 'WILD ANIMAL ACTIVITY:', heading3)
-    worksheet.write_string('B12', 'Camel', heading5)
-    worksheet.write_string('C12', 'Rabbit', heading5)
-    worksheet.write_string('D12', 'Donkey', heading5)
-    worksheet.write_string('E12', 'Horse', heading5)
-    worksheet.write_string('F12', 'Pig', heading5)
-    worksheet.write_string('G12', 'Buffalo', heading5)
-    worksheet.write_string('H12', 'Native herbivore', heading5)
-    worksheet.write_string('I12', 'Other', heading5)
-    worksheet.write_string('A13', 'ACTIVE', heading3)
-    worksheet.write_string('A14', 'EVIDENCE AND DESCRIPTION:', heading3)
-    worksheet.write_string('A17', 'FREQUENCY', heading3)
-    worksheet.write_string('A18', 'INTENSITY', heading3)
-    worksheet.write_string('A20', 'CATTLE ACTIVITY:', heading3)
-    worksheet.write_string('A22', 'IS THIS AN ERODIBLE SOIL?', heading3)
-    worksheet.write_string('B23', 'Severity', heading4)
-    worksheet.write_string('A24', 'SCALDING - wind or water', heading3)
-    worksheet.write_string('A25', 'WINDSHEETING', heading3)
-    worksheet.write_string('A26', 'WATERSHEETING', heading3)
-    worksheet.write_string('A27', 'RILLING', heading3)
-    worksheet.write_string('A28', 'GULLYING', heading3)
-    worksheet.write_string('A29', 'EROSION COMMENTS AND PHOTO NUMBERS', heading3)
-    worksheet.write_string('A30', 'WEEDS', heading3)
-    worksheet.write_string('A31', 'OTHER DISTURBANCE COMMENTS', heading3)
-
-    worksheet.write('A4', None, color_fill)
-    worksheet.write('A8', None, color_fill)
-    worksheet.write('A16', None, color_fill)
-    worksheet.write('A19', None, color_fill)
-    worksheet.write('A23', None, color_fill)
-
-    return workbook, worksheet
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7):
-    """ Add blank formatted cells to worksheet.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_blank('B13', None, heading7)
-    worksheet.write_blank('C13', None, heading7)
-    worksheet.write_blank('D13', None, heading7)
-    worksheet.write_blank('E13', None, heading7)
-    worksheet.write_blank('F13', None, heading7)
-    worksheet.write_blank('G13', None, heading7)
-    worksheet.write_blank('H13', None, heading7)
-    worksheet.write_blank('I13', None, heading7)
-    worksheet.write_blank('K20', None, heading7)
-    worksheet.write_blank('B24', None, heading7)
-    worksheet.write_blank('B25', None, heading7)
-    worksheet.write_blank('B26', None, heading7)
-    worksheet.write_blank('B27', None, heading7)
-    worksheet.write_blank('B28', None, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells_fn(workbook, worksheet, worksheet_name, heading1, heading2, heading4, heading7):
-    """ Add item headings to cells and merge.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param worksheet_name: string object containing the worksheet name.
-            :param heading1: workbook style derived  from define heading1_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.merge_range('A1:K1', worksheet_name, heading1)
-    worksheet.merge_range('B2:K2', 'INPUT', heading2)
-    worksheet.merge_range('B3:C3', '', heading7)
-    worksheet.merge_range('D3:E3', 'Photo numbers', heading4)
-    worksheet.merge_range('F3:K3', '', heading7)
-    worksheet.merge_range('B4:C4', 'Comments', heading4)
-    worksheet.merge_range('D4:K4', '', heading7)
-    worksheet.merge_range('B5:C5', '', heading7)
-    worksheet.merge_range('D5:E5', 'Photo numbers', heading4)
-    worksheet.merge_range('F5:K5', '', heading7)
-    worksheet.merge_range('B6:C6', 'Comments', heading4)
-    worksheet.merge_range('D6:K6', '', heading7)
-    worksheet.merge_range('B7:C7', '', heading7)
-    worksheet.merge_range('D7:E7', 'Photo numbers', heading4)
-    worksheet.merge_range('F7:K7', '', heading7)
-    worksheet.merge_range('B8:C8', 'Comments', heading4)
-    worksheet.merge_range('D8:K8', '', heading7)
-    worksheet.merge_range('B9:K9', '', heading7)
-    worksheet.merge_range('B10:K10', '', heading7)
-    worksheet.merge_range('B11:K11', '', heading7)
-    worksheet.merge_range('B14:K14', '', heading7)
-    worksheet.merge_range('A15:K15', 'FIRE', heading2)
-    worksheet.merge_range('B16:F16', 'NORTH REGION', heading4)
-    worksheet.merge_range('B17:F17', '', heading7)
-    worksheet.merge_range('G17:K17', '', heading7)
-    worksheet.merge_range('B18:F18', '', heading7)
-    worksheet.merge_range('G16:K16', 'SOUTH REGION', heading4)
-    worksheet.merge_range('G18:K18', '', heading7)
-    worksheet.merge_range('B19:K19', '')  # No formatting required
-    worksheet.merge_range('B20:C20', 'CATTLE PADS', heading4)
-    worksheet.merge_range('D20:F20', '', heading7)
-    worksheet.merge_range('G20:J20', 'TRAMPLING', heading4)
-    worksheet.merge_range('A21:K21', 'EROSION', heading2)
-    worksheet.merge_range('B22:K22', '', heading7)
-    worksheet.merge_range('C23:D23', 'Stability', heading4)
-    worksheet.merge_range('E23:K23', '', heading7)
-    worksheet.merge_range('C24:D24', '', heading7)
-    worksheet.merge_range('E24:K24', '', heading7)
-    worksheet.merge_range('C25:D25', '', heading7)
-    worksheet.merge_range('E25:K25', '', heading7)
-    worksheet.merge_range('C26:D26', '', heading7)
-    worksheet.merge_range('E26:K26', '', heading7)
-    worksheet.merge_range('C27:D27', '', heading7)
-    worksheet.merge_range('E27:K27', '', heading7)
-    worksheet.merge_range('C28:D28', '', heading7)
-    worksheet.merge_range('E28:K28', '', heading7)
-    worksheet.merge_range('B29:K29', '', heading7)
-    worksheet.merge_range('B30:K30', '', heading7)
-    worksheet.merge_range('B31:K31', '', heading7)
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ define and set column widths.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.set_column('A:A', 37.91)
-    worksheet.set_column('B:B', 12.27)
-    worksheet.set_column('C:C', 8.45)
-    worksheet.set_column('D:D', 10.82)
-    worksheet.set_column('E:E', 8.14)
-    worksheet.set_column('F:F', 8.09)
-    worksheet.set_column('G:G', 8.45)
-    worksheet.set_column('H:H', 12.14)
-    worksheet.set_column('I:I', 8.14)
-    worksheet.set_column('J:J', 6.82)
-    worksheet.set_column('K:K', 17.55)
-
-    return workbook, worksheet
+import worksheet_template
+
+
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step10_5_create_site_disturbance_sheet',
+    'default_row': 57.0,
+    'cell_list': [
+        ('write_string', 'A2', 'ITEM', 'heading2'),
+        ('write_string', 'A3', 'CLEARING:', 'heading3'),
+        ('write_string', 'A5', 'CYCLONE/STORM:', 'heading3'),
+        ('write_string', 'A7', 'DIEBACK', 'heading3'),
+        ('write_string', 'A9', 'ADJACENT INFRASTRUCTURE:', 'heading3'),
+        ('write_string', 'A10', 'COMMENTS:', 'heading3'),
+        ('write_string', 'A11', 'DISTANCE TO INFRASTRUCTURE:', 'heading3'),
+        ('write_string', 'A12', 'WILD ANIMAL ACTIVITY:', 'heading3'),
+        ('write_string', 'B12', 'Camel', 'heading5'),
+        ('write_string', 'C12', 'Rabbit', 'heading5'),
+        ('write_string', 'D12', 'Donkey', 'heading5'),
+        ('write_string', 'E12', 'Horse', 'heading5'),
+        ('write_string', 'F12', 'Pig', 'heading5'),
+        ('write_string', 'G12', 'Buffalo', 'heading5'),
+        ('write_string', 'H12', 'Native herbivore', 'heading5'),
+        ('write_string', 'I12', 'Other', 'heading5'),
+        ('write_string', 'A13', 'ACTIVE', 'heading3'),
+        ('write_string', 'A14', 'EVIDENCE AND DESCRIPTION:', 'heading3'),
+        ('write_string', 'A17', 'FREQUENCY', 'heading3'),
+        ('write_string', 'A18', 'INTENSITY', 'heading3'),
+        ('write_string', 'A20', 'CATTLE ACTIVITY:', 'heading3'),
+        ('write_string', 'A22', 'IS THIS AN ERODIBLE SOIL?', 'heading3'),
+        ('write_string', 'B23', 'Severity', 'heading4'),
+        ('write_string', 'A24', 'SCALDING - wind or water', 'heading3'),
+        ('write_string', 'A25', 'WINDSHEETING', 'heading3'),
+        ('write_string', 'A26', 'WATERSHEETING', 'heading3'),
+        ('write_string', 'A27', 'RILLING', 'heading3'),
+        ('write_string', 'A28', 'GULLYING', 'heading3'),
+        ('write_string', 'A29', 'EROSION COMMENTS AND PHOTO NUMBERS', 'heading3'),
+        ('write_string', 'A30', 'WEEDS', 'heading3'),
+        ('write_string', 'A31', 'OTHER DISTURBANCE COMMENTS', 'heading3'),
+        ('write', 'A4', None, 'color_fill'),
+        ('write', 'A8', None, 'color_fill'),
+        ('write', 'A16', None, 'color_fill'),
+        ('write', 'A19', None, 'color_fill'),
+        ('write', 'A23', None, 'color_fill'),
+        ('write_blank', 'B13', None, 'heading7'),
+        ('write_blank', 'C13', None, 'heading7'),
+        ('write_blank', 'D13', None, 'heading7'),
+        ('write_blank', 'E13', None, 'heading7'),
+        ('write_blank', 'F13', None, 'heading7'),
+        ('write_blank', 'G13', None, 'heading7'),
+        ('write_blank', 'H13', None, 'heading7'),
+        ('write_blank', 'I13', None, 'heading7'),
+        ('write_blank', 'K20', None, 'heading7'),
+        ('write_blank', 'B24', None, 'heading7'),
+        ('write_blank', 'B25', None, 'heading7'),
+        ('write_blank', 'B26', None, 'heading7'),
+        ('write_blank', 'B27', None, 'heading7'),
+        ('write_blank', 'B28', None, 'heading7'),
+        ('merge_range', 'A1:K1', worksheet_template.WORKSHEET_NAME, 'heading1'),
+        ('merge_range', 'B2:K2', 'INPUT', 'heading2'),
+        ('merge_range', 'B3:C3', '', 'heading7'),
+        ('merge_range', 'D3:E3', 'Photo numbers', 'heading4'),
+        ('merge_range', 'F3:K3', '', 'heading7'),
+        ('merge_range', 'B4:C4', 'Comments', 'heading4'),
+        ('merge_range', 'D4:K4', '', 'heading7'),
+        ('merge_range', 'B5:C5', '', 'heading7'),
+        ('merge_range', 'D5:E5', 'Photo numbers', 'heading4'),
+        ('merge_range', 'F5:K5', '', 'heading7'),
+        ('merge_range', 'B6:C6', 'Comments', 'heading4'),
+        ('merge_range', 'D6:K6', '', 'heading7'),
+        ('merge_range', 'B7:C7', '', 'heading7'),
+        ('merge_range', 'D7:E7', 'Photo numbers', 'heading4'),
+        ('merge_range', 'F7:K7', '', 'heading7'),
+        ('merge_range', 'B8:C8', 'Comments', 'heading4'),
+        ('merge_range', 'D8:K8', '', 'heading7'),
+        ('merge_range', 'B9:K9', '', 'heading7'),
+        ('merge_range', 'B10:K10', '', 'heading7'),
+        ('merge_range', 'B11:K11', '', 'heading7'),
+        ('merge_range', 'B14:K14', '', 'heading7'),
+        ('merge_range', 'A15:K15', 'FIRE', 'heading2'),
+        ('merge_range', 'B16:F16', 'NORTH REGION', 'heading4'),
+        ('merge_range', 'B17:F17', '', 'heading7'),
+        ('merge_range', 'G17:K17', '', 'heading7'),
+        ('merge_range', 'B18:F18', '', 'heading7'),
+        ('merge_range', 'G16:K16', 'SOUTH REGION', 'heading4'),
+        ('merge_range', 'G18:K18', '', 'heading7'),
+        ('merge_range', 'B19:K19', '', None),
+        ('merge_range', 'B20:C20', 'CATTLE PADS', 'heading4'),
+        ('merge_range', 'D20:F20', '', 'heading7'),
+        ('merge_range', 'G20:J20', 'TRAMPLING', 'heading4'),
+        ('merge_range', 'A21:K21', 'EROSION', 'heading2'),
+        ('merge_range', 'B22:K22', '', 'heading7'),
+        ('merge_range', 'C23:D23', 'Stability', 'heading4'),
+        ('merge_range', 'E23:K23', '', 'heading7'),
+        ('merge_range', 'C24:D24', '', 'heading7'),
+        ('merge_range', 'E24:K24', '', 'heading7'),
+        ('merge_range', 'C25:D25', '', 'heading7'),
+        ('merge_range', 'E25:K25', '', 'heading7'),
+        ('merge_range', 'C26:D26', '', 'heading7'),
+        ('merge_range', 'E26:K26', '', 'heading7'),
+        ('merge_range', 'C27:D27', '', 'heading7'),
+        ('merge_range', 'E27:K27', '', 'heading7'),
+        ('merge_range', 'C28:D28', '', 'heading7'),
+        ('merge_range', 'E28:K28', '', 'heading7'),
+        ('merge_range', 'B29:K29', '', 'heading7'),
+        ('merge_range', 'B30:K30', '', 'heading7'),
+        ('merge_range', 'B31:K31', '', 'heading7'),
+    ],
+    'column_list': [
+        ('A:A', 37.91),
+        ('B:B', 12.27),
+        ('C:C', 8.45),
+        ('D:D', 10.82),
+        ('E:E', 8.14),
+        ('F:F', 8.09),
+        ('G:G', 8.45),
+        ('H:H', 12.14),
+        ('I:I', 8.14),
+        ('J:J', 6.82),
+        ('K:K', 17.55),
+    ],
+}
 
 
 def list_of_photos_fn(site_dir, search_criteria):
@@ -247,20 +182,11 @@ def main_routine(color_fill, heading1, heading2, heading3, heading4, heading5, h
 
     worksheet_name = 'Step 3 - Disturbance Details'
 
-    # call the create_worksheet_fn function.
-    workbook, worksheet = create_worksheet_fn(workbook, worksheet_name)
-
-    # call the insert_sheet_headings_fn function.
-    workbook, worksheet = insert_sheet_headings(workbook, worksheet, heading2, heading3, heading4, heading5, color_fill)
-
-    # call the insert_blank_formatted_cells_fn function.
-    workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7)
-
-    # call the merge_cells_fn function.
-    workbook, worksheet = merge_cells_fn(workbook, worksheet, worksheet_name, heading1, heading2, heading4, heading7)
-
-    # call the define_column_widths_fn function
-    workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+    # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+    worksheet = worksheet_template.main_routine(
+        workbook, worksheet_name, LAYOUT,
+        dict(color_fill=color_fill, heading1=heading1, heading2=heading2, heading3=heading3, heading4=heading4,
+             heading5=heading5, heading7=heading7))
 
     disturbance_data_list = obs_data_list[2]
     if disturbance_data_list[0]:
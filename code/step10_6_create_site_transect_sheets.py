@@ -17,94 +17,41 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 SOFTWARE.
 """
 
-
-def create_worksheet_fn(workbook, worksheet_name):
-    """ Create establishment worksheet and set row height.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name."""
-
-    # Set up Site Establishment worksheet #
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(56.25)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings_fn(workbook, worksheet, heading2, heading4, color_fill, range_value):
-    """ Add item headings to cells as strings.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading2: workbook style derived  from define heading2_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :param color_fill: workbook style derived  from define colour_fill_fn.
-            :param range_value: range of integers as a tuple (i.e.(1, 101)).
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('B2', 'TRANSECT 1', heading2)
-    worksheet.write_string('C2', 'START POINT', heading2)
-    worksheet.write_string('B3', 'GROUND LAYER', heading4)
-    worksheet.write_string('C3', 'BELOW', heading4)
-    worksheet.write_string('D3', 'ABOVE', heading4)
-    worksheet.write_column('A4', range_value, heading4)
-    worksheet.write('A1', None, color_fill)
-    worksheet.write('A2', None, color_fill)
-    worksheet.write('A3', None, color_fill)
-
-    return workbook, worksheet, range_value
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7, range_value):
-    """ Add blank formatted cells to worksheet.
-
-            :param range_value: range of integers as a tuple (i.e.(1, 101)).
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_column('B4', range_value, heading7)
-    worksheet.write_column('C4', range_value, heading7)
-    worksheet.write_column('D4', range_value, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells(workbook, worksheet, heading1, heading7):
-    """ Add item headings to cells and merge.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading1: workbook style derived  from define heading1_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.merge_range('B1:E1', 'STEP 4A - TRANSECT 1', heading1)
-    worksheet.merge_range('D2:E2', '', heading7)
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ define and set column widths.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.set_column('A:A', 9.09)
-    worksheet.set_column('B:B', 48.00)
-    worksheet.set_column('C:C', 48.00)
-    worksheet.set_column('D:D', 48.00)
-    worksheet.set_column('E:E', 13.00)
-
-    return workbook, worksheet
+# import modules
+import worksheet_template
+
+
+# the transect point numbers (1 - 100).
+TRANSECT_POINT_LIST = list(range(1, 101))
+
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step10_6_create_site_transect_sheets',
+    'default_row': 56.25,
+    'cell_list': [
+        ('write_string', 'B2', 'TRANSECT 1', 'heading2'),
+        ('write_string', 'C2', 'START POINT', 'heading2'),
+        ('write_string', 'B3', 'GROUND LAYER', 'heading4'),
+        ('write_string', 'C3', 'BELOW', 'heading4'),
+        ('write_string', 'D3', 'ABOVE', 'heading4'),
+        ('write_column', 'A4', TRANSECT_POINT_LIST, 'heading4'),
+        ('write', 'A1', None, 'color_fill'),
+        ('write', 'A2', None, 'color_fill'),
+        ('write', 'A3', None, 'color_fill'),
+        ('write_column', 'B4', TRANSECT_POINT_LIST, 'heading7'),
+        ('write_column', 'C4', TRANSECT_POINT_LIST, 'heading7'),
+        ('write_column', 'D4', TRANSECT_POINT_LIST, 'heading7'),
+        ('merge_range', 'B1:E1', 'STEP 4A - TRANSECT 1', 'heading1'),
+        ('merge_range', 'D2:E2', '', 'heading7'),
+    ],
+    'column_list': [
+        ('A:A', 9.09),
+        ('B:B', 48.0),
+        ('C:C', 48.0),
+        ('D:D', 48.0),
+        ('E:E', 13.0),
+    ],
+}
 
 
 def extract_features_to_list_fn(clean_df_list):
@@ -172,23 +119,10 @@ def main_routine(clean_df_list, color_fill, heading1, heading2, heading4, headin
 
         worksheet_name = i
 
-        range_value = range(1, 101)
-
-        # call the create_worksheet_fn function.
-        workbook, worksheet = create_worksheet_fn(workbook, worksheet_name)
-
-        # call the insert_sheet_headings_fn function.
-        workbook, worksheet, range_value = insert_sheet_headings_fn(workbook, worksheet, heading2, heading4, color_fill,
-                                                                    range_value)
-
-        # call the insert_blank_formatted_cells_fn function.
-        workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7, range_value)
-
-        # call the merge_cells_fn function.
-        workbook, worksheet = merge_cells(workbook, worksheet, heading1, heading7)
-
-        # call the define_column_widths_fn(workbook) function.
-        workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+        # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+        worksheet = worksheet_template.main_routine(
+            workbook, worksheet_name, LAYOUT,
+            dict(color_fill=color_fill, heading1=heading1, heading2=heading2, heading4=heading4, heading7=heading7))
 
         # call the extract_features_to_list_fn function.
         content_list = extract_features_to_list_fn(clean_df_list)
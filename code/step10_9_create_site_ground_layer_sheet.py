@@ -19,122 +19,73 @@ SOFTWARE.
 
 """
 
+# import modules
+import worksheet_template
+
 
 # I have rearranged the order of this sheet. If there are errors it could be due to this.
 
 
-def create_worksheet_fn(workbook, worksheet_name):
-    """ Create worksheet and set row height.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name."""
-
-    # Set up Site Establishment worksheet
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(56.25)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings_fn(workbook, worksheet, heading4, color_fill):
-    """ Add item headings to cells as strings.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :param color_fill: workbook style derived  from define colour_fill_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('B5', 'Total site %', heading4)
-    worksheet.write_string('C5', 'Vegetation cover %', heading4)
-    worksheet.write_string('D5', 'Total site %', heading4)
-    worksheet.write_string('E5', 'Vegetation cover %', heading4)
-    worksheet.write_string('A6', 'Perennial grass', heading4)
-    worksheet.write_string('A7', 'Annual grass', heading4)
-    worksheet.write_string('A8', 'Perennial forb', heading4)
-    worksheet.write_string('A9', 'Annual forb', heading4)
-    worksheet.write_string('A10', 'Unspecified plant', heading4)
-    worksheet.write_string('A11', 'Total veg', heading4)
-    worksheet.write_string('A12', 'Litter', heading4)
-    worksheet.write_string('A13', 'Bare Ground', heading4)
-    worksheet.write('A4', None, color_fill)
-    worksheet.write('A5', None, color_fill)
-    worksheet.write('A2', None, color_fill)
-
-    return workbook, worksheet
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7):
-    """ Add blank formatted cells to worksheet.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_blank('C3', None, heading7)
-    worksheet.write_blank('B6', None, heading7)
-    worksheet.write_blank('B7', None, heading7)
-    worksheet.write_blank('B8', None, heading7)
-    worksheet.write_blank('B9', None, heading7)
-    worksheet.write_blank('B10', None, heading7)
-    worksheet.write_blank('B11', None, heading7)
-    worksheet.write_blank('B12', None, heading7)
-    worksheet.write_blank('B13', None, heading7)
-    worksheet.write_blank('C6', None, heading7)
-    worksheet.write_blank('C7', None, heading7)
-    worksheet.write_blank('C8', None, heading7)
-    worksheet.write_blank('C9', None, heading7)
-    worksheet.write_blank('C10', None, heading7)
-    worksheet.write_blank('D6', None, heading7)
-    worksheet.write_blank('D7', None, heading7)
-    worksheet.write_blank('D8', None, heading7)
-    worksheet.write_blank('D9', None, heading7)
-    worksheet.write_blank('D10', None, heading7)
-    worksheet.write_blank('D11', None, heading7)
-    worksheet.write_blank('D12', None, heading7)
-    worksheet.write_blank('D13', None, heading7)
-    worksheet.write_blank('E6', None, heading7)
-    worksheet.write_blank('E7', None, heading7)
-    worksheet.write_blank('E8', None, heading7)
-    worksheet.write_blank('E9', None, heading7)
-    worksheet.write_blank('E10', None, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells_fn(workbook, worksheet, heading1, heading4):
-    """ Add item headings to cells and merge.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading1: workbook style derived  from define heading1_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.merge_range('A1:E1', 'GROUND LAYER COMPOSITION', heading1)
-    worksheet.merge_range('A3:B3', 'DO THE TRANSECTS ACCURATELY REPRESENT THE SITE?', heading4)
-    worksheet.merge_range('B4:C4', 'Transect data', heading4)
-    worksheet.merge_range('D4:E4', 'Cover estimates', heading4)
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ define and set column widths.
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.set_column('A:A', 30.27)
-    worksheet.set_column('B:B', 30.27)
-    worksheet.set_column('C:C', 30.27)
-    worksheet.set_column('D:D', 30.27)
-    worksheet.set_column('E:E', 30.27)
-
-    return workbook, worksheet
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step10_9_create_site_ground_layer_sheet',
+    'default_row': 56.25,
+    'cell_list': [
+        ('write_string', 'B5', 'Total site %', 'heading4'),
+        ('write_string', 'C5', 'Vegetation cover %', 'heading4'),
+        ('write_string', 'D5', 'Total site %', 'heading4'),
+        ('write_string', 'E5', 'Vegetation cover %', 'heading4'),
+        ('write_string', 'A6', 'Perennial grass', 'heading4'),
+        ('write_string', 'A7', 'Annual grass', 'heading4'),
+        ('write_string', 'A8', 'Perennial forb', 'heading4'),
+        ('write_string', 'A9', 'Annual forb', 'heading4'),
+        ('write_string', 'A10', 'Unspecified plant', 'heading4'),
+        ('write_string', 'A11', 'Total veg', 'heading4'),
+        ('write_string', 'A12', 'Litter', 'heading4'),
+        ('write_string', 'A13', 'Bare Ground', 'heading4'),
+        ('write', 'A4', None, 'color_fill'),
+        ('write', 'A5', None, 'color_fill'),
+        ('write', 'A2', None, 'color_fill'),
+        ('write_blank', 'C3', None, 'heading7'),
+        ('write_blank', 'B6', None, 'heading7'),
+        ('write_blank', 'B7', None, 'heading7'),
+        ('write_blank', 'B8', None, 'heading7'),
+        ('write_blank', 'B9', None, 'heading7'),
+        ('write_blank', 'B10', None, 'heading7'),
+        ('write_blank', 'B11', None, 'heading7'),
+        ('write_blank', 'B12', None, 'heading7'),
+        ('write_blank', 'B13', None, 'heading7'),
+        ('write_blank', 'C6', None, 'heading7'),
+        ('write_blank', 'C7', None, 'heading7'),
+        ('write_blank', 'C8', None, 'heading7'),
+        ('write_blank', 'C9', None, 'heading7'),
+        ('write_blank', 'C10', None, 'heading7'),
+        ('write_blank', 'D6', None, 'heading7'),
+        ('write_blank', 'D7', None, 'heading7'),
+        ('write_blank', 'D8', None, 'heading7'),
+        ('write_blank', 'D9', None, 'heading7'),
+        ('write_blank', 'D10', None, 'heading7'),
+        ('write_blank', 'D11', None, 'heading7'),
+        ('write_blank', 'D12', None, 'heading7'),
+        ('write_blank', 'D13', None, 'heading7'),
+        ('write_blank', 'E6', None, 'heading7'),
+        ('write_blank', 'E7', None, 'heading7'),
+        ('write_blank', 'E8', None, 'heading7'),
+        ('write_blank', 'E9', None, 'heading7'),
+        ('write_blank', 'E10', None, 'heading7'),
+        ('merge_range', 'A1:E1', 'GROUND LAYER COMPOSITION', 'heading1'),
+        ('merge_range', 'A3:B3', 'DO THE TRANSECTS ACCURATELY REPRESENT THE SITE?', 'heading4'),
+        ('merge_range', 'B4:C4', 'Transect data', 'heading4'),
+        ('merge_range', 'D4:E4', 'Cover estimates', 'heading4'),
+    ],
+    'column_list': [
+        ('A:A', 30.27),
+        ('B:B', 30.27),
+        ('C:C', 30.27),
+        ('D:D', 30.27),
+        ('E:E', 30.27),
+    ],
+}
 
 
 def main_routine(color_fill, heading1, heading4, heading7,
@@ -153,20 +104,10 @@ def main_routine(color_fill, heading1, heading4, heading7,
 
     worksheet_name = 'Output 1 - Ground layer composi'
 
-    # call the create_worksheet_fn function.
-    workbook, worksheet = create_worksheet_fn(workbook, worksheet_name)
-
-    # call the insert_sheet_headings_fn function.
-    workbook, worksheet = insert_sheet_headings_fn(workbook, worksheet, heading4, color_fill)
-
-    # call the insert_blank_formatted_cells_fn function.
-    workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7)
-
-    # call the merge_cells_fn function.
-    workbook, worksheet = merge_cells_fn(workbook, worksheet, heading1, heading4)
-
-    # call the define_column_widths_fn function
-    workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+    # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+    worksheet = worksheet_template.main_routine(
+        workbook, worksheet_name, LAYOUT,
+        dict(color_fill=color_fill, heading1=heading1, heading4=heading4, heading7=heading7))
 
     cover_data_list = obs_data_list[5]
 
@@ -20,6 +20,7 @@ SOFTWARE.
 
 # import modules
 import xlsxwriter
+import stage_monitor
 
 
 def create_workbook(site_dir, site):
@@ -205,6 +206,7 @@ def define_colour_fill(workbook):
     return workbook, color_fill
 
 
+@stage_monitor.monitor_fn
 def main_routine(ras_data_list, site, site_dir, ras):
     """Create the Rangeland Monitoring rapid assessment survey (ras) excel workbook.
 
@@ -19,286 +19,226 @@ SOFTWARE.
 """
 
 # import modules
-
-
-def create_worksheet_fn(workbook, worksheet_name):
-    """ Create worksheet and set row height.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet_name: string object containing worksheet name.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet = workbook.add_worksheet(worksheet_name)
-
-    # Set row height
-    worksheet.set_default_row(56.25)
-
-    return workbook, worksheet
-
-
-def insert_sheet_headings_fn(workbook, worksheet, heading3, heading4, heading6, color_fill):
-    """ Add item headings to cells as strings.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading3: workbook style derived  from define heading3_fn.
-            :param heading4: workbook style derived  from define heading4_fn.
-            :param heading6: workbook style derived  from define heading6_fn.
-            :param color_fill: workbook style derived  from define colour_fill_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_string('A3', 'STATION', heading3)
-    worksheet.write_string('D3', 'SITE NUMBER', heading3)
-    worksheet.write_string('F3', 'DATE & TIME:', heading3)
-    worksheet.write_string('A4', 'Monitoring Officers', heading3)
-    worksheet.write_string('A5', 'Location', heading3)
-    worksheet.write_string('B5', 'LAT:', heading3)
-    worksheet.write_string('D5', 'LON:', heading3)
-    worksheet.write_string('F5', 'Paddock:', heading3)
-    worksheet.write_string('A6', 'NEAREST WATER: Name', heading3)
-    worksheet.write_string('C6', 'Type', heading3)
-    worksheet.write_string('E6', 'Distance (km)', heading3)
-    worksheet.write_string('G6', 'Direction', heading3)
-    worksheet.write_string('A7', 'LAND TYPE:', heading3)
-    worksheet.write_string('A8', 'Estimated bare soil', heading3)
-    worksheet.write_string('A10', 'Category', heading3)
-    worksheet.write_string('B10', '3P Grasses', heading4)
-    worksheet.write_string('C10', 'Other perennial grasses', heading4)
-    worksheet.write_string('D10', 'Annual grasses', heading4)
-    worksheet.write_string('E10', 'Forbs', heading4)
-    worksheet.write_string('G10', 'Max total', heading6)
-    worksheet.write_string('H10', 'Min total', heading6)
-    worksheet.write_string('A11', 'Cover', heading3)
-    worksheet.write_string('A12', 'Species 1', heading3)
-    worksheet.write_string('A13', 'Species 2', heading3)
-    worksheet.write_string('A14', 'Species 3', heading3)
-    worksheet.write_string('A15', 'Species 4', heading3)
-    worksheet.write_string('A17', 'Basal area (m2/ha)', heading3)
-    worksheet.write_string('A18', 'Category', heading3)
-    worksheet.write_string('A19', 'Juvenile density (Stems/ha)', heading3)
-    worksheet.write_string('A20', 'Species 1', heading3)
-    worksheet.write_string('A21', 'Species 2', heading3)
-    worksheet.write_string('A22', 'Species 3', heading3)
-    worksheet.write_string('A23', 'Species 4', heading3)
-    worksheet.write_string('A24', 'Species 5', heading3)
-    worksheet.write_string('A25', 'Species 6', heading3)
-    worksheet.write_string('A28', 'IS THIS AN ERODIBLE SOIL?', heading3)
-    worksheet.write_string('B29', 'Severity', heading4)
-    worksheet.write_string('C29', 'Stability', heading4)
-    worksheet.write_string('A30', 'SCALDING - wind or water', heading3)
-    worksheet.write_string('A31', 'WINDSHEETING', heading3)
-    worksheet.write_string('A32', 'WATERSHEETING', heading3)
-    worksheet.write_string('A33', 'RILLING', heading3)
-    worksheet.write_string('A34', 'GULLYING', heading3)
-    worksheet.write_string('A35', 'PASTURE UTILISATION:', heading3)
-    worksheet.write_string('A36', 'WEEDS:', heading3)
-    worksheet.write_string('A37', 'WILD ANIMAL ACTIVITY:', heading3)
-    worksheet.write_string('B37', 'Camel', heading4)
-    worksheet.write_string('C37', 'Rabbit', heading4)
-    worksheet.write_string('D37', 'Donkey', heading4)
-    worksheet.write_string('E37', 'Horse', heading4)
-    worksheet.write_string('F37', 'Pig', heading4)
-    worksheet.write_string('G37', 'Buffalo', heading4)
-    worksheet.write_string('H37', 'Native herbivore', heading4)
-    worksheet.write_string('A38', 'ACTIVE', heading3)
-    worksheet.write_string('A39', 'EVIDENCE AND DESCRIPTION:', heading3)
-    worksheet.write_string('A42', 'FIRE FREQUENCY:', heading3)
-    worksheet.write_string('A43', 'FIRE INTENSITY:', heading3)
-    worksheet.write_string('A45', 'LAND CONDITION SCORE:', heading3)
-
-    worksheet.write('A29', None, color_fill)
-    worksheet.write('A40', None, color_fill)
-    worksheet.write('A41', None, color_fill)
-    worksheet.write('A44', None, color_fill)
-    worksheet.write('A46', None, color_fill)
-
-    return workbook, worksheet
-
-
-def insert_blank_formatted_cells_fn(workbook, worksheet, heading7):
-    """ Add blank formatted cells to worksheet.
-
-            :param workbook: open workbook object derived from create_workbook_fn function.
-            :param worksheet: worksheet object current worksheet derived from create_worksheet_fn.
-            :param heading7: workbook style derived  from define heading7_fn.
-            :return: workbook: updated workbook object.
-            :return worksheet: updated worksheet object."""
-
-    worksheet.write_blank('B3', None, heading7)
-    worksheet.write_blank('E3', None, heading7)
-    worksheet.write_blank('G3', None, heading7)
-    worksheet.write_blank('B4', None, heading7)
-    worksheet.write_blank('D4', None, heading7)
-    worksheet.write_blank('F4', None, heading7)
-    worksheet.write_blank('C5', None, heading7)
-    worksheet.write_blank('E5', None, heading7)
-    worksheet.write_blank('G5', None, heading7)
-    worksheet.write_blank('B6', None, heading7)
-    worksheet.write_blank('D6', None, heading7)
-    worksheet.write_blank('F6', None, heading7)
-    worksheet.write_blank('H6', None, heading7)
-    worksheet.write_blank('B7', None, heading7)
-    worksheet.write_blank('F7', None, heading7)
-    worksheet.write_blank('B8', None, heading7)
-    worksheet.write_blank('B11', None, heading7)
-    worksheet.write_blank('B12', None, heading7)
-    worksheet.write_blank('B13', None, heading7)
-    worksheet.write_blank('B14', None, heading7)
-    worksheet.write_blank('B15', None, heading7)
-    worksheet.write_blank('C11', None, heading7)
-    worksheet.write_blank('C12', None, heading7)
-    worksheet.write_blank('C13', None, heading7)
-    worksheet.write_blank('C14', None, heading7)
-    worksheet.write_blank('C15', None, heading7)
-    worksheet.write_blank('D11', None, heading7)
-    worksheet.write_blank('D12', None, heading7)
-    worksheet.write_blank('D13', None, heading7)
-    worksheet.write_blank('D14', None, heading7)
-    worksheet.write_blank('D15', None, heading7)
-    worksheet.write_blank('E11', None, heading7)
-    worksheet.write_blank('E12', None, heading7)
-    worksheet.write_blank('E13', None, heading7)
-    worksheet.write_blank('E14', None, heading7)
-    worksheet.write_blank('E15', None, heading7)
-    worksheet.write_blank('G11', None, heading7)
-    worksheet.write_blank('H11', None, heading7)
-    worksheet.write_blank('B17', None, heading7)
-    worksheet.write_blank('B19', None, heading7)
-    worksheet.write_blank('B20', None, heading7)
-    worksheet.write_blank('B21', None, heading7)
-    worksheet.write_blank('B22', None, heading7)
-    worksheet.write_blank('B23', None, heading7)
-    worksheet.write_blank('B24', None, heading7)
-    worksheet.write_blank('B25', None, heading7)
-    worksheet.write_blank('E19', None, heading7)
-    worksheet.write_blank('E20', None, heading7)
-    worksheet.write_blank('E21', None, heading7)
-    worksheet.write_blank('E22', None, heading7)
-    worksheet.write_blank('E23', None, heading7)
-    worksheet.write_blank('E24', None, heading7)
-    worksheet.write_blank('E25', None, heading7)
-    worksheet.write_blank('B28', None, heading7)
-    worksheet.write_blank('B30', None, heading7)
-    worksheet.write_blank('B31', None, heading7)
-    worksheet.write_blank('B32', None, heading7)
-    worksheet.write_blank('B33', None, heading7)
-    worksheet.write_blank('B34', None, heading7)
-    worksheet.write_blank('C30', None, heading7)
-    worksheet.write_blank('C31', None, heading7)
-    worksheet.write_blank('C32', None, heading7)
-    worksheet.write_blank('C33', None, heading7)
-    worksheet.write_blank('C34', None, heading7)
-    worksheet.write_blank('B35', None, heading7)
-    worksheet.write_blank('B36', None, heading7)
-    worksheet.write_blank('B38', None, heading7)
-    worksheet.write_blank('C38', None, heading7)
-    worksheet.write_blank('D38', None, heading7)
-    worksheet.write_blank('E38', None, heading7)
-    worksheet.write_blank('F38', None, heading7)
-    worksheet.write_blank('G38', None, heading7)
-    worksheet.write_blank('H38', None, heading7)
-    worksheet.write_blank('B39', None, heading7)
-    worksheet.write_blank('B42', None, heading7)
-    worksheet.write_blank('B43', None, heading7)
-    worksheet.write_blank('E42', None, heading7)
-    worksheet.write_blank('E43', None, heading7)
-    worksheet.write_blank('B46', None, heading7)
-    worksheet.write_blank('E46', None, heading7)
-    worksheet.write_blank('B47', None, heading7)
-
-    return workbook, worksheet
-
-
-def merge_cells_fn(workbook, worksheet, heading1, heading2, heading3, heading4):
-    """ Merge and format required cells.
-
-    :param workbook: workbook object created in the create_workbook_fn function.
-    :param worksheet: excel sheet created with the create_worksheet_fn function.
-    :param heading1: heading styles
-    :param heading2: heading style
-    :param heading3: heading style
-    :param heading4: heading style
-    :return: formatted worksheet."""
-
-    worksheet.merge_range('A2:H2', 'RANGELAND ASSESSMENT SITE', heading1)
-    worksheet.merge_range('D7:E7', 'LAND SYSTEM', heading3)
-    worksheet.merge_range('A9:H9', 'PASTURE SPECIES COMPOSITION', heading2)
-    worksheet.merge_range('A16:H16', 'WOODY SPECIES', heading2)
-    worksheet.merge_range('B18:D18', 'Shrubs (adults <2m)', heading4)
-    worksheet.merge_range('E18:H18', 'Trees', heading4)
-    worksheet.merge_range('A26:H26', 'Disturbance', heading2)
-    worksheet.merge_range('A27:H27', 'Erosion', heading2)
-    worksheet.merge_range('D29:H29', 'Severity description', heading4)
-    worksheet.merge_range('B40:H40', 'Fire', heading2)
-    worksheet.merge_range('B41:D41', 'NORTH REGION', heading4)
-    worksheet.merge_range('E41:H41', 'SOUTH REGION', heading4)
-    worksheet.merge_range('B45:D45', 'LAND COND GUIDE (a, b,c, d)', heading4)
-    worksheet.merge_range('E45:H45', 'ASSESSMENT SCORE (good,fair, poor)', heading4)
-    worksheet.merge_range('A47:A49', 'OTHER COMMENTS:', heading3)
-    worksheet.merge_range('D30:H30', '')
-    worksheet.merge_range('D31:H31', '')
-    worksheet.merge_range('D32:H32', '')
-    worksheet.merge_range('D33:H33', '')
-    worksheet.merge_range('D34:H34', '')
-    worksheet.merge_range('B8:H8', '')
-    worksheet.merge_range('B7:C7', '')
-    worksheet.merge_range('F7:H7', '')
-    worksheet.merge_range('C28:H28', '')
-    worksheet.merge_range('B35:H35', '')
-    worksheet.merge_range('B36:H36', '')
-    worksheet.merge_range('B19:D19', '')
-    worksheet.merge_range('B20:D20', '')
-    worksheet.merge_range('B21:D21', '')
-    worksheet.merge_range('B22:D22', '')
-    worksheet.merge_range('B23:D23', '')
-    worksheet.merge_range('B24:D24', '')
-    worksheet.merge_range('B25:D25', '')
-    worksheet.merge_range('E19:H19', '')
-    worksheet.merge_range('E20:H20', '')
-    worksheet.merge_range('E21:H21', '')
-    worksheet.merge_range('E22:H22', '')
-    worksheet.merge_range('E23:H23', '')
-    worksheet.merge_range('E24:H24', '')
-    worksheet.merge_range('E25:H25', '')
-    worksheet.merge_range('B3:C3', '')
-    worksheet.merge_range('G3:H3', '')
-    worksheet.merge_range('B4:C4', '')
-    worksheet.merge_range('D4:E4', '')
-    worksheet.merge_range('F4:H4', '')
-    worksheet.merge_range('G5:H5', '')
-    worksheet.merge_range('B17:H17', '')
-    worksheet.merge_range('B42:D42', '')
-    worksheet.merge_range('B43:D43', '')
-    worksheet.merge_range('E42:H42', '')
-    worksheet.merge_range('E43:H43', '')
-    worksheet.merge_range('B46:D46', '')
-    worksheet.merge_range('E46:H46', '')
-    worksheet.merge_range('B47:H49', '')
-    worksheet.merge_range('B39:H39', '')
-    worksheet.merge_range('B44:H44', '')
-
-    return workbook, worksheet
-
-
-def define_column_widths_fn(workbook, worksheet):
-    """ Set column widths.
-
-    :param workbook: workbook object created in the create_workbook_fn function.
-    :param worksheet: excel sheet created with the create_worksheet_fn function.
-    :return: formatted worksheet. """
-
-    worksheet.set_column('A:A', 37.82)
-    worksheet.set_column('B:B', 18.45)
-    worksheet.set_column('C:C', 16.73)
-    worksheet.set_column('D:D', 17.91)
-    worksheet.set_column('E:E', 15.36)
-    worksheet.set_column('F:F', 15.27)
-    worksheet.set_column('G:G', 17.43)
-    worksheet.set_column('H:H', 14.14)
-
-    return workbook, worksheet
+import worksheet_template
+
+
+# static headings, blank formatted cells, merges, column widths and row heights of the worksheet (worksheet_template.py).
+LAYOUT = {
+    'name': 'step11_2_create_ras_sheet',
+    'default_row': 56.25,
+    'cell_list': [
+        ('write_string', 'A3', 'STATION', 'heading3'),
+        ('write_string', 'D3', 'SITE NUMBER', 'heading3'),
+        ('write_string', 'F3', 'DATE & TIME:', 'heading3'),
+        ('write_string', 'A4', 'Monitoring Officers', 'heading3'),
+        ('write_string', 'A5', 'Location', 'heading3'),
+        ('write_string', 'B5', 'LAT:', 'heading3'),
+        ('write_string', 'D5', 'LON:', 'heading3'),
+        ('write_string', 'F5', 'Paddock:', 'heading3'),
+        ('write_string', 'A6', 'NEAREST WATER: Name', 'heading3'),
+        ('write_string', 'C6', 'Type', 'heading3'),
+        ('write_string', 'E6', 'Distance (km)', 'heading3'),
+        ('write_string', 'G6', 'Direction', 'heading3'),
+        ('write_string', 'A7', 'LAND TYPE:', 'heading3'),
+        ('write_string', 'A8', 'Estimated bare soil', 'heading3'),
+        ('write_string', 'A10', 'Category', 'heading3'),
+        ('write_string', 'B10', '3P Grasses', 'heading4'),
+        ('write_string', 'C10', 'Other perennial grasses', 'heading4'),
+        ('write_string', 'D10', 'Annual grasses', 'heading4'),
+        ('write_string', 'E10', 'Forbs', 'heading4'),
+        ('write_string', 'G10', 'Max total', 'heading6'),
+        ('write_string', 'H10', 'Min total', 'heading6'),
+        ('write_string', 'A11', 'Cover', 'heading3'),
+        ('write_string', 'A12', 'Species 1', 'heading3'),
+        ('write_string', 'A13', 'Species 2', 'heading3'),
+        ('write_string', 'A14', 'Species 3', 'heading3'),
+        ('write_string', 'A15', 'Species 4', 'heading3'),
+        ('write_string', 'A17', 'Basal area (m2/ha)', 'heading3'),
+        ('write_string', 'A18', 'Category', 'heading3'),
+        ('write_string', 'A19', 'Juvenile density (Stems/ha)', 'heading3'),
+        ('write_string', 'A20', 'Species 1', 'heading3'),
+        ('write_string', 'A21', 'Species 2', 'heading3'),
+        ('write_string', 'A22', 'Species 3', 'heading3'),
+        ('write_string', 'A23', 'Species 4', 'heading3'),
+        ('write_string', 'A24', 'Species 5', 'heading3'),
+        ('write_string', 'A25', 'Species 6', 'heading3'),
+        ('write_string', 'A28', 'IS THIS AN ERODIBLE SOIL?', 'heading3'),
+        ('write_string', 'B29', 'Severity', 'heading4'),
+        ('write_string', 'C29', 'Stability', 'heading4'),
+        ('write_string', 'A30', 'SCALDING - wind or water', 'heading3'),
+        ('write_string', 'A31', 'WINDSHEETING', 'heading3'),
+        ('write_string', 'A32', 'WATERSHEETING', 'heading3'),
+        ('write_string', 'A33', 'RILLING', 'heading3'),
+        ('write_string', 'A34', 'GULLYING', 'heading3'),
+        ('write_string', 'A35', 'PASTURE UTILISATION:', 'heading3'),
+        ('write_string', 'A36', 'WEEDS:', 'heading3'),
+        ('write_string', 'A37', 'WILD ANIMAL ACTIVITY:', 'heading3'),
+        ('write_string', 'B37', 'Camel', 'heading4'),
+        ('write_string', 'C37', 'Rabbit', 'heading4'),
+        ('write_string', 'D37', 'Donkey', 'heading4'),
+        ('write_string', 'E37', 'Horse', 'heading4'),
+        ('write_string', 'F37', 'Pig', 'heading4'),
+        ('write_string', 'G37', 'Buffalo', 'heading4'),
+        ('write_string', 'H37', 'Native herbivore', 'heading4'),
+        ('write_string', 'A38', 'ACTIVE', 'heading3'),
+        ('write_string', 'A39', 'EVIDENCE AND DESCRIPTION:', 'heading3'),
+        ('write_string', 'A42', 'FIRE FREQUENCY:', 'heading3'),
+        ('write_string', 'A43', 'FIRE INTENSITY:', 'heading3'),
+        ('write_string', 'A45', 'LAND CONDITION SCORE:', 'heading3'),
+        ('write', 'A29', None, 'color_fill'),
+        ('write', 'A40', None, 'color_fill'),
+        ('write', 'A41', None, 'color_fill'),
+        ('write', 'A44', None, 'color_fill'),
+        ('write', 'A46', None, 'color_fill'),
+        ('write_blank', 'B3', None, 'heading7'),
+        ('write_blank', 'E3', None, 'heading7'),
+        ('write_blank', 'G3', None, 'heading7'),
+        ('write_blank', 'B4', None, 'heading7'),
+        ('write_blank', 'D4', None, 'heading7'),
+        ('write_blank', 'F4', None, 'heading7'),
+        ('write_blank', 'C5', None, 'heading7'),
+        ('write_blank', 'E5', None, 'heading7'),
+        ('write_blank', 'G5', None, 'heading7'),
+        ('write_blank', 'B6', None, 'heading7'),
+        ('write_blank', 'D6', None, 'heading7'),
+        ('write_blank', 'F6', None, 'heading7'),
+        ('write_blank', 'H6', None, 'heading7'),
+        ('write_blank', 'B7', None, 'heading7'),
+        ('write_blank', 'F7', None, 'heading7'),
+        ('write_blank', 'B8', None, 'heading7'),
+        ('write_blank', 'B11', None, 'heading7'),
+        ('write_blank', 'B12', None, 'heading7'),
+        ('write_blank', 'B13', None, 'heading7'),
+        ('write_blank', 'B14', None, 'heading7'),
+        ('write_blank', 'B15', None, 'heading7'),
+        ('write_blank', 'C11', None, 'heading7'),
+        ('write_blank', 'C12', None, 'heading7'),
+        ('write_blank', 'C13', None, 'heading7'),
+        ('write_blank', 'C14', None, 'heading7'),
+        ('write_blank', 'C15', None, 'heading7'),
+        ('write_blank', 'D11', None, 'heading7'),
+        ('write_blank', 'D12', None, 'heading7'),
+        ('write_blank', 'D13', None, 'heading7'),
+        ('write_blank', 'D14', None, 'heading7'),
+        ('write_blank', 'D15', None, 'heading7'),
+        ('write_blank', 'E11', None, 'heading7'),
+        ('write_blank', 'E12', None, 'heading7'),
+        ('write_blank', 'E13', None, 'heading7'),
+        ('write_blank', 'E14', None, 'heading7'),
+        ('write_blank', 'E15', None, 'heading7'),
+        ('write_blank', 'G11', None, 'heading7'),
+        ('write_blank', 'H11', None, 'heading7'),
+        ('write_blank', 'B17', None, 'heading7'),
+        ('write_blank', 'B19', None, 'heading7'),
+        ('write_blank', 'B20', None, 'heading7'),
+        ('write_blank', 'B21', None, 'heading7'),
+        ('write_blank', 'B22', None, 'heading7'),
+        ('write_blank', 'B23', None, 'heading7'),
+        ('write_blank', 'B24', None, 'heading7'),
+        ('write_blank', 'B25', None, 'heading7'),
+        ('write_blank', 'E19', None, 'heading7'),
+        ('write_blank', 'E20', None, 'heading7'),
+        ('write_blank', 'E21', None, 'heading7'),
+        ('write_blank', 'E22', None, 'heading7'),
+        ('write_blank', 'E23', None, 'heading7'),
+        ('write_blank', 'E24', None, 'heading7'),
+        ('write_blank', 'E25', None, 'heading7'),
+        ('write_blank', 'B28', None, 'heading7'),
+        ('write_blank', 'B30', None, 'heading7'),
+        ('write_blank', 'B31', None, 'heading7'),
+        ('write_blank', 'B32', None, 'heading7'),
+        ('write_blank', 'B33', None, 'heading7'),
+        ('write_blank', 'B34', None, 'heading7'),
+        ('write_blank', 'C30', None, 'heading7'),
+        ('write_blank', 'C31', None, 'heading7'),
+        ('write_blank', 'C32', None, 'heading7'),
+        ('write_blank', 'C33', None, 'heading7'),
+        ('write_blank', 'C34', None, 'heading7'),
+        ('write_blank', 'B35', None, 'heading7'),
+        ('write_blank', 'B36', None, 'heading7'),
+        ('write_blank', 'B38', None, 'heading7'),
+        ('write_blank', 'C38', None, 'heading7'),
+        ('write_blank', 'D38', None, 'heading7'),
+        ('write_blank', 'E38', None, 'heading7'),
+        ('write_blank', 'F38', None, 'heading7'),
+        ('write_blank', 'G38', None, 'heading7'),
+        ('write_blank', 'H38', None, 'heading7'),
+        ('write_blank', 'B39', None, 'heading7'),
+        ('write_blank', 'B42', None, 'heading7'),
+        ('write_blank', 'B43', None, 'heading7'),
+        ('write_blank', 'E42', None, 'heading7'),
+        ('write_blank', 'E43', None, 'heading7'),
+        ('write_blank', 'B46', None, 'heading7'),
+        ('write_blank', 'E46', None, 'heading7'),
+        ('write_blank', 'B47', None, 'heading7'),
+        ('merge_range', 'A2:H2', 'RANGELAND ASSESSMENT SITE', 'heading1'),
+        ('merge_range', 'D7:E7', 'LAND SYSTEM', 'heading3'),
+        ('merge_range', 'A9:H9', 'PASTURE SPECIES COMPOSITION', 'heading2'),
+        ('merge_range', 'A16:H16', 'WOODY SPECIES', 'heading2'),
+        ('merge_range', 'B18:D18', 'Shrubs (adults <2m)', 'heading4'),
+        ('merge_range', 'E18:H18', 'Trees', 'heading4'),
+        ('merge_range', 'A26:H26', 'Disturbance', 'heading2'),
+        ('merge_range', 'A27:H27', 'Erosion', 'heading2'),
+        ('merge_range', 'D29:H29', 'Severity description', 'heading4'),
+        ('merge_range', 'B40:H40', 'Fire', 'heading2'),
+        ('merge_range', 'B41:D41', 'NORTH REGION', 'heading4'),
+        ('merge_range', 'E41:H41', 'SOUTH REGION', 'heading4'),
+        ('merge_range', 'B45:D45', 'LAND COND GUIDE (a, b,c, d)', 'heading4'),
+        ('merge_range', 'E45:H45', 'ASSESSMENT SCORE (good,fair, poor)', 'heading4'),
+        ('merge_range', 'A47:A49', 'OTHER COMMENTS:', 'heading3'),
+        ('merge_range', 'D30:H30', '', None),
+        ('merge_range', 'D31:H31', '', None),
+        ('merge_range', 'D32:H32', '', None),
+        ('merge_range', 'D33:H33', '', None),
+        ('merge_range', 'D34:H34', '', None),
+        ('merge_range', 'B8:H8', '', None),
+        ('merge_range', 'B7:C7', '', None),
+        ('merge_range', 'F7:H7', '', None),
+        ('merge_range', 'C28:H28', '', None),
+        ('merge_range', 'B35:H35', '', None),
+        ('merge_range', 'B36:H36', '', None),
+        ('merge_range', 'B19:D19', '', None),
+        ('merge_range', 'B20:D20', '', None),
+        ('merge_range', 'B21:D21', '', None),
+        ('merge_range', 'B22:D22', '', None),
+        ('merge_range', 'B23:D23', '', None),
+        ('merge_range', 'B24:D24', '', None),
+        ('merge_range', 'B25:D25', '', None),
+        ('merge_range', 'E19:H19', '', None),
+        ('merge_range', 'E20:H20', '', None),
+        ('merge_range', 'E21:H21', '', None),
+        ('merge_range', 'E22:H22', '', None),
+        ('merge_range', 'E23:H23', '', None),
+        ('merge_range', 'E24:H24', '', None),
+        ('merge_range', 'E25:H25', '', None),
+        ('merge_range', 'B3:C3', '', None),
+        ('merge_range', 'G3:H3', '', None),
+        ('merge_range', 'B4:C4', '', None),
+        ('merge_range', 'D4:E4', '', None),
+        ('merge_range', 'F4:H4', '', None),
+        ('merge_range', 'G5:H5', '', None),
+        ('merge_range', 'B17:H17', '', None),
+        ('merge_range', 'B42:D42', '', None),
+        ('merge_range', 'B43:D43', '', None),
+        ('merge_range', 'E42:H42', '', None),
+        ('merge_range', 'E43:H43', '', None),
+        ('merge_range', 'B46:D46', '', None),
+        ('merge_range', 'E46:H46', '', None),
+        ('merge_range', 'B47:H49', '', None),
+        ('merge_range', 'B39:H39', '', None),
+        ('merge_range', 'B44:H44', '', None),
+    ],
+    'column_list': [
+        ('A:A', 37.82),
+        ('B:B', 18.45),
+        ('C:C', 16.73),
+        ('D:D', 17.91),
+        ('E:E', 15.36),
+        ('F:F', 15.27),
+        ('G:G', 17.43),
+        ('H:H', 14.14),
+    ],
+}
 
 
 def insert_vertical_data_fn(worksheet, row, col, input_list, style, factor):
@@ -354,20 +294,11 @@ def main_routine(color_fill, heading1, heading2, heading3, heading4, heading6, h
 
     worksheet_name = 'Rangeland Monitoring - RAS'
 
-    # call the create_worksheet_fn function.
-    workbook, worksheet = create_worksheet_fn(workbook, worksheet_name)
-
-    # call the insert_sheet_headings_fn function.
-    workbook, worksheet = insert_sheet_headings_fn(workbook, worksheet, heading3, heading4, heading6, color_fill)
-
-    # call the insert_blank_formatted_cells_fn function.
-    workbook, worksheet = insert_blank_formatted_cells_fn(workbook, worksheet, heading7)
-
-    # call the merge_cells_fn function.
-    workbook, worksheet = merge_cells_fn(workbook, worksheet, heading1, heading2, heading3, heading4)
-
-    # call the define_column_widths_fn(workbook) function
-    workbook, worksheet = define_column_widths_fn(workbook, worksheet)
+    # call the worksheet_template.py script - static headings, merges and widths replayed from the compiled layout.
+    worksheet = worksheet_template.main_routine(
+        workbook, worksheet_name, LAYOUT,
+        dict(color_fill=color_fill, heading1=heading1, heading2=heading2, heading3=heading3, heading4=heading4,
+             heading6=heading6, heading7=heading7))
 
     if ras_data_list[0]:
 
@@ -462,13 +393,9 @@ def main_routine(color_fill, heading1, heading2, heading3, heading4, heading6, h
         #todo erosion comment not functioning
         erosion_comment = ['BLANK', 'BLANK', 'BLANK', 'BLANK', 'BLANK']
         #todo the erosion comment is not functioning properly.
-        print('ras_data_list[18]: ', ras_data_list[18])
         for i in ras_data_list[18]:
-            print('ras_data_list[18]: ', ras_data_list[18])
             if i != 'BLANK':
-                print(i)
                 list_index = ras_data_list[19].index(i)
-                print('list item is : ', str(list_index) + 1)
                 erosion_comment.insert(list_index, ras_data_list[19][0])
 
         # call the insert_vertical_data_fn function to insert erosion comment.
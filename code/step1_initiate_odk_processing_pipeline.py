@@ -25,15 +25,15 @@ from datetime import datetime
 import argparse
 import shutil
 import sys
-import pandas as pd
 import warnings
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
 
 def cmd_args_fn():
     p = argparse.ArgumentParser(
-        description='''Process raw RMB odk outputs -> csv, shapefiles observational sheets, and Ras sheets.''')
+        description='''Process raw RMB odk outputs -> csv, GeoPackage, observational sheets, and Ras sheets.''')
 
     p.add_argument('-d', '--directory_odk', help='The directory containing ODK csv files.',
                    default=r'C:\Users\robot\new_z_drive\20210325_0640\20210323_1308')
@@ -47,8 +47,47 @@ def cmd_args_fn():
                    default=r"C:\Users\robot\new_z_drive\20210325_0640\20210323_1308\odk_veg_list_final.xlsx")
     p.add_argument('-s', '--shrub_list_excel', help='Odk shrub list Excel file path.',
                    default=r"C:\Users\robot\new_z_drive\20210325_0640\20210323_1308\dominantVegSplitDistricts2.xlsx")
-    p.add_argument('-p', '--pastoral_estate', help='File path to the pastoral estate shapefile.',
+    p.add_argument('-p', '--pastoral_estate', help='File path to the pastoral estate shapefile (enter None to run '
+                                                   'without it, the ras property codes are left blank).',
                    default=r"C:\Users\Rob\PycharmProjects\rmb_aggregate_processing\shapefiles\pastoral_estate.shp")
+    p.add_argument('-k', '--reference_cache', help='Directory used to store a snapshot of the veg and shrub list '
+                                                   'Excel files (optional, skips Excel parsing on repeat runs).',
+                   default=None)
+    p.add_argument('-w', '--workers', help='Number of worker processes used to produce the site observation and RAS '
+                                           'sheets (default 1, processes sites one at a time).',
+                   type=int, default=1)
+    p.add_argument('-j', '--form_workers', help='Number of worker processes used to clean the five forms (default 1, '
+                                               'processes the forms one at a time).',
+                   type=int, default=1)
+    p.add_argument('-o', '--site_csv', help='Export the per site csv files to the site output folders? - Enter Yes '
+                                            'or No (default No, sites are processed in memory).',
+                   default="No")
+    p.add_argument('-u', '--odk_user', help='ODK Aggregate user name, used to download the star transect tables.',
+                   default='odktest')
+    p.add_argument('-i', '--odk_password', help='ODK Aggregate password.', default='odktest')
+    p.add_argument('-a', '--odk_aggregate', help='Replace the ODK Aggregate host of the star transect table urls '
+                                                 '(i.e. http://localhost:8443 for mock_odk_aggregate_server.py).',
+                   default=None)
+    p.add_argument('-q', '--odk_pull', help='OData project url of the ODK server (i.e. https://<host>/v1/projects/1) - '
+                                            'pull the new submissions of the five forms into the directory_odk before '
+                                            'processing (optional).', default=None)
+    p.add_argument('-t', '--transect_cache', help='Directory used to store the downloaded and parsed star transect '
+                                                  'tables (optional, skips unchanged transects on repeat runs).',
+                   default=None)
+    p.add_argument('-n', '--state_store', help='SQLite file recording the processed ODK submissions (optional, '
+                                               'only sites with new or changed submissions are processed).',
+                   default=None)
+    p.add_argument('-g', '--spatial_output', help='GeoPackage holding the form point layers over the season (optional, '
+                                                  'only new meta:instanceIDs are appended, default writes '
+                                                  'clean_odk_forms.gpkg to the output directory).',
+                   default=None)
+    p.add_argument('-l', '--log_level', help='Level of the structured (JSON lines) log - DEBUG, INFO, WARNING or '
+                                             'ERROR (default WARNING).', default='WARNING')
+    p.add_argument('-f', '--log_file', help='File path of the structured log (optional, default is the console).',
+                   default=None)
+    p.add_argument('-e', '--profile', help='Directory for one cProfile dump per stage (optional).', default=None)
+    p.add_argument('-m', '--trace_memory', help='Record the tracemalloc peak of each stage? - Enter Yes or No '
+                                                '(default No, slows the run).', default='No')
 
     cmd_args = p.parse_args()
 
@@ -83,76 +122,43 @@ def temporary_dir(export_dir):
     return temp_dir
 
 
-def raw_odk_output_workflow_fn(file_path, search_criteria, temp_dir, veg_list_excel, pastoral_estate):
-    """ Defines the script pathway depending on what raw ODK files are contained in the directory.
+def raw_odk_output_workflow_fn(file_path, search_criteria, temp_dir, input_dict):
+    """ Run the form workflow registered for a raw ODK file (form_handler_registry.py).
 
             :param file_path: string object containing the dir_path concatenated with search_criteria.
             :param search_criteria: string object containing the raw odk file name and type.
             :param temp_dir: string object path to the created output directory (date_time).
-            :param veg_list_excel: string object path to the odk veglist excel file (botanical and common names).
-            :param pastoral_estate: string object containing the file path to the pastoral estate shapefile. """
+            :param input_dict: dictionary object (input name -> value or function returning the value) containing the
+            'reference_data' (reference_data_cache.py) and 'property_index' (property_code_index.py) inputs, each is
+            only loaded when a form workflow requires it.
+            :return: Boolean object - True if the form workflow ran. """
 
     print("Searching for ODK outputs..........")
     print(file_path)
 
-    if search_criteria == 'RM_Star_Transect_results.csv':
+    # call the form_handler_registry.py script - the form workflow module is imported when its export is found.
+    import form_handler_registry
+    return form_handler_registry.main_routine(file_path, temp_dir, input_dict,
+                                              form_handler_registry.handler_fn(search_criteria))
 
-        # call the step2_1_star_transect_processing_workflow.py script.
-        import step2_1_star_transect_processing_workflow
-        step2_1_star_transect_processing_workflow.main_routine(file_path, temp_dir, veg_list_excel)
 
-    elif search_criteria == 'RMB_Integrated_Site_results.csv':
-
-        # call the step3_1_integrated_processing_workflow.py script.
-
-        import step3_1_integrated_processing_workflow
-        step3_1_integrated_processing_workflow.main_routine(file_path, temp_dir)
-
-    elif search_criteria == 'RMB_Basal_Sweep_results.csv':
-
-        # call the step4_1_basal_processing_workflow.py script.
-        import step4_1_basal_processing_workflow
-        step4_1_basal_processing_workflow.main_routine(file_path, temp_dir)
-
-    elif search_criteria == 'RMB_Woody_Thickening_results.csv':
-
-        # call the step5_1_woody_processing_workflow.py script.
-        import step5_1_woody_processing_workflow
-        step5_1_woody_processing_workflow.main_routine(file_path, temp_dir)
-
-    elif search_criteria == 'RMB_Rapid_Assessment_RAS_results.csv':
-
-        print('RAS not completed')
-        # call the step6_1_ras_processing_workflow.py script.
-        import step6_1_ras_processing_workflow
-        step6_1_ras_processing_workflow.main_routine(file_path, temp_dir, veg_list_excel, pastoral_estate)
-
-
-def odk_export_csv_checker_fn(dir_path, located_list, search_criteria, temp_dir, veg_list_excel, shrub_list_excel,
-                              pastoral_estate):
+def odk_export_csv_checker_fn(dir_path, form_path_list, search_criteria):
     """ Search for a specific odk csv output.
 
-        :param located_list:
         :param dir_path: string object containing the raw odk output csv files.
+        :param form_path_list: list object - [search_criteria, file path] is appended if the output was located.
         :param search_criteria: string object containing the raw odk file name and type.
-        :param temp_dir: string object path to the created output directory (date_time).
-        :param veg_list_excel: string object path to the odk veglist excel file (containing botanical and common names).
-        :param shrub_list_excel: string object path to the odk veglist excel file (containing a 3P grass list).
-        :param pastoral_estate: string object containing the file path to the pastoral estate shapefile. """
+        :return file_path: string object containing the raw odk output file path. """
 
-    file_path = (dir_path + '\\' + search_criteria)
+    import form_handler_registry
+    file_path = form_handler_registry.locate_fn(dir_path, form_handler_registry.handler_fn(search_criteria))
 
-    if not os.path.exists(file_path):
+    if file_path is None:
         print(search_criteria, ' not located.')
-        df = pd.DataFrame()
-        located = False
+        file_path = (dir_path + '\\' + search_criteria)
     else:
-        print(search_criteria, ' located, initiating script..........')
-        # call the import_script_fn function.
-        raw_odk_output_workflow_fn(file_path, search_criteria, temp_dir, veg_list_excel, pastoral_estate)
-
-        located = True
-    located_list.append(located)
+        print(search_criteria, ' located..........')
+        form_path_list.append([search_criteria, file_path])
 
     return file_path
 
@@ -166,6 +172,17 @@ def main_routine():
             :param veg_list_excel: (command argument) cmd_args.veg_list_excel
             :param shrub_list_excel: (command argument) cmd_args.shrub_list_excel
             :param pastoral_estate: (command argument) cmd_args.pastoral_estate
+            :param reference_cache: (command argument) cmd_args.reference_cache
+            :param workers: (command argument) cmd_args.workers
+            :param form_workers: (command argument) cmd_args.form_workers
+            :param site_csv: (command argument) cmd_args.site_csv
+            :param odk_aggregate: (command argument) cmd_args.odk_user, cmd_args.odk_password, cmd_args.odk_aggregate
+            :param odk_pull: (command argument) cmd_args.odk_pull
+            :param transect_cache: (command argument) cmd_args.transect_cache
+            :param state_store: (command argument) cmd_args.state_store
+            :param spatial_output: (command argument) cmd_args.spatial_output
+            :param log_level: (command argument) cmd_args.log_level, cmd_args.log_file
+            :param profile: (command argument) cmd_args.profile, cmd_args.trace_memory
             :return observation spreadsheet (one per site)
             :return ras spreadsheet (one per site)
             :return
@@ -191,50 +208,104 @@ def main_routine():
     veg_list_excel = cmd_args.veg_list_excel
     shrub_list_excel = cmd_args.shrub_list_excel
     pastoral_estate = cmd_args.pastoral_estate
-
-    # create an empty list
-    located_list = []
+    reference_cache = cmd_args.reference_cache
+    workers = cmd_args.workers
+    form_workers = cmd_args.form_workers
+    site_csv = cmd_args.site_csv
+    odk_aggregate = {'user': cmd_args.odk_user, 'password': cmd_args.odk_password,
+                     'base_url': cmd_args.odk_aggregate}
+    transect_cache = cmd_args.transect_cache
+    state_store = cmd_args.state_store
+    spatial_output = cmd_args.spatial_output
+
+    # call the stage_monitor.py script - structured log, cProfile dumps and memory tracing of the stages.
+    stage_monitor.configure_fn(cmd_args.log_level, cmd_args.log_file, cmd_args.profile,
+                               cmd_args.trace_memory == 'Yes')
+
+    if cmd_args.odk_pull:
+        # call the odata_pull_client.py script - pull the new submissions and repeat groups of the five forms in
+        # place of the manual csv export.
+        import odata_pull_client
+        odata_pull_client.main_routine(directory_odk, cmd_args.odk_pull, odk_aggregate)
+
+    # call the reference_data_cache.py script - read the veg and shrub list excel files once for the whole run.
+    def reference_data_fn():
+        import reference_data_cache
+        return reference_data_cache.main_routine(veg_list_excel, shrub_list_excel, reference_cache)
+
+    # call the property_code_index.py script - read the pastoral estate shapefile once for the whole run.
+    def property_index_fn():
+        import property_code_index
+        return property_code_index.main_routine(pastoral_estate)
+
+    # run inputs, each is loaded the first time a form workflow (or step7) requires it.
+    import form_handler_registry
+    input_dict = {'reference_data': reference_data_fn, 'property_index': property_index_fn}
 
     # call the temporary_dir function.
     temp_dir = temporary_dir(export_dir)
 
-    # call the odk_export_csv_checker_fn function - search for star transect outputs
-    file_path = odk_export_csv_checker_fn(directory_odk, located_list, 'RM_Star_Transect_results.csv',
-                              temp_dir,
-                              veg_list_excel, shrub_list_excel, pastoral_estate)
-
-    # call the odk_export_csv_checker_fn function - search for star integrated outputs
-    file_path = odk_export_csv_checker_fn(directory_odk, located_list, 'RMB_Integrated_Site_results.csv',
-                              temp_dir,
-                              veg_list_excel, shrub_list_excel, pastoral_estate)
-
-    # call the odk_export_csv_checker_fn function - search for basal sweep outputs
-    file_path = odk_export_csv_checker_fn(directory_odk, located_list, 'RMB_Basal_Sweep_results.csv', temp_dir,
-                              veg_list_excel, shrub_list_excel, pastoral_estate)
-
-    # call the odk_export_csv_checker_fn function - search for woody thickening outputs
-    file_path = odk_export_csv_checker_fn(directory_odk, located_list, 'RMB_Woody_Thickening_results.csv',
-                              temp_dir,
-                              veg_list_excel, shrub_list_excel, pastoral_estate)
-
-    # call the odk_export_csv_checker_fn function - search for ras outputs
-    file_path = odk_export_csv_checker_fn(directory_odk, located_list, 'RMB_Rapid_Assessment_RAS_results.csv',
-                              temp_dir,
-                              veg_list_excel, shrub_list_excel, pastoral_estate)
+    # raw odk outputs of the registered form handlers, in processing order.
+    search_criteria_list = form_handler_registry.search_criteria_list_fn()
+
+    # directory searched for the raw odk outputs.
+    odk_dir = directory_odk
+
+    if state_store:
+        # call the incremental_state_store.py script - select the sites with new or changed submissions.
+        import incremental_state_store
+        conn = incremental_state_store.connect_fn(state_store)
+        file_path_dict = {}
+        for search_criteria in search_criteria_list:
+            file_path = form_handler_registry.locate_fn(directory_odk,
+                                                        form_handler_registry.handler_fn(search_criteria))
+            if file_path is not None:
+                file_path_dict[search_criteria] = file_path
+        odk_dir, state_dict = incremental_state_store.select_fn(conn, file_path_dict, temp_dir)
+
+    form_path_list = []
+    for search_criteria in search_criteria_list:
+        # call the odk_export_csv_checker_fn function - search for the star transect, integrated, basal sweep,
+        # woody thickening and ras outputs.
+        file_path = odk_export_csv_checker_fn(odk_dir, form_path_list, search_criteria)
+
+    # call the form_handler_registry.py script - run the located form workflows (in parallel with form_workers above
+    # 1), a failed form is reported and the outputs of the other forms are kept.
+    form_result_list = form_handler_registry.concurrent_fn(form_path_list, temp_dir, input_dict, form_workers)
+    located_list = [status == 'success' for _, status, _ in form_result_list]
 
     print('''====================================================''')
 
     # Verify if an odk file was created and call step18_completeOdkOutputs2.
     if True in located_list:
         print('True')
+        # call the spatial_sink.py script - one GeoPackage layer per form in place of the shapefiles.
+        import spatial_sink
+        spatial_sink.main_routine(temp_dir, spatial_output)
+
         # call the step7_site_processing_workflow.py script.
         print('step7_site_processing_workflow.py initiating..........')
         import step7_site_processing_workflow
-        step7_site_processing_workflow.main_routine(directory_odk, file_path, remote_desktop,
-                                                    temp_dir, veg_list_excel, shrub_list_excel)
+        site_result_list = step7_site_processing_workflow.main_routine(
+            directory_odk, file_path, remote_desktop, temp_dir,
+            form_handler_registry.inputs_fn(input_dict, 'reference_data'), workers, site_csv, odk_aggregate,
+            transect_cache)
 
     else:
         print('No observational/RAS sheets will be produced')
+        site_result_list = []
+
+    if state_store:
+        # the submissions of a failed form are processed again on the next run.
+        failed_form_list = [form for form, status, _ in form_result_list if status == 'failed']
+        state_dict = {form: state_df for form, state_df in state_dict.items() if form not in failed_form_list}
+
+        # call the incremental_state_store.py script - record the submissions of the successfully processed sites.
+        incremental_state_store.commit_fn(conn, state_dict, site_result_list)
+        conn.close()
+
+    # call the stage_monitor.py script - end of run timing table.
+    stage_monitor.report_fn()
 
 
 if __name__ == '__main__':
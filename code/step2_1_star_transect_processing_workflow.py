@@ -19,11 +19,11 @@ SOFTWARE.
 """
 
 # Import modules
+import os
+import logging
 import warnings
-from datetime import datetime
 import pandas as pd
-import numpy as np
-import geopandas as gpd
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -67,298 +67,195 @@ def string_clean_title_fn(dirty_string):
     return clean_string
 
 
-def date_time_fn(row):
-    """ Extract and reformat date and time fields.
-
-            :param row: pandas dataframe row value object.
-            :return date_time_list: list object containing two string variables: s_date2, obs_date_time. """
-
-    s_date, s_time = row['START'].split('T')
-    # date clean
-    s_date2 = s_date[-2:] + '/' + s_date[-5:-3] + '/' + s_date[2:4]
-
-    # time clean
-    s_hms, _ = s_time.split('.')
-    s_hm = s_hms[:5]
-    if s_hm[:1] == '0':
-        s_hm2 = s_hm[1:5]
-    else:
-        s_hm2 = s_hm[:5]
-
-    dirty_obs_time = datetime.strptime(s_hm2, '%H:%M')
-
-    obs_time = dirty_obs_time.strftime("%I:%M %p")
-    obs_date_time = s_date2 + ' ' + obs_time
-    # print('obs_date_time: ', obs_date_time)
-
-    date_time_list = [s_date2, obs_date_time]
-    return date_time_list
-
-
-def recorder_fn(row):
-    """ Extract recorder information.
-
-            :param row: pandas dataframe row value object.
-            :return obs_recorder: string object containing recorder name. """
-    recorder = str(row['OFFICER_ONE:RECORDER'])
-    # clean and incorporate recorder other
-    if recorder == 'other':
-        recorder = recorder.replace('other', str((row['OFFICER_ONE:OTHER_RECORDER'])))
-    # clean variable, remove white space and possible typos
-    recorder = string_clean_title_fn(recorder)
-    # print(recorder)
-    first, second = recorder.split(' ')
-    obs_recorder = second + ', ' + first
-
-    return obs_recorder
-
-
-def estimator_fn(row):
-    """ Extract estimator information.
-
-        :param row: pandas dataframe row value object.
-        :return obs_estimator: string object containing estimator name.
-        """
-    estimator = str(row['OFFICER_TWO:ESTIMATOR'])
-    # clean variable, remove white space and possible typos
-    if estimator == 'other':
-        estimator = estimator.replace('other', str((row['OFFICER_TWO:OTHER_ESTIMATOR'])))
-    estimator = string_clean_title_fn(estimator)
-    # print(estimator)
-    first, second = estimator.split(' ')
-    obs_estimator = second + ', ' + first
-
-    return obs_estimator
-
-
-def location_fn(row):
-    """ extract the district, property and site information.
-
-            :param row: pandas dataframe row value object.
-            :return location_list: list object containing five string variables:
-            district, listed_property, unlisted_property, final_property and site. """
-
-    # district
-    district = string_clean_title_fn(str(row['DISTRICT']))
-
-    listed_property = str(row['PROP:PROPERTY'])
-
-    # property name
-    if str(row['PROP:PROPERTY']) in set(
-            ('NP_prop_new', 'B_property_outside', 'D_property_outside', 'G_property_outside',
-             'K_property_outside', 'NAS_property_outside', 'P_property_outside', 'R_property_outside',
-             'SAS_property_outside', 'SP_property_outside', 'TC_property_outside', 'VR_property_outside',
-             'NP_property_outside')):
-
-        listed_property = np.nan
-        unlisted_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))  # todo property name not working
-        final_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))  # todo property name not working
-    else:
-        listed_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-        unlisted_property = np.nan
-        final_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-
-    site1 = str(row['GROUP_SITE:SITE_FINAL'])
-
-    # call the stringCleanFN function
-    site = string_clean_upper_fn(site1)
-    location_list = [district, listed_property, unlisted_property, final_property, site]
-    return location_list
-
-
-def gps_points_fn(row):
-    """ Extract the coordinate information.
-
-            :param row: pandas dataframe row value object.
-            :return gps: string object containing the gps device information.
-            :return c_lat: float object containing the center point latitude information.
-            :return c_lon: float object containing the center point longitude information.
-            :return c_acc: float object containing the center point accuracy information (mobile device only).
-            :return off_direct: string object containing the offset direction information.
-            :return o_lat: float object containing the offset point latitude information.
-            :return o_lon: float object containing the offset point longitude information.
-            :return o_acc: float object containing the center point accuracy information. """
-
-    gps = str(row['GPS_SELECT'])
-    # mobile device - collectd at the beginning of the odk form.
-    if gps == 'now_device':
-        c_lat = float(row['CENTRE_GPS1:Latitude'])
-        c_lon = float(row['CENTRE_GPS1:Longitude'])
-        c_acc = float(row['CENTRE_GPS1:Accuracy'])
-
-        off_direct = str(row['OFFSET1:OFFSET_DIRECTION1'])
-
-        o_lat = float(row['OFFSET1:OFFSET_GPS1:Latitude'])
-        o_lon = float(row['OFFSET1:OFFSET_GPS1:Longitude'])
-        o_acc = float(row['OFFSET1:OFFSET_GPS1:Accuracy'])
-
-    # mobile device - collected at the end of the odk form.
-    elif gps == 'later_device':
-        c_lat = float(row['CENTRE_GPS3:Latitude'])
-        c_lon = float(row['CENTRE_GPS3:Longitude'])
-        c_acc = float(row['CENTRE_GPS3:Accuracy'])
-
-        off_direct = str(row['EXT_GPS_COORD_OFFSET2:OFFSET_DIRECTION2'])
-
-        o_lat = float(row['OFFSET3:OFFSET_GPS3:Latitude'])
-        o_lon = float(row['OFFSET3:OFFSET_GPS3:Longitude'])
-        o_acc = float(row['OFFSET3:OFFSET_GPS3:Accuracy'])
-
-    # External device - collectd at the beginning of the odk form.
-    elif gps == 'now_gps':
-        c_lat = float(row['EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LAT2'])
-        c_lon = float(row['EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LONG2'])
-        c_acc = np.nan
-
-        off_direct = str(row['EXT_GPS_COORD_OFFSET2:OFFSET_DIRECTION2'])
-
-        o_lat = float(row['EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LAT2'])
-        o_lon = float(row['EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LONG2'])
-        o_acc = np.nan
-
-    # External device - collectd at the end of the odk form.
-    else:
-        c_lat = float(row['EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LAT4'])
-        c_lon = float(row['EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LONG4'])
-        c_acc = np.nan
-
-        off_direct = str(row['EXT_GPS_COORD_OFFSET4:OFFSET_DIRECTION4'])
-
-        o_lat = float(row['EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LAT4'])
-        o_lon = float(row['EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LONG4'])
-        o_acc = np.nan
-
-    lat_lon_list = [gps, c_lat, c_lon, c_acc, off_direct, o_lat, o_lon, o_acc]
-    return lat_lon_list
-
-
-def meta_data_fn(row):
-    """ Extract and clean the form key information.
-
-            :param row: pandas dataframe row value object.
-            :return meta_key: string object containing the odk form identifier key.
-            :return clean_meta_key: string object containing the cleaned odk form identifier key.
-            :return form_name: string object containing the odk form identifier key. """
-
-    meta_key = str(row['meta:instanceID'])
-    clean_meta_key = meta_key[5:]
-    form_name = str(row['meta:instanceName'])
-
-    meta_data_list = [meta_key, clean_meta_key, form_name]
-    return meta_data_list
-
-
-def main_routine(file_path, temp_dir, veg_list_excel):
+def header_mapping_fn():
+    """ Create the star transect column mapping of the site, date, officer, location, centre and offset coordinate
+    variables.
+
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples. """
+
+    import column_mapping_engine
+
+    gps_dict = {
+        # mobile device - collected at the beginning (now) or the end (later) of the odk form, external device - gps.
+        'c_lat': {'now_device': 'CENTRE_GPS1:Latitude', 'later_device': 'CENTRE_GPS3:Latitude',
+                  'now_gps': 'EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LAT2',
+                  'later_gps': 'EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LAT4'},
+        'c_lon': {'now_device': 'CENTRE_GPS1:Longitude', 'later_device': 'CENTRE_GPS3:Longitude',
+                  'now_gps': 'EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LONG2',
+                  'later_gps': 'EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LONG4'},
+        'c_acc': {'now_device': 'CENTRE_GPS1:Accuracy', 'later_device': 'CENTRE_GPS3:Accuracy',
+                  'now_gps': None, 'later_gps': None},
+        'off_direct': {'now_device': 'OFFSET1:OFFSET_DIRECTION1',
+                       'later_device': 'EXT_GPS_COORD_OFFSET2:OFFSET_DIRECTION2',
+                       'now_gps': 'EXT_GPS_COORD_OFFSET2:OFFSET_DIRECTION2',
+                       'later_gps': 'EXT_GPS_COORD_OFFSET4:OFFSET_DIRECTION4'},
+        'o_lat': {'now_device': 'OFFSET1:OFFSET_GPS1:Latitude', 'later_device': 'OFFSET3:OFFSET_GPS3:Latitude',
+                  'now_gps': 'EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LAT2',
+                  'later_gps': 'EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LAT4'},
+        'o_lon': {'now_device': 'OFFSET1:OFFSET_GPS1:Longitude', 'later_device': 'OFFSET3:OFFSET_GPS3:Longitude',
+                  'now_gps': 'EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LONG2',
+                  'later_gps': 'EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LONG4'},
+        'o_acc': {'now_device': 'OFFSET1:OFFSET_GPS1:Accuracy', 'later_device': 'OFFSET3:OFFSET_GPS3:Accuracy',
+                  'now_gps': None, 'later_gps': None}}
+
+    column_mapping = column_mapping_engine.header_mapping_fn(gps_dict, estimator=True)
+
+    return column_mapping
+
+
+def source_column_fn():
+    """ Declare the raw star transect odk columns read by the workflow (export_reader.py reads no other columns).
+
+            :return source_column_list: list object containing the odk column names. """
+
+    import column_mapping_engine
+
+    source_column_list = (column_mapping_engine.HEADER_SOURCE_LIST + column_mapping_engine.ESTIMATOR_SOURCE_LIST +
+                          column_mapping_engine.META_SOURCE_LIST)
+
+    # centre and offset coordinates (header_mapping_fn).
+    source_column_list.extend([
+        'CENTRE_GPS1:Latitude', 'CENTRE_GPS1:Longitude', 'CENTRE_GPS1:Accuracy',
+        'CENTRE_GPS3:Latitude', 'CENTRE_GPS3:Longitude', 'CENTRE_GPS3:Accuracy',
+        'OFFSET1:OFFSET_GPS1:Latitude', 'OFFSET1:OFFSET_GPS1:Longitude', 'OFFSET1:OFFSET_GPS1:Accuracy',
+        'OFFSET1:OFFSET_DIRECTION1',
+        'OFFSET3:OFFSET_GPS3:Latitude', 'OFFSET3:OFFSET_GPS3:Longitude', 'OFFSET3:OFFSET_GPS3:Accuracy',
+        'EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LAT2', 'EXT_GPS_COORD_CENTRE2:EXT_GPS_COORD_CENTRE_LONG2',
+        'EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LAT4', 'EXT_GPS_COORD_CENTRE4:EXT_GPS_COORD_CENTRE_LONG4',
+        'EXT_GPS_COORD_OFFSET2:OFFSET_DIRECTION2', 'EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LAT2',
+        'EXT_GPS_COORD_OFFSET2:EXT_GPS_COORD_OFFSET_LONG2',
+        'EXT_GPS_COORD_OFFSET4:OFFSET_DIRECTION4', 'EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LAT4',
+        'EXT_GPS_COORD_OFFSET4:EXT_GPS_COORD_OFFSET_LONG4'])
+
+    # transect counts and urls (step2_2_star_transect_basics.py).
+    for n in ['1', '2', '3']:
+        source_column_list.extend(['TRAN' + n, 'REPEAT_points_' + n])
+        source_column_list.extend([count + '_COUNT' + n for count in [
+            'BAREG', 'GRAV', 'RCK', 'ASHH', 'LIT', 'CRYP', 'DAG', 'DPG', 'DF', 'GAG', 'GPG', 'GF', 'ABOVEG', 'ABOVEB',
+            'ABOVED', 'ABOVEIC', 'ABOVENIC', 'BELOWG', 'BELOWB', 'BELOWD', 'BELOWN']])
+
+    # site cover fractions and heights (step2_2_star_transect_basics.py).
+    source_column_list.extend([
+        'EXPOSED_GROUND_SUM', 'LIT_SUM', 'VEG_SUM', 'PG_SUM_PROP', 'AG_SUM_PROP', 'F_SUM_PROP',
+        'SITE_COVER_FRACTIONS:TOTAL_COVER', 'SITE_COVER_FRACTIONS:SITE_COVER_ADJ',
+        'SITE_COVER_FRACTIONS:LITTER_ADJUSTED', 'SITE_COVER_FRACTIONS:EXPOSED_GROUND_ADJUSTED',
+        'SITE_COVER_FRACTIONS:TOTAL_VEG_ADJUSTED', 'SITE_COVER_FRACTIONS:SITE_ADJ',
+        'SITE_VEG_FRACTIONS:TOTAL_VEG_FRACTION', 'SITE_VEG_FRACTIONS:VEG_COVER_ADJUST',
+        'SITE_VEG_FRACTIONS:PG_TOTAL_ADJUSTED', 'SITE_VEG_FRACTIONS:AG_TOTAL_ADJUSTED',
+        'SITE_VEG_FRACTIONS:F_TOTAL_ADJUSTED', 'SITE_VEG_FRACTIONS:VEG_ADJ',
+        'HEIGHT_ESTIMATE:GRASS_HEIGHT', 'HEIGHT_ESTIMATE:TREE_HEIGHT'])
+
+    # botanical names and cover (step2_3_star_transect_botanical.py).
+    for n in ['PG', 'AG', 'F']:
+        source_column_list.extend([n + '_SP:' + n + str(i + 1) + '_NAME' for i in range(10)])
+        source_column_list.extend([n + '_COVER:' + n + '_SP' + str(i + 1) + '_COVER' for i in range(10)])
+
+    # photo urls (step2_4_photo_url_csv.py).
+    source_column_list.extend(['GROUP_SITE_PHOTO:PHOTO_OFF'] + ['GROUP_TRAN_PHOTO:PHOTO_' + direction for direction in
+                                                                ['C', 'N', 'NE', 'SW', 'S', 'SE', 'NW']])
+
+    return source_column_list
+
+
+@stage_monitor.monitor_fn
+def main_routine(file_path, temp_dir, reference_data):
     """ Control the star transect data extraction workflow producing five outputs:
 
             :param file_path: string object containing the dir_path concatenated with search_criteria.
             :param temp_dir: string object path to the created output directory (date_time).
-            :param veg_list_excel: string object path to the odk veg list excel file (botanical and common names).
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
             :return clean_star_transect.csv: clean csv file output to the command argument export directory.
             :return photo_star_url.csv:  csv file containing photo url information to the command argument export
             directory.
-            :return clean_star_transect.shp: clean shapefile output to the command argument export directory
-            - contains all information lat lon set to transect center points.
-            :return clean_offset.shp: shapefile output to the command argument export directory
-            - contains minor information lat lon set to transect offset points."""
+            :return clean_star_transect.arrow: clean table handed to step7 and spatial_sink.py (center and offset
+            point layers).
+            :return star_transect_points.arrow: transect points of the REPEAT_points_N exports, only when the repeat
+            group exports are in the raw odk directory (transect_repeat_reader.py)."""
 
     print('step2_1_star_transect_processing_workflow.py INITIATED.')
 
-    # Read in the star transect csv as a Pandas DataFrame.
-    df = pd.read_csv(file_path)
+    import column_mapping_engine
+    import export_reader
+    header_mapping = header_mapping_fn()
+    meta_mapping = column_mapping_engine.meta_mapping_fn()
 
+    header_list = []
+    meta_list = []
     final_star_list = []
     final_star_photo_list = []
 
-    # for loop through the star transect dataframe (df)
-    for index, row in df.iterrows():
-
-        # call the date_time_fn function to extract date and time information.
-        date_time_list = date_time_fn(row)
-
-        # call the recorder_fn function to extract the recorder information.
-        obs_recorder = recorder_fn(row)
-
-        # call the estimator_fn function to extract the estimator information.
-        obs_estimator = estimator_fn(row)
+    import step2_2_star_transect_basics
+    import step2_3_star_transect_botanical
+    import step2_4_photo_url_csv
 
-        # call the location_fn function to extract the district, property and site information.
-        location_list = location_fn(row)
+    # call the export_reader.py script - the declared star transect columns are streamed in chunks of submissions.
+    for df in export_reader.chunk_fn(file_path, source_column_fn()):
+        stage_monitor.count_fn(rows=len(df))
 
-        # call the gps_points_fn function to extract the longitude and latitude information.
-        lat_lon_list = gps_points_fn(row)
+        # call the column_mapping_engine.py script - header and form identifier variables are processed once for all
+        # records of the chunk.
+        chunk_header_df = column_mapping_engine.mapping_frame_fn(df, header_mapping)
+        header_list.append(chunk_header_df)
+        meta_list.append(column_mapping_engine.mapping_frame_fn(df, meta_mapping))
 
-        # call the meta_date_fn function to extract the unique identifier information for each form record.
-        meta_data_list = meta_data_fn(row)
+        # call the step2_3_star_transect_botanical.py script - species of all records of the chunk are classified and
+        # sorted at once.
+        botanical_record_list = step2_3_star_transect_botanical.botanical_records_fn(
+            df, string_clean_capital_fn, reference_data)
 
-        # create a list of variables to create a cleaned dataframe.
+        # for loop through the star transect records
+        for site, row, botanical_record in zip(chunk_header_df['site'].tolist(), column_mapping_engine.records_fn(df),
+                                               botanical_record_list):
 
-        # extract the site variable from the location list
-        site = location_list[4:][0]
+            # call the step2_2_star_transect_basics.py script.
+            clean_list = step2_2_star_transect_basics.main_routine([], row, site)
 
-        # create a clean list and append/extend output lists and variables
-        clean_list = [site]
-        clean_list.extend(date_time_list)
-        clean_list.extend([obs_recorder, obs_estimator])
-        clean_list.extend(location_list[:4])
-        clean_list.extend(lat_lon_list)
+            # call the step2_3_star_transect_botanical.py script.
+            clean_list, veg_list = step2_3_star_transect_botanical.main_routine(clean_list, row, botanical_record)
 
-        print('step2_1_star_transect_processing_workflow.py COMPLETED')
+            # call the step2_4_photo_url_csv.py script.
+            photo_url_list = step2_4_photo_url_csv.main_routine(row, site)
 
-        # call the step2_2_star_transect_basics.py script.
-        import step2_2_star_transect_basics
-        clean_list = step2_2_star_transect_basics.main_routine(clean_list, row, site)
+            clean_list.extend(photo_url_list[1:])
 
-        # call the step2_3_star_transect_botanical.py script.
-        import step2_3_star_transect_botanical
-        clean_list, veg_list = step2_3_star_transect_botanical.main_routine(
-            clean_list, row, string_clean_capital_fn, veg_list_excel)
+            # Replace clean list values (forb separation amendments to cover fractions if the veg_list is not empty
+            '''veg_list ([rep_veg, adj_perennial, adj_annual, adj_p_forb, field_a_forb, adj_a_forb,
+                        final_a_forb, adj_veg_total, final_veg_total])'''
 
-        # call the step2_4_photo_url_csv.py script.
-        import step2_4_photo_url_csv
-        photo_url_list = step2_4_photo_url_csv.main_routine(row, site)
+            ''''rep_veg', 'field_pg',
+            'adj_pg',
+            'final_pg', 'field_ag', 'adj_ag', 'final_ag', 'field_pf', 'adj_pf', 'final_pf', 'field_af', 'adj_af',
+            'final_af', 'field_veg_total', 'adj_veg_total', 'final_veg_total', 'height_tree', 'height_shrub','''
 
-        clean_list.extend(photo_url_list[1:])
-        # add metadata variables
-        clean_list.extend(meta_data_list)
-
-        # Replace clean list values (forb separation amendments to cover fractions if the veg_list is not empty
-        '''veg_list ([rep_veg, adj_perennial, adj_annual, adj_p_forb, field_a_forb, adj_a_forb,
-                    final_a_forb, adj_veg_total, final_veg_total])'''
-
-        ''''rep_veg', 'field_pg',
-        'adj_pg',
-        'final_pg', 'field_ag', 'adj_ag', 'final_ag', 'field_pf', 'adj_pf', 'final_pf', 'field_af', 'adj_af',
-        'final_af', 'field_veg_total', 'adj_veg_total', 'final_veg_total', 'height_tree', 'height_shrub','''
+            if veg_list:
+                # todo double check that these variables hit the correct cells and uncomment them..
+                stage_monitor.log_fn(logging.DEBUG, 'veg_list', site=site, veg_list=veg_list)
+                """clean_list[99] = veg_list[0]
+                clean_list[101] = veg_list[1]
+                clean_list[104] = veg_list[3]
 
-        if veg_list:
-            print('veg_list is not empty')  # todo double check that these variables hit the correct cells and uncomment them..
-            print("veg_list: ", veg_list)
-            """clean_list[99] = veg_list[0]
-            clean_list[101] = veg_list[1]
-            clean_list[104] = veg_list[3]
+                clean_list[107] = veg_list[4]
+                clean_list[109] = veg_list[5]
+                clean_list[111] = veg_list[6]
 
-            clean_list[107] = veg_list[4]
-            clean_list[109] = veg_list[5]
-            clean_list[111] = veg_list[6]
+                clean_list[113] = veg_list[7]
 
-            clean_list[113] = veg_list[7]
+                clean_list[114] = veg_list[8]"""
 
-            clean_list[114] = veg_list[8]"""
 
+            final_star_list.append(clean_list)
+            final_star_photo_list.append(photo_url_list)
 
-        final_star_list.append(clean_list)
-        final_star_photo_list.append(photo_url_list)
+    header_df = pd.concat(header_list, ignore_index=True)
+    meta_df = pd.concat(meta_list, ignore_index=True)
 
     print('------------------------------------------------------------')
     print('The following outputs have been created:')
 
-    # create offset geoDataFrame and export a shapefile lon lat set to center points.
-    star_transect_df = pd.DataFrame(final_star_list)
-    star_transect_df.columns = (
-        'site', 'date', 'date_time', 'recorder', 'estimator', 'district', 'prop', 'unlist_prop', 'final_prop',
-        'gps', 'c_lat', 'c_lon', 'c_acc', 'off_direct', 'o_lat', 'o_lon', 'o_acc',
-
+    # create the clean star transect dataFrame.
+    body_df = pd.DataFrame(final_star_list, index=header_df.index)
+    body_df.columns = (
         'transect1', 't1_bare', 't1_gravel', 't1_rock', 't1_ash', 't1_litter', 't1_crypto', 't1_dead_pg', 't1_green_pg',
         't1_dead_ag', 't1_green_ag', 't1_dead_fb', 't1_green_fb', 't1_abv_green', 't1_abv_dead', 't1_abv_brown',
         't1_abv_ic', 't1_abv_nic', 't1_blw_green', 't1_blw_dead', 't1_blw_brown', 't1_blw_none',
@@ -398,8 +295,9 @@ def main_routine(file_path, temp_dir, veg_list_excel):
         'bot_af_10', 'cover_af_1', 'cover_af_2', 'cover_af_3', 'cover_af_4', 'cover_af_5', 'cover_af_6', 'cover_af_7',
         'cover_af_8', 'cover_af_9', 'cover_af_10',
 
-        'photo_off', 'photo_c', 'photo_n', 'photo_ne', 'photo_se', 'photo_s', 'photo_sw', 'photo_nw',
-        'meta_key', 'clean_meta_key', 'form',)
+        'photo_off', 'photo_c', 'photo_n', 'photo_ne', 'photo_se', 'photo_s', 'photo_sw', 'photo_nw',)
+
+    star_transect_df = pd.concat([header_df, body_df, meta_df], axis=1)
 
     cols = ['c_acc', 'o_acc', 'field_litter', 'adj_litter', 'final_litter', 'field_exposed', 'adj_exposed',
             'final_exposed', 'field_veg',
@@ -422,46 +320,35 @@ def main_routine(file_path, temp_dir, veg_list_excel):
             'cover_af_1', 'cover_af_2', 'cover_af_3', 'cover_af_4', 'cover_af_5', 'cover_af_6',
             'cover_af_7', 'cover_af_8', 'cover_af_9', 'cover_af_10']
 
-
-
     # replace all int and float missing variables with a 0 value
     star_transect_df[cols] = star_transect_df[cols].fillna(0)
 
+    # call the intermediate_store.py script - typed hand-off to step7, missing values are stored as nulls.
+    import intermediate_store
+    print('-', intermediate_store.write_fn(star_transect_df, temp_dir, 'clean_star_transect'))
+
     star_transect_df2 = star_transect_df.replace('Nan', 'nan')
     star_transect_df3 = star_transect_df2.fillna('nan')
     csv_output = (temp_dir + '\\clean_star_transect.csv')
     star_transect_df3.to_csv(csv_output)
     print('-', csv_output)
-    print(star_transect_df3.final_veg.iloc[0]) #todo remove
-
-    """import sys
-    sys.exit()"""
-
-    # create offset geoDataFrame and export a shapefile lon lat set to center points.
-    star_transect_gdf = gpd.GeoDataFrame(
-        star_transect_df3, geometry=gpd.points_from_xy(star_transect_df.c_lon, star_transect_df.c_lat), crs="EPSG:4326")
-    shp_output = (temp_dir + '\\clean_star_transect.shp')
-    star_transect_gdf.to_file(shp_output, driver='ESRI Shapefile')
-    print('-', shp_output)
-
-    # create a geoDataFrame and export as a shapefile lon lat set to offset points.
-    off_set_star_df = star_transect_df3[['date', 'date_time', 'recorder', 'estimator', 'district', 'final_prop',
-                                          'off_direct', 'o_acc', 'o_lat', 'o_lon', 'meta_key',
-                                         'meta_key', 'form']]
-    off_set_star_gdf = gpd.GeoDataFrame(
-        off_set_star_df, geometry=gpd.points_from_xy(off_set_star_df.o_lon, off_set_star_df.o_lat), crs="EPSG:4326")
-    shp_output = (temp_dir + '\\clean_offset_star_transect.shp')
-    off_set_star_gdf.to_file(shp_output, driver='ESRI Shapefile')
-    print('-', shp_output)
 
     # create a dataFrame and export as a csv containing the photo_url_extraction_fn urls.
     star_photo_list_df = pd.DataFrame(final_star_photo_list)
     star_photo_list_df.columns = ['site', 'photo_off', 'photo_c', 'photo_n', 'photo_ne', 'photo_se', 'photo_s',
                                   'photo_sw', 'photo_nw']
+    print('-', intermediate_store.write_fn(star_photo_list_df, temp_dir, 'photo_star_url'))
     csv_output = (temp_dir + '\\photo_star_url.csv')
     star_photo_list_df.to_csv(csv_output)
     print('-', csv_output)
 
+    # call the transect_repeat_reader.py script - the transect points of the REPEAT_points_N exports, when they were
+    # exported beside the star transect csv, are joined to the submissions and handed to step7.
+    import transect_repeat_reader
+    transect_df = transect_repeat_reader.main_routine(os.path.dirname(os.path.abspath(file_path)), star_transect_df)
+    if transect_df is not None:
+        print('-', intermediate_store.write_fn(transect_df, temp_dir, transect_repeat_reader.TABLE))
+
     print('The Star transect ODK Aggregate csv file has been processed.........')
 
 
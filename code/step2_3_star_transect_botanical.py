@@ -59,183 +59,88 @@ def extract_botanical_fn(row, string_clean_capital_fn, n):
     return list_botanical
 
 
-def species_extraction_fn(row, string_clean_capital_fn, n):
-    """ Extract the botanical names and cover fraction values.
+def species_frame_fn(df, string_clean_capital_fn, n):
+    """ Extract the botanical names and cover fraction values of every record.
 
-            :param row: pandas dataframe row value object.
+            :param df: pandas dataframe object containing the raw star transect odk results.
+            :param string_clean_capital_fn: function to clean string objects returning capitalized format.
             :param n: string object containing the species form code(i.e. 'PG' or 'AG').
-            :return botanical_name_list: list object containing 10 botanical names variables.
-            :return final_cover_list: list object containing 10 float variables (None -> 9999.0)."""
-
-    botanical_name_list = []
-    cover_list = []
-    for i in range(10):
-        botanical_name = string_clean_capital_fn(str(row[n + '_SP:' + n + str(i + 1) + '_NAME']))
-        botanical_name_list.append(botanical_name)
-
-        cover = float(row[n + '_COVER:' + n + '_SP' + str(i + 1) + '_COVER'])
-        cover_list.append(cover)
+            :return name_df: pandas dataframe object containing 10 botanical name columns.
+            :return cover_df: pandas dataframe object containing 10 float cover columns (np.nan if empty)."""
 
-    # convert Nan values to 9999.0 in the cover list
-    final_cover_list = [9999.0 if x != x else x for x in cover_list]
+    name_df = pd.DataFrame({i: [string_clean_capital_fn(str(x)) for x in df[n + '_SP:' + n + str(i + 1) + '_NAME']]
+                            for i in range(10)}, index=df.index)
+    cover_df = pd.DataFrame({i: df[n + '_COVER:' + n + '_SP' + str(i + 1) + '_COVER'].astype(float)
+                             for i in range(10)})
 
-    return botanical_name_list, final_cover_list
+    return name_df, cover_df
 
 
-def botanical_extraction_fn(string_clean_capitalize_fn, match_list, input_name_list, input_cover_list):
-    """ Sorts contents of a list into two lists based on matches from a list of variables (cleaned3p_list).
+def nan_list_fn(value_array):
+    """ Convert a row of cover values to a list object, missing values as np.nan.
 
-            :param string_clean_capitalize_fn: remove whitespaces and clean strings (dirty_string -> clean_string)
-            :param match_list: list object of variables used to match against variables in the input list
-            (i.e. input_name_list).
-            :param input_name_list: list object containing n botanical names variables (species_extraction_fn)
-            :param input_cover_list: list object containing n float variables (None -> 9999.0) (species_extraction_fn).
-            :return list_botanical_match: list object of the same size as the input list (n) after
-            match (variable -> variable) or no match (variable -> str(Nan)) has been determined.
-            :return list_botanical_no_match: list object of the same size as the input list (n) after
-            match (variable -> variable) or no match (variable -> str(Nan)) has been determined.
-            :return list_cover_match: list object of the same size as the input list (n) after
-            match (variable -> variable) or no match (variable -> float(9999.0) has been determined.
-            :return list_cover_no_match:list object of the same size as the input list (n) after
-            match (variable -> variable) or no match (variable -> float(9999.0) has been determined."""
+            :param value_array: numpy array object containing the cover values.
+            :return: list object containing float variables or np.nan. """
 
-    list_botanical_match = []
-    list_botanical_no_match = []
-    list_cover_match = []
-    list_cover_no_match = []
+    return [np.nan if x != x else x for x in value_array.tolist()]
 
-    # sort the two lists based on the cover values
-    for name, cover in zip(input_name_list, input_cover_list):
 
-        # clean the species name
-        clean_name = string_clean_capitalize_fn(name)
+def botanical_records_fn(df, string_clean_capital_fn, reference_data):
+    """ Classify and sort the perennial grass, annual grass and forb species of all records in one pass.
 
-        # insert if else statement regarding Whitegrass !!!!!!!!!!#todo whitegrass statement
-
-        if any(clean_name in x for x in match_list):
-            list_botanical_match.append(clean_name)
-            list_cover_match.append(cover)
-            list_botanical_no_match.append('Nan')
-            list_cover_no_match.append(9999.0)
-
-        else:
-            list_botanical_no_match.append(clean_name)
-            list_cover_no_match.append(cover)
-            list_botanical_match.append('Nan')
-            list_cover_match.append(9999.0)
-    return list_botanical_match, list_botanical_no_match, list_cover_match, list_cover_no_match
+            :param df: pandas dataframe object containing the raw star transect odk results.
+            :param string_clean_capital_fn: function to clean string objects returning capitalized format.
+            :param reference_data: dictionary object containing the 3P grass (ppp_index) and annual forb (af_index)
+                species classification indexes created by reference_data_cache.py.
+            :return botanical_record_list: list object (one per record) containing the botanical list (3P, perennial
+                grass, annual grass, perennial forb and annual forb species and cover values) and the annual forb
+                cover list."""
 
+    import species_classifier
 
-def sort_two_lists(species_list, cover_list):
-    """ sort the two lists based on cover values and convert 9999.0 back to np.nan
+    # call the species_classifier.py script - 3p grass split from the perennial grass.
+    name_df, cover_df = species_frame_fn(df, string_clean_capital_fn, 'PG')
+    ppp_name, ppp_cover, pg_name, pg_cover = species_classifier.main_routine(
+        reference_data['ppp_index'], name_df, cover_df)
 
-            :param species_list: list object containing species names.
-            :param cover_list: list object containing species cover values.
-                Species and cover vales correspond to list order.
-            :return list_cover_sorted_nan: list object (species_list_fn) that has been sorted in ascending order based on
-            count values.
-            :return list_species_sorted: list object (cover_list) that has been sorted in ascending order with
-            injected values (9999.0 converted to np.nan."""
+    # annual grass is not sorted.
+    ag_name_df, ag_cover_df = species_frame_fn(df, string_clean_capital_fn, 'AG')
 
-    # zip species_list_fn with count and sort both lists based on count
-    tuple_cover_sorted, tuple_species_sorted = zip(*sorted(zip(cover_list, species_list)))
+    # call the species_classifier.py script - annual forb split from the perennial forb.
+    name_df, cover_df = species_frame_fn(df, string_clean_capital_fn, 'F')
+    af_name, af_cover, pf_name, pf_cover = species_classifier.main_routine(
+        reference_data['af_index'], name_df, cover_df)
 
-    # convert tuple to list
-    list_cover_sorted = list(tuple_cover_sorted)
-    list_species_sorted = list(tuple_species_sorted)
+    botanical_record_list = []
+    for i in range(len(df)):
+        af_cover_list = nan_list_fn(af_cover[i])
+        botanical_list = (ppp_name[i].tolist() + nan_list_fn(ppp_cover[i]) + pg_name[i].tolist() +
+                          nan_list_fn(pg_cover[i]) + ag_name_df.values[i].tolist() +
+                          nan_list_fn(ag_cover_df.values[i]) + pf_name[i].tolist() + nan_list_fn(pf_cover[i]) +
+                          af_name[i].tolist() + af_cover_list)
+        botanical_record_list.append([botanical_list, af_cover_list])
 
-    # convert 9999.0 back to np.nan values
-    list_cover_sorted_nan = [np.nan if i == 9999.0 else i for i in list_cover_sorted]
+    return botanical_record_list
 
-    return list_cover_sorted_nan, list_species_sorted
 
-
-def main_routine(clean_list, row, string_clean_capital_fn, veg_list_excel):
+def main_routine(clean_list, row, botanical_record):
     """ Extract and clean botanical values and botanical count values from the star transect odk raw output.
 
-            :param veg_list_excel: string object containing the path to an excel document containing the botanical and
-                common names of vegetation species.
-            :type string_clean_capital_fn: function created step2_1_star_transect_processing_workflow.py - used to
-                clean and return capitalize case string variables.
             :param clean_list: list object created under step2_1_star_transect_processing_workflow.py - new variables
                 are extended or appended to the end.
             :param row: pandas dataframe row value object.
+            :param botanical_record: list object containing the botanical list and annual forb cover list of the
+                record (botanical_records_fn defined).
             :return clean_list: list object with additional variables extended or appended to the end.
             :return veg_list: list object containing extended variable to separate forms into annual and perennial"""
 
     print('starTransectCleanPgBotanical3P.py INITIATED.')
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # read in 3p grass species excel
-    # import the 3p list from the final species excel replace all nan values with 'BLANK'
-    ppp = pd.read_excel(veg_list_excel, sheet_name='PPP_COMP', header=None).fillna('BLANK').replace('Nan', 'BLANK')
-
-    # convert column 4 of the worksheet to a list
-    ppp_list = ppp[3].tolist()
-
-    # remove all 'BLANK values from list
-    cleaned3p_list = [x for x in ppp_list if str(x) != 'BLANK']
-
-    # ---------------------------------------------------------------------------------------------------------------
-    # read in and annual forb species excel
-    # import the annual forb list from the final species excel replace all nan values with 'BLANK'
-    forb = pd.read_excel(veg_list_excel, sheet_name='ANNUAL_FORB_COMP', header=None).fillna('BLANK').replace('Nan',
-                                                                                                             'BLANK')
-    # convert to list
-    af_list = forb[5].tolist()
-
-    # remove all 'BLANK values from list
-    cleaned_af_list = [x for x in af_list if str(x) != 'BLANK']
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # perennial and 3p grass processing and sorting
-
-    botanical_name_list, cover_list = species_extraction_fn(row, string_clean_capital_fn, 'PG')
-
-    # call the botanicalPG function
-    list_botanical3p, list_botanical_pg, list3p_cover, list_pg_cover = botanical_extraction_fn(
-        string_clean_capital_fn, cleaned3p_list, botanical_name_list, cover_list)
-
-    list3p_cover_sorted_nan, list3p_species_sorted = sort_two_lists(list_botanical3p, list3p_cover)
-
-    list_pg_cover_sorted_nan, list_pg_species_sorted = sort_two_lists(list_botanical_pg, list_pg_cover)
-
-    # append all values to the cleaned values to the list (clean_list)
-    clean_list.extend(list3p_species_sorted)
-    clean_list.extend(list3p_cover_sorted_nan)
-    clean_list.extend(list_pg_species_sorted)
-    clean_list.extend(list_pg_cover_sorted_nan)
-
-    # ---------------------------------------------------------------------------------------------------------------
-    # annual grass processing
-
-    # extract botanical names and cover values.
-    botanical_name_list, cover_list = species_extraction_fn(row, string_clean_capital_fn, 'AG')
-    list_cover_sorted_nan = [np.nan if i == 9999.0 else i for i in cover_list]
-
-    # append all values to the cleaned values to the list (clean_list)
-    clean_list.extend(botanical_name_list)
-    clean_list.extend(list_cover_sorted_nan)
-
-    # ---------------------------------------------------------------------------------------------------------------
-    # forb extraction and sort
-
-    # extract botanical names and cover values.
-    botanical_name_list, cover_list = species_extraction_fn(row, string_clean_capital_fn, 'F')
-
-    # call the botanicalPG function
-    list_botanical_af, list_botanical_pf, list_af_cover, list_pf_cover = botanical_extraction_fn(
-        string_clean_capital_fn, cleaned_af_list, botanical_name_list, cover_list)
-
-    list_af_cover_sorted_nan, list_af_species_sorted = sort_two_lists(list_botanical_af, list_af_cover)
-
-    list_pf_cover_sorted_nan, list_pf_species_sorted = sort_two_lists(list_botanical_pf, list_pf_cover)
+    botanical_list, list_af_cover_sorted_nan = botanical_record
 
-    # append all values to the cleaned values to the list (clean_list)
-    clean_list.extend(list_pf_species_sorted)
-    clean_list.extend(list_pf_cover_sorted_nan)
-    clean_list.extend(list_af_species_sorted)
-    clean_list.extend(list_af_cover_sorted_nan)
+    # append the 3p, perennial grass, annual grass, perennial forb and annual forb species and cover values
+    # (botanical_records_fn sorted) to the list (clean_list)
+    clean_list.extend(botanical_list)
 
     veg_list = []
 
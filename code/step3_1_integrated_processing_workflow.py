@@ -22,9 +22,7 @@ SOFTWARE.
 from __future__ import print_function, division
 import pandas as pd
 import warnings
-from datetime import datetime
-import numpy as np
-import geopandas as gpd
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -68,157 +66,95 @@ def string_clean_title_fn(dirty_string):
     return clean_string
 
 
-def date_time_fn(row):
-    """ Extract and reformat date and time fields.
-            :param row: pandas dataframe row value object
-        :return date_time_list: list object containing two string variables: s_date2, obs_date_time. """
-
-    s_date, s_time = row['START'].split('T')
-    # date clean
-    s_date2 = s_date[-2:] + '/' + s_date[-5:-3] + '/' + s_date[2:4]
-
-    # time clean
-    s_hms, _ = s_time.split('.')
-    s_hm = s_hms[:5]
-    if s_hm[:1] == '0':
-        s_hm2 = s_hm[1:5]
-    else:
-        s_hm2 = s_hm[:5]
-
-    dirty_obs_time = datetime.strptime(s_hm2, '%H:%M')
-
-    obs_time = dirty_obs_time.strftime("%I:%M %p")
-    obs_date_time = s_date2 + ' ' + obs_time
-
-    date_time_list = [s_date2, obs_date_time]
-    return date_time_list
-
-
-def recorder_fn(row):
-    """ Extract recorder information.
-
-            :param row: pandas dataframe row value object.
-            :return obs_recorder: string object containing recorder name. """
-
-    recorder = str(row['OFFICER_ONE:RECORDER'])
-    # clean and incorporate recorder other
-    if recorder == 'other':
-        recorder = recorder.replace('other', str((row['OFFICER_ONE:OTHER_RECORDER'])))
-    # clean variable, remove white space and possible typos
-    recorder = string_clean_title_fn(recorder)
-    first, second = recorder.split(' ')
-    obs_recorder = second + ', ' + first
-
-    return obs_recorder
-
-
-def estimator_fn(row):
-    """ Extract estimator information.
-
-        :param row: pandas dataframe row value object.
-        :return obs_estimator: string object containing estimator name. """
-
-    estimator = str(row['OFFICER_TWO:ESTIMATOR'])
-    # clean variable, remove white space and possible typos
-    if estimator == 'other':
-        estimator = estimator.replace('other', str((row['OFFICER_TWO:OTHER_ESTIMATOR'])))
-    estimator = string_clean_title_fn(estimator)
-    first, second = estimator.split(' ')
-    obs_estimator = second + ', ' + first
-
-    return obs_estimator
-
-
-def location_fn(row):
-    """ extract the district, property and site information.
-
-            :param row: pandas dataframe row value object.
-            :return location_list: list object containing five string variables:
-            district, listed_property, unlisted_property, final_property and site. """
-
-    # district
-    district = string_clean_title_fn(str(row['DISTRICT']))
-
-    listed_property = str(row['PROP:PROPERTY'])
-
-    # property name
-    if str(row['PROP:PROPERTY']) in set(
-            ('NP_prop_new', 'B_property_outside', 'D_property_outside', 'G_property_outside',
-             'K_property_outside', 'NAS_property_outside', 'P_property_outside', 'R_property_outside',
-             'SAS_property_outside', 'SP_property_outside', 'TC_property_outside', 'VR_property_outside',
-             'NP_property_outside')):
-
-        listed_property = np.nan
-        unlisted_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))
-        final_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))
-    else:
-        listed_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-        unlisted_property = np.nan
-        final_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-
-    site1 = str(row['GROUP_SITE:SITE_FINAL'])
-
-    # call the stringCleanFN function
-    site = string_clean_upper_fn(site1)
-    location_list = [district, listed_property, unlisted_property, final_property, site]
-    return location_list
-
-
-def meta_data_fn(row):
-    """ Extract and clean the form key information.
-
-            :param row: pandas dataframe row value object.
-            :return meta_key: string object containing the odk form identifier key.
-            :return clean_meta_key: string object containing the cleaned odk form identifier key.
-            :return form_name: string object containing the odk form identifier key. """
-
-    meta_key = str(row['meta:instanceID'])
-    clean_meta_key = meta_key[5:]
-    form_name = str(row['meta:instanceName'])
-
-    meta_data_list = [meta_key, clean_meta_key, form_name]
-    return meta_data_list
-
-
-def gps_points_fn(row):
-    """ Extract the coordinate information.
-
-            :param row: pandas dataframe row value object.
-            :return gps: string object containing the gps device information.
-            :return c_lat: float object containing the center point latitude information.
-            :return c_lon: float object containing the center point longitude information.
-            :return c_acc: float object containing the center point accuracy information (mobile device only).
-            :return off_direct: string object containing the offset direction information.
-            :return o_lat: float object containing the offset point latitude information.
-            :return o_lon: float object containing the offset point longitude information.
-            :return o_acc: float object containing the center point accuracy information."""
-
-    gps = str(row['GPS_SELECT'])
-
-    if gps == 'now_device':
-        c_lat = float(row['GPS1:Latitude'])
-        c_lon = float(row['GPS1:Longitude'])
-        c_acc = float(row['GPS1:Accuracy'])
-
-    elif gps == 'later_device':
-        c_lat = float(row['GPS3:Latitude'])
-        c_lon = float(row['GPS3:Longitude'])
-        c_acc = float(row['GPS3:Accuracy'])
-
-    elif gps == 'now_gps':
-        c_lat = float(row['GPS2:GPS2_LAT2'])
-        c_lon = float(row['GPS2:GPS2_LONG2'])
-        c_acc = np.nan
-
-    else:  # later_gps
-        c_lat = float(row['GPS4:GPS4_LAT'])
-        c_lon = float(row['GPS4:GPS4_LONG'])
-        c_acc = np.nan
-
-    lat_lon_list = [gps, c_lat, c_lon, c_acc]
-    return lat_lon_list
-
-
+def header_mapping_fn():
+    """ Create the integrated column mapping of the site, date, officer, location and coordinate variables.
+
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples. """
+
+    import column_mapping_engine
+
+    gps_dict = {
+        'c_lat': {'now_device': 'GPS1:Latitude', 'later_device': 'GPS3:Latitude',
+                  'now_gps': 'GPS2:GPS2_LAT2', 'later_gps': 'GPS4:GPS4_LAT'},
+        'c_lon': {'now_device': 'GPS1:Longitude', 'later_device': 'GPS3:Longitude',
+                  'now_gps': 'GPS2:GPS2_LONG2', 'later_gps': 'GPS4:GPS4_LONG'},
+        'c_acc': {'now_device': 'GPS1:Accuracy', 'later_device': 'GPS3:Accuracy',
+                  'now_gps': None, 'later_gps': None}}
+
+    column_mapping = column_mapping_engine.header_mapping_fn(gps_dict)
+
+    return column_mapping
+
+
+def source_column_fn():
+    """ Declare the raw integrated odk columns read by the workflow (export_reader.py reads no other columns).
+
+            :return source_column_list: list object containing the odk column names. """
+
+    import column_mapping_engine
+
+    source_column_list = column_mapping_engine.HEADER_SOURCE_LIST + column_mapping_engine.META_SOURCE_LIST
+
+    # coordinates (header_mapping_fn).
+    source_column_list.extend([
+        'GPS1:Latitude', 'GPS1:Longitude', 'GPS1:Accuracy', 'GPS2:GPS2_LAT2', 'GPS2:GPS2_LONG2',
+        'GPS3:Latitude', 'GPS3:Longitude', 'GPS3:Accuracy', 'GPS4:GPS4_LAT', 'GPS4:GPS4_LONG'])
+
+    # site establishment (step3_2_integrated_establishment.py).
+    source_column_list.extend([
+        'GROUP_SITE_DESC:PADDOCK_NAME', 'GROUP_SITE_DESC:REASON_SITE', 'GROUP_SITE_DESC:SITE_DESC',
+        'GROUP_SITE_DESC:SITE_DESC_OTHER',
+        'SITE_ESTABLISHMENT:GROUP_SOIL:LANDSCAPE_POS', 'SITE_ESTABLISHMENT:GROUP_SOIL:SOIL_COLOR',
+        'SITE_ESTABLISHMENT:GROUP_LAND_SYSTEM:LAND_SYSTEM1', 'SITE_ESTABLISHMENT:GROUP_LS:LS_SOURCE',
+        'SITE_ESTABLISHMENT:GROUP_LS:LAND_SYS_CONSIST', 'SITE_ESTABLISHMENT:ALT_LAND_SYS',
+        'SITE_ESTABLISHMENT:GROUP_ALT_LS:ALT_LS_SOURCE',
+        'SITE_ESTABLISHMENT:ESTAB_GROUP_TRACK:DIRECTION_TRACK', 'SITE_ESTABLISHMENT:ESTAB_GROUP_TRACK:DIST_TRACK',
+        'SITE_ESTABLISHMENT:ESTAB_GROUP_INFRA:EST_INFRA_FINAL',
+        'SITE_ESTABLISHMENT:ESTAB_GROUP_INFRA:GROUP_INFRA_DIST:ESTAB_INFRA_DIST',
+        'GROUP_WATER:WATER_FINAL', 'GROUP_WATER:GROUP_WATER_DIST:NEAR_WATER_NAME',
+        'GROUP_WATER:GROUP_WATER_DIST:DIRECTION_WATER', 'GROUP_WATER:GROUP_WATER_DIST:DIST_NEAR_WATER',
+        'GROUP_INFRA:INFRA_FINAL', 'GROUP_INFRA:GROUP_OTHER_INFRA_DIST:INFRA_DIST',
+        'GROUP_INFRA:GROUP_OTHER_INFRA_DIST:INFRA_COMMENT',
+        'SITE_REVISIT:SEASON_COND', 'SITE_REVISIT:ATM_COND',
+        'SOIL_REVISIT:SURF_CRACK', 'SOIL_REVISIT:SOIL_MOIST', 'SOIL_REVISIT:ERODIBLE_SOIL'])
+
+    # disturbance (step3_3_integrated_disturbance.py).
+    for i in range(6):
+        source_column_list.extend(['GROUP_FERAL:FERAL' + str(i + 1), 'GROUP_FERAL:FERAL' + str(i + 1) + '_EVID'])
+    source_column_list.extend([
+        'GROUP_FERAL:FERAL_OTHER', 'GROUP_FERAL:FERAL_OTHER_EVID',
+        'CLEARING:CLEAR_AGE', 'CLEARING:CLEAR_TYPE', 'CLEARING:PDK_NAME', 'CLEARING:LAND_USE', 'CLEARING:LU_OTHER',
+        'DIST_COMMENTS:CYCLONE_COMMENT', 'DIST_COMMENTS:DIEBACK_COMMENT',
+        'FIRE:NORTH_FF', 'FIRE:NORTH_FI', 'FIRE:SOUTH_FF', 'FIRE:SOUTH_FI'])
+    for n in ['1', '2', '3']:
+        source_column_list.extend([
+            'WEEDS:GROUP_WEED' + n + ':WEED' + n, 'WEEDS:GROUP_WEED' + n + ':WEED' + n + '_OTHER',
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:SPECIES_SIZE' + n,
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:SPECIES_DENSITY' + n,
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:WEED' + n + '_COMMENT'])
+
+    # erosion, cattle and condition (step3_4_integrated_disturbance2.py).
+    for i in ['SCALDING', 'WINDSHEETING', 'WATERSHEETING', 'RILLING', 'GULLYING']:
+        source_column_list.extend(['DISTURBANCE_EROSION:GROUP_SCALDING:' + i + '_SEVERITY',
+                                   'DISTURBANCE_EROSION:GROUP_SCALDING:' + i + '_STABILITY'])
+    source_column_list.extend([
+        'DISTURBANCE_EROSION:GROUP_SCALDING:EROSION_COMMENTS', 'CATTLE:CATTLE_PAD', 'CATTLE:CATTLE_TRAMP',
+        'GROUP_CONTITION:GREENESS', 'GROUP_CONTITION:GREENESS_COMMENT', 'GROUP_CONTITION:ABUNDANCE',
+        'GROUP_CONTITION:ABUNDANCE_COMMENT', 'GROUP_CONTITION:PAST_UTIL_PROP', 'GROUP_CONTITION:PAST_UTIL_COMMENT',
+        'CONDITION:CONDITION_SCORE', 'CONDITION:VISIT_NOTES', 'CONDITION:DEV_NOTE'])
+
+    # disturbance photos (step3_5_integrated_photos.py).
+    for i in range(8):
+        dest = 'DEST' + str(i + 1)
+        source_column_list.append('GROUP_PHOTOS:' + dest)
+        for n in range(3):
+            photo = 'GROUP_PHOTOS:GROUP_' + dest + '_PHOTO:' + dest + '_PHOTO' + str(n + 1)
+            source_column_list.extend([photo, photo + '_BEARING'])
+
+    return source_column_list
+
+
+@stage_monitor.monitor_fn
 def main_routine(file_path, temp_dir):
     """ Control the integrated data extraction workflow producing two outputs.
 
@@ -230,71 +166,59 @@ def main_routine(file_path, temp_dir):
 
     print('step3_1_integrated_processing_workflow.py INITIATED.')
 
-    # Read in the star transect csv as  a Pandas DataFrame.
-    df = pd.read_csv(file_path)
+    import column_mapping_engine
+    import export_reader
+    header_mapping = header_mapping_fn()
+    meta_mapping = column_mapping_engine.meta_mapping_fn()
 
+    header_list = []
+    meta_list = []
     final_clean_list = []
     final_photo_url_list = []
 
-    # from datetime import datetime
-    for index, row in df.iterrows():
-        # call the date_time_fn function to extract date and time information.
-        date_time_list = date_time_fn(row)
-
-        # call the recorder_fn function to extract the recorder information.
-        obs_recorder = recorder_fn(row)
-
-        # call the location_fn function to extract the district, property and site information.
-        location_list = location_fn(row)
-
-        # call the gps_points_fn function to extract the longitude and latitude information.
-        lat_lon_list = gps_points_fn(row)
-
-        # call the meta_date_fn function to extract the unique identifier information for each form record.
-        meta_data_list = meta_data_fn(row)
+    print('step3_2_integrated_establishment.py initiating...........')
+    import step3_2_integrated_establishment
+    import step3_3_integrated_disturbance
+    import step3_4_integrated_disturbance2
+    import step3_5_integrated_photos
 
-        # extract the site variable from the location list
-        site = location_list[4:][0]
+    # call the export_reader.py script - the declared integrated columns are streamed in chunks of submissions.
+    for df in export_reader.chunk_fn(file_path, source_column_fn()):
+        stage_monitor.count_fn(rows=len(df))
 
-        # create a clean list and append/extend output lists and variables
-        clean_list = [site]
-        clean_list.extend(date_time_list)
-        clean_list.append(obs_recorder)
-        clean_list.extend(location_list[:4])
-        clean_list.extend(lat_lon_list)
+        # call the column_mapping_engine.py script - header and form identifier variables are processed once for all
+        # records of the chunk.
+        chunk_header_df = column_mapping_engine.mapping_frame_fn(df, header_mapping)
+        header_list.append(chunk_header_df)
+        meta_list.append(column_mapping_engine.mapping_frame_fn(df, meta_mapping))
 
-        print('step3_1_integrated_processing_workflow.py COMPLETED')
-        print('step3_2_integrated_establishment.py initiating...........')
+        for site, row in zip(chunk_header_df['site'].tolist(), column_mapping_engine.records_fn(df)):
 
-        # call the step3_2_integrated_establishment.py script.
-        import step3_2_integrated_establishment
-        clean_list = step3_2_integrated_establishment.main_routine(
-            clean_list, row, string_clean_capital_fn, string_clean_title_fn)
+            # call the step3_2_integrated_establishment.py script.
+            clean_list = step3_2_integrated_establishment.main_routine(
+                [], row, string_clean_capital_fn, string_clean_title_fn)
 
-        # call the step3_3_integrated_disturbance.py script.
-        import step3_3_integrated_disturbance
-        clean_list = step3_3_integrated_disturbance.main_routine(
-            clean_list, row, string_clean_capital_fn)
+            # call the step3_3_integrated_disturbance.py script.
+            clean_list = step3_3_integrated_disturbance.main_routine(
+                clean_list, row, string_clean_capital_fn)
 
-        # call the step3_4_integrated_disturbance2.py script.
-        import step3_4_integrated_disturbance2
-        clean_list = step3_4_integrated_disturbance2.main_routine(
-            clean_list, row, string_clean_capital_fn)
+            # call the step3_4_integrated_disturbance2.py script.
+            clean_list = step3_4_integrated_disturbance2.main_routine(
+                clean_list, row, string_clean_capital_fn)
 
-        # call the step3_5_integrated_photos.py script.
-        import step3_5_integrated_photos
-        clean_list, photo_url_list = step3_5_integrated_photos.main_routine(
-            clean_list, row, site)
+            # call the step3_5_integrated_photos.py script.
+            clean_list, photo_url_list = step3_5_integrated_photos.main_routine(
+                clean_list, row, site)
 
-        clean_list.extend(meta_data_list)
-        final_clean_list.append(clean_list)
-        final_photo_url_list.append(photo_url_list)
+            final_clean_list.append(clean_list)
+            final_photo_url_list.append(photo_url_list)
 
+    header_df = pd.concat(header_list, ignore_index=True)
+    meta_df = pd.concat(meta_list, ignore_index=True)
 
-    integrated_df = pd.DataFrame(final_clean_list)
-    integrated_df.columns = [
-        'site', 'date', 'date_time', 'recorder', 'district', 'prop', 'unlist_prop', 'final_prop', 'gps', 'c_lat',
-        'c_lon', 'c_acc', 'paddock', 'desc', 'reason', 'landscape', 'soil_colour',
+    body_df = pd.DataFrame(final_clean_list, index=header_df.index)
+    body_df.columns = [
+        'paddock', 'desc', 'reason', 'landscape', 'soil_colour',
         'land_system', 'ls_consist', 'ls_alt', 'ls_source', 'water_point', 'water_name', 'water_dir', 'water_dist',
         'est_track', 'est_track_dist', 'est_track_dir', 'est_inf_oth', 'est_inf_oth_dist', 'rev_inf', 'rev_inf_dist',
         'rev_inf_comm', 'season_cond', 'soil_moist', 'atm_cond', 'soil_cracks', 'erod_soil', 'clearing', 'cyclone',
@@ -311,29 +235,24 @@ def main_routine(file_path, temp_dir):
         'dist4_p1', 'dist4_pb1', 'dist4_p2', 'dist4_pb2', 'dist4_p3', 'dist4_pb3', 'dist5', 'dist5_p1', 'dist5_pb1',
         'dist5_p2', 'dist5_pb2', 'dist5_p3', 'dist5_pb3', 'dist6', 'dist6_p1', 'dist6_pb1', 'dist6_p2', 'dist6_pb2',
         'dist6_p3', 'dist6_pb3', 'dist7', 'dist7_p1', 'dist7_pb1', 'dist7_p2', 'dist7_pb2', 'dist7_p3', 'dist7_pb3',
-        'dist8', 'dist8_p1', 'dist8_pb1', 'dist8_p2', 'dist8_pb2', 'dist8_p3', 'dist8_pb3', 'meta_key',
-        'clean_meta_key', 'form', ]
+        'dist8', 'dist8_p1', 'dist8_pb1', 'dist8_p2', 'dist8_pb2', 'dist8_p3', 'dist8_pb3']
+
+    integrated_df = pd.concat([header_df, body_df, meta_df], axis=1)
 
     integrated_df2 = integrated_df.replace('Nan', 'nan')
 
     csv_output = (temp_dir + '\\clean_integrated.csv')
     integrated_df2.to_csv(csv_output)
 
+    # call the intermediate_store.py script - typed hand-off to step7, missing values are stored as nulls.
+    import intermediate_store
+    store_output = intermediate_store.write_fn(integrated_df, temp_dir, 'clean_integrated')
+
     print('------------------------------------------------------------')
     print('The following outputs have been created:')
+    print('-', store_output)
     print('-', csv_output)
 
-    # create a geoDataFrame
-    integrated_gdf = gpd.GeoDataFrame(integrated_df2,
-                                      geometry=gpd.points_from_xy(integrated_df.c_lon, integrated_df.c_lat),
-                                      crs="EPSG:4326")
-    shp_output = (temp_dir + '\\clean_integrated.shp')
-
-    # Export shapefile
-    integrated_gdf.to_file(shp_output, driver='ESRI Shapefile')
-
-    print('-', shp_output)
-
     photo_list_df = pd.DataFrame(final_photo_url_list)
     photo_list_df.columns = [
         'site', 'dist1', 'dist1_p1', 'dist1_pb1', 'dist1_p2', 'dist1_pb2', 'dist1_p3', 'dist1_pb3',
@@ -345,6 +264,7 @@ def main_routine(file_path, temp_dir):
         'dist7', 'dist7_p1', 'dist7_pb1', 'dist7_p2', 'dist7_pb2', 'dist7_p3', 'dist7_pb3',
         'dist8', 'dist8_p1', 'dist8_pb1', 'dist8_p2', 'dist8_pb2', 'dist8_p3', 'dist8_pb3']
     # starTransectDF.set_index('site', inplace=True)
+    print('-', intermediate_store.write_fn(photo_list_df, temp_dir, 'photo_integrated_url'))
     csv_output = (temp_dir + '\\photo_integrated_url.csv')
     photo_list_df.to_csv(csv_output)
     print('-', csv_output)
@@ -25,83 +25,59 @@ import warnings
 warnings.filterwarnings("ignore")
 
 
-def basal_factors_fn(row):
-    """ Extract the basal factor.
+def basal_position_mapping_fn():
+    """ Create the column mapping of the basal information for the seven locations within each site.
 
-            :param row: pandas dataframe row value object.
-            :return factor: integer object containing the basal factor."""
+            :return column_mapping: list object containing five basal variables for each of the seven locations."""
 
-    factor = int(row['LOCATION_FACTOR'])
+    import column_mapping_engine as cme
 
-    return factor
-
-
-def basal_position_fn(row):
-    """ Extract basal information for seven locations within each site.
-
-            :param row: pandas dataframe row value object.
-            :return basal_list: list object containing  five basal variables for each of the seven sites."""
-
-    basal_list = []
+    column_mapping = []
     for i in range(7):
-        str(i + 1)
+        prefix = 'Location_' + str(i + 1) + ':LOCATION' + str(i + 1)
 
-        basal = str(row['Location_' + str(i + 1) + ':LOCATION' + str(i + 1) + '_LABEL'][:-4]).replace('-', ' ')
-        dead_tree = float(row['Location_' + str(i + 1) + ':LOCATION' + str(i + 1) + '_TREE_DEAD'])
-        live_tree = float(row['Location_' + str(i + 1) + ':LOCATION' + str(i + 1) + '_TREE_LIVE'])
-        dead_shrub = float(row['Location_' + str(i + 1) + ':LOCATION' + str(i + 1) + '_SHRUB_DEAD'])
-        live_shrub = float(row['Location_' + str(i + 1) + ':LOCATION' + str(i + 1) + '_SHRUB_LIVE'])
-        list_a = [basal, dead_tree, live_tree, dead_shrub, live_shrub]
-        basal_list.extend(list_a)
+        column_mapping.extend([
+            ('basal' + str(i + 1), cme.text_fn, (prefix + '_LABEL', 4)),
+            ('dead_tree' + str(i + 1), cme.float_fn, (prefix + '_TREE_DEAD',)),
+            ('live_tree' + str(i + 1), cme.float_fn, (prefix + '_TREE_LIVE',)),
+            ('dead_shrub' + str(i + 1), cme.float_fn, (prefix + '_SHRUB_DEAD',)),
+            ('live_shrub' + str(i + 1), cme.float_fn, (prefix + '_SHRUB_LIVE',))])
 
-    return basal_list
+    return column_mapping
 
 
-def basal_calc_odk_fn(row):
-    """ Extract basal totals.
+def column_mapping_fn():
+    """ Create the column mapping of the basal factor, counts and totals.
 
-            :param row: pandas dataframe row value object.
-            :return basal_totals_list: list object containing three basal totals per site."""
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples."""
 
-    basal_tree = float(row['BA_ADULT_TREES'])
-    basal_shrub = float(row['BA_ADULT_SHRUBS'])
+    import column_mapping_engine as cme
 
-    total_basal = basal_tree + basal_shrub
+    column_mapping = [('factor', cme.int_fn, ('LOCATION_FACTOR',))]
+    column_mapping.extend(basal_position_mapping_fn())
+    column_mapping.extend([
+        ('basal_tree', cme.float_fn, ('BA_ADULT_TREES',)),
+        ('basal_shrub', cme.float_fn, ('BA_ADULT_SHRUBS',)),
+        ('total_basal', cme.float_sum_fn, (['BA_ADULT_TREES', 'BA_ADULT_SHRUBS'],))])
 
-    basal_totals_list = [basal_tree, basal_shrub, total_basal]
+    return column_mapping
 
-    return basal_totals_list
 
-
-def main_routine(clean_list, row):
+def main_routine(df):
     """ Extract the basal factor, counts and totals.
 
-            :param clean_list: list object containing processed variables
-            - new variables are extended to the end of the list.
-            :param row: pandas dataframe row value object.
-            :return clean_list: list object containing processed variables
-            - new variables are extended to the end of the list."""
+            :param df: pandas dataframe object containing the raw odk basal sweep results.
+            :return basal_df: pandas dataframe object containing the processed variables (one row per record)."""
 
     print('step4_2_basal_factor.py INITIATED.')
 
-    # call the basal_factors_fn function
-    factor = basal_factors_fn(row)
-
-    # call the basal_position_fn function
-    basal_list = basal_position_fn(row)
-
-    # call the basal_calc_odk_fn function
-    basal_totals_list = basal_calc_odk_fn(row)
-
-    # extend outputs to clean_list
-    clean_list.extend([factor])
-    clean_list.extend(basal_list)
-    clean_list.extend(basal_totals_list)
+    import column_mapping_engine
+    basal_df = column_mapping_engine.mapping_frame_fn(df, column_mapping_fn())
 
     print('step4_2_basal_factor.py COMPLETED.')
     print('step4_3_basal_botanical.py initiating..........')
 
-    return clean_list
+    return basal_df
 
 
 if __name__ == '__main__':
@@ -25,57 +25,47 @@ import warnings
 warnings.filterwarnings("ignore")
 
 
-def extract_botanical_fn(row, string_clean_capital_fn, n):
-    """ Extract woody thickening information for the five transects within each site.
+def botanical_mapping_fn(n, output):
+    """ Create the column mapping of the five botanical names of a species form, 'Other1'-'Other5' values are
+    replaced with the matching free text value.
 
-             :param row: pandas dataframe row value object.
-             :param string_clean_capital_fn: function to clean string objects returning capitalized format.
              :param n: string object passed into the function (i.e str(TS), str(SB)).
-             :return list_botanical: list object containing the five botanical names for the input species form.
-             within each site."""
+             :param output: string object containing the output column prefix (i.e. 'bot_ts').
+             :return column_mapping: list object containing the five botanical name column mappings."""
 
-    list_botanical = []
+    import column_mapping_engine as cme
 
+    column_mapping = []
     for i in range(5):
+        column_mapping.append(
+            (output + str(i + 1), cme.other_substitution_fn, (n + '_SP:' + n + str(i + 1), n + '_SP:' + n + '_OTHER')))
 
-        botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + str(i + 1)]))
-        if botanical == 'Other1':
-            final_botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + '_OTHER1']))
-        elif botanical == 'Other2':
-            fina_botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + '_OTHER2']))
-        elif botanical == 'Other3':
-            fina_botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + '_OTHER3']))
-        elif botanical == 'Other4':
-            final_botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + '_OTHER4']))
-        elif botanical == 'Other5':
-            final_botanical = string_clean_capital_fn(str(row[n + '_SP:' + n + '_OTHER5']))
-        else:
-            final_botanical = botanical
-        list_botanical.append(final_botanical)
-
-    return list_botanical
-
-
-def main_routine(clean_list, row, string_clean_capital_fn):
-    """ Extract the basal botanical names from the raw RMB ODK basal sweep results.
+    return column_mapping
 
-            :param clean_list: list object containing processed variables
-            - new variables are extended to the end of the list.
-            :param row: pandas dataframe row value object.
-            :param string_clean_capital_fn: function to clean string objects returning capitalized format.
-            :return clean_list: list object containing processed variables
-            - new variables are extended to the end of the list."""
 
-    print('step4_3_basal_botanical.py INITIATED.')
+def column_mapping_fn():
+    """ Create the column mapping of the tree and shrub botanical names.
+
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples."""
+
+    column_mapping = botanical_mapping_fn('TS', 'bot_ts')
+    column_mapping.extend(botanical_mapping_fn('SB', 'bot_sb'))
+
+    return column_mapping
 
-    tree_botanical_list = extract_botanical_fn(row, string_clean_capital_fn, 'TS')
 
-    shrub_botanical_list = extract_botanical_fn(row, string_clean_capital_fn, 'SB')
+def main_routine(df):
+    """ Extract the basal botanical names from the raw RMB ODK basal sweep results.
+
+            :param df: pandas dataframe object containing the raw odk results.
+            :return botanical_df: pandas dataframe object containing the processed variables (one row per record)."""
+
+    print('step4_3_basal_botanical.py INITIATED.')
 
-    clean_list.extend(tree_botanical_list)
-    clean_list.extend(shrub_botanical_list)
+    import column_mapping_engine
+    botanical_df = column_mapping_engine.mapping_frame_fn(df, column_mapping_fn())
 
-    return clean_list
+    return botanical_df
 
 
 if __name__ == '__main__':
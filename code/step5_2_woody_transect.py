@@ -25,81 +25,60 @@ import warnings
 warnings.filterwarnings("ignore")
 
 
-def belt_width_fn(row):
-    """ Extract the woody thickening belt width.
+def wood_thick_counts_mapping_fn():
+    """ Create the column mapping of the woody thickening information for the five transects within each site.
 
-            :param row: pandas dataframe row value object.
-            :return factor: integer object containing the woody transect width."""
+            :return column_mapping: list object containing three woody thickening variables for each of the five
+            transects within each site."""
 
-    belt_width = int(row['BELT_WIDTH'])
+    import column_mapping_engine as cme
 
-    return belt_width
-
-
-def wood_thick_counts_fn(row):
-    """ Extract woody thickening information for the five transects within each site.
-
-            :param row: pandas dataframe row value object.
-            :return woody_list: list object containing three woody thickening variables for each of the five transects
-            within each site."""
-
-    woody_list = []
+    column_mapping = []
     for i in range(5):
-        woody = str(row['TRANSECT_' + str(i + 1) + ':TRAN' + str(i + 1)]).replace('-', ' ')
-        tree = (row['TRANSECT_' + str(i + 1) + ':T' + str(i + 1) + '_JUV_TREE'])
-        shrub = float(row['TRANSECT_' + str(i + 1) + ':T' + str(i + 1) + '_JUV_SHRUB'])
-        list_a = [woody, tree, shrub]
-        woody_list.extend(list_a)
+        n = str(i + 1)
+        prefix = 'TRANSECT_' + n + ':'
 
-    return woody_list
+        column_mapping.extend([
+            ('woody' + n, cme.text_fn, (prefix + 'TRAN' + n,)),
+            ('tree' + n, cme.column_fn, (prefix + 'T' + n + '_JUV_TREE',)),
+            ('shrub' + n, cme.float_fn, (prefix + 'T' + n + '_JUV_SHRUB',))])
 
+    return column_mapping
 
-def woody_density_odk_fn(row):
-    """ Extract woody density totals.
 
-            :param row: pandas dataframe row value object.
-            :return woody_density_list: list object containing four density totals per site."""
+def column_mapping_fn():
+    """ Create the column mapping of the woody thickening transect width, form counts and density totals.
 
-    juv_tree_count = float(row['GROUP_VEG_LIST:STEM_COUNT_TOTAL_TREE'])
-    juv_shrub_count = float(row['GROUP_VEG_LIST:STEM_COUNT_TOTAL_SHRUB'])
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples."""
 
-    juv_tree_density = float(row['GROUP_VEG_LIST:STEM_DENSITY_TREE_CALC'])
-    juv_shrub_density = float(row['GROUP_VEG_LIST:STEM_DENSITY_SHRUB_CALC'])
+    import column_mapping_engine as cme
 
-    woody_density_list = [juv_tree_count, juv_shrub_count, juv_tree_density, juv_shrub_density]
+    column_mapping = [('belt_width', cme.int_fn, ('BELT_WIDTH',))]
+    column_mapping.extend(wood_thick_counts_mapping_fn())
+    column_mapping.extend([
+        ('juv_tree_count', cme.float_fn, ('GROUP_VEG_LIST:STEM_COUNT_TOTAL_TREE',)),
+        ('juv_shrub_count', cme.float_fn, ('GROUP_VEG_LIST:STEM_COUNT_TOTAL_SHRUB',)),
+        ('juv_tree_den', cme.float_fn, ('GROUP_VEG_LIST:STEM_DENSITY_TREE_CALC',)),
+        ('juv_shrub_den', cme.float_fn, ('GROUP_VEG_LIST:STEM_DENSITY_SHRUB_CALC',))])
 
-    return woody_density_list
+    return column_mapping
 
 
-def main_routine(clean_list, row):
+def main_routine(df):
     """ Extract the woody thickening transect width, form counts and density totals.
 
-        :param clean_list: list object containing processed variables
-        - new variables are extended to the end of the list.
-        :param row: pandas dataframe row value object.
-        :return clean_list: list object containing processed variables
-        - new variables are extended to the end of the list."""
+        :param df: pandas dataframe object containing the raw odk woody thickening results.
+        :return woody_df: pandas dataframe object containing the processed variables (one row per record)."""
 
     print('step5_2_woody_transect.py INITIATED.')
 
-    # call the belt_width_fn function
-    belt_width = belt_width_fn(row)
-
-    # call the wood_thick_counts_fn function
-    woody_list = wood_thick_counts_fn(row)
-
-    # call the woody_density_odk_fn function
-    woody_density_list = woody_density_odk_fn(row)
-
-    # extend outputs to clean_list
-    clean_list.extend([belt_width])
-    clean_list.extend(woody_list)
-    clean_list.extend(woody_density_list)
+    import column_mapping_engine
+    woody_df = column_mapping_engine.mapping_frame_fn(df, column_mapping_fn())
 
     print('step5_2_woody_transect.py COMPLETED.')
     print('step5_3_woody_botanical.py initiating..........')
 
-    return clean_list
+    return woody_df
 
 
 if __name__ == '__main__':
@@ -22,9 +22,7 @@ SOFTWARE.
 from __future__ import print_function, division
 import pandas as pd
 import warnings
-from datetime import datetime
-import numpy as np
-import geopandas as gpd
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -68,169 +66,97 @@ def string_clean_title_fn(dirty_string):
     return clean_string
 
 
-def date_time_fn(row):
-    """ Extract and reformat date and time fields.
-            :param row: pandas dataframe row value object
-            :return date_time_list: list object containing two string variables: s_date2, obs_date_time. """
+def header_mapping_fn():
+    """ Create the ras column mapping of the site, date, officer, location and coordinate variables.
 
-    s_date, s_time = row['START'].split('T')
-    # date clean
-    s_date2 = s_date[-2:] + '/' + s_date[-5:-3] + '/' + s_date[2:4]
+            :return column_mapping: list object containing (output name, transform function, arguments) tuples. """
 
-    # time clean
-    s_hms, _ = s_time.split('.')
-    s_hm = s_hms[:5]
-    if s_hm[:1] == '0':
-        s_hm2 = s_hm[1:5]
-    else:
-        s_hm2 = s_hm[:5]
+    import column_mapping_engine
 
-    dirty_obs_time = datetime.strptime(s_hm2, '%H:%M')
+    gps_dict = {
+        'c_lat': {'now_device': 'GPS1:Latitude', 'later_device': 'SITE_GPS3:Latitude',
+                  'now_gps': 'GPS2:GPS2_LAT2', 'later_gps': 'EXT_GPS_COORD4:GPS_COORD_LAT4'},
+        'c_lon': {'now_device': 'GPS1:Longitude', 'later_device': 'SITE_GPS3:Longitude',
+                  'now_gps': 'GPS2:GPS2_LONG2', 'later_gps': 'EXT_GPS_COORD4:GPS_COORD_LONG4'},
+        'c_acc': {'now_device': 'GPS1:Accuracy', 'later_device': 'SITE_GPS3:Accuracy',
+                  'now_gps': None, 'later_gps': None}}
 
-    obs_time = dirty_obs_time.strftime("%I:%M %p")
-    obs_date_time = s_date2 + ' ' + obs_time
+    column_mapping = column_mapping_engine.header_mapping_fn(gps_dict)
 
-    date_time_list = [s_date2, obs_date_time]
-    return date_time_list
+    return column_mapping
 
 
-def recorder_fn(row):
-    """ Extract recorder information.
+def source_column_fn():
+    """ Declare the raw ras odk columns read by the workflow (export_reader.py reads no other columns).
 
-            :param row: pandas dataframe row value object.
-            :return obs_recorder: string object containing recorder name. """
+            :return source_column_list: list object containing the odk column names. """
 
-    recorder = str(row['OFFICER_ONE:RECORDER'])
-    # clean and incorporate recorder other
-    if recorder == 'other':
-        recorder = recorder.replace('other', str((row['OFFICER_ONE:OTHER_RECORDER'])))
-    # clean variable, remove white space and possible typos
-    recorder = string_clean_title_fn(recorder)
-    first, second = recorder.split(' ')
-    obs_recorder = second + ', ' + first
+    import column_mapping_engine
 
-    return obs_recorder
+    source_column_list = column_mapping_engine.HEADER_SOURCE_LIST + column_mapping_engine.META_SOURCE_LIST
 
+    # coordinates (header_mapping_fn).
+    source_column_list.extend([
+        'GPS1:Latitude', 'GPS1:Longitude', 'GPS1:Accuracy', 'GPS2:GPS2_LAT2', 'GPS2:GPS2_LONG2',
+        'SITE_GPS3:Latitude', 'SITE_GPS3:Longitude', 'SITE_GPS3:Accuracy',
+        'EXT_GPS_COORD4:GPS_COORD_LAT4', 'EXT_GPS_COORD4:GPS_COORD_LONG4'])
 
-def estimator_fn(row):
-    """ Extract estimator information.
+    # land types (step6_2_ras_land_types.py).
+    source_column_list.extend([
+        'GROUP_LAND_SYSTEM:LAND_SYSTEM', 'GROUP_LS:LS_SOURCE', 'GROUP_LS:LAND_SYS_CONSIST', 'ALT_LAND_SYS',
+        'GROUP_ALT_LS:ALT_LS_SOURCE', 'GROUP_LT:LAND_TYPE', 'GROUP_LT:LAND_TYPE_OTHER', 'GROUP_SOIL:BARE_SOIL',
+        'GROUP_SOIL:ERODIBLE_SOIL', 'GROUP_WATER:WATER_FINAL', 'GROUP_WATER:GROUP_WATER_DIST:NEAR_WATER_NAME',
+        'GROUP_WATER:GROUP_WATER_DIST:DIRECTION_WATER', 'GROUP_WATER:GROUP_WATER_DIST:DIST_NEAR_WATER'])
 
-        :param row: pandas dataframe row value object.
-        :return obs_estimator: string object containing estimator name. """
+    # disturbance (step6_3_ras_disturbance.py).
+    for i in range(6):
+        source_column_list.extend(['GROUP_FERAL:FERAL' + str(i + 1), 'GROUP_FERAL:FERAL' + str(i + 1) + '_EVID'])
+    source_column_list.extend([
+        'GROUP_FERAL:FERAL_OTHER', 'GROUP_FERAL:FERAL_OTHER_EVID',
+        'FIRE:NORTH_FF', 'FIRE:NORTH_FI', 'FIRE:SOUTH_FF', 'FIRE:SOUTH_FI'])
+    for n in ['1', '2', '3']:
+        source_column_list.extend([
+            'WEEDS:GROUP_WEED' + n + ':WEED' + n, 'WEEDS:GROUP_WEED' + n + ':WEED' + n + '_OTHER',
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:SPECIES_SIZE' + n,
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:SPECIES_DENSITY' + n,
+            'WEEDS:GROUP_WEED' + n + ':GROUP_WEEDS' + n + '_SIZE:WEED' + n + '_COMMENT'])
 
-    estimator = str(row['OFFICER_TWO:ESTIMATOR'])
-    # clean variable, remove white space and possible typos
-    if estimator == 'other':
-        estimator = estimator.replace('other', str((row['OFFICER_TWO:OTHER_ESTIMATOR'])))
-    estimator = string_clean_title_fn(estimator)
-    first, second = estimator.split(' ')
-    obs_estimator = second + ', ' + first
+    # erosion and condition (step6_4_ras_disturbance2.py).
+    for i in ['SCALDING', 'WINDSHEETING', 'WATERSHEETING', 'RILLING', 'GULLYING']:
+        source_column_list.extend(['DISTURBANCE_EROSION:GROUP_SCALDING:' + i + '_SEVERITY',
+                                   'DISTURBANCE_EROSION:GROUP_SCALDING:' + i + '_STABILITY'])
+    source_column_list.extend(['DISTURBANCE_EROSION:GROUP_SCALDING:EROSION_COMMENTS', 'CONDITION:CONDITION_SCORE',
+                               'CONDITION:VISIT_NOTES', 'CONDITION:DEV_NOTE'])
 
-    return obs_estimator
+    # botanical names, cover, basal area and density (step6_5_ras_botanical.py).
+    for n in ['PPP', 'PG', 'AG', 'FB', 'TS', 'SB']:
+        source_column_list.extend([n + '_SP:' + n + str(i + 1) for i in range(4)])
+    for n in ['PPP', 'PG', 'AG', 'FB']:
+        source_column_list.extend(['GROUP_GROUND_COVER:MIN_' + n + '_COVER_TOTAL',
+                                   'GROUP_GROUND_COVER:MAX_' + n + '_COVER_TOTAL'])
+    source_column_list.extend(['GROUP_GROUND_COVER:MIN_TOTAL', 'GROUP_GROUND_COVER:MAX_TOTAL', 'BASAL_AREA',
+                               'WOODY_THICKENING:TREE_COVER', 'WOODY_THICKENING:SHRUB_COVER'])
 
+    # site and erosion photos (step6_6_ras_photos.py).
+    for i in range(3):
+        for photo in ['GROUP_SITE_PHOTO:SITE_PHOTO' + str(i + 1), 'GROUP_SITE_PHOTO2:SITE_PHOTO' + str(i + 1) + '_2',
+                      'DISTURBANCE_EROSION:GROUP_EROSION_PHOTO:EROSION_PHOTO' + str(i + 1)]:
+            source_column_list.extend([photo, photo + '_BEARING'])
 
-def location_fn(row):
-    """ extract the district, property and site information.
+    return source_column_list
 
-            :param row: pandas dataframe row value object.
-            :return location_list: list object containing five string variables:
-            district, listed_property, unlisted_property, final_property and site. """
 
-    # district
-    district = string_clean_title_fn(str(row['DISTRICT']))
+def prop_code_extraction_fn(property_index, property_name, site):
+    """ Extract the property code from the pastoral estate property index.
 
-    listed_property = str(row['PROP:PROPERTY'])
-
-    # property name
-    if str(row['PROP:PROPERTY']) in set(
-            ('NP_prop_new', 'B_property_outside', 'D_property_outside', 'G_property_outside',
-             'K_property_outside', 'NAS_property_outside', 'P_property_outside', 'R_property_outside',
-             'SAS_property_outside', 'SP_property_outside', 'TC_property_outside', 'VR_property_outside',
-             'NP_property_outside')):
-
-        listed_property = np.nan
-        unlisted_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))  # todo property name not working
-        final_property = string_clean_title_fn(str(row['PROP:NOT_PASTORAL_NAME2']))  # todo property name not working
-    else:
-        listed_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-        unlisted_property = np.nan
-        final_property = string_clean_title_fn(str(row['PROP:PROPERTY']))
-
-    site1 = str(row['GROUP_SITE:SITE_FINAL'])
-
-    # call the stringCleanFN function
-    site = string_clean_upper_fn(site1)
-    location_list = [district, listed_property, unlisted_property, final_property, site]
-    return location_list
-
-
-def meta_data_fn(row):
-    """ Extract and clean the form key information.
-
-            :param row: pandas dataframe row value object.
-            :return meta_key: string object containing the odk form identifier key.
-            :return clean_meta_key: string object containing the cleaned odk form identifier key.
-            :return form_name: string object containing the odk form identifier key.
-            """
-    meta_key = str(row['meta:instanceID'])
-    clean_meta_key = meta_key[5:]
-    form_name = str(row['meta:instanceName'])
-
-    meta_data_list = [meta_key, clean_meta_key, form_name]
-    return meta_data_list
-
-
-def gps_points_fn(row):
-    """ Extract the coordinate information.
-
-            :param row: pandas dataframe row value object.
-            :return gps: string object containing the gps device information.
-            :return c_lat: float object containing the center point latitude information.
-            :return c_lon: float object containing the center point longitude information.
-            :return c_acc: float object containing the center point accuracy information (mobile device only).
-            :return off_direct: string object containing the offset direction information.
-            :return o_lat: float object containing the offset point latitude information.
-            :return o_lon: float object containing the offset point longitude information.
-            :return o_acc: float object containing the center point accuracy information."""
-
-    gps = str(row['GPS_SELECT'])
-
-    if gps == 'now_device':
-        c_lat = float(row['GPS1:Latitude'])
-        c_lon = float(row['GPS1:Longitude'])
-        c_acc = float(row['GPS1:Accuracy'])
-
-    elif gps == 'later_device':
-        c_lat = float(row['SITE_GPS3:Latitude'])
-        c_lon = float(row['SITE_GPS3:Longitude'])
-        c_acc = float(row['SITE_GPS3:Accuracy'])
-
-    elif gps == 'now_gps':
-        c_lat = float(row['GPS2:GPS2_LAT2'])
-        c_lon = float(row['GPS2:GPS2_LONG2'])
-        c_acc = np.nan
-
-    else:  # later_gps
-        c_lat = float(row['EXT_GPS_COORD4:GPS_COORD_LAT4'])
-        c_lon = float(row['EXT_GPS_COORD4:GPS_COORD_LONG4'])
-        c_acc = np.nan
-
-    lat_lon_list = [gps, c_lat, c_lon, c_acc]
-    return lat_lon_list
-
-
-def prop_code_extraction_fn(estate_series, property_name, site):
-    """ Extract the common name from the botanical_common_series excel document.
-
-            :param estate_series: geopandas series object containing property and property code variables.
+            :param property_index: dictionary object containing the property code lookup table
+            (property_code_index.py).
             :param property_name: string object containing the property name passed into the function.
             :return prop_code: string object containing the property code. """
 
-    property_name_list = estate_series.PROPERTY.tolist()
-    prop_upper = string_clean_upper_fn(str(property_name))
-    if prop_upper in property_name_list:
-        prop_code = estate_series.loc[estate_series['PROPERTY'] == prop_upper, 'PROP_TAG'].iloc[0]
-    else:
+    import property_code_index
+    prop_code = property_code_index.prop_tag_lookup_fn(property_index, property_name)
+    if prop_code is None:
         prop_code = property_name
 
     prop_code. replace(" ", "_")
@@ -239,104 +165,93 @@ def prop_code_extraction_fn(estate_series, property_name, site):
     return prop_code, code_site
 
 
-def main_routine(file_path, temp_dir, veg_list_excel, pastoral_estate):
+@stage_monitor.monitor_fn
+def main_routine(file_path, temp_dir, reference_data, property_index):
     """ Control the ras data extraction workflow producing two outputs.
 
             :param file_path: string object containing the dir_path concatenated with search_criteria.
             :param temp_dir: string object path to the created output directory (date_time).
-            :param veg_list_excel: string object containing the path to an excel document containing botanical and
-            common names.
-            :param pastoral_estate: string object containing the file path to the pastoral estate shapefile.
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
+            :param property_index: dictionary object containing the pastoral estate property code lookup table
+            (property_code_index.py).
             :return clean_star_transect.csv: clean csv file output to the command argument export directory.
             :return clean_ras.csv.csv:  csv file containing photo url information to the command argument export
             directory.
-            :return clean_ras.csv.shp: clean shapefile output to the command argument export directory
-            - contains all information."""
+            :return clean_ras.arrow: clean table handed to step7 and spatial_sink.py."""
 
     print('step6_1_ras_processing_workflow.py INITIATED.')
 
-    # Read in the star transect csv as  a Pandas DataFrame.
-    df = pd.read_csv(file_path)
+    import column_mapping_engine
+    import export_reader
+    header_mapping = header_mapping_fn()
+    meta_mapping = column_mapping_engine.meta_mapping_fn()
 
+    header_list = []
+    meta_list = []
+    prop_code_list = []
+    site_code_list = []
     final_ras_list = []
     final_ras_photo_list = []
 
-    for index, row in df.iterrows():
-        # call the date_time_fn function to extract date and time information.
-        date_time_list = date_time_fn(row)
-
-        # call the recorder_fn function to extract the recorder information.
-        obs_recorder = recorder_fn(row)
+    print('step6_2_ras_land_types.py initiating...........')
+    import step6_2_ras_land_types
+    import step6_3_ras_disturbance
+    import step6_4_ras_disturbance2
+    import step6_5_ras_botanical
+    import step6_6_ras_photos
 
-        # call the location_fn function to extract the district, property and site information.
-        location_list = location_fn(row)
+    # call the export_reader.py script - the declared ras columns are streamed in chunks of submissions.
+    for df in export_reader.chunk_fn(file_path, source_column_fn()):
+        stage_monitor.count_fn(rows=len(df))
 
-        # call the gps_points_fn function to extract the longitude and latitude information.
-        lat_lon_list = gps_points_fn(row)
+        # call the column_mapping_engine.py script - header and form identifier variables are processed once for all
+        # records of the chunk.
+        chunk_header_df = column_mapping_engine.mapping_frame_fn(df, header_mapping)
+        header_list.append(chunk_header_df)
+        meta_list.append(column_mapping_engine.mapping_frame_fn(df, meta_mapping))
 
-        # call the meta_date_fn function to extract the unique identifier information for each form record.
-        meta_data_list = meta_data_fn(row)
+        # call the prop_code_extraction_fn function to extract the property code and the property code site name.
+        chunk_site_code_list = []
+        for final_prop, site in zip(chunk_header_df['final_prop'].tolist(), chunk_header_df['site'].tolist()):
+            prop_code, site_code = prop_code_extraction_fn(property_index, final_prop, site)
+            prop_code_list.append(prop_code)
+            chunk_site_code_list.append(site_code)
+        site_code_list.extend(chunk_site_code_list)
 
-        # extract the site variable from the location list
-        site = location_list[4:][0]
+        for site_code, row in zip(chunk_site_code_list, column_mapping_engine.records_fn(df)):
 
-        # read in the estate shapefile and create series
-        estate = gpd.read_file(pastoral_estate)
-        estate_series = estate[['PROPERTY', 'PROP_TAG']]
+            # call the step6_2_ras_land_types.py script.
+            clean_list = step6_2_ras_land_types.main_routine(
+                [], row, string_clean_capital_fn, string_clean_title_fn, string_clean_upper_fn)
 
-        # extract the final property value
-        final_prop = location_list[3:4][0]
-        # call the extract_prop_code_fn function to extract the property code
-        prop_code, site_code = prop_code_extraction_fn(estate_series, final_prop, site)
+            # call the step6_3_ras_disturbance.py script.
+            clean_list = step6_3_ras_disturbance.main_routine(
+                clean_list, row, string_clean_capital_fn)
 
-        # create a clean list and append/extend output lists and variables
-        clean_list = [site]
-        clean_list.extend(date_time_list)
-        clean_list.append(obs_recorder)
-        clean_list.extend(location_list[:4])
-        clean_list.extend([prop_code, site_code])
-        clean_list.extend(lat_lon_list)
+            # call the step6_4_ras_disturbance2.py script.
+            clean_list = step6_4_ras_disturbance2.main_routine(
+                clean_list, row, string_clean_capital_fn)
 
-        print('step6_1_ras_processing_workflow.py COMPLETED')
-        print('step6_2_ras_land_types.py initiating...........')
+            # call the step6_5_ras_botanical.py script.
+            ras_clean_list = step6_5_ras_botanical.main_routine(
+                clean_list, row, string_clean_capital_fn)
 
-        # call the step6_2_ras_land_types.py script.
-        import step6_2_ras_land_types
-        clean_list = step6_2_ras_land_types.main_routine(
-            clean_list, row, string_clean_capital_fn, string_clean_title_fn, string_clean_upper_fn)
+            # call the step6_6_ras_photos.py script.
+            clean_list, ras_photo_list = step6_6_ras_photos.main_routine(
+                clean_list, row, site_code)
 
-        # call the step6_3_ras_disturbance.py script.
-        import step6_3_ras_disturbance
-        clean_list = step6_3_ras_disturbance.main_routine(
-            clean_list, row, string_clean_capital_fn)
+            final_ras_list.append(clean_list)
+            final_ras_photo_list.append(ras_photo_list)
 
-        # call the step5_3_woody_botanical.py script.
-        import step6_4_ras_disturbance2
-        clean_list = step6_4_ras_disturbance2.main_routine(
-            clean_list, row, string_clean_capital_fn)
-
-        # call the step6_6_ras_photos.py script.
-        import step6_5_ras_botanical
-        ras_clean_list = step6_5_ras_botanical.main_routine(
-            clean_list, row, string_clean_capital_fn)
-
-        # call the step6_6_ras_photos.py script.
-        import step6_6_ras_photos
-        clean_list, ras_photo_list = step6_6_ras_photos.main_routine(
-            clean_list, row, site_code)
-
-        # add metadata variables
-        clean_list.extend(meta_data_list)
-        final_ras_list.append(clean_list)
-        final_ras_photo_list.append(ras_photo_list)
+    header_df = pd.concat(header_list, ignore_index=True)
+    meta_df = pd.concat(meta_list, ignore_index=True)
 
     # convert the final list to a DataFrame
-    ras_df = pd.DataFrame(final_ras_list)
+    body_df = pd.DataFrame(final_ras_list, index=header_df.index)
 
-    ras_df.columns = [
-        'site_orig', 'date', 'date_time', 'recorder', 'district', 'prop', 'unlist_prop', 'final_prop', 'prop_code',
-        'site', 'gps', 'c_lat',
-        'c_lon', 'c_acc', 'desc', 'erod_soil', 'bare_soil', 'land_system',
+    body_df.columns = [
+        'desc', 'erod_soil', 'bare_soil', 'land_system',
         'ls_consist',
         'ls_alt', 'ls_source', 'water_point', 'water_name', 'water_dir', 'water_dist', 'camel', 'rabbit',
         'donkey', 'horse', 'pig', 'buffalo', 'nat_herb', 'other_feral', 'feral_com', 'north_ff', 'north_fi',
@@ -348,8 +263,15 @@ def main_routine(file_path, temp_dir, veg_list_excel, pastoral_estate):
         'bot_pf_3', 'bot_pf_4', 'bot_ts_1', 'bot_ts_2', 'bot_ts_3', 'bot_ts_4', 'bot_sb_1', 'bot_sb_2', 'bot_sb_3',
         'bot_sb_4', 'cover_3p', 'cover_pg', 'cover_ag', 'cover_pf', 'min_cover', 'max_cover', 'basal', 'tree_density',
         'shrub_density', 'site_photo1', 'photo_bear1', 'site_photo2',
-        'photo_bear2', 'site_photo3', 'photo_bear3', 'eros_photo1', 'photo_bear1', 'eros_photo2', 'eros_bear2',
-        'eros_photo3', 'eros_bear3', 'meta_key', 'clean_meta_key', 'form']
+        'photo_bear2', 'site_photo3', 'photo_bear3', 'eros_photo1', 'eros_bear1', 'eros_photo2', 'eros_bear2',
+        'eros_photo3', 'eros_bear3']
+
+    # the original site name is retained as site_orig, site is replaced with the property code site name.
+    header_df = header_df.rename(columns={'site': 'site_orig'})
+    header_df.insert(header_df.columns.get_loc('final_prop') + 1, 'prop_code', prop_code_list)
+    header_df.insert(header_df.columns.get_loc('prop_code') + 1, 'site', site_code_list)
+
+    ras_df = pd.concat([header_df, body_df, meta_df], axis=1)
 
     cols = ['basal', 'tree_density', 'shrub_density']
 
@@ -365,16 +287,9 @@ def main_routine(file_path, temp_dir, veg_list_excel, pastoral_estate):
     print('The following outputs have been created:')
     print('-', csv_output)
 
-    # create a geoDataFrame
-    ras_gdf = gpd.GeoDataFrame(
-        ras_df, geometry=gpd.points_from_xy(
-            ras_df2.c_lon, ras_df.c_lat), crs="EPSG:4326")
-
-    shp_output = (temp_dir + '\\clean_ras.shp')
-
-    # Export shapefile
-    ras_gdf.to_file(shp_output, driver='ESRI Shapefile')
-    print('-', shp_output)
+    # call the intermediate_store.py script - typed hand-off to step7, missing values are stored as nulls.
+    import intermediate_store
+    print('-', intermediate_store.write_fn(ras_df, temp_dir, 'clean_ras'))
 
     # create a dataFrame and export as a csv containing the photo_url_extraction_fn urls.
     ras_photo_list_df = pd.DataFrame(final_ras_photo_list)
@@ -382,6 +297,7 @@ def main_routine(file_path, temp_dir, veg_list_excel, pastoral_estate):
                                  'site_photo3', 'bearing_photo3',
                                  'erosion_photo1', 'bearing_erosion1', 'erosion_photo2', 'bearing_erosion2',
                                  'erosion_photo3', 'bearing_erosion3']
+    print('-', intermediate_store.write_fn(ras_photo_list_df, temp_dir, 'photo_ras_url'))
     csv_output = (temp_dir + '\\photo_ras_url.csv')
     ras_photo_list_df.to_csv(csv_output)
     print('-', csv_output)
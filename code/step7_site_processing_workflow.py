@@ -19,344 +19,599 @@ SOFTWARE.
 """
 
 from __future__ import print_function, division
-import pandas as pd
-import glob
 import os
+import logging
+import traceback
 import warnings
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
+# reference data stored once per worker process (see worker_init_fn).
+WORKER_REFERENCE_DATA = {}
 
-def glob_dir_fn(dir_path, search_wild_card):
-    """ Create a list of file paths based on search variable.
 
-            :param dir_path: string object containing directory path.
-            :param search_wild_card: string object containing the search wildcard information.
-            :return csv_list: list object containing a list oc csv paths.
-            :return df_list: list object containing open pandas data frames."""
+def site_partition_fn(table_list, df_list):
+    """ Partition each clean table by site in a single pass.
 
-    # create two empty lists
-    csv_list = []
-    df_list = []
+            :param table_list: list object containing the intermediate table names (intermediate_store defined).
+            :param df_list: list object containing open pandas data frames (intermediate_store defined).
+            :return site_df_dict: dictionary object keyed on site, each value is a dictionary of the site data frames
+            keyed on the table name (i.e. 'clean_star_transect'). """
 
-    for file in glob.glob(dir_path + '\\' + search_wild_card):
-        csv_list.append(file)
+    site_df_dict = {}
 
-        df = pd.read_csv(file)
-        df_list.append(df)
+    for table, df in zip(table_list, df_list):
+        if 'site' not in df.columns:
+            continue
 
-    return csv_list, df_list
+        # one groupby per table (sites in order of appearance), index reset so row 0 is the first site record.
+        for unique_site, site_df in df.groupby('site', sort=False):
+            site_df_dict.setdefault(unique_site, {})[table] = site_df.reset_index(drop=True)
 
+    return site_df_dict
 
-def export_site_csv_fn(csv_list, temp_dir):
-    """ Filter csv by site name and export csv.
 
+def site_directories_fn(site_df_dict, temp_dir, site_csv='No'):
+    """ Create a folder per site and optionally export the site csv files.
+
+            :param site_df_dict: dictionary object containing the site data frames (site_partition_fn defined).
             :param temp_dir: string object containing directory path.
-            :param csv_list: list object containing a list of csv paths, defined under glob_dir_fn function.
-            :return df_list: list object containing open pandas data frames.
+            :param site_csv: string object - export the site csv files to the site folders - Yes or No
+            (cmd_args_fn defined).
             :return dir_path: string object containing the path to a new directory called site_outputs.
-            :return all_site_list: list object containing a unique list of sites.
-            :return site_folder_path: string object containing the path to the current site folder within the dir_path
-            directory called site_outputs."""
+            :return site_dir_path_list: list object containing all site folder paths as string variables. """
 
-    # create empty lists
-    complete_site_list = []
-    complete_site_dir_list = []
+    site_dir_path_list = []
     # create directory string variable
     dir_path = (temp_dir + '\\site_outputs')
     # create a new folder called site_outputs
     if not os.path.exists(dir_path):
         os.mkdir(dir_path)
 
-    for i in csv_list:
-        # iterate through csv_list and create a pandas data frame for string path object (i)
-        df = pd.read_csv(i)
-        # create a list of unique site names from the pandas dataframe (df)
-        unique_site_list = df.site.unique().tolist()
-        for unique_site in unique_site_list:
-            # iterate through the list of unique site names.
-            complete_site_list.append(unique_site)
-
-            site_folder_path = (dir_path + '\\' + str(unique_site))
-            complete_site_dir_list.append(site_folder_path)
-
-            # create a folder in the dir_path with the site name
-            if not os.path.exists(site_folder_path):
-                os.mkdir(site_folder_path)
-            # separate the filename including the .csv extension from the path
-            file_name = i.rsplit('\\', 1)[1]
-
-            # create and export a site csv
-            site_df = df[df['site'] == unique_site]
-            site_df.to_csv(site_folder_path + '//' + str(unique_site) + '_' + file_name)
+    for unique_site, frame_dict in site_df_dict.items():
+        site_folder_path = (dir_path + '\\' + str(unique_site))
+        site_dir_path_list.append(site_folder_path)
+
+        # create a folder in the dir_path with the site name
+        if not os.path.exists(site_folder_path):
+            os.mkdir(site_folder_path)
+
+        if site_csv == 'Yes':
+            for table, site_df in frame_dict.items():
+                # create and export a site csv
+                site_df.to_csv(site_folder_path + '//' + str(unique_site) + '_' + table + '.csv')
+
+    return dir_path, site_dir_path_list
+
+
+def site_extraction_fn(site_dir, frame_dict, reference_data):
+    """ Extract the observational and ras sheet data of a single site (step8 scripts).
+
+            :param site_dir: string object containing the path to the site directory.
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name
+            (site_partition_fn defined).
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
+            :return obs_data_list: list object containing list elements - each list contains the input variables for the
+            observation spreadsheet, one list per page.
+            :return ras_data_list: list object containing the input variables for the ras spreadsheet. """
+
+    _, site = site_dir.rsplit('\\', 1)
+    if 'clean_integrated' in frame_dict:
+
+        print('clean_integrated.csv exists.')
+        import step8_1_site_integrated_data_extraction
+        establish_list2456, visit_vert_list2, disturb_vert_list12345678, dist_hor_list12345, cond_vert_list12, \
+        cond_hor_list1, = step8_1_site_integrated_data_extraction.main_routine(
+            frame_dict['clean_integrated'], site_dir)
+
     else:
-        site_folder_path = ""
 
-    # remove duplicates from siteList
-    all_site_list = list(dict.fromkeys(complete_site_list))
+        establish_list2456 = [[], [], [], []]
+        disturb_vert_list12345678 = [[], [], [], [], [], [], [], []]
+        dist_hor_list12345 = [[], [], [], [], []]
+        visit_vert_list2 = []
+        cond_vert_list12 = [[], []]
+        cond_hor_list1 = []
+
+    if 'clean_star_transect' in frame_dict:
+        print('clean_star_transect.csv exists.')
+        import step8_2_site_star_data_extraction
+        estab_vert_list13, visit_vert_list1, ground_vert_list12345, estimates_hor_list12345, estimates_veg_list \
+            = step8_2_site_star_data_extraction.main_routine(
+            frame_dict['clean_star_transect'], site, site_dir, reference_data, frame_dict.get('species_cover'),
+            frame_dict.get('ground_cover'))
 
-    # print(complete_site_dir_list)
-    return dir_path, all_site_list, site_folder_path
+    else:
+        estab_vert_list13 = [[], []]
+        ground_vert_list12345 = [[], [], [], [], []]
+        estimates_hor_list12345 = [[], [], [], [], []]
+        estimates_veg_list = [[], [], [], [], [], [], [], [], [], [], []]
 
+        visit_vert_list1 = []
 
-def list_of_directories_fn(dir_path):
-    """ Create list of site directory paths.
+        cond_hor_list1 = []
 
-            :param dir_path: string object containing directory path defined under export_site_csv.
-            :return site_dir_path_list: list object containing all site folder paths ans string variables."""
+    if 'clean_basal' in frame_dict:
 
-    site_dir_path_list = []
+        print('clean_basal.csv exists.')
+        # call the step8_3_site_basal_sweep_data_extraction.py script.
+        import step8_3_site_basal_sweep_data_extraction
+        basal_hor_list1234, basal_vert_list123 = step8_3_site_basal_sweep_data_extraction.main_routine(
+            frame_dict['clean_basal'], site, site_dir, reference_data)
 
-    for root, dirs, files in os.walk(dir_path, topdown=False):
+    else:
 
-        for name in dirs:
-            # iterate through all directories within dir_path
-            # join the root and the directory as a path
-            site_dir_path = os.path.join(root, name)
-            # append path to list
-            site_dir_path_list.append(site_dir_path)
+        basal_hor_list1234 = [[], [], [], []]
+        basal_vert_list123 = [[], [], []]
 
-    return site_dir_path_list
+    if 'clean_woody_thick' in frame_dict:
 
+        print('clean_woody_thick.csv exists.')
+        # run cleanIntData.
+        import step8_4_site_woody_thickening_data_extraction
+        woody_vert_list12345678910 = step8_4_site_woody_thickening_data_extraction.main_routine(
+            frame_dict['clean_woody_thick'], site, site_dir, reference_data)
 
-def data_extraction_workflow_fn(directory_odk, site_dir_path_list, remote_desktop, veg_list_excel, shrub_list_excel):
-    """ create list of site directory paths.
+    else:
+        woody_vert_list12345678910 = [[], [], [], [], [], [], [], [], [], []]
+
+    if 'clean_ras' in frame_dict:
+
+        print('cleanRas.csv exists.')
+        # run cleanIntData.
+        ras_data_list = []
+
+        print('Ras.csv exists.')
+        # run stepX_ras_basic.
+        import step8_5_site_ras_data_extraction
+        ras_hort_list1234567891011121314, ras_vert_list123456789101112 = step8_5_site_ras_data_extraction.main_routine(
+            frame_dict['clean_ras'], site, site_dir)
+
+
+    else:
+        ras_hort_list1234567891011121314 = [[], [], [], [], [], [], [], [], [], [], [], [], [], []]
+        ras_vert_list123456789101112 = [[], [], [], [], [], [], [], [], [], [], [], []]
+
+    # Sort observation sheet data into page items.
+    establish_data_list = [estab_vert_list13[0], establish_list2456[0], estab_vert_list13[1], establish_list2456[1],
+                           establish_list2456[2], establish_list2456[3]]
+
+    visit_data_list = [visit_vert_list1, visit_vert_list2]
+
+    # create disturbance list of lists
+    disturbance_data_list = [
+        disturb_vert_list12345678[0], disturb_vert_list12345678[1], disturb_vert_list12345678[2],
+        disturb_vert_list12345678[3], dist_hor_list12345[0], dist_hor_list12345[1], dist_hor_list12345[2],
+        dist_hor_list12345[3], dist_hor_list12345[4], disturb_vert_list12345678[4], disturb_vert_list12345678[5],
+        disturb_vert_list12345678[6], disturb_vert_list12345678[7]]
 
+    basal_data_list = basal_hor_list1234[0], basal_hor_list1234[1], basal_hor_list1234[2], basal_hor_list1234[3], \
+                      basal_vert_list123[0], basal_vert_list123[1], basal_vert_list123[2]
+
+    woody_data_list = woody_vert_list12345678910
+
+    ground_data_list = ground_vert_list12345
+
+    estimates_data_list = estimates_hor_list12345
+
+    estimates_veg_data_list = estimates_veg_list
+
+    condition_data_list = [cond_vert_list12[0], cond_hor_list1, cond_vert_list12[1]]
+
+    ras_data_list = [ras_hort_list1234567891011121314[0], ras_hort_list1234567891011121314[1],
+                     ras_hort_list1234567891011121314[2], ras_hort_list1234567891011121314[3],
+                     ras_hort_list1234567891011121314[4], ras_hort_list1234567891011121314[5],
+                     ras_hort_list1234567891011121314[6], ras_vert_list123456789101112[0],
+                     ras_vert_list123456789101112[1], ras_vert_list123456789101112[2],
+                     ras_vert_list123456789101112[3], ras_vert_list123456789101112[4],
+                     ras_hort_list1234567891011121314[7], ras_hort_list1234567891011121314[8],
+                     ras_vert_list123456789101112[4], ras_vert_list123456789101112[5],
+                     ras_hort_list1234567891011121314[9], ras_vert_list123456789101112[7],
+                     ras_vert_list123456789101112[8], ras_hort_list1234567891011121314[9],
+                     ras_hort_list1234567891011121314[10], ras_hort_list1234567891011121314[11],
+                     ras_hort_list1234567891011121314[12], ['TO DOOOOO'],
+                     ras_vert_list123456789101112[1], ras_vert_list123456789101112[10],
+                     ras_vert_list123456789101112[11], ras_hort_list1234567891011121314[13]]
+
+    stage_monitor.log_fn(logging.DEBUG, 'ras_data_list', site=site, ras_data_list=ras_data_list)
+    obs_data_list = [establish_data_list, visit_data_list, disturbance_data_list, basal_data_list, woody_data_list,
+                     ground_data_list, estimates_data_list, estimates_veg_data_list, condition_data_list]
+
+    return obs_data_list, ras_data_list
+
+
+def site_photo_fn(site_dir, frame_dict, odk_aggregate):
+    """ Download the integrated, star transect and ras photographs of a single site (step8_6, step8_7 and step8_8
+    scripts).
+
+            :param site_dir: string object containing the path to the site directory.
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name
+            (site_partition_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined). """
+
+    _, site = site_dir.rsplit('\\', 1)
+
+    if 'photo_integrated_url' in frame_dict:
+        print('photo_int_url.csv exists.')
+        import step8_6_site_integrated_photo_download
+        step8_6_site_integrated_photo_download.main_routine(frame_dict['photo_integrated_url'], site, site_dir,
+                                                            odk_aggregate)
+
+    if 'photo_star_url' in frame_dict:
+        print('photo_star_url.csv exists.')
+        import step8_7_site_star_photo_download
+        step8_7_site_star_photo_download.main_routine(frame_dict['photo_star_url'], site, site_dir, odk_aggregate)
+
+    if 'photo_ras_url' in frame_dict:
+        print('photo_ras_url.csv exists.')
+        import step8_8_site_ras_photo_download
+        step8_8_site_ras_photo_download.main_routine(frame_dict['photo_ras_url'], site, site_dir, odk_aggregate)
+
+
+def site_sheet_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache, obs_data_list,
+                  ras_data_list):
+    """ Produce the observational or ras sheet of a single site (step9, step10 and step11 scripts).
 
             :param directory_odk: string object containing the directory path to the raw odk result csv
             (cmd_args_fn defined).
-            :param site_dir_path_list: list object containing all site folder paths ans string variables
-            (list_of_directories_fn defined)
+            :param site_dir: string object containing the path to the site directory.
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name
+            (site_partition_fn defined).
             :param remote_desktop: Boolean object - working on the PGB-BAS14 server (cmd_args_fn defined).
-            :param veg_list_excel: string object containing the file path to the odk vegetation excel file
-            (cmd_args_fn defined).
-            :param shrub_list_excel: string object containing the file path to a second odk vegetation excel file
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+            :param obs_data_list: list object containing the observation sheet data (site_extraction_fn defined).
+            :param ras_data_list: list object containing the ras sheet data (site_extraction_fn defined). """
+
+    _, site = site_dir.rsplit('\\', 1)
+
+    if 'clean_star_transect' in frame_dict and 'star_transect_points' in frame_dict:
+        # the transect points were ingested from the repeat group exports (transect_repeat_reader.py) - the transect
+        # tables are neither downloaded nor read from html.
+        star = frame_dict['clean_star_transect'].fillna('BLANK')
+        import transect_repeat_reader
+        clean_df_list = transect_repeat_reader.site_transect_list_fn(frame_dict['star_transect_points'], site)
+
+        print('step10_1_site_observation_sheet_processing_workflow.py initiating..........')
+        # call the step10_1_site_observation_sheet_processing_workflow.py script.
+        import step10_1_site_observation_sheet_processing_workflow
+        step10_1_site_observation_sheet_processing_workflow.main_routine(obs_data_list, site, site_dir, star,
+                                                                         transect_cache, clean_df_list)
+
+    elif remote_desktop == 'Yes':
+        if 'clean_star_transect' in frame_dict:
+            star = frame_dict['clean_star_transect'].fillna('BLANK')
+            print('step9_2_aggregate_transect_extraction_remote_desktop.py initiating..........')
+            # call the step9_2_aggregate_transect_extraction_remote_desktop.py script.
+            import step9_2_aggregate_transect_extraction_remote_desktop
+            step9_2_aggregate_transect_extraction_remote_desktop.main_routine(
+                obs_data_list, site, site_dir, star, odk_aggregate, transect_cache)
+
+        elif 'clean_ras' in frame_dict:
+            ras = frame_dict['clean_ras'].fillna('BLANK')
+
+            # call the step11_1_site_ras_processing_workflow.py script.
+            print('step11_1_site_ras_processing_workflow.py initiating..........')
+            import step11_1_site_ras_processing_workflow
+            step11_1_site_ras_processing_workflow.main_routine(
+                ras_data_list, site, site_dir, ras)
+
+        else:
+            print(site, ' observational/ras sheet will NOT be produced')
+
+    else:
+
+        # if star transect for the site exists -- create an observational sheet and populate.
+        if 'clean_star_transect' in frame_dict:
+            star = frame_dict['clean_star_transect'].fillna('BLANK')
+            print('step9_1_aggregate_transect_bypass_not_remote_desktop.py initiating..........')
+            # call the step9_1_aggregate_transect_bypass_not_remote_desktop.py script.
+            import step9_1_aggregate_transect_bypass_not_remote_desktop
+            step9_1_aggregate_transect_bypass_not_remote_desktop.main_routine(
+                directory_odk, obs_data_list,  site, site_dir, star, transect_cache)
+
+        elif 'clean_ras' in frame_dict:
+            ras = frame_dict['clean_ras'].fillna('BLANK')
+
+            print('step11_1_site_ras_processing_workflow.py initiating..........')
+            import step11_1_site_ras_processing_workflow
+            step11_1_site_ras_processing_workflow.main_routine(
+                ras_data_list, site, site_dir, ras)
+
+
+def site_workflow_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache,
+                     reference_data):
+    """ Extract the site data and produce the observational or ras sheet for a single site.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv
             (cmd_args_fn defined).
-            :return site_dir_path_list: list object containing all site folder paths ans string variables.
-            :return obs_data_list: list object containing list elements - each list contains the input variables for the
-            observation spreadsheet, one list per page.
-            :return ras_data_list: list object containing the input variables for the ras spreadsheet, one list per page.
-            :return site: string variable containing the current site name.
-            :return site_dir: string variable containing the current site directory path.
-            :return star_csv: string object containing the path to the clean_star_transect.csv file created under
-            step2_1_star_transect_processing_workflow. """
+            :param site_dir: string object containing the path to the site directory.
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name
+            (site_partition_fn defined).
+            :param remote_desktop: Boolean object - working on the PGB-BAS14 server (cmd_args_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py). """
 
-    for site_dir in site_dir_path_list:
-        # iterate through site_dir_path_list
-        _, site = site_dir.rsplit('\\', 1)
-        integrated_csv = os.path.join(site_dir, site + '_clean_integrated.csv')
-        if os.path.isfile(integrated_csv):
+    # call the site_extraction_fn function.
+    obs_data_list, ras_data_list = site_extraction_fn(site_dir, frame_dict, reference_data)
 
-            print('clean_integrated.csv exists.')
-            import step8_1_site_integrated_data_extraction
-            establish_list2456, visit_vert_list2, disturb_vert_list12345678, dist_hor_list12345, cond_vert_list12, \
-            cond_hor_list1, = step8_1_site_integrated_data_extraction.main_routine(integrated_csv, site_dir)
+    if remote_desktop == 'Yes':
+        # call the site_photo_fn function - the photographs are on ODK Aggregate, as the star transect tables.
+        site_photo_fn(site_dir, frame_dict, odk_aggregate)
 
-        else:
+    # call the site_sheet_fn function.
+    site_sheet_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache, obs_data_list,
+                  ras_data_list)
 
-            establish_list2456 = [[], [], [], []]
-            disturb_vert_list12345678 = [[], [], [], [], [], [], [], []]
-            dist_hor_list12345 = [[], [], [], [], []]
-            visit_vert_list2 = []
-            cond_vert_list12 = [[], []]
-            cond_hor_list1 = []
 
-        star_csv = os.path.join(site_dir, site + '_clean_star_transect.csv')
-        if os.path.isfile(star_csv):
-            print('clean_star_transect.csv exists.')
-            import step8_2_site_star_data_extraction
-            estab_vert_list13, visit_vert_list1, ground_vert_list12345, estimates_hor_list12345, estimates_veg_list \
-                = step8_2_site_star_data_extraction.main_routine(star_csv, site, site_dir, shrub_list_excel)
+def worker_init_fn(reference_data, monitor_settings=None):
+    """ Store the reference data once in each worker process.
 
-        else:
-            estab_vert_list13 = [[], []]
-            ground_vert_list12345 = [[], [], [], [], []]
-            estimates_hor_list12345 = [[], [], [], [], []]
-            estimates_veg_list = [[], [], [], [], [], [], [], [], [], [], []]
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
+            :param monitor_settings: dictionary object containing the stage_monitor.py settings of the parent
+            process. """
 
-            visit_vert_list1 = []
+    WORKER_REFERENCE_DATA.update(reference_data)
 
-            cond_hor_list1 = []
+    # call the stage_monitor.py script - the worker logs and profiles its stages like the parent process.
+    stage_monitor.reset_fn()
+    if monitor_settings:
+        stage_monitor.configure_fn(**monitor_settings)
 
-        basal_csv = os.path.join(site_dir, site + '_clean_basal.csv')
-        if os.path.isfile(basal_csv):
 
-            print('clean_basal.csv exists.')
-            # call the step8_3_site_basal_sweep_data_extraction.py script.
-            import step8_3_site_basal_sweep_data_extraction
-            basal_hor_list1234, basal_vert_list123 = step8_3_site_basal_sweep_data_extraction.main_routine(
-                basal_csv, site, site_dir, shrub_list_excel)
+def instance_list_fn(frame_dict):
+    """ List the ODK submissions (meta:instanceID) held in the clean tables of a single site.
 
-        else:
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name
+            (site_partition_fn defined).
+            :return: list object containing the sorted meta:instanceID values. """
 
-            basal_hor_list1234 = [[], [], [], []]
-            basal_vert_list123 = [[], [], []]
+    instance_set = set()
+    for site_df in frame_dict.values():
+        if 'meta_key' in site_df.columns:
+            instance_set.update(site_df['meta_key'].dropna().astype(str).tolist())
 
-        woody_csv = os.path.join(site_dir, site + '_clean_woody_thick.csv')
-        if os.path.isfile(woody_csv):
+    return sorted(instance_set)
 
-            print('clean_woody_thick.csv exists.')
-            # run cleanIntData.
-            import step8_4_site_woody_thickening_data_extraction
-            woody_vert_list12345678910 = step8_4_site_woody_thickening_data_extraction.main_routine(
-                woody_csv, site, site_dir, shrub_list_excel)
 
-        else:
-            woody_vert_list12345678910 = [[], [], [], [], [], [], [], [], [], []]
-
-        # TODO turn this field back on when back at the office
-        '''
-        photo_int_url_csv = os.path.join(site_dir, site + '_photo_integrated_url.csv')
-        # print(photo_int_url_csv)
-        if os.path.isfile(photo_int_url_csv):
-            print('photo_int_url.csv exists.')
-            import step8_6_site_integrated_photo_download
-            step8_6_site_integrated_photo_download.main_routine(photo_int_url_csv, site, site_dir)
-        
-        photo_star_url_csv = os.path.join(site_dir, site + '_photo_star_url.csv')
-        # print(photo_star_url_csv)
-        if os.path.isfile(photo_star_url_csv):
-            print('photo_star_url.csv exists.')
-            import step8_7_site_star_photo_download
-            step8_7_site_star_photo_download.main_routine(photo_star_url_csv, site, site_dir)
-
-        photo_ras_url_csv = os.path.join(site_dir, site + '_photo_ras_url.csv')
-        # print(photo_ras_url_csv)
-        if os.path.isfile(photo_ras_url_csv):
-            print('photo_ras_url.csv exists.')
-            import step8_8_site_ras_photo_download
-            step8_8_site_ras_photo_download.main_routine(photo_ras_url_csv, site, site_dir)
-        '''
-        ras_csv = os.path.join(site_dir, site + '_clean_ras.csv')
-
-        if os.path.isfile(ras_csv):
-
-            print('cleanRas.csv exists.')
-            # run cleanIntData.
-            ras_data_list = []
-
-            print('Ras.csv exists.')
-            # run stepX_ras_basic.
-            import step8_5_site_ras_data_extraction
-            ras_hort_list1234567891011121314, ras_vert_list123456789101112 = step8_5_site_ras_data_extraction.main_routine(
-                ras_csv, site, site_dir)
+def site_worker_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache,
+                   reference_data=None):
+    """ Run site_workflow_fn and return the outcome instead of raising, so one failed site does not stop the run.
 
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :param site_dir: string object containing the path to the site directory.
+            :param frame_dict: dictionary object containing the site data frames keyed on the clean csv file name.
+            :param remote_desktop: Boolean object - working on the PGB-BAS14 server (cmd_args_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+            :param reference_data: dictionary object containing the reference data, if None the reference data stored
+            by worker_init_fn is used.
+            :return site_result: list object containing the site directory, status (success/failed), error and the
+            meta:instanceID values of the site (instance_list_fn defined). """
 
-        else:
-            ras_hort_list1234567891011121314 = [[], [], [], [], [], [], [], [], [], [], [], [], [], []]
-            ras_vert_list123456789101112 = [[], [], [], [], [], [], [], [], [], [], [], []]
-
-        # Sort observation sheet data into page items.
-        establish_data_list = [estab_vert_list13[0], establish_list2456[0], estab_vert_list13[1], establish_list2456[1],
-                               establish_list2456[2], establish_list2456[3]]
-
-        visit_data_list = [visit_vert_list1, visit_vert_list2]
-
-        # create disturbance list of lists
-        disturbance_data_list = [
-            disturb_vert_list12345678[0], disturb_vert_list12345678[1], disturb_vert_list12345678[2],
-            disturb_vert_list12345678[3], dist_hor_list12345[0], dist_hor_list12345[1], dist_hor_list12345[2],
-            dist_hor_list12345[3], dist_hor_list12345[4], disturb_vert_list12345678[4], disturb_vert_list12345678[5],
-            disturb_vert_list12345678[6], disturb_vert_list12345678[7]]
-
-        basal_data_list = basal_hor_list1234[0], basal_hor_list1234[1], basal_hor_list1234[2], basal_hor_list1234[3], \
-                          basal_vert_list123[0], basal_vert_list123[1], basal_vert_list123[2]
-
-        woody_data_list = woody_vert_list12345678910
-
-        ground_data_list = ground_vert_list12345
-
-        estimates_data_list = estimates_hor_list12345
-
-        estimates_veg_data_list = estimates_veg_list
-
-        condition_data_list = [cond_vert_list12[0], cond_hor_list1, cond_vert_list12[1]]
-
-        ras_data_list = [ras_hort_list1234567891011121314[0], ras_hort_list1234567891011121314[1],
-                         ras_hort_list1234567891011121314[2], ras_hort_list1234567891011121314[3],
-                         ras_hort_list1234567891011121314[4], ras_hort_list1234567891011121314[5],
-                         ras_hort_list1234567891011121314[6], ras_vert_list123456789101112[0],
-                         ras_vert_list123456789101112[1], ras_vert_list123456789101112[2],
-                         ras_vert_list123456789101112[3], ras_vert_list123456789101112[4],
-                         ras_hort_list1234567891011121314[7], ras_hort_list1234567891011121314[8],
-                         ras_vert_list123456789101112[4], ras_vert_list123456789101112[5],
-                         ras_hort_list1234567891011121314[9], ras_vert_list123456789101112[7],
-                         ras_vert_list123456789101112[8], ras_hort_list1234567891011121314[9],
-                         ras_hort_list1234567891011121314[10], ras_hort_list1234567891011121314[11],
-                         ras_hort_list1234567891011121314[12], ['TO DOOOOO'],
-                         ras_vert_list123456789101112[1], ras_vert_list123456789101112[10],
-                         ras_vert_list123456789101112[11], ras_hort_list1234567891011121314[13]]
-
-        print('ras_data_list: ', ras_data_list)
-        obs_data_list = [establish_data_list, visit_data_list, disturbance_data_list, basal_data_list, woody_data_list,
-                         ground_data_list, estimates_data_list, estimates_veg_data_list, condition_data_list]
-
-        # create paths to the required sit csv files
-        ras_csv = os.path.join(site_dir, site + '_clean_ras.csv')
-        star_csv = os.path.join(site_dir, site + '_clean_star_transect.csv')
-
-        if remote_desktop == 'Yes':
-            if os.path.isfile(star_csv):
-                star = pd.read_csv(star_csv).fillna('BLANK').replace('Nan', 'BLANK')
-                print('step9_2_aggregate_transect_extraction_remote_desktop.py initiating..........')
-                # call the step9_2_aggregate_transect_extraction_remote_desktop.py script.
-                import step9_2_aggregate_transect_extraction_remote_desktop
-                step9_2_aggregate_transect_extraction_remote_desktop.main_routine(
-                    obs_data_list, site, site_dir, star)
-
-            elif os.path.isfile(ras_csv):
-                ras = pd.read_csv(ras_csv).fillna('BLANK').replace('Nan', 'BLANK')
-
-                # call the step11_1_site_ras_processing_workflow.py script.
-                print('step11_1_site_ras_processing_workflow.py initiating..........')
-                import step11_1_site_ras_processing_workflow
-                step11_1_site_ras_processing_workflow.main_routine(
-                    ras_data_list, site, site_dir, ras)
-
-            else:
-                print(site, ' observational/ras sheet will NOT be produced')
+    if reference_data is None:
+        reference_data = WORKER_REFERENCE_DATA
 
-        else:
+    try:
+        site_workflow_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache,
+                         reference_data)
+        site_result = [site_dir, 'success', '', instance_list_fn(frame_dict)]
+    except Exception as e:
+        traceback.print_exc()
+        site_result = [site_dir, 'failed', '{0}: {1}'.format(type(e).__name__, e), instance_list_fn(frame_dict)]
+
+    return site_result
+
+
+def site_pool_worker_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache):
+    """ Run site_worker_fn in a worker process and hand the stage records of the site back to the parent process.
+
+            :return site_result: list object containing the site directory, status (success/failed), error and the
+            meta:instanceID values of the site.
+            :return record_list: list object containing the stage records of the site (stage_monitor.py). """
+
+    site_result = site_worker_fn(directory_odk, site_dir, frame_dict, remote_desktop, odk_aggregate, transect_cache)
+
+    return site_result, stage_monitor.drain_fn()
+
+
+def site_summary_fn(site_result_list):
+    """ Print the success/failure summary of the site workflow.
+
+            :param site_result_list: list object containing the site_worker_fn outputs. """
+
+    failed_list = [result for result in site_result_list if result[1] != 'success']
 
-            # if star transect for the site exists -- create an observational sheet and populate.
-            star_csv = os.path.join(site_dir, site + '_clean_star_transect.csv')
+    print('------------------------------------------------------------')
+    print('Site summary: ', len(site_result_list) - len(failed_list), ' succeeded, ', len(failed_list), ' failed.')
+    for site_dir, status, error, _ in failed_list:
+        print(' - ', site_dir.rsplit('\\', 1)[-1], status, error)
 
-            if os.path.isfile(star_csv):
-                star = pd.read_csv(star_csv).fillna('BLANK').replace('Nan', 'BLANK')
-                print('step9_1_aggregate_transect_bypass_not_remote_desktop.py initiating..........')
-                # call the step9_1_aggregate_transect_bypass_not_remote_desktop.py script.
-                import step9_1_aggregate_transect_bypass_not_remote_desktop
-                step9_1_aggregate_transect_bypass_not_remote_desktop.main_routine(
-                    directory_odk, obs_data_list,  site, site_dir, star)
 
-            elif os.path.isfile(ras_csv):
-                ras = pd.read_csv(ras_csv).fillna('BLANK').replace('Nan', 'BLANK')
+def data_extraction_workflow_fn(directory_odk, site_dir_path_list, site_df_dict, remote_desktop, reference_data,
+                                workers=1, odk_aggregate=None, transect_cache=None):
+    """ create list of site directory paths.
+
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv
+            (cmd_args_fn defined).
+            :param site_dir_path_list: list object containing all site folder paths ans string variables
+            (site_directories_fn defined)
+            :param site_df_dict: dictionary object containing the site data frames (site_partition_fn defined).
+            :param remote_desktop: Boolean object - working on the PGB-BAS14 server (cmd_args_fn defined).
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+            (reference_data_cache.py).
+            :param workers: integer object containing the number of worker processes (cmd_args_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+            :return site_dir_path_list: list object containing all site folder paths ans string variables.
+            :return obs_data_list: list object containing list elements - each list contains the input variables for the
+            observation spreadsheet, one list per page.
+            :return ras_data_list: list object containing the input variables for the ras spreadsheet, one list per page.
+            :return site: string variable containing the current site name.
+            :return site_dir: string variable containing the current site directory path.
+            :return star_csv: string object containing the path to the clean_star_transect.csv file created under
+            step2_1_star_transect_processing_workflow. """
+
+
+    site_result_list = []
+
+    if workers > 1:
+        # sites are independent (each writes to its own site directory) - fan them out to a process pool.
+        from concurrent.futures import ProcessPoolExecutor
+
+        print('Processing ', len(site_dir_path_list), ' sites with ', workers, ' workers..........')
+        with ProcessPoolExecutor(max_workers=workers, initializer=worker_init_fn,
+                                 initargs=(reference_data, stage_monitor.SETTINGS)) as executor:
+            future_list = [executor.submit(site_pool_worker_fn, directory_odk, site_dir, frame_dict, remote_desktop,
+                                           odk_aggregate, transect_cache)
+                           for site_dir, frame_dict in zip(site_dir_path_list, site_df_dict.values())]
+
+            for site_dir, frame_dict, future in zip(site_dir_path_list, site_df_dict.values(), future_list):
+                try:
+                    site_result, record_list = future.result()
+                    site_result_list.append(site_result)
+                    # call the stage_monitor.py script - add the worker stage records to the end of run table.
+                    stage_monitor.merge_fn(record_list)
+                except Exception as e:
+                    # the worker process itself failed (i.e. terminated).
+                    site_result_list.append([site_dir, 'failed', '{0}: {1}'.format(type(e).__name__, e),
+                                             instance_list_fn(frame_dict)])
+
+    else:
+        for site_dir, frame_dict in zip(site_dir_path_list, site_df_dict.values()):
+            site_result_list.append(site_worker_fn(directory_odk, site_dir, frame_dict, remote_desktop,
+                                                   odk_aggregate, transect_cache, reference_data))
+
+    # call the site_summary_fn function
+    site_summary_fn(site_result_list)
 
-                print('step11_1_site_ras_processing_workflow.py initiating..........')
-                import step11_1_site_ras_processing_workflow
-                step11_1_site_ras_processing_workflow.main_routine(
-                    ras_data_list, site, site_dir, ras)
+    return site_result_list
 
 
 """ ---------------------------------------------------------------------------------------------"""
 
 
-def main_routine(directory_odk, file_path, remote_desktop, temp_dir, veg_list_excel, shrub_list_excel):
+def transect_fetch_fn(site_df_dict, site_dir_path_list, odk_aggregate, transect_cache=None):
+    """ Download the star transect tables of every site concurrently before the site workflow starts.
+
+            :param site_df_dict: dictionary object containing the site data frames (site_partition_fn defined).
+            :param site_dir_path_list: list object containing all site folder paths (site_directories_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined),
+            tables already downloaded for a submission are restored from the cache. """
+
+    import transect_table_fetcher
+
+    fetch_list = []
+    for site_dir, frame_dict in zip(site_dir_path_list, site_df_dict.values()):
+        # sites with repeat group transect points (transect_repeat_reader.py) need no download.
+        if 'clean_star_transect' in frame_dict and 'star_transect_points' not in frame_dict:
+            _, site = site_dir.rsplit('\\', 1)
+            fetch_list.extend(transect_table_fetcher.site_transect_list_fn(
+                frame_dict['clean_star_transect'], site, site_dir))
+
+    if fetch_list:
+        print('Downloading ', len(fetch_list), ' star transect tables from ODK Aggregate..........')
+        # call the transect_table_fetcher.py script.
+        transect_table_fetcher.main_routine(fetch_list, odk_aggregate, transect_cache)
+
+
+def transect_reconcile_fn(table_list, df_list, site_df_dict, site_dir_path_list, directory_odk, remote_desktop,
+                          temp_dir, transect_cache=None):
+    """ Reconcile the transect points of every star transect site, from the repeat group exports or the transect
+    tables (html), with the star transect form counts.
+
+            :param table_list: list object containing the intermediate table names (intermediate_store defined).
+            :param df_list: list object containing open pandas data frames (intermediate_store defined).
+            :param site_df_dict: dictionary object containing the site data frames (site_partition_fn defined).
+            :param site_dir_path_list: list object containing all site folder paths (site_directories_fn defined).
+            :param directory_odk: string object containing the directory path to the raw odk result csv and the saved
+            transect tables (cmd_args_fn defined).
+            :param remote_desktop: Boolean object - working on the PGB-BAS14 server, the transect tables were
+            downloaded to the site directories (cmd_args_fn defined).
+            :param temp_dir: string object path to the created output directory (date_time).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined). """
+
+    import transect_count_reconciler
+    import transect_table_fetcher
+
+    html_list = []
+    for site_dir, frame_dict in zip(site_dir_path_list, site_df_dict.values()):
+        # the sites without repeat group transect points are read from the html of step9_1 or step9_2.
+        if 'clean_star_transect' in frame_dict and 'star_transect_points' not in frame_dict:
+            _, site = site_dir.rsplit('\\', 1)
+            clean_meta_key = frame_dict['clean_star_transect'].clean_meta_key.iloc[0]
+            for loop in (1, 2, 3):
+                if remote_desktop == 'Yes':
+                    html_path = transect_table_fetcher.transect_html_path_fn(site_dir, site, loop)
+                else:
+                    html_path = transect_table_fetcher.transect_html_path_fn(directory_odk, site, loop)
+                html_list.append([site, clean_meta_key, loop, html_path])
+
+    point_df = df_list[table_list.index('star_transect_points')] if 'star_transect_points' in table_list else None
+
+    # call the transect_count_reconciler.py script.
+    transect_count_reconciler.main_routine(df_list[table_list.index('clean_star_transect')], point_df, temp_dir,
+                                           html_list, transect_cache)
+
+
+@stage_monitor.monitor_fn
+def main_routine(directory_odk, file_path, remote_desktop, temp_dir, reference_data, workers=1, site_csv='No',
+                 odk_aggregate=None, transect_cache=None):
     print('step7_site_processing_workflow.py INITIATED.')
 
-    # call the globDir function
-    csv_list, df_list = glob_dir_fn(temp_dir, '*.csv')
+    # call the intermediate_store.py script - read the typed tables written by the form workflows.
+    import intermediate_store
+    table_list, df_list = intermediate_store.main_routine(temp_dir)
+
+    # call the species_cover_matrix.py script - the species of every site ranked once for the season.
+    import species_cover_matrix
+    species_df = species_cover_matrix.main_routine(table_list, df_list, temp_dir)
+    if species_df is not None:
+        table_list.append(species_cover_matrix.TABLE)
+        df_list.append(species_df)
+
+    if 'clean_star_transect' in table_list:
+        # call the ground_cover_fraction.py script - the ground layer cover fractions of every site in one pass.
+        import ground_cover_fraction
+        table_list.append(ground_cover_fraction.TABLE)
+        df_list.append(ground_cover_fraction.main_routine(df_list[table_list.index('clean_star_transect')]))
 
-    # call the export SiteCsv function
-    dir_path, all_site_list, site_folder_path = export_site_csv_fn(csv_list, temp_dir)
+    # call the site_partition_fn function - split each clean table by site once, in memory.
+    site_df_dict = site_partition_fn(table_list, df_list)
 
-    # call the listOfDirectoriesFN function
-    site_dir_path_list = list_of_directories_fn(dir_path)
+    # call the site_directories_fn function
+    dir_path, site_dir_path_list = site_directories_fn(site_df_dict, temp_dir, site_csv)
+    stage_monitor.count_fn(sites=len(site_dir_path_list))
 
-    data_extraction_workflow_fn(directory_odk, site_dir_path_list, remote_desktop, veg_list_excel, shrub_list_excel)
+    if remote_desktop == 'Yes':
+        # call the transect_fetch_fn function - one authenticated session for the star transect tables of all sites.
+        transect_fetch_fn(site_df_dict, site_dir_path_list, odk_aggregate, transect_cache)
+
+    if 'clean_star_transect' in table_list:
+        # call the transect_reconcile_fn function - the transect points of the season against the form counts.
+        transect_reconcile_fn(table_list, df_list, site_df_dict, site_dir_path_list, directory_odk, remote_desktop,
+                              temp_dir, transect_cache)
+
+    site_result_list = data_extraction_workflow_fn(directory_odk, site_dir_path_list, site_df_dict, remote_desktop,
+                                                   reference_data, workers, odk_aggregate, transect_cache)
 
     print('step7_site_processing_workflow.py COMPLETE.')
 
+    return site_result_list
+
 
 if __name__ == "__main__":
     main_routine()
@@ -20,9 +20,9 @@ SOFTWARE.
 
 # Import modules
 from __future__ import print_function, division
-import pandas as pd
 import os
 import warnings
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -331,10 +331,11 @@ def site_cond_variable_list_fn(inter):
     return cond_vert_list12, cond_hor_list1
 
 
-def main_routine(integrated_csv, site_dir):
+@stage_monitor.monitor_fn
+def main_routine(integrated_df, site_dir):
     """ Extract variables from the current site integrated data frame and return ordered lists for observational 
     workbook insertion.
-            :param integrated_csv: sting object containing the file path to the current site integrated csv file.
+            :param integrated_df: pandas dataframe object containing the current site integrated data (step7 defined).
             :param site_dir: string object containing the path to the site directory.
             :return establish_list2456: list object containing list elements with establishment variables for ordered
                 vertical insertion.
@@ -352,7 +353,7 @@ def main_routine(integrated_csv, site_dir):
 
     print('step8_1_site_integrated_data_extraction.py INITIATED.')
 
-    inter = pd.read_csv(integrated_csv).fillna('BLANK').replace('Nan', 'BLANK')
+    inter = integrated_df.fillna('BLANK')
 
     # call the site_visit_vertical_list_fn function
     visit_ver_list2 = site_visit_vertical_list_fn(inter)
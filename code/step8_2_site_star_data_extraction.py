@@ -23,6 +23,7 @@ from __future__ import print_function, division
 import pandas as pd
 import warnings
 from datetime import datetime
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -96,16 +97,25 @@ def site_establishment_fn(star):
     return estab_vert_list13
 
 
-def ground_composition_ver_list_fn(star):
-    """ Collect the ground layer composite data and preform fractononl calculations.
+def int_fn(value):
+    """ Convert a rounded cover value to an integer, 'BLANK' is returned as is.
 
-     :param star: pandaas data frame object.
+            :param value: float or string object.
+            :return: integer or string object. """
+
+    return int(value) if isinstance(value, float) else value
+
+
+def ground_composition_ver_list_fn(cover):
+    """ Collect the ground layer composite data (ground_cover_fraction.py calculated).
+
+     :param cover: pandas data frame object containing the site ground cover fractions (ground_cover_fraction.py).
      :return ground_vert_list12345: list object containing list elements of ground cover fractions ready for observation
       sheet insertion. """
 
     ############################# check that lists 4 and 5 need to be entered if it is representitive.......
 
-    if star.rep_cover[0] == 'representative' and star.rep_veg[0] == 'representative':
+    if cover.representative[0]:
 
         ground_layer_ver_list1 = ['Yes']
     else:
@@ -113,20 +123,18 @@ def ground_composition_ver_list_fn(star):
 
     # TODO need to check the calculations
     ground_layer_ver_list1 = ['Yes']
-    ground_layer_ver_list2 = [(round(float(star.field_pg[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.field_ag[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.field_pf[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.field_af[0]) * float(star.final_veg[0]) / 100)), 0,
-                              round(star.field_veg[0]), round(star.field_litter[0]), round(star.field_exposed[0])]
-    ground_layer_ver_list3 = [round(star.field_pg[0]), round(star.field_ag[0]), round(star.field_pf[0]),
-                              round(star.field_af[0]), 0]
-    ground_layer_ver_list4 = [(round(float(star.final_pg[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.final_ag[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.final_pf[0]) * float(star.final_veg[0]) / 100)),
-                              (round(float(star.final_af[0]) * float(star.final_veg[0]) / 100)), 0,
-                              round(star.final_veg[0]), round(star.final_litter[0]), round(star.final_exposed[0])]
-    ground_layer_ver_list5 = [round(star.final_pg[0]), round(star.final_ag[0]), round(star.final_pf[0]),
-                              round(star.final_af[0]), 0]
+    ground_layer_ver_list2 = [int_fn(cover.ground_field_pg[0]), int_fn(cover.ground_field_ag[0]),
+                              int_fn(cover.ground_field_pf[0]), int_fn(cover.ground_field_af[0]), 0,
+                              int_fn(cover.round_field_veg[0]), int_fn(cover.round_field_litter[0]),
+                              int_fn(cover.round_field_exposed[0])]
+    ground_layer_ver_list3 = [int_fn(cover.round_field_pg[0]), int_fn(cover.round_field_ag[0]),
+                              int_fn(cover.round_field_pf[0]), int_fn(cover.round_field_af[0]), 0]
+    ground_layer_ver_list4 = [int_fn(cover.ground_final_pg[0]), int_fn(cover.ground_final_ag[0]),
+                              int_fn(cover.ground_final_pf[0]), int_fn(cover.ground_final_af[0]), 0,
+                              int_fn(cover.round_final_veg[0]), int_fn(cover.round_final_litter[0]),
+                              int_fn(cover.round_final_exposed[0])]
+    ground_layer_ver_list5 = [int_fn(cover.round_final_pg[0]), int_fn(cover.round_final_ag[0]),
+                              int_fn(cover.round_final_pf[0]), int_fn(cover.round_final_af[0]), 0]
 
     ground_vert_list12345 = [ground_layer_ver_list1, ground_layer_ver_list2, ground_layer_ver_list3,
                              ground_layer_ver_list4, ground_layer_ver_list5]
@@ -134,227 +142,94 @@ def ground_composition_ver_list_fn(star):
     return ground_vert_list12345
 
 
-def site_cover_estimates_fn(star):
+def site_cover_estimates_fn(cover):
     """ Extract and observational workbook, site cover variables as lists for workbook insertion.
 
-            :param star: pandas dataframe object (star transect).
+            :param cover: pandas dataframe object containing the site ground cover fractions
+            (ground_cover_fraction.py).
             :return estimates_hor_list12345: list object containing list elements. List elements include field,
             adjusted and total cover fractions. """
 
-    if star.rep_cover[0] == 'representative':
+    if cover.rep_cover[0] == 'representative':
 
-        estimates_hor_list1 = [star.field_litter[0], star.field_exposed[0], star.field_veg[0], star.field_site_total[0]]
-        print(']]]]]]]]]]]]]]]]]]]]]]]]estimates_hor_list1', estimates_hor_list1)
+        estimates_hor_list1 = [cover.field_litter[0], cover.field_exposed[0], cover.field_veg[0],
+                               cover.field_site_total[0]]
         estimates_hor_list2 = [0, 0, 0, 0, 0]
-        estimates_hor_list3 = [star.field_pg[0], star.field_ag[0], star.field_pf[0], star.field_af[0]]
-        estimates_hor_list4 = [star.adj_pg[0], star.adj_ag[0], star.adj_pf[0], star.adj_af[0]]
+        estimates_hor_list3 = [cover.field_pg[0], cover.field_ag[0], cover.field_pf[0], cover.field_af[0]]
+        estimates_hor_list4 = [cover.adj_pg[0], cover.adj_ag[0], cover.adj_pf[0], cover.adj_af[0]]
 
         estimates_hor_list5 = ['DONT KNOW WHAT THIS IS']  # todo figure this out.
 
     else:
 
-        estimates_hor_list1 = [star.field_litter[0], star.field_exposed[0], star.field_veg[0], star.field_site_total[0]]
-        print(']]]]]]]]]]]]]]]]]]]]]]]]estimates_hor_list1', estimates_hor_list1)
-        estimates_hor_list2 = [star.adj_litter[0], star.adj_exposed[0], star.adj_veg[0], star.adj_site_total[0]]
-        estimates_hor_list3 = [star.field_pg[0], star.field_ag[0], star.field_pf[0], star.field_af[0]]
-        estimates_hor_list4 = [star.adj_pg[0], star.adj_ag[0], star.adj_pf[0], star.adj_af[0]]
+        estimates_hor_list1 = [cover.field_litter[0], cover.field_exposed[0], cover.field_veg[0],
+                               cover.field_site_total[0]]
+        estimates_hor_list2 = [cover.adj_litter[0], cover.adj_exposed[0], cover.adj_veg[0], cover.adj_site_total[0]]
+        estimates_hor_list3 = [cover.field_pg[0], cover.field_ag[0], cover.field_pf[0], cover.field_af[0]]
+        estimates_hor_list4 = [cover.adj_pg[0], cover.adj_ag[0], cover.adj_pf[0], cover.adj_af[0]]
 
         estimates_hor_list5 = ['DONT KNOW WHAT THIS IS']
 
     estimates_hor_list12345 = [estimates_hor_list1, estimates_hor_list2, estimates_hor_list3, estimates_hor_list4,
                                estimates_hor_list5]
 
-    print('PPPPPPPPPPPPPPPPPPP estimates_hor_list12345', estimates_hor_list12345)
     return estimates_hor_list12345
 
 
-def species_list_fn(df, n):  # todo this is the botanical and cover functions.
-    """ Create a list from the required (n) botanical name fields from the dataframe (df), loops through ten
-        times(number of variables).
-
-            :param df: pandas data frame object.
-            :param n: string object passed into the function (i.e. 'PG', 'AG').
-            :return botanical_list: list object containing ten botanical names."""
-
-    botanical_list = []
-
-    for i in range(10):
-        species = df['bot_' + n + '_' + str(i + 1)][0]
-        botanical_list.extend([species])
-
-    return botanical_list
-
-
-def cover_list_fn(df, n):
-    """ create a list from the required (n) cover fields from the DataFrame (df), loops through ten
-        times(number of variables).
-
-            :param df: pandas data frame object.
-            :param n: string object passed into the function (i.e. 'PG', 'AG').
-            :return cover_list: list object containing ten cover values names."""
-
-    cover_list = []
-
-    for i in range(10):
-        cover = df['cover_' + n + '_' + str(i + 1)][0]
-        cover_list.extend([cover])
-
-    return cover_list
-
-
-def remove_list_values_fn(list1, search_criteria):
-    """ Remove all values within a list containing the search_criteria.
-
-             :param list1: input list object.
-             :param search_criteria: string object passed into the function.
-             :return list1: processed list object. """
-
-    while search_criteria in list1: list1.remove(search_criteria)
-
-    return list1
-
-
-def reverse_order_lists_and_clean_species_list_fn(species):
-    """ Reverse the species list.
-
-            :param species: list object containing species names and 'BLANK list elements.
-            :return output_list: list object containing the elements of the species list in reverse order."""
-
-    # call the remove_list_values_fn function on the species list
-    species_list = remove_list_values_fn(species, 'BLANK')
-
-    # reverse order list
-    output_list = []
-
-    for i in reversed(species_list):
-        output_list.append(i)
-
-    return output_list
-
-
-def reverse_order_lists_and_clean_cover_list(cover):
-    """ reverse the count list and convert to int.
-
-            :param cover: list object containing cover value list elements.
-            :return output_list: list object containing the elements of the cover list in reverse order."""
-
-    cover_list = remove_list_values_fn(cover, 'BLANK')
-
-    output_list = []
-    # convert float to int in reverse order
-    for i in reversed(cover_list):
-        n = int(i)
-        output_list.append(n)
-
-    return output_list
-
-
-def split_list_fn(list1, n):
-    """ split a list into maximum length (n).
-
-            :param list1: input list object.
-            :param n: integer object passed through the function defining the maximum values in the primary list.
-            :return primary_list: list object containing the n number of variables form list1.
-            :return secondary_list: list object containing all other variables from list1."""
-
-    if len(list1) > n:
-
-        output = [list1[i:i + n] for i in range(0, len(list1), n)]
-
-        primary_list = output[0]
-        secondary_list = output[1]
-    else:
-        primary_list = list1
-        secondary_list = []
-
-    return primary_list, secondary_list
-
-
-def sum_list_fn(list1):
-    """ Calculate the sum of list elements.
-
-            :param list1:" input list of numeric variables.
-            :return total: integer object containing the total value of summed values from the list1 object. """
-
-    total = 0
-
-    # Iterate each element in list
-    # and add them in variable total
-    for ele in range(0, len(list1)):
-        total = total + list1[ele]
-
-    return total
-
-
-def common_name_extraction_fn(botanical_series, target_list):
-    """ Extract the common name from the botanical_common_series excel document, if there is no match the botanical name
+def common_name_extraction_fn(taxonomy_index, target_list):
+    """ Extract the common name from the botanical_common lookup table, if there is no match the botanical name
      will be listed as the common name as well as the botanical.
 
-            :param botanical_series: series object containing botanical and common names.
+            :param taxonomy_index: dictionary object containing the botanical -> common name lookup tables
+            (taxonomy_resolver.py).
             :param target_list: list object of botanical names.
             :return species_list: list object containing list elements of botanical and common named species. """
 
-    species_list = []
-
-    for botanical_name in target_list:
-        botanical_name_list = botanical_series.copyBotanical2.tolist()
-        if botanical_name in botanical_name_list:
-
-            common_name = botanical_series.loc[botanical_series['copyBotanical2'] == botanical_name, 'copyCommon'].iloc[
-                0]
-
-        else:
-            common_name = botanical_name
-
-        species_list.append([botanical_name, common_name])
+    # call the taxonomy_resolver.py script - the whole list is resolved in one call.
+    import taxonomy_resolver
+    species_list = taxonomy_resolver.main_routine(taxonomy_index, target_list)
 
     return species_list
 
 
-def cover_vegetation_extraction_fn(veg_series, species, cover):
-    """ Controls the sorting and common name extraction of the input lists species and cover.
-
-            :param veg_series: series object containing botanical and common species names.
-            :param species: list object containing botanical species names.
-            :param cover: list object containing species count values.
-            :return primary_cover_list: list object containing the (n) number of list elements.
-            :return secondary_cover_list: list object containing the remainder of (n) elements.
-            :return final_species_list: list object containing (n) list elements of botanical and common named species.
-            :return secondary_species_list: list object containing the remainder of (n) list elements of  botanical and common named species"""
+def cover_vegetation_extraction_fn(veg_dict, species_df, group):
+    """ Extract the listed species and cover values of a functional group from the ranked site species.
 
-    # call the reverse_order_lists_and_clean_species_list_fn function
-    descend_species_list = reverse_order_lists_and_clean_species_list_fn(species)
+            :param veg_dict: dictionary object containing the botanical -> common name lookup tables
+            (taxonomy_resolver.py).
+            :param species_df: pandas dataframe object containing the ranked species of the site
+            (species_cover_matrix.py).
+            :param group: string object containing the functional group (i.e. '3p', 'pg').
+            :return primary_cover_list: list object containing the cover values of the listed species (largest first).
+            :return final_species_list: list object containing the botanical and common names of the listed species.
+            :return sum_total: integer object containing the total cover of the listed species. """
 
-    # call the reverse_order_lists_and_clean_cover_list function
-    descend_cover_list = reverse_order_lists_and_clean_cover_list(cover)
+    group_df = species_df[(species_df['form'] == 'star') & (species_df['group'] == group) & species_df['primary']]
 
-    # call the split_list_fn function
-    primary_species_list, secondary_species_list = split_list_fn(descend_species_list, 4)
-    # print(primary_species_list)
-    # print(secondary_species_list)
-
-    # call the split_list_fn function
-    primary_cover_list, secondary_cover_list = split_list_fn(descend_cover_list, 4)
-    # print(primary_cover_list)
-    # print(secondary_cover_list)
+    primary_cover_list = [int(cover) for cover in group_df['cover'].fillna(0).tolist()]
 
     # call the commonNameExtraction FN function
-    final_species_list = common_name_extraction_fn(veg_series, primary_species_list)
-    # print('final_species_list: ', final_species_list)
-    # print('primary_cover_list: ', primary_cover_list)
+    final_species_list = common_name_extraction_fn(veg_dict, group_df['botanical'].tolist())
+
+    sum_total = int(group_df['group_total'].iloc[0]) if len(group_df) else 0
 
-    return primary_cover_list, secondary_cover_list, final_species_list, secondary_species_list
+    return primary_cover_list, final_species_list, sum_total
 
 
-def main_routine(star_csv, site, site_dir, shrub_list_excel):
+@stage_monitor.monitor_fn
+def main_routine(star_df, site, site_dir, reference_data, species_df=None, ground_df=None):
     """ Extract variables from the current site star data frame and return ordered lists for observational
     workbook insertion.
 
-            :param star_csv: sting object containing the file path to the current site star csv file.
+            :param star_df: pandas dataframe object containing the current site star transect data (step7 defined).
             :param site: string object containing the current site.
             :param site_dir: string object containing the path to the site directory.
-            :param shrub_list_excel: string object containing the path to an excel document containing botanical and
-                common names.
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+                (reference_data_cache.py).
+            :param species_df: pandas dataframe object containing the ranked species of the site
+                (species_cover_matrix.py defined), if None it is built from star_df.
+            :param ground_df: pandas dataframe object containing the site ground cover fractions
+                (ground_cover_fraction.py defined), if None it is calculated from star_df.
             :return estab_vert_list13:  list of variables for vertical insertion, including property name,
                 officers and lat lon information.
             :return visit_vert_list1: list of variables for vertical insertion, including recorder, site and date time
@@ -367,93 +242,48 @@ def main_routine(star_csv, site, site_dir, shrub_list_excel):
 
     print('step_8_2_site_star_data_extraction.py INITIATED.')
 
-    # import the site star transect csv
-    star = pd.read_csv(star_csv).fillna('BLANK').replace('Nan', 'BLANK')
-
-    # import the odk veg list
-    veg_df = pd.read_excel(shrub_list_excel, sheet_name='completeGrassForb')
+    star = star_df.fillna('BLANK')
 
-    # filter out unwanted fields.
-    veg_series = veg_df[['copyBotanical2', 'copyCommon']]
-    print(veg_series)
+    # grass and forb botanical -> common name lookup table (completeGrassForb).
+    veg_dict = reference_data['grass_forb_index']
 
     # call the site_visit_vertical_list_fn function
     visit_vert_list1 = site_visit_variable_list_fn(star)
 
     estab_vert_list13 = site_establishment_fn(star)
 
-    ground_vert_list12345 = ground_composition_ver_list_fn(star)
-
-    estimates_hor_list12345 = site_cover_estimates_fn(star)
-
-    # call the species_list_fn function
-    species = species_list_fn(star, '3p')
-    # call the cover_list function
-    cover = cover_list_fn(star, '3p')
-
-    primary_cover_list3p, secondary_cover_list3p, final_species_list3p, secondary_species_list3p = cover_vegetation_extraction_fn(
-        veg_series, species, cover)
-
-    print('3P finalSpeciesList: ', final_species_list3p)
-    print('3P primaryCoverList: ', primary_cover_list3p)
-
-    # call the species_list_fn function
-    species = species_list_fn(star, 'pg')
-    # call the cover_list function
-    cover = cover_list_fn(star, 'pg')
-
-    print('Pg species: ', species)
-    print('Pg cover: ', cover)
-    # print('Length of second: ', len(secondaryCoverList))
-
-    if len(secondary_cover_list3p) > 0:
-        # print('Length of second: ', len(secondary_cover_list3p))
-        species.extend(secondary_species_list3p)
-        cover.extend(secondary_cover_list3p)
-    print('Pg species extended: ', species)
-    print('Pg cover extended: ', cover)
-
-    primary_cover_list_pg, secondary_cover_list_pg, final_species_list_pg, secondary_species_list_pg = cover_vegetation_extraction_fn(
-        veg_series, species, cover)
-
-    print('Pg finalSpeciesList: ', final_species_list_pg)
-    print('Pg primaryCoverList: ', primary_cover_list_pg)
-
-    # call the sum_list_fn function
-    sum_total_p = sum_list_fn(primary_cover_list3p + primary_cover_list_pg)
-
-    ''' --------------------------- Annual Grass -------------------------'''
-    # call the species_list_fn function
-    species = species_list_fn(star, 'ag')
-    # call the cover_list function
-    cover = cover_list_fn(star, 'ag')
-    primary_cover_list_ag, secondary_cover_list_ag, final_species_list_ag, secondary_species_list_ag = cover_vegetation_extraction_fn(
-        veg_series, species, cover)
-
-    # call the sum_list_fn function
-    sum_total_ag = sum_list_fn(primary_cover_list_ag)
-
-    ''' ------------------------ Perennial Forb -----------------------------'''
-    # call the species_list_fn function
-    species = species_list_fn(star, 'pf')
-    # call the cover_list function
-    cover = cover_list_fn(star, 'pf')
-    primary_cover_list_pf, secondary_cover_list_pf, final_species_list_pf, secondary_species_list_pf = cover_vegetation_extraction_fn(
-        veg_series, species, cover)
-    print('final_species_list_pf', final_species_list_pf)
-    # call the sum_list_fn function
-    sum_total_pf = sum_list_fn(primary_cover_list_pf)
-
-    '''---------------------------- Annual forb -------------------------------'''
-    # call the species_list_fn function
-    species = species_list_fn(star, 'af')
-    # call the cover_list function
-    cover = cover_list_fn(star, 'af')
-    primary_cover_list_af, secondary_cover_list_af, final_species_list_af, secondary_species_list_af = cover_vegetation_extraction_fn(
-        veg_series, species, cover)
-    print('final_species_list_pf', final_species_list_pf)
-    # call the sum_list_fn function
-    sum_total_af = sum_list_fn(primary_cover_list_af)
+    if ground_df is None:
+        # call the ground_cover_fraction.py script - the cover fractions of this site only.
+        import ground_cover_fraction
+        ground_df = ground_cover_fraction.main_routine(star_df)
+    cover = ground_df.fillna('BLANK')
+
+    ground_vert_list12345 = ground_composition_ver_list_fn(cover)
+
+    estimates_hor_list12345 = site_cover_estimates_fn(cover)
+
+    if species_df is None:
+        # call the species_cover_matrix.py script - the ranked species of this site only.
+        import species_cover_matrix
+        species_df = species_cover_matrix.main_routine(['clean_star_transect'], [star_df])
+        if species_df is None:
+            species_df = pd.DataFrame(columns=['form', 'group', 'botanical', 'cover', 'primary', 'group_total'])
+
+    # call the cover_vegetation_extraction_fn function - 3P species ranked after the fourth are perennial grass
+    # (species_cover_matrix.overflow_fn).
+    primary_cover_list3p, final_species_list3p, sum_total_3p = cover_vegetation_extraction_fn(
+        veg_dict, species_df, '3p')
+    primary_cover_list_pg, final_species_list_pg, sum_total_pg = cover_vegetation_extraction_fn(
+        veg_dict, species_df, 'pg')
+    sum_total_p = sum_total_3p + sum_total_pg
+
+    # annual grass, perennial forb and annual forb.
+    primary_cover_list_ag, final_species_list_ag, sum_total_ag = cover_vegetation_extraction_fn(
+        veg_dict, species_df, 'ag')
+    primary_cover_list_pf, final_species_list_pf, sum_total_pf = cover_vegetation_extraction_fn(
+        veg_dict, species_df, 'pf')
+    primary_cover_list_af, final_species_list_af, sum_total_af = cover_vegetation_extraction_fn(
+        veg_dict, species_df, 'af')
 
     total_cover_list = [sum_total_p, sum_total_ag, sum_total_pf, sum_total_af, 0]
     estimates_veg_list = [final_species_list3p, primary_cover_list3p, final_species_list_pg, primary_cover_list_pg,
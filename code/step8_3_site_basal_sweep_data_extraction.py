@@ -20,8 +20,8 @@ SOFTWARE.
 
 # Import modules
 from __future__ import print_function, division
-import pandas as pd
 import warnings
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -85,33 +85,22 @@ def basal_list_vertical_fn(basal):
     return basal_vert_list123
 
 
-def common_name_extraction_fn(botanical_series, target_list, form):
-    """ Extract the common name from the botanical_common_series excel document.
+def common_name_extraction_fn(botanical_dict, target_list, form):
+    """ Extract the common name from the botanical_common lookup table.
 
-            :param botanical_series: pandas series object containing common and botanical species names.
+            :param botanical_dict: dictionary object containing the botanical -> common name lookup tables
+            (taxonomy_resolver.py).
             :param target_list: List of botanical species defined under basal_list_vertical_fn.
             :param form: string object passed into the function (tree or shrub).
             :return species_list: list object containing list elements [botanical_name, common_name].
             :return form_list: list object containing the form identifier of each species. """
 
-    species_list = []
-    form_list = []
+    botanical_name_list = [botanical_name for botanical_name in target_list if botanical_name != 'BLANK']
 
-    for botanical_name in target_list:
-        botanical_name_list = botanical_series.copyBotanical2.tolist()
-
-        if botanical_name != 'BLANK':
-
-            if botanical_name in botanical_name_list:
-
-                common_name = botanical_series.loc[botanical_series['copyBotanical2'] == botanical_name, 'copyCommon'].iloc[
-                    0]
-            else:
-                common_name = botanical_name
-
-            form_list.append(form)
-
-            species_list.append([botanical_name, common_name])
+    # call the taxonomy_resolver.py script - the whole list is resolved in one call.
+    import taxonomy_resolver
+    species_list = taxonomy_resolver.main_routine(botanical_dict, botanical_name_list)
+    form_list = [form] * len(species_list)
 
     return species_list, form_list
 
@@ -124,16 +113,17 @@ def common_name_extraction_fn(botanical_series, target_list, form):
     return lista, listb, listc'''
 
 
-def main_routine(basal_csv, site, site_dir, shrub_list_excel):
+@stage_monitor.monitor_fn
+def main_routine(basal_df, site, site_dir, reference_data):
 
     """ Extract variables from the current site basal data frame and return ordered lists for observational
     workbook insertion.
 
-            :param basal_csv: sting object containing the file path to the current site basal csv file.
+            :param basal_df: pandas dataframe object containing the current site basal data (step7 defined).
             :param site: string object containing the current site.
             :param site_dir: string object containing the path to the site directory.
-            :param shrub_list_excel: string object containing the path to an excel document containing botanical and
-                common names.
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+                (reference_data_cache.py).
             :return basal_hor_list1234: list object containing basal information to be inserted into the observation
             sheet horizontally, including factor, basal species and count information.
             :return basal_vert_list123: list object containing basal information to be inserted into the observation
@@ -141,15 +131,11 @@ def main_routine(basal_csv, site, site_dir, shrub_list_excel):
 
     print('step8_3_site_basal_sweep_data_extraction.py INITIATED.')
 
-    basal = pd.read_csv(basal_csv).fillna('BLANK').replace('Nan', 'BLANK')
-
-    shrub_df = pd.read_excel(shrub_list_excel, sheet_name='CompleteTree')
-    # filter out unwanted fields.
-    tree_series = shrub_df[['copyBotanical2', 'copyCommon']]
+    basal = basal_df.fillna('BLANK')
 
-    shrub_df = pd.read_excel(shrub_list_excel, sheet_name='CompleteShrub')
-    # filter out unwanted fields.
-    shrub_series = shrub_df[['copyBotanical2', 'copyCommon']]
+    # tree and shrub botanical -> common name lookup tables (CompleteTree and CompleteShrub).
+    tree_index = reference_data['tree_index']
+    shrub_index = reference_data['shrub_index']
 
     # call the basal_list_horizontal_fn function
     basal_hor_list1234 = basal_list_horizontal_fn(basal)
@@ -158,13 +144,13 @@ def main_routine(basal_csv, site, site_dir, shrub_list_excel):
     basal_vert_list123 = basal_list_vertical_fn(basal)
 
     # call the commonNameExtraction FN function
-    basal_species_list1, basal_ver_list4 = common_name_extraction_fn(tree_series, basal_vert_list123[1], 'Tree')
+    basal_species_list1, basal_ver_list4 = common_name_extraction_fn(tree_index, basal_vert_list123[1], 'Tree')
     '''#todo sort list here
     lista, listb, listc = sort_three_lists(lista, listb, listc)
     print(lista, listb, listc)'''
 
     # call the common_name_extraction_fn function
-    basal_species_list2, basal_ver_list5 = common_name_extraction_fn(shrub_series, basal_vert_list123[2], 'Shrub')
+    basal_species_list2, basal_ver_list5 = common_name_extraction_fn(shrub_index, basal_vert_list123[2], 'Shrub')
 
     # extend the basal_species_list1 containing all tree and shrub species and replace the list at basalVerList[1]
     basal_species_list1.extend(basal_species_list2)
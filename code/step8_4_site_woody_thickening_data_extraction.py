@@ -21,8 +21,8 @@ SOFTWARE.
 
 # Import modules
 from __future__ import print_function, division
-import pandas as pd
 import warnings
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -85,47 +85,36 @@ def woody_list_vertical_fn(woody):
     return species_list, form_list'''
 
 
-def common_name_extraction_fn(botanical_series, target_list, form):
-    """ Extract the common name from the botanical_common_series excel document.
+def common_name_extraction_fn(botanical_dict, target_list, form):
+    """ Extract the common name from the botanical_common lookup table.
 
-            :param botanical_series: pandas series object containing common and botanical species names.
-            :param target_list: List of botanical species defined under basal_list_vertical_fn.
+            :param botanical_dict: dictionary object containing the botanical -> common name lookup tables
+            (taxonomy_resolver.py).
+            :param target_list: List of botanical species defined under woody_list_vertical_fn.
             :param form: string object passed into the function (tree or shrub).
             :return species_list: list object containing list elements [botanical_name, common_name].
             :return form_list: list object containing the form identifier of each species. """
 
-    species_list = []
-    form_list = []
-
-    for botanical_name in target_list:
-        botanical_name_list = botanical_series.copyBotanical2.tolist()
-
-        if botanical_name != 'BLANK':
-
-            if botanical_name in botanical_name_list:
-
-                common_name = botanical_series.loc[botanical_series['copyBotanical2'] == botanical_name, 'copyCommon'].iloc[
-                    0]
+    botanical_name_list = [botanical_name for botanical_name in target_list if botanical_name != 'BLANK']
 
-            else:
-                common_name = botanical_name
-
-                form_list.append(form)
-
-            species_list.append([botanical_name, common_name])
+    # call the taxonomy_resolver.py script - the whole list is resolved in one call.
+    import taxonomy_resolver
+    species_list = taxonomy_resolver.main_routine(botanical_dict, botanical_name_list)
+    form_list = [form] * len(species_list)
 
     return species_list, form_list
 
 
-def main_routine(woody_csv, site, site_dir, shrub_list_excel):
+@stage_monitor.monitor_fn
+def main_routine(woody_df, site, site_dir, reference_data):
     """ Extract variables from the current site woody data frame and return ordered lists for observational
     workbook insertion.
 
-            :param woody_csv: sting object containing the file path to the current site woody csv file.
+            :param woody_df: pandas dataframe object containing the current site woody data (step7 defined).
             :param site: string object containing the current site.
             :param site_dir: string object containing the path to the site directory.
-            :param shrub_list_excel: string object containing the path to an excel document containing botanical and
-                common names.
+            :param reference_data: dictionary object containing the veg and shrub list lookup tables
+                (reference_data_cache.py).
             :return basal_hor_list1234: list object containing basal information to be inserted into the observation
             sheet horizontally, including factor, basal species and count information.
             :return basal_vert_list123: list object containing basal information to be inserted into the observation
@@ -133,27 +122,22 @@ def main_routine(woody_csv, site, site_dir, shrub_list_excel):
 
     print('step8_4_site_woody_thickening_data_extraction.py INITIATED.')
 
-    # woody = globDir(site_folder_path, '\\*cleanWoodyThickening.csv')
-    woody = pd.read_csv(woody_csv).fillna('BLANK').replace('Nan', 'BLANK')
-
-    tree_df = pd.read_excel(shrub_list_excel, sheet_name='CompleteTree')
-    # filter out unwanted fields.
-    tree_series = tree_df[['copyBotanical2', 'copyCommon']]
+    woody = woody_df.fillna('BLANK')
 
-    shrub_df = pd.read_excel(shrub_list_excel, sheet_name='CompleteShrub')
-    # filter out unwanted fields.
-    shrub_series = shrub_df[['copyBotanical2', 'copyCommon']]
+    # tree and shrub botanical -> common name lookup tables (CompleteTree and CompleteShrub).
+    tree_index = reference_data['tree_index']
+    shrub_index = reference_data['shrub_index']
 
     # call the woody_list_vertical_fn function
     woody_vert_list12345678910 = woody_list_vertical_fn(woody)
 
     # call the commonNameExtraction FN function passing the tree botanical list
     woody_species_list1, woody_ver_list11 = common_name_extraction_fn(
-        tree_series, woody_vert_list12345678910[8], 'Tree')
+        tree_index, woody_vert_list12345678910[8], 'Tree')
 
     # call the common_name_extraction_fn function passing the shrub botanical list
     woody_species_list2, woody_ver_list12 = common_name_extraction_fn(
-        shrub_series, woody_vert_list12345678910[9], 'Shrub')
+        shrub_index, woody_vert_list12345678910[9], 'Shrub')
 
     # extend the woody_species_list1 containing all tree and shrub species and replace the list at woodyVerList[1]
     woody_species_list1.extend(woody_species_list2)
@@ -19,10 +19,10 @@ SOFTWARE.
 """
 
 # Import modules
-import pandas as pd
 import warnings
 import numpy as np
 from datetime import datetime
+import stage_monitor
 
 warnings.filterwarnings("ignore")
 
@@ -229,11 +229,11 @@ def weeds_comment_fn(ras):
     return weed_comment_list
 
 
-def main_routine(ras_csv, site, site_dir):
+@stage_monitor.monitor_fn
+def main_routine(ras_df, site, site_dir):
     print('step8_5_site_ras_data_extraction.py INITIATED.')
 
-    # import the site ras transect csv
-    ras = pd.read_csv(ras_csv).fillna('BLANK').replace('Nan', 'BLANK')
+    ras = ras_df.fillna('BLANK')
 
     # call the site_hor_list_variable_fn function
     ras_hort_list1234567891011121314 = site_hor_list_variable_fn(ras)
@@ -23,7 +23,7 @@ from __future__ import print_function, division
 import pandas as pd
 import glob
 import warnings
-import urllib
+import photo_download_client
 
 warnings.filterwarnings("ignore")
 
@@ -80,9 +80,10 @@ def save_photo_fn(photo_list, site, site_dir):
 
             :param photo_list: list object containing the kind of disturbance, the photo url and the photo bearing.
             :param site: string object containing the site name.
-            :param site_dir: string object containing the path to the site directory. """
+            :param site_dir: string object containing the path to the site directory.
+            :return download_list: list object containing [photo url, output file path] list elements. """
 
-    photo_disturb_list = []
+    download_list = []
 
     for dist in photo_list:
 
@@ -94,26 +95,32 @@ def save_photo_fn(photo_list, site, site_dir):
             photo_number = str(photo_url[-6:])
             output_str = (
                     site_dir + '\\' + site + '_' + photo_number + '_' + disturb + '_BEARING_' + bearing + '.jpg')  # return date following site
-            photo_disturb_list.append(output_str)
-            urllib.request.urlretrieve(photo_url, output_str)
+            download_list.append([photo_url, output_str])
 
+    return download_list
 
-def main_routine(photo_int_url_csv, site, site_dir):
-    """ Read in the site_photo_integrated_url.csv file sort and download and name the relevant photographs.
 
-            :param photo_int_url_csv: string object containing the path to the site_photo_integrated_url csv file.
+def main_routine(photo_int_url_df, site, site_dir, odk_aggregate=None):
+    """ Sort, download and name the relevant photographs of the site photo_integrated_url data.
+
+            :param photo_int_url_df: pandas dataframe object containing the current site photo_integrated_url data
+            (step7 defined).
             :param site: site: string object containing the site name.
-            :param site_dir: string object containing the path to the site directory. """
+            :param site_dir: string object containing the path to the site directory.
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined). """
 
     print('step8_6_integrated_photo_download.py INITIATED.')
 
-    df = pd.read_csv(photo_int_url_csv, index_col=0).fillna('BLANK').replace('Nan', 'BLANK')
-    df.to_csv(r"Z:\Scratch\Rob\code\draft\test_outputs\odk_outputs\int_photo.csv")
+    df = photo_int_url_df.fillna('BLANK')
     # call photos_fn function
     photo_list = photo_fn(df)
 
     # call the savePhotos function
-    save_photo_fn(photo_list, site, site_dir)
+    download_list = save_photo_fn(photo_list, site, site_dir)
+
+    # call the photo_download_client.py script - download the photographs concurrently.
+    photo_download_client.main_routine(download_list, site_dir, odk_aggregate)
 
     print('step8_6_integrated_photo_download.py COMPLETED.')
 
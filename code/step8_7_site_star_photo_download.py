@@ -19,9 +19,8 @@ SOFTWARE.
 """
 
 # Import modules
-import pandas as pd
 import warnings
-import urllib
+import photo_download_client
 
 warnings.filterwarnings("ignore")
 
@@ -44,9 +43,9 @@ def photos_fn(df, site):
 
 
 def save_photo_fn(photos_list, site, site_dir):
-    """Download and save the seven transect photos_fn."""
+    """Name the seven transect photos_fn and return the download list."""
 
-    photo_dir_list = []
+    download_list = []
 
     # date = sDate.replace('-', '_')
 
@@ -55,21 +54,24 @@ def save_photo_fn(photos_list, site, site_dir):
         print('TAIL: ', tail)
         photo_name = tail[1].replace('PHOTO', '')
         output_str = (site_dir + '\\' + site + '_' + '_PHOTO' + photo_name + '.jpg')  # return date following site
-        photo_dir_list.append(output_str)
-        urllib.request.urlretrieve(i, output_str)
+        download_list.append([i, output_str])
 
+    return download_list
 
-def main_routine(photo_star_url_csv, site, site_dir):
+
+def main_routine(photo_star_url_df, site, site_dir, odk_aggregate=None):
     print('step8_7_site_star_photo_download.py INITIATED.')
 
-    df = pd.read_csv(photo_star_url_csv)
-    # df = pd.read_csv(photo_star_url_csv).fillna('BLANK').replace('Nan', 'BLANK')
+    df = photo_star_url_df
     # call photos_fn function
     photos_list = photos_fn(df, site)
     # print("photos_fn function complete.")
 
     # call the savePhotos function
-    save_photo_fn(photos_list, site, site_dir)
+    download_list = save_photo_fn(photos_list, site, site_dir)
+
+    # call the photo_download_client.py script - download the photographs concurrently.
+    photo_download_client.main_routine(download_list, site_dir, odk_aggregate)
 
     print('step8_7_site_star_photo_download.py COMPLETED.')
 
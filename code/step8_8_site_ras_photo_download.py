@@ -19,9 +19,8 @@ SOFTWARE.
 """
 
 # Import modules
-import pandas as pd
 import warnings
-import urllib
+import photo_download_client
 
 warnings.filterwarnings("ignore")
 
@@ -52,9 +51,10 @@ def save_photo_fn(photo_list, bearing_list, site, site_dir):
             :param photo_list: list object containing the photo url.
             :param bearing_list: list object containing the photo bearing.
             :param site: string object containing the site name.
-            :param site_dir: string object containing the path to the site directory. """
+            :param site_dir: string object containing the path to the site directory.
+            :return download_list: list object containing [photo url, output file path] list elements. """
 
-    photo_dir_list = []
+    download_list = []
 
     for photo, bear in zip(photo_list, bearing_list):
         print(photo)
@@ -66,27 +66,33 @@ def save_photo_fn(photo_list, bearing_list, site, site_dir):
             bear2 = round(float(bear[2]), 4)
             bearing = str(bear2).replace('.', '-')
             output_str = (site_dir + '\\' + site + '_' + '_PHOTO' + photo_name + '_' + bearing + '.jpg')
-            photo_dir_list.append(output_str)
-            urllib.request.urlretrieve(photo, output_str)
+            download_list.append([photo, output_str])
 
+    return download_list
 
-def main_routine(photo_ras_url_csv, site, site_dir):
-    """ Read in the site_photo_ras_url.csv file sort and download and name the relevant photographs.
 
-            :param photo_ras_url_csv: string object containing the path to the site_photo_ras_url csv file.
+def main_routine(photo_ras_url_df, site, site_dir, odk_aggregate=None):
+    """ Sort, download and name the relevant photographs of the site photo_ras_url data.
+
+            :param photo_ras_url_df: pandas dataframe object containing the current site photo_ras_url data
+            (step7 defined).
             :param site: site: string object containing the site name.
-            :param site_dir: string object containing the path to the site directory. """
+            :param site_dir: string object containing the path to the site directory.
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined). """
 
     print('step8_8_site_ras_photo_download.py INITIATED.')
 
-    ras_photo = pd.read_csv(photo_ras_url_csv, index_col=0).fillna('BLANK').replace('Nan', 'BLANK')
-    ras_photo.to_csv(r'Z:\Scratch\Rob\code\draft\test_outputs\odk_outputs\ras_photos.csv')
+    ras_photo = photo_ras_url_df.fillna('BLANK')
     # call photos_fn function
     photo_list, bearing_list = photos_fn(ras_photo)
     # print("photos_fn function complete.")
 
     # call the savePhotos function
-    save_photo_fn(photo_list, bearing_list, site, site_dir)
+    download_list = save_photo_fn(photo_list, bearing_list, site, site_dir)
+
+    # call the photo_download_client.py script - download the photographs concurrently.
+    photo_download_client.main_routine(download_list, site_dir, odk_aggregate)
 
     print('step8_8_site_ras_photo_download.py COMPLETED.')
 
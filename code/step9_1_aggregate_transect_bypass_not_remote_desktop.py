@@ -82,6 +82,7 @@ import time
 import os
 import shutil
 import glob
+import stage_monitor
 
 
 def search_html_files_fn(directory_odk, site):
@@ -98,7 +99,7 @@ def search_html_files_fn(directory_odk, site):
 
 def move_html_files(html_list, site, site_dir):
     for i in html_list:
-        _, file = i.rsplit('\\', 1)
+        file = os.path.basename(i)
         # print('file: ', file)
 
         shutil.copy(i, site_dir + '//' + file)
@@ -107,7 +108,8 @@ def move_html_files(html_list, site, site_dir):
     return ()
 
 
-def main_routine(directory_odk, obs_data_list, site, site_dir, star):
+@stage_monitor.monitor_fn
+def main_routine(directory_odk, obs_data_list, site, site_dir, star, transect_cache=None):
     """Extract the URL's contained within the Star Transect ODK Aggregate .csv for the star transect repeats (transects).
     Open and log into ODK Aggregate using the testodk username and password,
     navigate and open the transect tables, and download the table data as a .html so that it can be imported as a Pandas DataFrame in the following script.
@@ -124,7 +126,8 @@ def main_routine(directory_odk, obs_data_list, site, site_dir, star):
 
     # call the step10_1_site_observation_sheet_processing_workflow.py script.
     import step10_1_site_observation_sheet_processing_workflow
-    step10_1_site_observation_sheet_processing_workflow.main_routine(obs_data_list, site, site_dir, star)
+    step10_1_site_observation_sheet_processing_workflow.main_routine(obs_data_list, site, site_dir, star,
+                                                                     transect_cache)
 
 
 if __name__ == "__main__":
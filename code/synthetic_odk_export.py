@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Synthetic ODK Aggregate export of any number of sites, used to measure how the pipeline scales:
+
+    python synthetic_odk_export.py -d <sample directory> -x <output directory> -n 1000 -e 0
+
+The raw odk csv files in the sample directory are used as row templates, so the output has the real column headers.
+Each synthetic site receives a new site name, meta:instanceID (also replaced in the photo and transect table urls),
+location and species drawn from the odk veg list. Observation sites receive a star transect, integrated, basal sweep and
+woody thickening submission and three <SITE>_transect<N>.html tables whose points match the transect count columns,
+every fourth site is a RAS site. The same seed always produces the same export. With -r the transects are written as
+the three RM_Star_Transect-REPEAT_points_<N>.csv repeat group exports (ODK Briefcase layout) instead of html tables.
+"""
+
+# Import modules
+import os
+import re
+import uuid
+import random
+import argparse
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# raw odk outputs - observation forms are submitted for every observation site.
+OBSERVATION_FORM_LIST = ['RM_Star_Transect_results.csv', 'RMB_Integrated_Site_results.csv',
+                         'RMB_Basal_Sweep_results.csv', 'RMB_Woody_Thickening_results.csv']
+RAS_FORM = 'RMB_Rapid_Assessment_RAS_results.csv'
+
+# every RAS_INTERVAL site is a RAS site.
+RAS_INTERVAL = 4
+
+SITE_COLUMN_LIST = ['GROUP_SITE:SITE_TEXT', 'GROUP_SITE:SITE_FINAL']
+INSTANCE_COLUMN = 'meta:instanceID'
+INSTANCE_NAME_COLUMN = 'meta:instanceName'
+
+# odk veg list worksheet -> species category, a name listed on more than one worksheet keeps the first category.
+VEG_SHEET_LIST = [('PPP_COMP', 'ppp'), ('PER_COMP', 'perennial_grass'), ('ANNUAL_COMP', 'annual_grass'),
+                  ('FORB_COMP', 'forb'), ('TREE_COMP', 'tree'), ('SHRUB_COMP', 'shrub'), ('WEEDS', 'weed')]
+
+# northern territory extent used for the site centres (latitude, longitude).
+LATITUDE_RANGE = (-25.5, -11.5)
+LONGITUDE_RANGE = (129.5, 137.5)
+
+TRANSECT_POINTS = 100
+
+# odk transect value -> count / indicator column prefix (the transect number is appended) and relative frequency.
+GROUND_COUNT_LIST = [('bare', 'BAREG', 4), ('gravel', 'GRAV', 10), ('rock', 'RCK', 3), ('ash', 'ASHH', 1),
+                     ('litter', 'LIT', 50), ('cryptogram', 'CRYP', 1), ('dead_annual_grass', 'DAG', 3),
+                     ('dead_perennial_grass', 'DPG', 6), ('dead_forb', 'DF', 3), ('green_annual_grass', 'GAG', 4),
+                     ('green_perennial_grass', 'GPG', 10), ('green_forb', 'GF', 5)]
+BELOW_COUNT_LIST = [('below_green', 'BELOWG', 3), ('below_brown', 'BELOWB', 2), ('below_dead', 'BELOWD', 1),
+                    ('none', 'BELOWN', 94)]
+ABOVE_COUNT_LIST = [('above_green', 'ABOVEG', 50), ('above_brown', 'ABOVEB', 5), ('above_dead', 'ABOVED', 5),
+                    ('above_in_crown', 'ABOVEIC', 8), ('not_in_crown', 'ABOVENIC', 32)]
+
+# indicator columns of the Aggregate REPEAT_points_N table, in table order.
+INDICATOR_LIST = ['BAREG', 'GRAV', 'RCK', 'ASHH', 'LIT', 'CRYP', 'DAG', 'DPG', 'DF', 'GAG', 'GPG', 'GF', 'ABOVEG',
+                  'ABOVEB', 'ABOVED', 'ABOVEIC', 'ABOVENIC', 'BELOWG', 'BELOWB', 'BELOWD', 'BELOWIC', 'BELOWN']
+
+HTML_HEAD = ('<html><head><link rel="icon" href="/ODKAggregate/favicon.ico"><link type="text/css" rel="stylesheet" '
+             'href="/ODKAggregate/AggregateUI.css"><title>ODK AGGREGATE</title></head><body><div align="CENTER"><h1>'
+             'Submissions Results: REPEAT_points_{0}</h1></div><table border="1"><tbody>')
+HTML_TAIL = '</tbody></table></body></html>'
+
+# ODK Briefcase repeat group export of the star transect form (transect_repeat_reader.py).
+REPEAT_FILE = 'RM_Star_Transect-REPEAT_points_{0}.csv'
+
+
+def cmd_args_fn():
+    p = argparse.ArgumentParser(description='''Create a synthetic raw ODK export of any number of sites.''')
+
+    p.add_argument('-d', '--template_dir', help='The directory containing the sample raw odk csv files.',
+                   default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    p.add_argument('-x', '--export_dir', help='Directory path for the synthetic export.', default=os.getcwd())
+    p.add_argument('-n', '--sites', help='Number of sites.', type=int, default=100)
+    p.add_argument('-e', '--seed', help='Random seed.', type=int, default=0)
+    p.add_argument('-r', '--repeat_csv', help='Write the transects as REPEAT_points_N repeat group csv exports instead '
+                                              'of html tables.', action='store_true')
+    p.add_argument('-v', '--veg_list_excel', help='Odk veg list Excel file path (default: the template directory '
+                                                  'odk_veg_list_final.xlsx).', default=None)
+
+    cmd_args = p.parse_args()
+
+    return cmd_args
+
+
+def species_dict_fn(veg_list_excel):
+    """ Read the odk species names of each veg list category.
+
+            :param veg_list_excel: string object containing the path to the odk veg list Excel file.
+            :return category_dict: dictionary object (odk name -> category).
+            :return species_dict: dictionary object (category -> list of odk names). """
+
+    sheet_dict = pd.read_excel(veg_list_excel, sheet_name=[sheet for sheet, _ in VEG_SHEET_LIST], header=None)
+
+    category_dict = {}
+    species_dict = {}
+    for sheet, category in VEG_SHEET_LIST:
+        name_list = [str(name).strip() for name in sheet_dict[sheet].iloc[:, 1].dropna().tolist()]
+        species_dict[category] = sorted(set(name_list))
+        for name in name_list:
+            category_dict.setdefault(name, category)
+
+    return category_dict, species_dict
+
+
+def template_fn(df, category_dict):
+    """ Locate the cells of each template row that are replaced for a synthetic site.
+
+            :param df: pandas dataframe object containing the sample raw odk results.
+            :param category_dict: dictionary object (odk name -> category) (species_dict_fn defined).
+            :return template_list: list object containing one dictionary per template row: the row values, the
+            instance id, site, latitude / longitude and species cell positions. """
+
+    column_list = df.columns.tolist()
+    latitude_list = [n for n, column in enumerate(column_list)
+                     if re.search(r'(:Latitude|_LAT\d*|:GPS_COORD\d*)$', column)]
+    longitude_list = [n for n, column in enumerate(column_list) if re.search(r'(:Longitude|_LONG\d*)$', column)]
+
+    template_list = []
+    for value_list in df.astype(object).where(df.notnull(), None).values.tolist():
+        instance_id = str(value_list[column_list.index(INSTANCE_COLUMN)]).replace('uuid:', '')
+        site = str(value_list[column_list.index('GROUP_SITE:SITE_FINAL')])
+
+        uuid_list = [n for n, value in enumerate(value_list) if isinstance(value, str) and instance_id in value]
+        species_list = [n for n, value in enumerate(value_list) if isinstance(value, str) and
+                        any(token in category_dict for token in value.split())]
+        latitude = [value_list[n] for n in latitude_list if value_list[n] is not None]
+        longitude = [value_list[n] for n in longitude_list if value_list[n] is not None]
+
+        template_list.append({'value_list': value_list, 'instance_id': instance_id, 'site': site,
+                              'uuid_list': uuid_list, 'species_list': species_list,
+                              'latitude': [latitude[0] if latitude else 0.0, latitude_list],
+                              'longitude': [longitude[0] if longitude else 0.0, longitude_list]})
+
+    return template_list
+
+
+def site_name_fn(n):
+    """ Create the name of synthetic site n (observation sites SYN, RAS sites SRS). """
+
+    if n % RAS_INTERVAL == RAS_INTERVAL - 1:
+        return 'SRS' + str(n).zfill(5)
+
+    return 'SYN' + str(n).zfill(5) + 'A'
+
+
+def species_map_fn(rng, value_list, species_cell_list, category_dict, species_dict):
+    """ Map each odk species name of a template row to a random name of the same category, without repeats.
+
+            :param rng: random.Random object.
+            :param value_list: list object containing the template row values.
+            :param species_cell_list: list object containing the positions of the species cells.
+            :param category_dict: dictionary object (odk name -> category).
+            :param species_dict: dictionary object (category -> list of odk names).
+            :return species_map: dictionary object (template name -> synthetic name). """
+
+    species_map = {}
+    used_set = set()
+
+    for n in species_cell_list:
+        for token in value_list[n].split():
+            category = category_dict.get(token)
+            if category is None or token in species_map:
+                continue
+            choice_list = [name for name in rng.sample(species_dict[category], min(5, len(species_dict[category])))
+                           if name not in used_set] or [token]
+            species_map[token] = choice_list[0]
+            used_set.add(choice_list[0])
+
+    return species_map
+
+
+def synthetic_row_fn(rng, template, site, centre, column_list, category_dict, species_dict):
+    """ Create one synthetic submission from a template row.
+
+            :param rng: random.Random object.
+            :param template: dictionary object (template_fn defined).
+            :param site: string object containing the synthetic site name.
+            :param centre: list object containing the site latitude and longitude.
+            :param column_list: list object containing the form column names.
+            :param category_dict: dictionary object (odk name -> category).
+            :param species_dict: dictionary object (category -> list of odk names).
+            :return value_list: list object containing the synthetic row values. """
+
+    value_list = list(template['value_list'])
+    instance_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    for n in template['uuid_list']:
+        value_list[n] = value_list[n].replace(template['instance_id'], instance_id)
+
+    species_map = species_map_fn(rng, value_list, template['species_list'], category_dict, species_dict)
+    for n in template['species_list']:
+        value_list[n] = ' '.join(species_map.get(token, token) for token in value_list[n].split())
+
+    for (origin, position_list), site_value in zip((template['latitude'], template['longitude']), centre):
+        for n in position_list:
+            if value_list[n] is not None:
+                value_list[n] = round(value_list[n] - origin + site_value, 7)
+
+    for column in SITE_COLUMN_LIST:
+        value_list[column_list.index(column)] = site
+    n = column_list.index(INSTANCE_NAME_COLUMN)
+    value_list[n] = str(value_list[n]).replace(template['site'], site)
+
+    return value_list
+
+
+def transect_points_fn(rng):
+    """ Draw the ground, below and above values of the points of one transect.
+
+            :param rng: random.Random object.
+            :return: list object containing three lists of odk values (ground, below and above). """
+
+    return [rng.choices([value for value, _, _ in count_list], [weight for _, _, weight in count_list],
+                        k=TRANSECT_POINTS)
+            for count_list in (GROUND_COUNT_LIST, BELOW_COUNT_LIST, ABOVE_COUNT_LIST)]
+
+
+def transect_rows_fn(loop, point_list):
+    """ Create the header and point rows of a REPEAT_points_N table.
+
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :param point_list: list object containing the ground, below and above values (transect_points_fn defined).
+            :return header_list: list object containing the column names.
+            :return row_list: list object containing one list of cell values per point. """
+
+    suffix = str(loop)
+    prefix_dict = {value: prefix for count_list in (GROUND_COUNT_LIST, BELOW_COUNT_LIST, ABOVE_COUNT_LIST)
+                   for value, prefix, _ in count_list}
+
+    header_list = [header + suffix for header in ['REPEAT_COUNT', 'LOCATION_NOTE', 'GROUND', 'BELOW', 'ABOVE'] +
+                   INDICATOR_LIST]
+    row_list = []
+
+    for point, (ground, below, above) in enumerate(zip(*point_list), 1):
+        prefix_set = {prefix_dict[ground], prefix_dict[below], prefix_dict[above]}
+        row_list.append([str(point), '', ground, below, above] +
+                        ['1' if indicator in prefix_set else '0' for indicator in INDICATOR_LIST])
+
+    return header_list, row_list
+
+
+def transect_html_fn(loop, point_list):
+    """ Create a REPEAT_points_N table in the ODK Aggregate html layout.
+
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :param point_list: list object containing the ground, below and above values (transect_points_fn defined).
+            :return: string object containing the html. """
+
+    header_list, row_list = transect_rows_fn(loop, point_list)
+
+    html_list = ['<tr>' + ''.join('<th>' + header + '</th>' for header in header_list) + '</tr>']
+    html_list.extend('<tr>' + ''.join('<td>' + cell + '</td>' for cell in cell_list) + '</tr>'
+                     for cell_list in row_list)
+
+    return HTML_HEAD.format(loop) + ''.join(html_list) + HTML_TAIL
+
+
+def transect_repeat_fn(loop, point_list, instance_id):
+    """ Create the REPEAT_points_N rows of a submission in the ODK Briefcase repeat group csv layout.
+
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :param point_list: list object containing the ground, below and above values (transect_points_fn defined).
+            :param instance_id: string object containing the meta:instanceID of the submission.
+            :return header_list: list object containing the column names.
+            :return row_list: list object containing one list of cell values per point. """
+
+    header_list, row_list = transect_rows_fn(loop, point_list)
+    key = instance_id + '/REPEAT_points_' + str(loop)
+
+    return header_list + ['PARENT_KEY', 'KEY'], [cell_list + [instance_id, key + '[' + str(point) + ']']
+                                                 for point, cell_list in enumerate(row_list, 1)]
+
+
+def transect_count_fn(value_list, column_list, transect_list):
+    """ Overwrite the transect and site count columns of a star transect row with the tallies of the synthetic
+    transects.
+
+            :param value_list: list object containing the synthetic row values.
+            :param column_list: list object containing the form column names.
+            :param transect_list: list object containing the three transect_points_fn outputs. """
+
+    column_dict = {column: n for n, column in enumerate(column_list)}
+    site_count_dict = {}
+
+    for loop, point_list in enumerate(transect_list, 1):
+        for count_list, value_point_list in zip((GROUND_COUNT_LIST, BELOW_COUNT_LIST, ABOVE_COUNT_LIST), point_list):
+            for value, prefix, _ in count_list:
+                count = value_point_list.count(value)
+                site_count_dict[prefix] = site_count_dict.get(prefix, 0) + count
+                if prefix + '_COUNT' + str(loop) in column_dict:
+                    value_list[column_dict[prefix + '_COUNT' + str(loop)]] = count
+        if 'REPEAT_points_' + str(loop) + '_count' in column_dict:
+            value_list[column_dict['REPEAT_points_' + str(loop) + '_count']] = TRANSECT_POINTS
+
+    for prefix, count in site_count_dict.items():
+        if prefix + '_COUNT' in column_dict:
+            value_list[column_dict[prefix + '_COUNT']] = count
+
+
+def main_routine(template_dir, export_dir, sites, seed=0, veg_list_excel=None, repeat_csv=False):
+    """ Write a synthetic raw odk export of a number of sites.
+
+            :param template_dir: string object containing the directory of the sample raw odk csv files.
+            :param export_dir: string object containing the output directory.
+            :param sites: integer object containing the number of sites.
+            :param seed: integer object containing the random seed.
+            :param veg_list_excel: string object containing the path to the odk veg list Excel file, None uses the
+            template directory odk_veg_list_final.xlsx.
+            :param repeat_csv: Boolean object - write the transects as repeat group csv exports instead of html tables.
+            :return file_list: list object containing the paths of the written csv files. """
+
+    print('synthetic_odk_export.py INITIATED.')
+
+    if not os.path.exists(export_dir):
+        os.makedirs(export_dir)
+
+    category_dict, species_dict = species_dict_fn(
+        veg_list_excel or os.path.join(template_dir, 'odk_veg_list_final.xlsx'))
+
+    rng = random.Random(seed)
+    site_list = [site_name_fn(n) for n in range(sites)]
+    centre_list = [[round(rng.uniform(*LATITUDE_RANGE), 7), round(rng.uniform(*LONGITUDE_RANGE), 7)]
+                   for _ in site_list]
+
+    file_list = []
+    repeat_dict = {}
+    for form in OBSERVATION_FORM_LIST + [RAS_FORM]:
+        df = pd.read_csv(os.path.join(template_dir, form))
+        column_list = df.columns.tolist()
+        template_list = template_fn(df, category_dict)
+
+        # one random stream per form, so a form is the same whichever forms are generated.
+        form_rng = random.Random(str(seed) + form)
+        row_list = []
+        for n, (site, centre) in enumerate(zip(site_list, centre_list)):
+            if (form == RAS_FORM) != site.startswith('SRS'):
+                continue
+
+            value_list = synthetic_row_fn(form_rng, template_list[n % len(template_list)], site, centre, column_list,
+                                          category_dict, species_dict)
+
+            if form == 'RM_Star_Transect_results.csv':
+                transect_list = [transect_points_fn(form_rng) for _ in range(3)]
+                transect_count_fn(value_list, column_list, transect_list)
+                for loop, point_list in enumerate(transect_list, 1):
+                    if repeat_csv:
+                        repeat_header_list, repeat_list = transect_repeat_fn(
+                            loop, point_list, value_list[column_list.index(INSTANCE_COLUMN)])
+                        repeat_dict.setdefault(loop, [repeat_header_list, []])[1].extend(repeat_list)
+                    else:
+                        with open(os.path.join(export_dir, site + '_transect' + str(loop) + '.html'), 'w') as f:
+                            f.write(transect_html_fn(loop, point_list))
+
+            row_list.append(value_list)
+
+        pd.DataFrame(row_list, columns=column_list).to_csv(os.path.join(export_dir, form), index=False)
+        file_list.append(os.path.join(export_dir, form))
+        print(form, ' - ', len(row_list), ' submissions.')
+
+    for loop, (repeat_header_list, repeat_list) in sorted(repeat_dict.items()):
+        pd.DataFrame(repeat_list, columns=repeat_header_list).to_csv(
+            os.path.join(export_dir, REPEAT_FILE.format(loop)), index=False)
+        file_list.append(os.path.join(export_dir, REPEAT_FILE.format(loop)))
+        print(REPEAT_FILE.format(loop), ' - ', len(repeat_list), ' transect points.')
+
+    print('synthetic_odk_export.py COMPLETED - ', sites, ' sites written to ', export_dir)
+
+    return file_list
+
+
+if __name__ == '__main__':
+    cmd_args = cmd_args_fn()
+    main_routine(cmd_args.template_dir, cmd_args.export_dir, cmd_args.sites, cmd_args.seed, cmd_args.veg_list_excel,
+                 cmd_args.repeat_csv)
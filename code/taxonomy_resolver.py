@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# Import modules
+from __future__ import print_function, division
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# maximum number of single character edits accepted when a botanical name is not an exact match.
+FUZZY_DISTANCE = 2
+# shorter names are only matched exactly (i.e. genus abbreviations).
+FUZZY_MIN_LENGTH = 6
+# candidate names are bucketed on their first characters.
+PREFIX_LENGTH = 2
+
+
+def botanical_name_clean_fn(botanical_name):
+    """ Normalise a botanical name for lookup (lower case, '_' and '-' as spaces and collapsed whitespace).
+
+            :param botanical_name: string object containing the botanical name.
+            :return clean_string: processed string object. """
+
+    str1 = str(botanical_name).replace('_', ' ')
+    str2 = str1.replace('-', ' ')
+    clean_string = ' '.join(str2.lower().split())
+
+    return clean_string
+
+
+def taxonomy_index_fn(botanical_dict):
+    """ Create the normalised botanical name lookup tables of a species list, the first record of a duplicated name is
+    retained.
+
+            :param botanical_dict: dictionary object (botanical name -> common name) (reference_data_cache defined).
+            :return taxonomy_index: dictionary object containing:
+                name_dict: dictionary object (normalised name -> [botanical name, common name]).
+                bucket_dict: dictionary object (name prefix -> list of normalised names).
+                fuzzy_dict: dictionary object caching the result of each fuzzy lookup. """
+
+    name_dict = {}
+    bucket_dict = {}
+    for botanical_name, common_name in botanical_dict.items():
+        clean_name = botanical_name_clean_fn(botanical_name)
+        if clean_name and clean_name not in name_dict:
+            name_dict[clean_name] = [botanical_name, common_name]
+            bucket_dict.setdefault(clean_name[:PREFIX_LENGTH], []).append(clean_name)
+
+    taxonomy_index = {'name_dict': name_dict, 'bucket_dict': bucket_dict, 'fuzzy_dict': {}}
+
+    return taxonomy_index
+
+
+def edit_distance_fn(string1, string2, max_distance):
+    """ Calculate the Levenshtein distance of two strings, stopping once it exceeds max_distance.
+
+            :param string1: string object.
+            :param string2: string object.
+            :param max_distance: integer object containing the largest distance of interest.
+            :return: integer object containing the distance (max_distance + 1 if it is larger). """
+
+    if abs(len(string1) - len(string2)) > max_distance:
+        return max_distance + 1
+
+    previous_row = list(range(len(string2) + 1))
+    for i, char1 in enumerate(string1, 1):
+        current_row = [i]
+        for j, char2 in enumerate(string2, 1):
+            current_row.append(min(previous_row[j] + 1, current_row[j - 1] + 1,
+                                   previous_row[j - 1] + (char1 != char2)))
+        if min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def fuzzy_lookup_fn(taxonomy_index, clean_name):
+    """ Match a misspelled botanical name (i.e. field typos and free text 'Other' entries) to the closest listed name
+    with the same first characters.
+
+            :param taxonomy_index: dictionary object created by taxonomy_index_fn.
+            :param clean_name: string object containing the normalised botanical name.
+            :return: list object containing the listed [botanical name, common name], None if there is no match. """
+
+    fuzzy_dict = taxonomy_index['fuzzy_dict']
+
+    if clean_name not in fuzzy_dict:
+        match = None
+        if len(clean_name) >= FUZZY_MIN_LENGTH:
+            best_distance = FUZZY_DISTANCE + 1
+            for candidate in taxonomy_index['bucket_dict'].get(clean_name[:PREFIX_LENGTH], []):
+                distance = edit_distance_fn(clean_name, candidate, best_distance - 1)
+                if distance < best_distance:
+                    best_distance = distance
+                    match = taxonomy_index['name_dict'][candidate]
+        if match is not None:
+            print('Botanical name: ', clean_name, ' matched to: ', match[0])
+        fuzzy_dict[clean_name] = match
+
+    return fuzzy_dict[clean_name]
+
+
+def main_routine(taxonomy_index, botanical_name_list):
+    """ Resolve a batch of botanical names to their listed botanical and common names, names that are not listed keep
+    the botanical name as the common name.
+
+            :param taxonomy_index: dictionary object created by taxonomy_index_fn.
+            :param botanical_name_list: list object containing botanical names.
+            :return species_list: list object containing list elements [botanical name, common name]. """
+
+    name_dict = taxonomy_index['name_dict']
+    resolved_dict = {}
+
+    species_list = []
+    for botanical_name in botanical_name_list:
+        if botanical_name not in resolved_dict:
+            clean_name = botanical_name_clean_fn(botanical_name)
+            if clean_name in name_dict:
+                resolved_dict[botanical_name] = [botanical_name, name_dict[clean_name][1]]
+            else:
+                match = fuzzy_lookup_fn(taxonomy_index, clean_name)
+                resolved_dict[botanical_name] = list(match) if match else [botanical_name, botanical_name]
+
+        species_list.append(list(resolved_dict[botanical_name]))
+
+    return species_list
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Reconcile the star transect point observations with the 21 transect counts of the star transect form.
+
+The transect points of the season are the star_transect_points table (repeat group exports) and the transect tables
+(html) of the sites without repeat group points, read into the same layout by html_point_fn. The ground, below and
+above values of every point are categorical codes. Each code is mapped to its count (a lookup array per column), so
+the 3 x 21 tallies of every submission are a single np.bincount. The tallies are compared with the t<N>_<count>
+columns of the clean star transect table and every difference is written to the discrepancy report.
+"""
+
+# Import modules
+import os
+import time
+import numpy as np
+import pandas as pd
+import warnings
+import transect_table_cache
+
+warnings.filterwarnings("ignore")
+
+# clean star transect count name (t<N>_<name> columns, step2_2_star_transect_basics.transect_variables_fn order) ->
+# transect point column and observation sheet value (transect_html_parser.py).
+COUNT_LIST = [('bare', 'ground', 'BARE GROUND'), ('gravel', 'ground', 'GRAVEL'), ('rock', 'ground', 'ROCK'),
+              ('ash', 'ground', 'ASH'), ('litter', 'ground', 'LITTER'), ('crypto', 'ground', 'CRYPTOGRAM'),
+              ('dead_pg', 'ground', 'DEAD PERENNIAL GRASS'), ('green_pg', 'ground', 'GREEN PERENNIAL GRASS'),
+              ('dead_ag', 'ground', 'DEAD ANNUAL GRASS'), ('green_ag', 'ground', 'GREEN ANNUAL GRASS'),
+              ('dead_fb', 'ground', 'DEAD PERENNIAL FORB / HERB'),
+              ('green_fb', 'ground', 'GREEN PERENNIAL FORB / HERB'),
+              ('abv_green', 'above', 'ABOVE - GREEN'), ('abv_dead', 'above', 'ABOVE - DEAD'),
+              ('abv_brown', 'above', 'ABOVE - BROWN'), ('abv_ic', 'above', 'ABOVE - IN CROWN'),
+              ('abv_nic', 'above', 'BLANK'),
+              ('blw_green', 'below', 'BELOW - GREEN'), ('blw_dead', 'below', 'BELOW - DEAD'),
+              ('blw_brown', 'below', 'BELOW - BROWN'), ('blw_none', 'below', 'BLANK')]
+
+TRANSECTS = 3
+
+REPORT_NAME = 'transect_count_discrepancy.csv'
+
+
+def html_point_fn(html_list, transect_cache=None):
+    """ Read the transect tables (html) of the sites without repeat group points into the star_transect_points layout.
+
+            :param html_list: list object containing [site, clean_meta_key, transect number, html file path] list
+            elements, a html file that does not exist is skipped.
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined), html
+            already parsed (i.e. by step10_1) is not parsed again.
+            :return point_df: pandas dataframe object containing the site, clean_meta_key, transect, point, ground,
+            below and above columns, None if no html file exists. """
+
+    point_list = []
+    for site, clean_meta_key, loop, html_path in html_list:
+        if not os.path.isfile(html_path):
+            continue
+
+        # call the transect_table_cache.py script - ground, below and above columns in point order.
+        df = transect_table_cache.parse_cached_fn(html_path, transect_cache)
+        point_list.append(pd.DataFrame({'site': site, 'clean_meta_key': clean_meta_key, 'transect': loop,
+                                        'point': np.arange(1, len(df) + 1), 'ground': df['ground'].to_numpy(),
+                                        'below': df['below'].to_numpy(), 'above': df['above'].to_numpy()}))
+
+    if not point_list:
+        return None
+
+    return pd.concat(point_list, ignore_index=True)
+
+
+def code_lookup_fn(series, column):
+    """ Map the categorical codes of a transect point column to the count index (-1 if the value is not counted).
+
+            :param series: pandas categorical series object containing the ground, below or above values.
+            :param column: string object containing the column name ('ground', 'below' or 'above').
+            :return: numpy array object containing the count index of every point. """
+
+    category_list = series.cat.categories.tolist()
+    count_dict = {value: n for n, (_, count_column, value) in enumerate(COUNT_LIST) if count_column == column}
+
+    # one extra slot so the -1 code of a missing value is not counted.
+    lookup = np.array([count_dict.get(category, -1) for category in category_list] + [-1], dtype='int16')
+
+    return lookup[series.cat.codes.to_numpy()]
+
+
+def tally_fn(point_df, record, record_count):
+    """ Tally the transect counts of every submission in one bincount.
+
+            :param point_df: pandas dataframe object containing the transect, ground, below and above columns.
+            :param record: numpy array object containing the submission index of every point (-1 for a point without
+            a submission).
+            :param record_count: integer object containing the number of submissions.
+            :return: numpy array object (submissions x transects x counts) containing the integer tallies. """
+
+    size = record_count * TRANSECTS * len(COUNT_LIST)
+    transect = point_df['transect'].to_numpy(dtype='int32') - 1
+    base = (record.astype('int32') * TRANSECTS + transect) * len(COUNT_LIST)
+    valid = (record >= 0) & (transect >= 0) & (transect < TRANSECTS)
+
+    index_list = []
+    for column in ('ground', 'below', 'above'):
+        count = code_lookup_fn(point_df[column].astype('category'), column)
+        # a point without a submission or a value that is not counted falls in the extra (dropped) bin.
+        index_list.append(np.where(valid & (count >= 0), base + count, size))
+
+    tally = np.bincount(np.concatenate(index_list), minlength=size + 1)[:size]
+
+    return tally.reshape(record_count, TRANSECTS, len(COUNT_LIST))
+
+
+def form_count_fn(star_df):
+    """ Read the transect counts of the star transect form.
+
+            :param star_df: pandas dataframe object containing the clean star transect table.
+            :return: numpy array object (submissions x transects x counts) containing the float counts. """
+
+    column_list = ['t{0}_{1}'.format(loop + 1, name) for loop in range(TRANSECTS) for name, _, _ in COUNT_LIST]
+    count_array = star_df.reindex(columns=column_list).apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+
+    return count_array.reshape(len(star_df), TRANSECTS, len(COUNT_LIST))
+
+
+def report_fn(star_df, tally, form_count, recorded):
+    """ List every transect count where the form and the transect points disagree.
+
+            :param star_df: pandas dataframe object containing the clean star transect table.
+            :param tally: numpy array object containing the transect point tallies (tally_fn defined).
+            :param form_count: numpy array object containing the form counts (form_count_fn defined).
+            :param recorded: numpy array object containing True for the submissions with transect points.
+            :return: pandas dataframe object containing the site, clean_meta_key, transect, count, form_count,
+            point_count and difference columns. """
+
+    difference = tally - form_count
+    # a missing form count is reported as well, a submission without transect points is not.
+    mismatch = ((difference != 0) | np.isnan(form_count)) & recorded[:, None, None]
+    record, transect, count = np.nonzero(mismatch)
+
+    return pd.DataFrame({'site': star_df['site'].to_numpy(dtype=object)[record],
+                         'clean_meta_key': star_df['clean_meta_key'].to_numpy(dtype=object)[record],
+                         'transect': transect + 1,
+                         'count': np.asarray([name for name, _, _ in COUNT_LIST], dtype=object)[count],
+                         'form_count': form_count[record, transect, count],
+                         'point_count': tally[record, transect, count],
+                         'difference': difference[record, transect, count]})
+
+
+def main_routine(star_df, point_df=None, temp_dir=None, html_list=None, transect_cache=None):
+    """ Reconcile the transect points of the season with the star transect form counts.
+
+            :param star_df: pandas dataframe object containing the clean star transect table.
+            :param point_df: pandas dataframe object containing the star_transect_points table
+            (transect_repeat_reader.py), None if there is no repeat group export.
+            :param temp_dir: string object path to the created output directory (date_time), if given the
+            discrepancy report csv is written to it.
+            :param html_list: list object containing the transect tables (html) of the sites without repeat group
+            points (html_point_fn defined).
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined).
+            :return report_df: pandas dataframe object containing the discrepancies (report_fn defined), None if there
+            are no transect points. """
+
+    start = time.perf_counter()
+
+    point_list = [point_df, html_point_fn(html_list or [], transect_cache)]
+    point_list = [df for df in point_list if df is not None]
+    if not point_list:
+        return None
+    # the value categories of the two ingest paths differ - the columns are categorised again by tally_fn.
+    point_df = pd.concat(point_list, ignore_index=True)
+
+    # the points are keyed to the submission (clean_meta_key), a site may hold more than one visit.
+    # the point keys are interned once, only the unique keys are looked up in the star transect table.
+    point_code, point_key = pd.factorize(point_df['clean_meta_key'])
+    position = pd.Series(np.arange(len(star_df)), index=star_df['clean_meta_key'].to_numpy())
+    position = position[~position.index.duplicated()]
+    position = np.append(position.reindex(point_key).fillna(-1).to_numpy(dtype='int64'), -1)
+    record = position[point_code]
+
+    tally = tally_fn(point_df, record, len(star_df))
+
+    recorded = np.bincount(record[record >= 0], minlength=len(star_df)) > 0
+    report_df = report_fn(star_df, tally, form_count_fn(star_df), recorded)
+
+    print('Transect count reconciliation: ', int(recorded.sum()), ' submissions, ', len(report_df),
+          ' discrepancies (', round(time.perf_counter() - start, 3), ' seconds).')
+
+    if temp_dir is not None:
+        report_df.to_csv(temp_dir + '\\' + REPORT_NAME, index=False)
+
+    return report_df
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import re
+import html
+import pandas as pd
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# number of points recorded along each star transect.
+TRANSECT_POINTS = 100
+
+# odk value -> observation sheet value, one table per transect column.
+GROUND_VALUES = {'bare': 'BARE GROUND', 'gravel': 'GRAVEL', 'rock': 'ROCK', 'ash': 'ASH', 'litter': 'LITTER',
+                 'cryptogram': 'CRYPTOGRAM',
+                 'dead_annual_grass': 'DEAD ANNUAL GRASS', 'dead_perennial_grass': 'DEAD PERENNIAL GRASS',
+                 'dead_annual_forb': 'DEAD ANNUAL FORB / HERB', 'dead_forb': 'DEAD PERENNIAL FORB / HERB',
+                 'green_annual_grass': 'GREEN ANNUAL GRASS',
+                 'green_perennial_grass': 'GREEN PERENNIAL GRASS', 'green_annual_forb': 'GREEN ANNUAL FORB / HERB',
+                 'green_forb': 'GREEN PERENNIAL FORB / HERB', 'green_plant': 'GREEN PLANT', 'dead_plant': 'DEAD PLANT'}
+
+BELOW_VALUES = {'below_green': 'BELOW - GREEN', 'below_brown': 'BELOW - BROWN', 'below_dead': 'BELOW - DEAD',
+                'subshrub': 'SUBSHRUB - GREY', 'none': 'BLANK'}
+
+ABOVE_VALUES = {'above_green': 'ABOVE - GREEN', 'above_brown': 'ABOVE - BROWN', 'above_dead': 'ABOVE - DEAD',
+                'above_in_crown': 'ABOVE - IN CROWN', 'not_in_crown': 'BLANK'}
+
+# the Aggregate repeat table is a single <table> of <tr> rows: one <th> header row then one <td> row per point.
+ROW_PATTERN = re.compile(r'<tr[^>]*>(.*?)</tr>', re.I | re.S)
+CELL_PATTERN = re.compile(r'<t([hd])[^>]*>(.*?)</t[hd]>', re.I | re.S)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def code_table_fn(value_dict):
+    """ Precompute the categories of a transect column and the odk value -> category code lookup table.
+
+            :param value_dict: dictionary object (odk value -> observation sheet value).
+            :return category_list: list object containing the unique observation sheet values.
+            :return code_dict: dictionary object (odk value -> category code). """
+
+    category_list = list(dict.fromkeys(value_dict.values()))
+    code_dict = {odk_value: category_list.index(value) for odk_value, value in value_dict.items()}
+
+    return category_list, code_dict
+
+
+# (column name, header prefix, fallback column position, categories, codes) - built once per process.
+COLUMN_TABLE = [(name, prefix, position) + code_table_fn(value_dict) for name, prefix, position, value_dict in
+                (('ground', 'GROUND', 2, GROUND_VALUES), ('below', 'BELOW', 3, BELOW_VALUES),
+                 ('above', 'ABOVE', 4, ABOVE_VALUES))]
+
+
+def cell_text_fn(cell):
+    """ Remove any markup from a table cell and unescape the html entities.
+
+            :param cell: string object containing the cell html.
+            :return: string object containing the cell text. """
+
+    if '<' in cell:
+        cell = TAG_PATTERN.sub('', cell)
+
+    return html.unescape(cell).strip()
+
+
+def parse_rows_fn(page):
+    """ Split the repeat table into its header and point rows.
+
+            :param page: string object containing the transect html.
+            :return header_list: list object containing the header names.
+            :return row_list: list object containing one list of cell values per point. """
+
+    header_list = []
+    row_list = []
+
+    for row in ROW_PATTERN.finditer(page):
+        cell_list = CELL_PATTERN.findall(row.group(1))
+        if not cell_list:
+            continue
+        if cell_list[0][0].lower() == 'h':
+            header_list = [cell_text_fn(cell) for _, cell in cell_list]
+        else:
+            row_list.append([cell_text_fn(cell) for _, cell in cell_list])
+
+    return header_list, row_list
+
+
+def column_position_fn(header_list, prefix, position):
+    """ Locate a transect column by its header (i.e. GROUND1), falling back to the fixed Aggregate column position.
+
+            :param header_list: list object containing the header names.
+            :param prefix: string object containing the header name without the transect number.
+            :param position: integer object containing the fallback column position.
+            :return: integer object containing the column position. """
+
+    for n, header in enumerate(header_list):
+        if header.upper().rstrip('0123456789') == prefix:
+            return n
+
+    return position
+
+
+def categorical_fn(value_list, category_list, code_dict):
+    """ Map odk values to a categorical through the precomputed code table, unlisted values are kept as is.
+
+            :param value_list: list object containing the odk values.
+            :param category_list: list object containing the categories (code_table_fn defined).
+            :param code_dict: dictionary object (odk value -> category code) (code_table_fn defined).
+            :return: pandas categorical object. """
+
+    category_list = list(category_list)
+    code_list = []
+
+    for value in value_list:
+        code = code_dict.get(value)
+        if code is None:
+            # not in the lookup table (i.e. an empty cell) - keep the odk value as its own category.
+            value = value or 'BLANK'
+            if value not in category_list:
+                category_list.append(value)
+            code = category_list.index(value)
+        code_list.append(code)
+
+    return pd.Categorical.from_codes(code_list, category_list)
+
+
+def parse_transect_html_fn(page, html_path=''):
+    """ Parse an ODK Aggregate REPEAT_points_N table into the ground, below and above transect points.
+
+            :param page: string object containing the transect html.
+            :param html_path: string object containing the html file path (used in messages).
+            :return df: pandas dataframe object containing the categorical ground, below and above columns. """
+
+    header_list, row_list = parse_rows_fn(page)
+
+    if len(row_list) != TRANSECT_POINTS:
+        print('ERROR -- ', html_path, ' contains ', len(row_list), ' transect points, ', TRANSECT_POINTS,
+              ' were expected.')
+
+    column_dict = {}
+    for name, prefix, position, category_list, code_dict in COLUMN_TABLE:
+        n = column_position_fn(header_list, prefix, position)
+        value_list = [row[n] if n < len(row) else '' for row in row_list]
+        column_dict[name] = categorical_fn(value_list, category_list, code_dict)
+
+    df = pd.DataFrame(column_dict, columns=['ground', 'below', 'above'])
+
+    return df
+
+
+def main_routine(html_path):
+    """ Read and parse a saved transect table.
+
+            :param html_path: string object containing the path to a <SITE>_transect<N>.html file.
+            :return df: pandas dataframe object containing the categorical ground, below and above columns. """
+
+    with open(html_path, encoding='utf-8', errors='replace') as f:
+        page = f.read()
+
+    return parse_transect_html_fn(page, html_path)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Star transect points read from the ODK repeat group exports (REPEAT_points_1 - 3) instead of the transect html tables.
+
+ODK Briefcase (<form>-REPEAT_points_N.csv) and ODK Aggregate (<form>_REPEAT_points_N_results.csv) export each repeat
+group as its own csv, one row per transect point, keyed to the star transect submission by PARENT_KEY
+(= meta:instanceID). The three exports are joined to the star transect submissions in one merge and stored as the
+star_transect_points table, so the transect sheets of a site need no download (step9_2) or html (step9_1) stage.
+"""
+
+# Import modules
+import os
+import re
+import pandas as pd
+import warnings
+import export_reader
+import transect_html_parser
+
+warnings.filterwarnings("ignore")
+
+# repeat group export file name -> transect number (Briefcase and Aggregate naming).
+REPEAT_FILE_PATTERN = re.compile(r'REPEAT_points_([123])(?:_results)?\.csv$', re.I)
+
+PARENT_KEY = 'PARENT_KEY'
+KEY = 'KEY'
+
+# the repeat instance number at the end of the KEY (i.e. uuid:<instanceID>/REPEAT_points_1[37]).
+POINT_PATTERN = r'\[(\d+)\]$'
+
+# intermediate store table name (step7 partitions it by site with the clean form tables).
+TABLE = 'star_transect_points'
+
+
+def repeat_file_fn(directory_odk):
+    """ Locate the star transect repeat group exports in the raw odk directory.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :return repeat_dict: dictionary object (transect number -> repeat export file path). """
+
+    repeat_dict = {}
+
+    for file in sorted(os.listdir(directory_odk)):
+        match = REPEAT_FILE_PATTERN.search(file)
+        if match:
+            repeat_dict.setdefault(int(match.group(1)), os.path.join(directory_odk, file))
+
+    return repeat_dict
+
+
+def source_column_fn(header_list):
+    """ Map the repeat export headers (i.e. REPEAT_points_1:GROUND1) to the key and the transect columns.
+
+            :param header_list: list object containing the repeat export column names.
+            :return column_dict: dictionary object (repeat export column name -> output column name). """
+
+    column_dict = {}
+    name_list = [header.rsplit(':', 1)[-1].rsplit('/', 1)[-1] for header in header_list]
+
+    for header, name in zip(header_list, name_list):
+        if name.upper() in (PARENT_KEY, KEY):
+            column_dict[header] = name.lower()
+
+    for name, prefix, position, _, _ in transect_html_parser.COLUMN_TABLE:
+        # call the transect_html_parser.py script - the same header match as the html tables.
+        n = transect_html_parser.column_position_fn(name_list, prefix, -1)
+        if n >= 0:
+            column_dict[header_list[n]] = name
+
+    return column_dict
+
+
+def categorical_fn(series, category_list, code_dict):
+    """ Map odk values to a categorical through the precomputed code table, unlisted values are kept as is (the
+    vectorised transect_html_parser.categorical_fn).
+
+            :param series: pandas series object containing the odk values.
+            :param category_list: list object containing the categories (transect_html_parser.code_table_fn defined).
+            :param code_dict: dictionary object (odk value -> category code) (transect_html_parser.code_table_fn
+            defined).
+            :return: pandas categorical object. """
+
+    value_series = series.fillna('').astype(str).str.strip()
+    code_series = value_series.map(code_dict)
+
+    unlisted_series = value_series[code_series.isna()].replace('', 'BLANK')
+    extra_list = [value for value in unlisted_series.unique().tolist() if value not in category_list]
+    category_list = list(category_list) + extra_list
+
+    code_series = code_series.fillna(unlisted_series.map({value: n for n, value in enumerate(category_list)}))
+
+    return pd.Categorical.from_codes(code_series.to_numpy(dtype='int64'), category_list)
+
+
+def read_repeat_fn(file_path, loop):
+    """ Read a repeat group export into the transect points of every submission.
+
+            :param file_path: string object containing the repeat export file path.
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :return df: pandas dataframe object containing the parent_key, transect, point, ground, below and above
+            columns. """
+
+    column_dict = source_column_fn(export_reader.header_fn(file_path))
+
+    if 'parent_key' not in column_dict.values():
+        print('ERROR -- ', file_path, ' has no ', PARENT_KEY, ' column and will not be used.')
+        return None
+
+    # call the export_reader.py script - only the key and transect columns are read.
+    df = pd.concat(export_reader.chunk_fn(file_path, list(column_dict)), ignore_index=True)
+    df = df.rename(columns=column_dict)
+
+    # a PARENT_KEY holds the meta:instanceID of the submission, with or without the 'uuid:' prefix.
+    parent_series = df['parent_key'].astype(str).str.split('/', n=1).str[0].str.replace('uuid:', '', regex=False)
+
+    if 'key' in df.columns:
+        point_series = pd.to_numeric(df['key'].astype(str).str.extract(POINT_PATTERN)[0], errors='coerce')
+    else:
+        point_series = pd.Series(float('nan'), index=df.index)
+    # a KEY without a repeat instance number keeps the export order.
+    point_series = point_series.fillna(parent_series.groupby(parent_series).cumcount() + 1).astype('int64')
+
+    point_df = pd.DataFrame({'parent_key': parent_series, 'transect': loop, 'point': point_series})
+
+    for name, _, _, category_list, code_dict in transect_html_parser.COLUMN_TABLE:
+        value_series = df[name] if name in df.columns else pd.Series('', index=df.index)
+        point_df[name] = categorical_fn(value_series, category_list, code_dict)
+
+    return point_df
+
+
+def site_transect_list_fn(transect_df, site=''):
+    """ Split the transect points of a site into the three transect tables of the observation sheet.
+
+            :param transect_df: pandas dataframe object containing the site star_transect_points records.
+            :param site: string object containing the site name (used in messages).
+            :return clean_df_list: list object containing one pandas dataframe (ground, below and above columns) per
+            transect. """
+
+    clean_df_list = []
+
+    for loop in (1, 2, 3):
+        df = transect_df[transect_df['transect'] == loop].sort_values('point', kind='stable')
+
+        if len(df) != transect_html_parser.TRANSECT_POINTS:
+            print('ERROR -- ', site, ' transect ', loop, ' contains ', len(df), ' transect points, ',
+                  transect_html_parser.TRANSECT_POINTS, ' were expected.')
+
+        clean_df_list.append(df[['ground', 'below', 'above']].reset_index(drop=True))
+
+    return clean_df_list
+
+
+def main_routine(directory_odk, star_df):
+    """ Join the star transect repeat group exports to the star transect submissions.
+
+            :param directory_odk: string object containing the directory path to the raw odk result csv.
+            :param star_df: pandas dataframe object containing the clean star transect data (site and clean_meta_key
+            columns).
+            :return df: pandas dataframe object containing the site, clean_meta_key, transect, point, ground, below and
+            above columns, None if there is no repeat group export. """
+
+    repeat_dict = repeat_file_fn(directory_odk)
+    if not repeat_dict:
+        return None
+
+    point_list = [read_repeat_fn(file_path, loop) for loop, file_path in sorted(repeat_dict.items())]
+    point_list = [point_df for point_df in point_list if point_df is not None]
+    if not point_list:
+        return None
+
+    point_df = pd.concat(point_list, ignore_index=True)
+    for name, _, _, _, _ in transect_html_parser.COLUMN_TABLE:
+        # the unlisted values of each export can differ - union the categories before the tables are stored.
+        point_df[name] = point_df[name].astype('category')
+
+    parent_df = star_df[['site', 'clean_meta_key']].dropna(subset=['clean_meta_key']).drop_duplicates(
+        'clean_meta_key')
+
+    # one merge for the points of every submission, a point without a star transect submission is dropped.
+    df = parent_df.merge(point_df, left_on='clean_meta_key', right_on='parent_key', how='inner', sort=False)
+    # sites keep the star transect order, the points of each submission are in transect and point order.
+    df = df.drop(columns='parent_key').sort_values(['transect', 'point'], kind='stable')
+
+    unmatched = len(point_df) - len(df)
+    if unmatched:
+        print(unmatched, ' repeat group transect points have no star transect submission and were not used.')
+
+    print('Star transect repeat group exports: ', len(repeat_dict), ' transects, ', len(df), ' points joined.')
+
+    return df.reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    main_routine()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Content addressed cache of the star transect tables, kept between runs:
+
+    <cache_dir>/html/<sha1>.html                  transect html as downloaded or copied
+    <cache_dir>/parsed/<sha1>_v<N>.pickle         ground, below and above points parsed from that html
+    <cache_dir>/instance/<instanceID>_transect<N> sha1 of the html downloaded for an ODK submission
+
+An ODK submission does not change once sent, so a transect already downloaded for a meta:instanceID is restored from
+the cache instead of downloaded again, and html with a known hash is not parsed again.
+"""
+
+# Import modules
+import os
+import shutil
+import pickle
+import warnings
+import reference_data_cache
+import transect_html_parser
+
+warnings.filterwarnings("ignore")
+
+# increment when the output of transect_html_parser.py changes so old parsed tables are ignored.
+PARSED_VERSION = 1
+
+
+def write_atomic_fn(file_path, data):
+    """ Write bytes to a temporary file and move it into place, so an interrupted run does not leave a corrupt entry.
+
+            :param file_path: string object containing the file path.
+            :param data: bytes object. """
+
+    if not os.path.exists(os.path.dirname(file_path)):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    # the process id keeps concurrent site workers from sharing a temporary file.
+    temp_path = file_path + '.' + str(os.getpid()) + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, file_path)
+
+
+def instance_key_fn(instance_id, loop):
+    """ Create the cache key of a transect of an ODK submission.
+
+            :param instance_id: string object containing the meta:instanceID (with or without the 'uuid:' prefix).
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :return: string object containing the key, None if the instance id is missing. """
+
+    instance_id = str(instance_id).replace('uuid:', '').strip()
+    if not instance_id or instance_id in ('nan', 'BLANK'):
+        return None
+
+    return instance_id + '_transect' + str(loop)
+
+
+def html_path_fn(cache_dir, digest):
+    """ Define the cached html file path of a html hash. """
+
+    return os.path.join(cache_dir, 'html', digest + '.html')
+
+
+def parsed_path_fn(cache_dir, digest):
+    """ Define the parsed table file path of a html hash. """
+
+    return os.path.join(cache_dir, 'parsed', digest + '_v' + str(PARSED_VERSION) + '.pickle')
+
+
+def instance_path_fn(cache_dir, instance_key):
+    """ Define the file path recording the html hash of a submission transect. """
+
+    return os.path.join(cache_dir, 'instance', instance_key)
+
+
+def restore_html_fn(cache_dir, instance_key, output_path):
+    """ Copy the cached html of a submission transect to the site directory.
+
+            :param cache_dir: string object containing the cache directory path.
+            :param instance_key: string object containing the cache key (instance_key_fn defined).
+            :param output_path: string object containing the output file path.
+            :return: Boolean object - True if the transect was restored. """
+
+    if not instance_key or not os.path.isfile(instance_path_fn(cache_dir, instance_key)):
+        return False
+
+    with open(instance_path_fn(cache_dir, instance_key)) as f:
+        digest = f.read().strip()
+
+    if not os.path.isfile(html_path_fn(cache_dir, digest)):
+        return False
+
+    shutil.copyfile(html_path_fn(cache_dir, digest), output_path)
+
+    return True
+
+
+def store_html_fn(cache_dir, html_path, instance_key=None):
+    """ Add a transect html to the cache, and record it against the submission transect if the key is known.
+
+            :param cache_dir: string object containing the cache directory path.
+            :param html_path: string object containing the transect html file path.
+            :param instance_key: string object containing the cache key (instance_key_fn defined).
+            :return digest: string object containing the sha1 hash of the html. """
+
+    digest = reference_data_cache.file_hash_fn(html_path)
+
+    if not os.path.isfile(html_path_fn(cache_dir, digest)):
+        with open(html_path, 'rb') as f:
+            write_atomic_fn(html_path_fn(cache_dir, digest), f.read())
+
+    if instance_key:
+        write_atomic_fn(instance_path_fn(cache_dir, instance_key), digest.encode('ascii'))
+
+    return digest
+
+
+def parse_cached_fn(html_path, cache_dir=None):
+    """ Return the parsed transect table of a html file, parsing it only if the html hash is not in the cache.
+
+            :param html_path: string object containing the transect html file path.
+            :param cache_dir: string object containing the cache directory path, None parses without a cache.
+            :return df: pandas dataframe object containing the categorical ground, below and above columns. """
+
+    if not cache_dir:
+        return transect_html_parser.main_routine(html_path)
+
+    digest = store_html_fn(cache_dir, html_path)
+    parsed_path = parsed_path_fn(cache_dir, digest)
+
+    if os.path.isfile(parsed_path):
+        try:
+            with open(parsed_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            print('Parsed transect table could not be read and will be parsed again: ', parsed_path)
+
+    # call the transect_html_parser.py script.
+    df = transect_html_parser.main_routine(html_path)
+    write_atomic_fn(parsed_path, pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+
+    return df
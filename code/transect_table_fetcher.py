@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Import modules
+from __future__ import print_function, division
+import os
+import base64
+import time
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+import photo_download_client
+import transect_table_cache
+
+warnings.filterwarnings("ignore")
+
+# ODK Aggregate account used to open the star transect (REPEAT_points_N) tables.
+ODK_AGGREGATE_USER = 'odktest'
+ODK_AGGREGATE_PASSWORD = 'odktest'
+
+FETCH_WORKERS = 8
+FETCH_RETRIES = 3
+FETCH_BACKOFF = 1.0
+FETCH_TIMEOUT = 60
+
+
+def transect_html_path_fn(site_dir, site, loop):
+    """ Create the path of a saved transect table.
+
+            :param site_dir: string object containing the path to the site directory.
+            :param site: string object containing the site name.
+            :param loop: integer object containing the transect number (1, 2 or 3).
+            :return: string object containing the transect html file path. """
+
+    return site_dir + "//" + site + '_transect' + str(loop) + ".html"
+
+
+def site_transect_list_fn(star, site, site_dir):
+    """ Collate the three transect table urls of a site and the html file each table is saved to.
+
+            :param star: pandas dataframe object containing the current site star transect data.
+            :param site: string object containing the site name.
+            :param site_dir: string object containing the path to the site directory.
+            :return fetch_list: list object containing [table url, output file path, cache key] list elements. """
+
+    tran_url_list = [star.tran1_url.iloc[0], star.tran2_url.iloc[0], star.tran3_url.iloc[0]]
+    instance_id = star.clean_meta_key.iloc[0] if 'clean_meta_key' in star.columns else None
+
+    fetch_list = [[url, transect_html_path_fn(site_dir, site, loop),
+                   transect_table_cache.instance_key_fn(instance_id, loop)]
+                  for loop, url in enumerate(tran_url_list, 1)]
+
+    return fetch_list
+
+
+def auth_header_fn(user, password):
+    """ Create the basic authentication request header, built once per run.
+
+            :param user: string object containing the ODK Aggregate user name.
+            :param password: string object containing the ODK Aggregate password.
+            :return: dictionary object containing the Authorization header. """
+
+    token = base64.b64encode((user + ':' + password).encode('utf-8')).decode('ascii')
+
+    return {'Authorization': 'Basic ' + token}
+
+
+def rebase_url_fn(url, base_url):
+    """ Point a table url at another ODK Aggregate host (i.e. the local mock server).
+
+            :param url: string object containing the table url.
+            :param base_url: string object containing the replacement scheme and host (i.e. 'http://localhost:8443'),
+            None keeps the url.
+            :return: string object containing the table url. """
+
+    if not base_url:
+        return url
+
+    parts = urllib.parse.urlsplit(url)
+    base = urllib.parse.urlsplit(base_url)
+
+    return urllib.parse.urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+
+def fetch_table_fn(url, output_path, headers, retries, backoff, timeout):
+    """ Download a transect table html, retrying with an exponential backoff.
+
+            :param url: string object containing the table url.
+            :param output_path: string object containing the output file path.
+            :param headers: dictionary object containing the request headers (authentication).
+            :param retries: integer object containing the number of attempts.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return fetch_result: list object containing the output path, status (downloaded/skipped/failed) and
+            error. """
+
+    # the table was saved by an earlier (interrupted) run.
+    if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+        return [output_path, 'skipped', '']
+
+    error = None
+    for attempt in range(retries):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            response, connection_key = photo_download_client.request_fn('GET', url, headers, timeout)
+            try:
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                photo_download_client.drop_connection_fn(*connection_key)
+                raise
+
+            if response.status == 200:
+                with open(output_path + '.part', 'wb') as f:
+                    f.write(body)
+                os.replace(output_path + '.part', output_path)
+                return [output_path, 'downloaded', '']
+
+            error = http.client.HTTPException('HTTP {0} {1}: {2}'.format(response.status, response.reason, url))
+            if response.status < 500 and response.status != 429:
+                # i.e. 401 - the credentials are wrong, retrying will not help.
+                break
+
+        except (OSError, http.client.HTTPException) as e:
+            error = e
+
+    return [output_path, 'failed', '{0}: {1}'.format(type(error).__name__, error)]
+
+
+def main_routine(fetch_list, odk_aggregate=None, transect_cache=None, workers=FETCH_WORKERS, retries=FETCH_RETRIES,
+                 backoff=FETCH_BACKOFF, timeout=FETCH_TIMEOUT):
+    """ Download the star transect tables of one or many sites concurrently over one authenticated session.
+
+            :param fetch_list: list object containing [table url, output file path, cache key] list elements
+            (site_transect_list_fn defined).
+            :param odk_aggregate: dictionary object containing the ODK Aggregate 'user', 'password' and optional
+            'base_url' (cmd_args_fn defined), None uses the default account.
+            :param transect_cache: string object containing the transect cache directory (cmd_args_fn defined),
+            tables of a submission already in the cache are restored instead of downloaded.
+            :param workers: integer object containing the number of concurrent downloads.
+            :param retries: integer object containing the number of attempts per table.
+            :param backoff: float object containing the first retry delay (seconds).
+            :param timeout: integer object containing the socket timeout (seconds).
+            :return fetch_result_list: list object containing the fetch_table_fn outputs. """
+
+    odk_aggregate = odk_aggregate or {}
+    headers = auth_header_fn(odk_aggregate.get('user') or ODK_AGGREGATE_USER,
+                             odk_aggregate.get('password') or ODK_AGGREGATE_PASSWORD)
+    base_url = odk_aggregate.get('base_url')
+
+    fetch_result_list = []
+    download_list = []
+    for url, output_path, instance_key in fetch_list:
+        if transect_cache and not os.path.isfile(output_path) and \
+                transect_table_cache.restore_html_fn(transect_cache, instance_key, output_path):
+            fetch_result_list.append([output_path, 'cached', ''])
+        else:
+            download_list.append([url, output_path, instance_key])
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            future_list = [executor.submit(fetch_table_fn, rebase_url_fn(url, base_url), output_path, headers,
+                                           retries, backoff, timeout)
+                           for url, output_path, _ in download_list]
+            download_result_list = [future.result() for future in future_list]
+    finally:
+        photo_download_client.close_connections_fn()
+
+    for (_, _, instance_key), (output_path, status, error) in zip(download_list, download_result_list):
+        if status == 'failed':
+            print('Transect table download failed: ', output_path, error)
+        elif transect_cache:
+            # call the transect_table_cache.py script - keep the table for the next run.
+            transect_table_cache.store_html_fn(transect_cache, output_path, instance_key)
+
+    fetch_result_list.extend(download_result_list)
+
+    status_list = [result[1] for result in fetch_result_list]
+    print('Transect tables - downloaded: ', status_list.count('downloaded'), ', cached: ', status_list.count('cached'),
+          ', skipped: ', status_list.count('skipped'), ', failed: ', status_list.count('failed'))
+
+    return fetch_result_list
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+"""
+Copyright 2021 Robert McGregor
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+"""
+Worksheet layout templates. The static part of each observation / RAS worksheet is declared once as data in its
+step module (LAYOUT):
+
+    default_row    default row height.
+    cell_list      (method, cell or range, value, style name) in write order - write_string, write_number,
+                   write_blank, write, write_column and merge_range; WORKSHEET_NAME is replaced by the sheet name.
+    column_list    (column range, width).
+    row_list       (row number - zero indexed, height).
+
+A layout is compiled once per process into a write plan (A1 references resolved to row / column numbers and
+neighbouring cells of the same style collapsed into write_row / write_column calls) and replayed for every site
+workbook with the styles of that workbook.
+"""
+
+# Import modules
+import re
+import warnings
+from xlsxwriter.utility import xl_cell_to_rowcol
+
+warnings.filterwarnings("ignore")
+
+# value replaced by the worksheet name when the plan is replayed.
+WORKSHEET_NAME = '<worksheet_name>'
+
+# compiled write plans (layout name -> plan).
+PLAN_DICT = {}
+
+# strings that worksheet.write() does not store as a plain string (formulas, urls), these are not collapsed.
+SPECIAL_STRING = re.compile(r'^(=|\{|[a-z]+://|mailto:|internal:|external:)', re.I)
+
+
+def column_range_fn(column_range):
+    """ Convert a column range (i.e. 'A:C') to column numbers.
+
+            :param column_range: string object containing the column range.
+            :return: list object containing the first and last column numbers. """
+
+    first, _, last = column_range.partition(':')
+
+    return [xl_cell_to_rowcol(first + '1')[1], xl_cell_to_rowcol((last or first) + '1')[1]]
+
+
+def collapsible_fn(method, value):
+    """ Determine if a cell can be written as part of a write_row / write_column run without changing the stored
+    value (worksheet.write() dispatches on the value).
+
+            :param method: string object containing the worksheet method name.
+            :param value: cell value.
+            :return: Boolean object. """
+
+    if method == 'write_blank':
+        return value is None
+    if method == 'write_number':
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if method == 'write_string':
+        return isinstance(value, str) and value != '' and not SPECIAL_STRING.match(value)
+
+    return False
+
+
+def compile_fn(layout):
+    """ Compile a layout into a write plan.
+
+            :param layout: dictionary object containing the worksheet layout (see module docstring).
+            :return plan: list object containing (worksheet method, argument list, style name) elements. """
+
+    plan = []
+    # the open write_row / write_column run: [method, row, col, value list, style, direction].
+    run = None
+
+    for method, cell, value, style in layout.get('cell_list', []):
+        if method == 'merge_range':
+            first, _, last = cell.partition(':')
+            plan.append(('merge_range', list(xl_cell_to_rowcol(first)) + list(xl_cell_to_rowcol(last)) + [value],
+                         style))
+            run = None
+            continue
+
+        row, col = xl_cell_to_rowcol(cell)
+
+        if method == 'write_column':
+            plan.append(('write_column', [row, col, list(value)], style))
+            run = None
+            continue
+
+        if not collapsible_fn(method, value):
+            plan.append((method, [row, col, value], style))
+            run = None
+            continue
+
+        if run is not None and run[0] == method and run[4] == style:
+            run_row, run_col, size = run[1], run[2], len(run[3])
+            if run[5] in (None, 'write_row') and row == run_row and col == run_col + size:
+                run[3].append(value)
+                run[5] = 'write_row'
+                continue
+            if run[5] in (None, 'write_column') and col == run_col and row == run_row + size:
+                run[3].append(value)
+                run[5] = 'write_column'
+                continue
+
+        run = [method, row, col, [value], style, None]
+        plan.append(run)
+
+    # close the runs: a single cell keeps its own method.
+    plan = [(step[5] or step[0], [step[1], step[2], step[3] if step[5] else step[3][0]], step[4])
+            if isinstance(step, list) else step for step in plan]
+
+    return plan
+
+
+def plan_fn(layout):
+    """ Return the compiled write plan of a layout, compiling it only once per process.
+
+            :param layout: dictionary object containing the worksheet layout, including its unique 'name'.
+            :return: list object containing the write plan (compile_fn defined). """
+
+    if layout['name'] not in PLAN_DICT:
+        PLAN_DICT[layout['name']] = compile_fn(layout)
+
+    return PLAN_DICT[layout['name']]
+
+
+def main_routine(workbook, worksheet_name, layout, style_dict):
+    """ Create a worksheet and write its static headings, blank cells, merges, column widths and row heights.
+
+            :param workbook: open workbook object derived from create_workbook_fn function.
+            :param worksheet_name: string object containing the worksheet name.
+            :param layout: dictionary object containing the worksheet layout (see module docstring).
+            :param style_dict: dictionary object (style name -> workbook style) of the current workbook.
+            :return worksheet: worksheet object. """
+
+    worksheet = workbook.add_worksheet(worksheet_name)
+
+    if layout.get('default_row'):
+        # Set row height
+        worksheet.set_default_row(layout['default_row'])
+
+    for method, argument_list, style in plan_fn(layout):
+        if method == 'merge_range' and argument_list[4] == WORKSHEET_NAME:
+            argument_list = argument_list[:4] + [worksheet_name]
+        getattr(worksheet, method)(*argument_list, style_dict.get(style))
+
+    for column_range, width in layout.get('column_list', []):
+        worksheet.set_column(*(column_range_fn(column_range) + [width]))
+
+    for row, height in layout.get('row_list', []):
+        worksheet.set_row(row, height)
+
+    return worksheet